@@ -1,16 +1,25 @@
 """Application layer."""
 
+from .loaders import DataLoader
 from .ports import (
     AppointmentRepository,
+    AppointmentStatsService,
     AuthenticationService,
+    BookingService,
     CacheService,
     NotificationService,
     PatientRepository,
     PractitionerRepository,
+    RecurringSeriesRepository,
     TenantRepository,
     VideoCallService,
 )
-from .use_cases.appointments import CreateAppointmentUseCase
+from .tenant_context import current_tenant_id, tenant_scope
+from .use_cases.appointments import (
+    CreateAppointmentUseCase,
+    CreateRecurringSeriesUseCase,
+    GetAvailableSlotsUseCase,
+)
 
 __all__ = [
     # Ports
@@ -18,10 +27,20 @@ __all__ = [
     "PatientRepository",
     "PractitionerRepository",
     "AppointmentRepository",
+    "RecurringSeriesRepository",
     "AuthenticationService",
     "NotificationService",
     "VideoCallService",
     "CacheService",
+    "BookingService",
+    "AppointmentStatsService",
     # Use Cases
     "CreateAppointmentUseCase",
+    "CreateRecurringSeriesUseCase",
+    "GetAvailableSlotsUseCase",
+    # Loaders
+    "DataLoader",
+    # Context
+    "current_tenant_id",
+    "tenant_scope",
 ]
@@ -0,0 +1,17 @@
+"""Columnar appointment analytics (requires the ``analytics`` extra)."""
+
+from .appointment_frame import (
+    APPOINTMENT_TYPES,
+    CATEGORICAL_COLUMNS,
+    STATUSES,
+    AppointmentFrame,
+    epoch_seconds,
+)
+
+__all__ = [
+    "AppointmentFrame",
+    "epoch_seconds",
+    "CATEGORICAL_COLUMNS",
+    "STATUSES",
+    "APPOINTMENT_TYPES",
+]
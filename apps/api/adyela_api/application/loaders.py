@@ -0,0 +1,82 @@
+"""Request-scoped batching loaders over repository lookups."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Mapping, Sequence
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class DataLoader(Generic[K, V]):
+    """Batch and memoize lookups made while serving one request.
+
+    Keys passed to ``load`` during the same event-loop tick are collected,
+    deduplicated and fetched with a single ``batch_load`` call (for example a
+    repository's ``get_many``), so resolving a related entity per list row
+    costs one round trip instead of one per row. Results, including misses as
+    ``None``, are memoized for the loader's lifetime; create one per request.
+    """
+
+    def __init__(
+        self,
+        batch_load: Callable[[list[K]], Awaitable[Mapping[K, V]]],
+        max_batch_size: int | None = None,
+    ) -> None:
+        self._batch_load = batch_load
+        self._max_batch_size = max_batch_size
+        self._futures: dict[K, asyncio.Future[V | None]] = {}
+        self._queue: list[K] = []
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def load(self, key: K) -> V | None:
+        """Load a value, batching with other loads in the same tick."""
+        future = self._futures.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._futures[key] = future
+            if not self._queue:
+                loop.call_soon(self._dispatch)
+            self._queue.append(key)
+        return await future
+
+    async def load_many(self, keys: Sequence[K]) -> list[V | None]:
+        """Load several values with one batch, keeping the order of ``keys``."""
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def prime(self, key: K, value: V) -> None:
+        """Seed the memo with a value that is already known."""
+        if key not in self._futures:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(value)
+            self._futures[key] = future
+
+    def clear(self, key: K) -> None:
+        """Forget a memoized value, e.g. after the entity was written."""
+        self._futures.pop(key, None)
+
+    def _dispatch(self) -> None:
+        keys, self._queue = self._queue, []
+        size = self._max_batch_size or len(keys)
+        for start in range(0, len(keys), size):
+            task = asyncio.ensure_future(self._load_batch(keys[start : start + size]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _load_batch(self, keys: list[K]) -> None:
+        futures = [self._futures[key] for key in keys]
+        try:
+            values = await self._batch_load(keys)
+        except Exception as e:
+            # Failures are not memoized so that a later load can retry
+            for key, future in zip(keys, futures, strict=True):
+                if self._futures.get(key) is future:
+                    del self._futures[key]
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for key, future in zip(keys, futures, strict=True):
+            if not future.done():
+                future.set_result(values.get(key))
@@ -3,20 +3,37 @@
 from .repositories import (
     AppointmentRepository,
     BaseRepository,
+    BulkWriteFailure,
+    BulkWriteResult,
+    Page,
     PatientRepository,
     PractitionerRepository,
+    RecurringSeriesRepository,
     TenantRepository,
 )
-from .services import AuthenticationService, CacheService, NotificationService, VideoCallService
+from .services import (
+    AppointmentStatsService,
+    AuthenticationService,
+    BookingService,
+    CacheService,
+    NotificationService,
+    VideoCallService,
+)
 
 __all__ = [
+    "Page",
+    "BulkWriteResult",
+    "BulkWriteFailure",
     "BaseRepository",
     "TenantRepository",
     "PatientRepository",
     "PractitionerRepository",
     "AppointmentRepository",
+    "RecurringSeriesRepository",
     "AuthenticationService",
     "NotificationService",
     "VideoCallService",
     "CacheService",
+    "BookingService",
+    "AppointmentStatsService",
 ]
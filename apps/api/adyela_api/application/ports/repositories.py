@@ -1,13 +1,60 @@
 """Repository port interfaces."""
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Sequence
+from dataclasses import dataclass, field
 from typing import Generic, TypeVar
 
-from adyela_api.domain import Appointment, Patient, Practitioner, Tenant
+from adyela_api.domain import (
+    Appointment,
+    AppointmentSummary,
+    Patient,
+    Practitioner,
+    RecurringSeries,
+    Tenant,
+)
 
 T = TypeVar("T")
 
 
+@dataclass
+class Page(Generic[T]):
+    """A page of results from a keyset-paginated query.
+
+    ``next_page_token`` is an opaque cursor to pass back to the same query to
+    fetch the following page; it is ``None`` on the last page.
+    """
+
+    items: list[T] = field(default_factory=list)
+    next_page_token: str | None = None
+
+
+@dataclass
+class BulkWriteFailure:
+    """A single item that could not be written in a bulk operation."""
+
+    index: int
+    entity_id: str | None
+    error: str
+
+
+@dataclass
+class BulkWriteResult(Generic[T]):
+    """Outcome of a bulk write, reported per item.
+
+    ``succeeded`` keeps the input order; ``failed`` refers back to inputs by
+    their index.
+    """
+
+    succeeded: list[T] = field(default_factory=list)
+    failed: list[BulkWriteFailure] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """Check if every item was written."""
+        return not self.failed
+
+
 class BaseRepository(ABC, Generic[T]):
     """Base repository interface."""
 
@@ -21,6 +68,11 @@ class BaseRepository(ABC, Generic[T]):
         """Get entity by ID."""
         pass
 
+    @abstractmethod
+    async def get_many(self, entity_ids: Sequence[str]) -> dict[str, T]:
+        """Get entities by ID in as few round trips as possible; missing IDs are left out."""
+        pass
+
     @abstractmethod
     async def update(self, entity: T) -> T:
         """Update an existing entity."""
@@ -32,7 +84,24 @@ class BaseRepository(ABC, Generic[T]):
         pass
 
     @abstractmethod
-    async def list(self, skip: int = 0, limit: int = 100, filters: dict | None = None) -> list[T]:
+    async def create_many(self, entities: list[T]) -> BulkWriteResult[T]:
+        """Create many entities, reporting failures per item."""
+        pass
+
+    @abstractmethod
+    async def update_many(self, entities: list[T]) -> BulkWriteResult[T]:
+        """Update many existing entities, reporting failures per item."""
+        pass
+
+    @abstractmethod
+    async def delete_many(self, entity_ids: list[str]) -> BulkWriteResult[str]:
+        """Delete many entities by ID, reporting failures per item."""
+        pass
+
+    @abstractmethod
+    async def list(
+        self, limit: int = 100, filters: dict | None = None, page_token: str | None = None
+    ) -> Page[T]:
         """List entities with pagination and filtering."""
         pass
 
@@ -63,8 +132,8 @@ class PatientRepository(BaseRepository[Patient]):
 
     @abstractmethod
     async def list_by_tenant(
-        self, tenant_id: str, skip: int = 0, limit: int = 100
-    ) -> list[Patient]:
+        self, tenant_id: str, limit: int = 100, page_token: str | None = None
+    ) -> Page[Patient]:
         """List patients for a tenant."""
         pass
 
@@ -79,15 +148,15 @@ class PractitionerRepository(BaseRepository[Practitioner]):
 
     @abstractmethod
     async def list_by_tenant(
-        self, tenant_id: str, skip: int = 0, limit: int = 100
-    ) -> list[Practitioner]:
+        self, tenant_id: str, limit: int = 100, page_token: str | None = None
+    ) -> Page[Practitioner]:
         """List practitioners for a tenant."""
         pass
 
     @abstractmethod
     async def list_by_specialty(
-        self, tenant_id: str, specialty: str, skip: int = 0, limit: int = 100
-    ) -> list[Practitioner]:
+        self, tenant_id: str, specialty: str, limit: int = 100, page_token: str | None = None
+    ) -> Page[Practitioner]:
         """List practitioners by specialty."""
         pass
 
@@ -97,15 +166,15 @@ class AppointmentRepository(BaseRepository[Appointment]):
 
     @abstractmethod
     async def list_by_patient(
-        self, tenant_id: str, patient_id: str, skip: int = 0, limit: int = 100
-    ) -> list[Appointment]:
+        self, tenant_id: str, patient_id: str, limit: int = 100, page_token: str | None = None
+    ) -> Page[Appointment]:
         """List appointments for a patient."""
         pass
 
     @abstractmethod
     async def list_by_practitioner(
-        self, tenant_id: str, practitioner_id: str, skip: int = 0, limit: int = 100
-    ) -> list[Appointment]:
+        self, tenant_id: str, practitioner_id: str, limit: int = 100, page_token: str | None = None
+    ) -> Page[Appointment]:
         """List appointments for a practitioner."""
         pass
 
@@ -115,15 +184,89 @@ class AppointmentRepository(BaseRepository[Appointment]):
         tenant_id: str,
         start_date: str,
         end_date: str,
-        skip: int = 0,
         limit: int = 100,
-    ) -> list[Appointment]:
+        page_token: str | None = None,
+    ) -> Page[Appointment]:
         """List appointments within a date range."""
         pass
 
+    @abstractmethod
+    async def count(self, filters: dict | None = None) -> int:
+        """Count appointments matching equality filters without reading them."""
+        pass
+
+    @abstractmethod
+    def iter_by_patient(
+        self, tenant_id: str, patient_id: str, page_size: int = 500
+    ) -> AsyncIterator[Appointment]:
+        """Yield every appointment for a patient, fetching ``page_size`` at a time."""
+        pass
+
+    @abstractmethod
+    def iter_by_practitioner(
+        self, tenant_id: str, practitioner_id: str, page_size: int = 500
+    ) -> AsyncIterator[Appointment]:
+        """Yield every appointment for a practitioner, fetching ``page_size`` at a time."""
+        pass
+
+    @abstractmethod
+    def iter_by_date_range(
+        self, tenant_id: str, start_date: str, end_date: str, page_size: int = 500
+    ) -> AsyncIterator[Appointment]:
+        """Yield every appointment within a date range, fetching ``page_size`` at a time.
+
+        Only one page is held in memory at a time, so exports of any size run
+        in constant memory.
+        """
+        pass
+
+    @abstractmethod
+    async def list_summaries(
+        self,
+        tenant_id: str,
+        fields: Sequence[str] | None = None,
+        filters: dict | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        limit: int = 100,
+        page_token: str | None = None,
+    ) -> Page[AppointmentSummary]:
+        """List appointment summaries, fetching only the requested fields.
+
+        ``fields`` defaults to ``AppointmentSummary.DEFAULT_FIELDS``; ``filters``
+        are equality filters (e.g. ``practitioner_id``) and the optional dates
+        bound ``start_time``.
+        """
+        pass
+
     @abstractmethod
     async def check_availability(
         self, tenant_id: str, practitioner_id: str, start_time: str, end_time: str
     ) -> bool:
         """Check if practitioner is available in the given time slot."""
         pass
+
+    @abstractmethod
+    async def check_patient_availability(
+        self, tenant_id: str, patient_id: str, start_time: str, end_time: str
+    ) -> bool:
+        """Check if patient has no other active appointment in the given time slot."""
+        pass
+
+
+class RecurringSeriesRepository(BaseRepository[RecurringSeries]):
+    """Recurring appointment series repository interface."""
+
+    @abstractmethod
+    async def list_by_practitioner(
+        self, tenant_id: str, practitioner_id: str, limit: int = 100, page_token: str | None = None
+    ) -> Page[RecurringSeries]:
+        """List active series for a practitioner."""
+        pass
+
+    @abstractmethod
+    async def list_by_patient(
+        self, tenant_id: str, patient_id: str, limit: int = 100, page_token: str | None = None
+    ) -> Page[RecurringSeries]:
+        """List active series for a patient."""
+        pass
@@ -1,8 +1,12 @@
 """Service port interfaces."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from typing import Any
 
+from adyela_api.config import AppointmentStatus
+from adyela_api.domain import Appointment
+
 
 class AuthenticationService(ABC):
     """Authentication service interface."""
@@ -82,3 +86,40 @@ class CacheService(ABC):
     async def exists(self, key: str) -> bool:
         """Check if key exists in cache."""
         pass
+
+
+class BookingService(ABC):
+    """Booking service interface."""
+
+    @abstractmethod
+    async def book(self, appointment: Appointment) -> Appointment:
+        """Atomically check the practitioner's schedule and create the appointment.
+
+        Raises ``BusinessRuleViolationError`` if the slot overlaps another
+        booking of the practitioner.
+        """
+        pass
+
+    @abstractmethod
+    async def record(self, appointment: Appointment) -> None:
+        """Add an appointment written without ``book`` to the schedule, without checks."""
+        pass
+
+    @abstractmethod
+    async def release(self, appointment: Appointment) -> None:
+        """Free a cancelled, rescheduled or deleted appointment's slot in the schedule."""
+        pass
+
+
+class AppointmentStatsService(ABC):
+    """Appointment statistics service interface."""
+
+    @abstractmethod
+    async def increment(self, tenant_id: str, deltas: Mapping[AppointmentStatus, int]) -> None:
+        """Add per-status deltas to a tenant's appointment counts."""
+        pass
+
+    @abstractmethod
+    async def status_counts(self, tenant_id: str) -> dict[AppointmentStatus, int]:
+        """Get a tenant's number of appointments in each status."""
+        pass
@@ -0,0 +1,19 @@
+"""Tenant of the request being served."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Set by the tenant middleware; adapters that partition data by tenant use it to
+# locate documents addressed only by ID
+current_tenant_id: ContextVar[str | None] = ContextVar("current_tenant_id", default=None)
+
+
+@contextmanager
+def tenant_scope(tenant_id: str) -> Iterator[None]:
+    """Act on behalf of a tenant outside a request, e.g. in a background job."""
+    token = current_tenant_id.set(tenant_id)
+    try:
+        yield
+    finally:
+        current_tenant_id.reset(token)
@@ -1,5 +1,7 @@
 """Appointment use cases."""
 
 from .create_appointment import CreateAppointmentUseCase
+from .create_recurring_series import CreateRecurringSeriesUseCase
+from .get_available_slots import GetAvailableSlotsUseCase
 
-__all__ = ["CreateAppointmentUseCase"]
+__all__ = ["CreateAppointmentUseCase", "CreateRecurringSeriesUseCase", "GetAvailableSlotsUseCase"]
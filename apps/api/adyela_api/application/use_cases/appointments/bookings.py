@@ -0,0 +1,83 @@
+"""Busy time of a practitioner or patient, shared by the booking use cases."""
+
+from datetime import datetime, timedelta
+
+from adyela_api.application.ports import AppointmentRepository, RecurringSeriesRepository
+from adyela_api.config.constants import (
+    ACTIVE_APPOINTMENT_STATUSES,
+    MAX_APPOINTMENT_DURATION_MINUTES,
+)
+from adyela_api.domain import Occurrence
+from adyela_api.domain.value_objects import DateTimeRange
+
+# Bookings are read a page of projected summaries at a time
+BOOKINGS_PAGE_SIZE = 500
+# A practitioner or patient has a handful of active series
+SERIES_PAGE_SIZE = 100
+
+
+async def active_bookings(
+    repository: AppointmentRepository,
+    tenant_id: str,
+    filters: dict[str, str],
+    start: datetime,
+    end: datetime,
+) -> list[DateTimeRange]:
+    """Active bookings matching ``filters`` that overlap ``[start, end)``, from summaries."""
+    # A booking starting up to the longest duration earlier can still overlap
+    earliest = start - timedelta(minutes=MAX_APPOINTMENT_DURATION_MINUTES)
+    bookings: list[DateTimeRange] = []
+    page_token = None
+    while True:
+        page = await repository.list_summaries(
+            tenant_id,
+            fields=["start_time", "end_time", "status"],
+            filters=filters,
+            start_date=earliest.isoformat(),
+            end_date=end.isoformat(),
+            limit=BOOKINGS_PAGE_SIZE,
+            page_token=page_token,
+        )
+        bookings.extend(
+            DateTimeRange(start=summary.start_time, end=summary.end_time)
+            for summary in page.items
+            if summary.status in ACTIVE_APPOINTMENT_STATUSES
+            and summary.start_time is not None
+            and summary.end_time is not None
+            and summary.end_time > start
+        )
+        page_token = page.next_page_token
+        if page_token is None:
+            return bookings
+
+
+async def series_occurrences(
+    repository: RecurringSeriesRepository,
+    tenant_id: str,
+    window: DateTimeRange,
+    *,
+    practitioner_id: str | None = None,
+    patient_id: str | None = None,
+) -> list[Occurrence]:
+    """Occurrences of a practitioner's or patient's active series that overlap ``window``.
+
+    Each series is expanded for the window only, never materialized whole.
+    """
+    occurrences: list[Occurrence] = []
+    page_token = None
+    while True:
+        if practitioner_id is not None:
+            page = await repository.list_by_practitioner(
+                tenant_id, practitioner_id, limit=SERIES_PAGE_SIZE, page_token=page_token
+            )
+        elif patient_id is not None:
+            page = await repository.list_by_patient(
+                tenant_id, patient_id, limit=SERIES_PAGE_SIZE, page_token=page_token
+            )
+        else:
+            raise TypeError("Pass a practitioner_id or a patient_id")
+        for series in page.items:
+            occurrences.extend(series.occurrences(window))
+        page_token = page.next_page_token
+        if page_token is None:
+            return sorted(occurrences, key=lambda occurrence: occurrence.schedule.start)
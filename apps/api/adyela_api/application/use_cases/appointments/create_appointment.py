@@ -2,7 +2,13 @@
 
 from datetime import datetime
 
-from adyela_api.application.ports import AppointmentRepository, PractitionerRepository
+from adyela_api.application.ports import (
+    AppointmentRepository,
+    BookingService,
+    PractitionerRepository,
+    RecurringSeriesRepository,
+)
+from adyela_api.application.use_cases.appointments.bookings import series_occurrences
 from adyela_api.config import AppointmentType
 from adyela_api.domain import Appointment, BusinessRuleViolationError
 from adyela_api.domain.value_objects import DateTimeRange, TenantId
@@ -15,9 +21,13 @@ class CreateAppointmentUseCase:
         self,
         appointment_repository: AppointmentRepository,
         practitioner_repository: PractitionerRepository,
+        booking_service: BookingService | None = None,
+        series_repository: RecurringSeriesRepository | None = None,
     ) -> None:
         self.appointment_repository = appointment_repository
         self.practitioner_repository = practitioner_repository
+        self.booking_service = booking_service
+        self.series_repository = series_repository
 
     async def execute(
         self,
@@ -39,7 +49,8 @@ class CreateAppointmentUseCase:
         if str(practitioner.tenant_id) != tenant_id:
             raise BusinessRuleViolationError("Practitioner does not belong to this tenant")
 
-        # Check practitioner availability
+        # Check practitioner availability. The booking service repeats the check
+        # atomically, but only against appointments its schedule documents know of
         is_available = await self.appointment_repository.check_availability(
             tenant_id=tenant_id,
             practitioner_id=practitioner_id,
@@ -52,10 +63,39 @@ class CreateAppointmentUseCase:
                 "Practitioner is not available in the selected time slot"
             )
 
+        # Prevent patient double-booking
+        is_patient_available = await self.appointment_repository.check_patient_availability(
+            tenant_id=tenant_id,
+            patient_id=patient_id,
+            start_time=start_time.isoformat(),
+            end_time=end_time.isoformat(),
+        )
+
+        if not is_patient_available:
+            raise BusinessRuleViolationError(
+                "Patient already has an appointment in the selected time slot"
+            )
+
+        # Recurring series only exist as rules; expand them for this slot
+        if self.series_repository is not None:
+            slot = DateTimeRange(start=start_time, end=end_time)
+            if await series_occurrences(
+                self.series_repository, tenant_id, slot, practitioner_id=practitioner_id
+            ):
+                raise BusinessRuleViolationError(
+                    "Practitioner is not available in the selected time slot"
+                )
+            if await series_occurrences(
+                self.series_repository, tenant_id, slot, patient_id=patient_id
+            ):
+                raise BusinessRuleViolationError(
+                    "Patient already has an appointment in the selected time slot"
+                )
+
         # Create appointment
         appointment = Appointment(
             id="",  # Will be generated by repository
-            tenant_id=TenantId(tenant_id),
+            tenant_id=TenantId.of(tenant_id),
             patient_id=patient_id,
             practitioner_id=practitioner_id,
             schedule=DateTimeRange(start=start_time, end=end_time),
@@ -64,6 +104,9 @@ class CreateAppointmentUseCase:
         )
 
         # Save appointment
+        if self.booking_service is not None:
+            return await self.booking_service.book(appointment)
+
         created_appointment = await self.appointment_repository.create(appointment)
 
         return created_appointment
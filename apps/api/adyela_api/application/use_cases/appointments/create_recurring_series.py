@@ -0,0 +1,117 @@
+"""Create recurring series use case."""
+
+import asyncio
+from datetime import datetime, timedelta
+
+from adyela_api.application.ports import (
+    AppointmentRepository,
+    PractitionerRepository,
+    RecurringSeriesRepository,
+)
+from adyela_api.application.use_cases.appointments.bookings import (
+    active_bookings,
+    series_occurrences,
+)
+from adyela_api.config import AppointmentType
+from adyela_api.config.constants import SERIES_CONFLICT_HORIZON_DAYS
+from adyela_api.domain import BusinessRuleViolationError, IntervalSet, RecurringSeries
+from adyela_api.domain.value_objects import DateTimeRange, TenantId
+
+
+class CreateRecurringSeriesUseCase:
+    """Use case for booking a recurring series of appointments as one stored rule."""
+
+    def __init__(
+        self,
+        appointment_repository: AppointmentRepository,
+        practitioner_repository: PractitionerRepository,
+        series_repository: RecurringSeriesRepository,
+    ) -> None:
+        self.appointment_repository = appointment_repository
+        self.practitioner_repository = practitioner_repository
+        self.series_repository = series_repository
+
+    async def execute(
+        self,
+        tenant_id: str,
+        patient_id: str,
+        practitioner_id: str,
+        recurrence: str,
+        first_start: datetime,
+        duration_minutes: int,
+        appointment_type: AppointmentType,
+        reason: str | None = None,
+    ) -> RecurringSeries:
+        """Execute the create recurring series use case.
+
+        Occurrences within ``SERIES_CONFLICT_HORIZON_DAYS`` of the first start
+        must not overlap the practitioner's or the patient's bookings and other
+        series; later ones are checked when they are booked against.
+        """
+        practitioner = await self.practitioner_repository.get_by_id(practitioner_id)
+        if not practitioner or not practitioner.is_active:
+            raise BusinessRuleViolationError("Practitioner not found or inactive")
+        if str(practitioner.tenant_id) != tenant_id:
+            raise BusinessRuleViolationError("Practitioner does not belong to this tenant")
+
+        series = RecurringSeries(
+            id="",  # Will be generated by repository
+            tenant_id=TenantId.of(tenant_id),
+            patient_id=patient_id,
+            practitioner_id=practitioner_id,
+            recurrence=recurrence,
+            first_start=first_start,
+            duration_minutes=duration_minutes,
+            appointment_type=appointment_type,
+            reason=reason,
+        )
+
+        horizon = DateTimeRange(
+            start=first_start, end=first_start + timedelta(days=SERIES_CONFLICT_HORIZON_DAYS)
+        )
+        busy = await self._busy(tenant_id, patient_id, practitioner_id, horizon)
+        conflicts = [
+            occurrence
+            for occurrence in series.occurrences(horizon)
+            if busy.overlaps(occurrence.schedule)
+        ]
+        if conflicts:
+            raise BusinessRuleViolationError(
+                f"{len(conflicts)} occurrences conflict with existing bookings, "
+                f"the first at {conflicts[0].schedule.start.isoformat()}"
+            )
+
+        return await self.series_repository.create(series)
+
+    async def _busy(
+        self, tenant_id: str, patient_id: str, practitioner_id: str, horizon: DateTimeRange
+    ) -> IntervalSet:
+        """Bookings and series occurrences of the practitioner and the patient."""
+        results = await asyncio.gather(
+            active_bookings(
+                self.appointment_repository,
+                tenant_id,
+                {"practitioner_id": practitioner_id},
+                horizon.start,
+                horizon.end,
+            ),
+            active_bookings(
+                self.appointment_repository,
+                tenant_id,
+                {"patient_id": patient_id},
+                horizon.start,
+                horizon.end,
+            ),
+            series_occurrences(
+                self.series_repository, tenant_id, horizon, practitioner_id=practitioner_id
+            ),
+            series_occurrences(self.series_repository, tenant_id, horizon, patient_id=patient_id),
+        )
+        practitioner_bookings, patient_bookings, *occurrences = results
+        return IntervalSet.of(
+            [
+                *practitioner_bookings,
+                *patient_bookings,
+                *(occurrence.schedule for found in occurrences for occurrence in found),
+            ]
+        )
@@ -0,0 +1,81 @@
+"""Get available slots use case."""
+
+from datetime import UTC, date, datetime, time, timedelta
+
+from adyela_api.application.ports import (
+    AppointmentRepository,
+    PractitionerRepository,
+    RecurringSeriesRepository,
+)
+from adyela_api.application.use_cases.appointments.bookings import (
+    active_bookings,
+    series_occurrences,
+)
+from adyela_api.config.constants import DEFAULT_WORKING_HOURS
+from adyela_api.domain import EntityNotFoundError, SlotGrid, WorkingHours
+from adyela_api.domain.value_objects import DateTimeRange
+
+
+class GetAvailableSlotsUseCase:
+    """Use case for listing a practitioner's free slots over several days."""
+
+    def __init__(
+        self,
+        appointment_repository: AppointmentRepository,
+        practitioner_repository: PractitionerRepository,
+        grid: SlotGrid | None = None,
+        series_repository: RecurringSeriesRepository | None = None,
+    ) -> None:
+        self.appointment_repository = appointment_repository
+        self.practitioner_repository = practitioner_repository
+        self.grid = grid or SlotGrid()
+        self.series_repository = series_repository
+
+    async def execute(
+        self,
+        tenant_id: str,
+        practitioner_id: str,
+        start_date: date,
+        days: int,
+        duration_minutes: int,
+        step_minutes: int | None = None,
+    ) -> dict[date, list[DateTimeRange]]:
+        """Execute the get available slots use case."""
+        practitioner = await self.practitioner_repository.get_by_id(practitioner_id)
+        if (
+            not practitioner
+            or not practitioner.is_active
+            or str(practitioner.tenant_id) != tenant_id
+        ):
+            raise EntityNotFoundError("Practitioner", practitioner_id)
+
+        window_start = datetime.combine(start_date, time(), UTC)
+        window_end = window_start + timedelta(days=days)
+        bookings = await active_bookings(
+            self.appointment_repository,
+            tenant_id,
+            {"practitioner_id": practitioner_id},
+            window_start,
+            window_end,
+        )
+        if self.series_repository is not None:
+            # Recurring series are expanded for this window only
+            occurrences = await series_occurrences(
+                self.series_repository,
+                tenant_id,
+                DateTimeRange(start=window_start, end=window_end),
+                practitioner_id=practitioner_id,
+            )
+            bookings.extend(occurrence.schedule for occurrence in occurrences)
+        working_hours = practitioner.working_hours or WorkingHours.weekdays(
+            *map(time.fromisoformat, DEFAULT_WORKING_HOURS)
+        )
+        return self.grid.free_slots(
+            working_hours,
+            bookings,
+            start_date,
+            days,
+            duration_minutes,
+            step_minutes=step_minutes,
+            not_before=datetime.now(UTC),
+        )
@@ -14,6 +14,14 @@ class AppointmentStatus(str, Enum):
     NO_SHOW = "no_show"
 
 
+# Statuses that hold a practitioner's (and patient's) time slot
+ACTIVE_APPOINTMENT_STATUSES = (
+    AppointmentStatus.SCHEDULED,
+    AppointmentStatus.CONFIRMED,
+    AppointmentStatus.IN_PROGRESS,
+)
+
+
 class NotificationType(str, Enum):
     """Notification type enumeration."""
 
@@ -48,15 +56,26 @@ COLLECTIONS = {
     "patients": "patients",
     "practitioners": "practitioners",
     "appointments": "appointments",
+    "recurring_series": "recurring_series",
+    "practitioner_schedules": "practitioner_schedules",
+    "appointment_stats": "appointment_stats",
+    "tenant_partitions": "tenant_partitions",
+    # Lookup keys: {tenant_id}:{value} -> entity ID (tenant names are global)
+    "patient_email": "patient_email",
+    "patient_medical_record": "patient_medical_record",
+    "practitioner_email": "practitioner_email",
+    "tenant_name": "tenant_name",
     "notifications": "notifications",
     "audit_logs": "audit_logs",
 }
 
-# Cache keys
+# Cache keys; entities owned by a tenant are keyed within it
 CACHE_KEYS = {
     "tenant": "tenant:{tenant_id}",
     "user": "user:{user_id}",
-    "appointment": "appointment:{appointment_id}",
+    "appointment": "appointment:{tenant_id}:{appointment_id}",
+    "patient": "patient:{tenant_id}:{patient_id}",
+    "practitioner": "practitioner:{tenant_id}:{practitioner_id}",
 }
 
 # Cache TTL (in seconds)
@@ -64,12 +83,17 @@ CACHE_TTL = {
     "tenant": 3600,  # 1 hour
     "user": 1800,  # 30 minutes
     "appointment": 300,  # 5 minutes
+    "patient": 900,  # 15 minutes
+    "practitioner": 1800,  # 30 minutes
 }
 
 # Pagination
 DEFAULT_PAGE_SIZE = 20
 MAX_PAGE_SIZE = 100
 
+# Interned value objects (tenant IDs, emails, phone numbers) kept per cache
+INTERNED_VALUE_OBJECTS = 16_384
+
 # Date/Time formats
 DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
 DATE_FORMAT = "%Y-%m-%d"
@@ -80,6 +104,14 @@ MIN_APPOINTMENT_DURATION_MINUTES = 15
 MAX_APPOINTMENT_DURATION_MINUTES = 240
 DEFAULT_APPOINTMENT_DURATION_MINUTES = 30
 
+# Availability
+SLOT_GRID_MINUTES = 5
+MAX_AVAILABILITY_DAYS = 14
+# UTC hours, Monday to Friday, for practitioners without working hours
+DEFAULT_WORKING_HOURS = ("09:00", "17:00")
+# Days of a new recurring series checked against existing bookings
+SERIES_CONFLICT_HORIZON_DAYS = 90
+
 # Video call
 VIDEO_CALL_MAX_DURATION_MINUTES = 120
 VIDEO_CALL_ROOM_PREFIX = "adyela"
@@ -66,6 +66,24 @@ class Settings(BaseSettings):
 
     # Firestore
     firestore_emulator_host: str | None = None
+    # gRPC keepalive of the process-wide channels, and the startup warm-up budget and retry delay
+    firestore_keepalive_time_ms: int = 30000
+    firestore_keepalive_timeout_ms: int = 10000
+    firestore_warmup_timeout_seconds: float = 10
+    firestore_warmup_retry_seconds: float = 5
+    # "memory" serves repositories from process memory, for load tests without Firestore
+    repository_backend: Literal["firestore", "memory"] = "firestore"
+    availability_index_ttl_seconds: int = 300
+    availability_index_max_keys: int = 10000
+    count_cache_ttl_seconds: int = 60
+    stats_counter_shards: int = 10
+    stats_cache_ttl_seconds: int = 10
+    # Mirror today's appointments in process via snapshot listeners (one per active tenant)
+    today_view_enabled: bool = False
+    # Layout of appointments for tenants without a stored partition state
+    default_partition_layout: Literal["flat", "subcollection", "database"] = "flat"
+    tenant_database_template: str = "tenant-{tenant_id}"
+    partition_refresh_seconds: int = 60
 
     # Redis
     redis_url: str = "redis://localhost:6379/0"
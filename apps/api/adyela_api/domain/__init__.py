@@ -1,6 +1,24 @@
 """Domain layer."""
 
-from .entities import Appointment, Patient, Practitioner, Tenant
+from .codecs import (
+    APPOINTMENT_CODEC,
+    PATIENT_CODEC,
+    PRACTITIONER_CODEC,
+    RECURRING_SERIES_CODEC,
+    TENANT_CODEC,
+    EntityCodec,
+    codec_for,
+)
+from .entities import (
+    Appointment,
+    AppointmentSummary,
+    Occurrence,
+    Patient,
+    Practitioner,
+    RecurringSeries,
+    Tenant,
+)
+from .events import AppointmentStatusChanged, status_deltas
 from .exceptions import (
     AuthenticationError,
     AuthorizationError,
@@ -10,7 +28,17 @@ from .exceptions import (
     EntityNotFoundError,
     ValidationError,
 )
-from .value_objects import Address, DateTimeRange, Email, PhoneNumber, TenantId
+from .slot_grid import SlotGrid
+from .value_objects import (
+    Address,
+    DateTimeRange,
+    Email,
+    IntervalSet,
+    PhoneNumber,
+    SeriesExceptions,
+    TenantId,
+    WorkingHours,
+)
 
 __all__ = [
     # Entities
@@ -18,12 +46,31 @@ __all__ = [
     "Patient",
     "Practitioner",
     "Appointment",
+    "AppointmentSummary",
+    "RecurringSeries",
+    "Occurrence",
+    # Codecs
+    "EntityCodec",
+    "codec_for",
+    "APPOINTMENT_CODEC",
+    "PATIENT_CODEC",
+    "PRACTITIONER_CODEC",
+    "TENANT_CODEC",
+    "RECURRING_SERIES_CODEC",
+    # Availability
+    "SlotGrid",
+    # Events
+    "AppointmentStatusChanged",
+    "status_deltas",
     # Value Objects
     "Email",
     "PhoneNumber",
     "TenantId",
     "Address",
     "DateTimeRange",
+    "IntervalSet",
+    "WorkingHours",
+    "SeriesExceptions",
     # Exceptions
     "DomainException",
     "EntityNotFoundError",
@@ -0,0 +1,319 @@
+"""Entity serializers generated once per entity type."""
+
+import dataclasses
+import types
+from collections.abc import Callable, Iterable, Mapping
+from datetime import date, datetime
+from enum import Enum
+from functools import cache, lru_cache
+from typing import Any, Generic, TypeVar, Union, cast, get_args, get_origin, get_type_hints
+
+from adyela_api.config.constants import INTERNED_VALUE_OBJECTS
+
+from .entities import Appointment, Patient, Practitioner, RecurringSeries, Tenant
+
+E = TypeVar("E")
+V = TypeVar("V")
+
+# Field types stored as they are
+PLAIN_TYPES = (str, int, float, bool, dict, list, Any)
+
+
+class _EnumLookup(dict[Any, Enum]):
+    """Value-to-member map that falls back to the enum for unknown values."""
+
+    def __init__(self, enum: type[Enum]) -> None:
+        super().__init__({member.value: member for member in enum})
+        self.enum = enum
+
+    def __missing__(self, value: Any) -> Enum:
+        # Raises ValueError for invalid values, as the enum constructor does
+        return self.enum(value)
+
+
+# Builds a Python expression from a source expression and a spare variable name
+Builder = Callable[[str, str], str]
+
+
+def _same(value: str, _: str) -> str:
+    return value
+
+
+def _call(function: str) -> Builder:
+    return lambda value, _: f"{function}({value})"
+
+
+def _optional(build: Builder) -> Builder:
+    """Apply a builder only to values that are not ``None``."""
+    return lambda value, name: f"({build(name, '_')} if ({name} := {value}) is not None else None)"
+
+
+def _setter(cls: type, name: str) -> Callable[[Any, Any], None]:
+    """Function storing a field directly, bypassing frozen dataclasses' ``__setattr__``."""
+    descriptor = vars(cls).get(name)
+    if hasattr(descriptor, "__set__"):
+        # Slot member descriptor
+        return cast(Callable[[Any, Any], None], descriptor.__set__)  # type: ignore[union-attr]
+    return lambda instance, value: object.__setattr__(instance, name, value)
+
+
+def trusted(cls: type[V]) -> Callable[..., V]:
+    """Constructor of a dataclass that skips ``__init__`` and validation.
+
+    Takes the fields positionally. Only for values that were validated
+    before they were stored.
+    """
+    setters = [_setter(cls, field.name) for field in dataclasses.fields(cls)]  # type: ignore[arg-type]
+    new = object.__new__
+    if len(setters) == 1:
+        (set_value,) = setters
+
+        def build_one(value: Any) -> V:
+            instance = new(cls)
+            set_value(instance, value)
+            return instance
+
+        return build_one
+
+    def build(*values: Any) -> V:
+        instance = new(cls)
+        for set_value, value in zip(setters, values, strict=True):
+            set_value(instance, value)
+        return instance
+
+    return build
+
+
+@cache
+def _interned_trusted(cls: type[V]) -> Callable[[Any], V]:
+    """Trusted single-value constructor sharing one instance per stored value.
+
+    The bounded counterpart of the validating ``of`` interning for hydration.
+    """
+    return lru_cache(maxsize=INTERNED_VALUE_OBJECTS)(trusted(cls))
+
+
+class EntityCodec(Generic[E]):
+    """Encode and decode one entity type with functions compiled for its fields.
+
+    The result matches the entity's ``to_dict`` and ``from_dict``, which
+    remain the reference implementation, but each direction is one
+    straight-line function: the constructor is called with positional
+    arguments, converters are bound as globals and enums are resolved from a
+    value map instead of calling the enum class. ``encode_many`` and
+    ``decode_many`` run the same code inside a single list comprehension.
+
+    ``hydrate`` and ``hydrate_many`` are the trusted path for data read back
+    from storage, which was validated when it was written: they allocate the
+    entity with ``object.__new__`` and fill its slots directly, so neither
+    ``__post_init__`` business rules (an appointment in the past is valid
+    history) nor value-object validation run. User input must go through
+    ``decode`` or the entity constructor.
+
+    Stored fields are required unless listed in ``optional`` with the
+    default used when they are missing. ``ranges`` stores a
+    ``DateTimeRange`` field as two ISO timestamps under the given keys.
+    """
+
+    def __init__(
+        self,
+        entity_type: type[E],
+        optional: Mapping[str, Any] | None = None,
+        ranges: Mapping[str, tuple[str, str]] | None = None,
+    ) -> None:
+        self.entity_type = entity_type
+        self.optional = dict(optional or {})
+        self.ranges = dict(ranges or {})
+        self._globals: dict[str, Any] = {
+            "__builtins__": __builtins__,
+            "_entity": entity_type,
+            "_datetime": datetime.fromisoformat,
+            "_date": date.fromisoformat,
+            "_new": object.__new__,
+        }
+        self.source = self._generate()
+        namespace: dict[str, Any] = {}
+        exec(
+            compile(self.source, f"<codec {entity_type.__name__}>", "exec"),
+            self._globals,
+            namespace,
+        )
+        self.encode: Callable[[E], dict[str, Any]] = namespace["encode"]
+        self.decode: Callable[[dict[str, Any]], E] = namespace["decode"]
+        self._encode_many: Callable[[Iterable[E]], list[dict[str, Any]]] = namespace["encode_many"]
+        self._decode_many: Callable[[Iterable[dict[str, Any]]], list[E]] = namespace["decode_many"]
+        self.hydrate: Callable[[dict[str, Any]], E] = namespace["hydrate"]
+        self._hydrate_many: Callable[[Iterable[dict[str, Any]]], list[E]] = namespace[
+            "hydrate_many"
+        ]
+
+    def encode_many(self, entities: Iterable[E]) -> list[dict[str, Any]]:
+        """Encode entities in one pass."""
+        return self._encode_many(entities)
+
+    def decode_many(self, rows: Iterable[dict[str, Any]]) -> list[E]:
+        """Decode stored dictionaries in one pass."""
+        return self._decode_many(rows)
+
+    def hydrate_many(self, rows: Iterable[dict[str, Any]]) -> list[E]:
+        """Hydrate stored dictionaries in one pass, without validation."""
+        return self._hydrate_many(rows)
+
+    def _generate(self) -> str:
+        hints = get_type_hints(self.entity_type)
+        encoded: list[str] = []
+        arguments: list[str] = []
+        assignments: list[str] = []
+        frozen = self.entity_type.__dataclass_params__.frozen  # type: ignore[attr-defined]
+        for index, field in enumerate(dataclasses.fields(self.entity_type)):  # type: ignore[arg-type]
+            if frozen:
+                setter = self._bind(f"_set{index}", _setter(self.entity_type, field.name))
+                store = f"{setter}(e, {{}})"
+            else:
+                # Plain stores are cheaper than descriptor calls and run no validation either
+                store = f"e.{field.name} = {{}}"
+            if not field.init:
+                if field.default_factory is not dataclasses.MISSING:
+                    factory = self._bind(f"_factory{index}", field.default_factory)
+                    assignments.append(store.format(f"{factory}()"))
+                else:
+                    default = self._bind(f"_default{index}", field.default)
+                    assignments.append(store.format(default))
+                continue
+            hint = hints[field.name]
+            if field.name in self.ranges:
+                start_key, end_key = self.ranges[field.name]
+                range_type = self._bind(f"_range{index}", hint)
+                trusted_range = self._bind(f"_trusted{index}", trusted(hint))
+                attribute = f"e.{field.name}"
+                encoded.append(f"{start_key!r}: {attribute}.start.isoformat()")
+                encoded.append(f"{end_key!r}: {attribute}.end.isoformat()")
+                bounds = f"_datetime(data[{start_key!r}]), _datetime(data[{end_key!r}])"
+                arguments.append(f"{range_type}({bounds})")
+                assignments.append(store.format(f"{trusted_range}({bounds})"))
+                continue
+
+            if field.name in self.optional:
+                source = f"data.get({field.name!r}, {self.optional[field.name]!r})"
+            else:
+                source = f"data[{field.name!r}]"
+            encode, decode, hydrate = self._converters(index, hint)
+            encoded.append(f"{field.name!r}: {encode(f'e.{field.name}', f'_e{index}')}")
+            arguments.append(decode(source, f"_d{index}"))
+            assignments.append(store.format(hydrate(source, f"_d{index}")))
+
+        body = ", ".join(encoded)
+        call = f"_entity({', '.join(arguments)})"
+        return "\n".join(
+            [
+                "def encode(e):",
+                f"    return {{{body}}}",
+                "def encode_many(entities):",
+                f"    return [{{{body}}} for e in entities]",
+                "def decode(data):",
+                f"    return {call}",
+                "def decode_many(rows):",
+                f"    return [{call} for data in rows]",
+                "def hydrate(data):",
+                "    e = _new(_entity)",
+                *(f"    {assignment}" for assignment in assignments),
+                "    return e",
+                "def hydrate_many(rows):",
+                "    entities = []",
+                "    append = entities.append",
+                "    for data in rows:",
+                "        e = _new(_entity)",
+                *(f"        {assignment}" for assignment in assignments),
+                "        append(e)",
+                "    return entities",
+            ]
+        )
+
+    def _converters(self, index: int, hint: Any) -> tuple[Builder, Builder, Builder]:
+        """Encode, decode and trusted decode expression builders for a field type."""
+        if get_origin(hint) in (Union, types.UnionType) and type(None) in get_args(hint):
+            (inner,) = [arg for arg in get_args(hint) if arg is not type(None)]
+            builders = self._converters(index, inner)
+            if all(build("x", "_") == "x" for build in builders):
+                return builders
+            return tuple(_optional(build) for build in builders)  # type: ignore[return-value]
+
+        origin = get_origin(hint) or hint
+        if origin in PLAIN_TYPES:
+            return _same, _same, _same
+        if hint is datetime:
+            parse = _call("_datetime")
+            return (lambda value, _: f"{value}.isoformat()"), parse, parse
+        if hint is date:
+            parse = _call("_date")
+            return (lambda value, _: f"{value}.isoformat()"), parse, parse
+        if isinstance(hint, type) and issubclass(hint, Enum):
+            members = self._bind(f"_members{index}", _EnumLookup(hint))
+            values = self._bind(f"_values{index}", {member: member.value for member in hint})
+            lookup = lambda value, _: f"{members}[{value}]"  # noqa: E731
+            return (lambda value, _: f"{values}[{value}]"), lookup, lookup
+        if dataclasses.is_dataclass(hint) and hasattr(hint, "from_dict"):
+            nested = self._bind(f"_nested{index}", hint)
+            parse = _call(f"{nested}.from_dict")
+            return (lambda value, _: f"{value}.to_dict()"), parse, parse
+        if (
+            isinstance(hint, type)
+            and dataclasses.is_dataclass(hint)
+            and len(dataclasses.fields(hint)) == 1
+        ):
+            # Single-value value objects are stored as their string form, and
+            # interned when they are repeated across many rows
+            of = getattr(hint, "of", None)
+            wrapper = self._bind(f"_value{index}", of or hint)
+            trusted_wrapper = self._bind(
+                f"_trusted{index}",
+                _interned_trusted(hint) if of is not None else trusted(hint),
+            )
+            return (
+                (lambda value, _: f"str({value})"),
+                _call(wrapper),
+                _call(trusted_wrapper),
+            )
+        raise TypeError(f"No codec for {self.entity_type.__name__} field of type {hint!r}")
+
+    def _bind(self, name: str, value: Any) -> str:
+        self._globals[name] = value
+        return name
+
+
+APPOINTMENT_CODEC = EntityCodec(
+    Appointment,
+    optional={"reason": None, "notes": None, "video_room_url": None, "metadata": {}},
+    ranges={"schedule": ("start_time", "end_time")},
+)
+PATIENT_CODEC = EntityCodec(
+    Patient,
+    optional={"gender": None, "medical_record_number": None, "is_active": True, "metadata": {}},
+)
+PRACTITIONER_CODEC = EntityCodec(
+    Practitioner,
+    optional={
+        "specialty": None,
+        "license_number": None,
+        "is_active": True,
+        "working_hours": None,
+        "metadata": {},
+    },
+)
+TENANT_CODEC = EntityCodec(Tenant, optional={"is_active": True, "settings": {}})
+RECURRING_SERIES_CODEC = EntityCodec(
+    RecurringSeries, optional={"reason": None, "is_active": True, "metadata": {}}
+)
+
+CODECS: dict[type, EntityCodec[Any]] = {
+    Appointment: APPOINTMENT_CODEC,
+    Patient: PATIENT_CODEC,
+    Practitioner: PRACTITIONER_CODEC,
+    Tenant: TENANT_CODEC,
+    RecurringSeries: RECURRING_SERIES_CODEC,
+}
+
+
+def codec_for(entity_type: type[E]) -> EntityCodec[E]:
+    """Get the codec of an entity type."""
+    return CODECS[entity_type]
@@ -1,8 +1,17 @@
 """Domain entities."""
 
-from .appointment import Appointment
+from .appointment import Appointment, AppointmentSummary
 from .patient import Patient
 from .practitioner import Practitioner
+from .recurring_series import Occurrence, RecurringSeries
 from .tenant import Tenant
 
-__all__ = ["Tenant", "Patient", "Practitioner", "Appointment"]
+__all__ = [
+    "Tenant",
+    "Patient",
+    "Practitioner",
+    "Appointment",
+    "AppointmentSummary",
+    "RecurringSeries",
+    "Occurrence",
+]
@@ -2,14 +2,15 @@
 
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, ClassVar
 
 from adyela_api.config import AppointmentStatus, AppointmentType
+from adyela_api.domain.events import AppointmentStatusChanged
 from adyela_api.domain.exceptions import BusinessRuleViolationError
 from adyela_api.domain.value_objects import DateTimeRange, TenantId
 
 
-@dataclass
+@dataclass(slots=True)
 class Appointment:
     """Appointment entity."""
 
@@ -26,27 +27,46 @@ class Appointment:
     created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
     updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
     metadata: dict[str, Any] = field(default_factory=dict)
+    # Status changes not yet handed to the repository; never persisted
+    events: list[AppointmentStatusChanged] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Validate appointment after initialization."""
         if self.schedule.start < datetime.now(UTC):
             raise BusinessRuleViolationError("Cannot create appointment in the past")
 
+    def pull_events(self) -> list[AppointmentStatusChanged]:
+        """Return and clear the status changes recorded since the last pull."""
+        events, self.events = self.events, []
+        return events
+
+    def _transition(self, status: AppointmentStatus) -> None:
+        self.events.append(
+            AppointmentStatusChanged(
+                appointment_id=self.id,
+                tenant_id=str(self.tenant_id),
+                previous_status=self.status,
+                new_status=status,
+            )
+        )
+        self.status = status
+        self.updated_at = datetime.now(UTC)
+
     def confirm(self) -> None:
         """Confirm the appointment."""
         if self.status != AppointmentStatus.SCHEDULED:
             raise BusinessRuleViolationError(
                 f"Cannot confirm appointment with status {self.status}"
             )
-        self.status = AppointmentStatus.CONFIRMED
-        self.updated_at = datetime.now(UTC)
+        self._transition(AppointmentStatus.CONFIRMED)
 
     def start(self) -> None:
         """Start the appointment."""
         if self.status not in [AppointmentStatus.SCHEDULED, AppointmentStatus.CONFIRMED]:
             raise BusinessRuleViolationError(f"Cannot start appointment with status {self.status}")
-        self.status = AppointmentStatus.IN_PROGRESS
-        self.updated_at = datetime.now(UTC)
+        self._transition(AppointmentStatus.IN_PROGRESS)
 
     def complete(self, notes: str | None = None) -> None:
         """Complete the appointment."""
@@ -54,17 +74,15 @@ class Appointment:
             raise BusinessRuleViolationError(
                 f"Cannot complete appointment with status {self.status}"
             )
-        self.status = AppointmentStatus.COMPLETED
         if notes:
             self.notes = notes
-        self.updated_at = datetime.now(UTC)
+        self._transition(AppointmentStatus.COMPLETED)
 
     def cancel(self) -> None:
         """Cancel the appointment."""
         if self.status in [AppointmentStatus.COMPLETED, AppointmentStatus.CANCELLED]:
             raise BusinessRuleViolationError(f"Cannot cancel appointment with status {self.status}")
-        self.status = AppointmentStatus.CANCELLED
-        self.updated_at = datetime.now(UTC)
+        self._transition(AppointmentStatus.CANCELLED)
 
     def mark_no_show(self) -> None:
         """Mark appointment as no-show."""
@@ -72,8 +90,7 @@ class Appointment:
             raise BusinessRuleViolationError(
                 f"Cannot mark as no-show appointment with status {self.status}"
             )
-        self.status = AppointmentStatus.NO_SHOW
-        self.updated_at = datetime.now(UTC)
+        self._transition(AppointmentStatus.NO_SHOW)
 
     def set_video_room(self, room_url: str) -> None:
         """Set video room URL."""
@@ -124,7 +141,7 @@ class Appointment:
         """Create from dictionary."""
         return cls(
             id=data["id"],
-            tenant_id=TenantId(data["tenant_id"]),
+            tenant_id=TenantId.of(data["tenant_id"]),
             patient_id=data["patient_id"],
             practitioner_id=data["practitioner_id"],
             schedule=DateTimeRange(
@@ -140,3 +157,58 @@ class Appointment:
             updated_at=datetime.fromisoformat(data["updated_at"]),
             metadata=data.get("metadata", {}),
         )
+
+
+@dataclass(frozen=True, slots=True)
+class AppointmentSummary:
+    """Lightweight, read-only projection of an appointment for list views.
+
+    Built from a projected document, so only the requested fields are set and
+    the rest are ``None``. Notes, reason and metadata are never loaded.
+    """
+
+    id: str
+    tenant_id: str | None = None
+    patient_id: str | None = None
+    practitioner_id: str | None = None
+    start_time: datetime | None = None
+    end_time: datetime | None = None
+    appointment_type: AppointmentType | None = None
+    status: AppointmentStatus | None = None
+
+    # Storage fields a summary can be projected from
+    FIELDS: ClassVar[frozenset[str]] = frozenset(
+        {
+            "tenant_id",
+            "patient_id",
+            "practitioner_id",
+            "start_time",
+            "end_time",
+            "appointment_type",
+            "status",
+        }
+    )
+    DEFAULT_FIELDS: ClassVar[tuple[str, ...]] = (
+        "start_time",
+        "end_time",
+        "status",
+        "practitioner_id",
+    )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "AppointmentSummary":
+        """Create from a (possibly projected) dictionary."""
+        start_time = data.get("start_time")
+        end_time = data.get("end_time")
+        appointment_type = data.get("appointment_type")
+        status = data.get("status")
+        return cls(
+            id=data["id"],
+            tenant_id=data.get("tenant_id"),
+            patient_id=data.get("patient_id"),
+            practitioner_id=data.get("practitioner_id"),
+            start_time=datetime.fromisoformat(start_time) if start_time else None,
+            end_time=datetime.fromisoformat(end_time) if end_time else None,
+            appointment_type=AppointmentType(appointment_type) if appointment_type else None,
+            status=AppointmentStatus(status) if status else None,
+        )
@@ -7,7 +7,7 @@ from typing import Any
 from adyela_api.domain.value_objects import Email, PhoneNumber, TenantId
 
 
-@dataclass
+@dataclass(slots=True)
 class Patient:
     """Patient entity."""
 
@@ -78,11 +78,11 @@ class Patient:
         """Create from dictionary."""
         return cls(
             id=data["id"],
-            tenant_id=TenantId(data["tenant_id"]),
+            tenant_id=TenantId.of(data["tenant_id"]),
             first_name=data["first_name"],
             last_name=data["last_name"],
-            email=Email(data["email"]),
-            phone=PhoneNumber(data["phone"]),
+            email=Email.of(data["email"]),
+            phone=PhoneNumber.of(data["phone"]),
             date_of_birth=date.fromisoformat(data["date_of_birth"]),
             gender=data.get("gender"),
             medical_record_number=data.get("medical_record_number"),
@@ -5,10 +5,10 @@ from datetime import datetime
 from typing import Any
 
 from adyela_api.config import UserRole
-from adyela_api.domain.value_objects import Email, PhoneNumber, TenantId
+from adyela_api.domain.value_objects import Email, PhoneNumber, TenantId, WorkingHours
 
 
-@dataclass
+@dataclass(slots=True)
 class Practitioner:
     """Practitioner entity (doctor, nurse, etc.)."""
 
@@ -22,6 +22,8 @@ class Practitioner:
     specialty: str | None = None
     license_number: str | None = None
     is_active: bool = True
+    # UTC weekly hours; None means DEFAULT_WORKING_HOURS on weekdays
+    working_hours: WorkingHours | None = None
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: datetime = field(default_factory=datetime.utcnow)
     metadata: dict[str, Any] = field(default_factory=dict)
@@ -63,6 +65,7 @@ class Practitioner:
             "specialty": self.specialty,
             "license_number": self.license_number,
             "is_active": self.is_active,
+            "working_hours": self.working_hours.to_dict() if self.working_hours else None,
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
             "metadata": self.metadata,
@@ -73,15 +76,18 @@ class Practitioner:
         """Create from dictionary."""
         return cls(
             id=data["id"],
-            tenant_id=TenantId(data["tenant_id"]),
+            tenant_id=TenantId.of(data["tenant_id"]),
             first_name=data["first_name"],
             last_name=data["last_name"],
-            email=Email(data["email"]),
-            phone=PhoneNumber(data["phone"]),
+            email=Email.of(data["email"]),
+            phone=PhoneNumber.of(data["phone"]),
             role=UserRole(data["role"]),
             specialty=data.get("specialty"),
             license_number=data.get("license_number"),
             is_active=data.get("is_active", True),
+            working_hours=(
+                WorkingHours.from_dict(data["working_hours"]) if data.get("working_hours") else None
+            ),
             created_at=datetime.fromisoformat(data["created_at"]),
             updated_at=datetime.fromisoformat(data["updated_at"]),
             metadata=data.get("metadata", {}),
@@ -0,0 +1,234 @@
+"""Recurring appointment series entity."""
+
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+from typing import Any
+
+from dateutil.rrule import rrule, rrulestr
+
+from adyela_api.config import AppointmentType
+from adyela_api.config.constants import (
+    MAX_APPOINTMENT_DURATION_MINUTES,
+    MIN_APPOINTMENT_DURATION_MINUTES,
+)
+from adyela_api.domain.exceptions import BusinessRuleViolationError, ValidationError
+from adyela_api.domain.value_objects import DateTimeRange, SeriesExceptions, TenantId
+
+# Fixed-length frequencies, whose rules can skip whole periods unchanged
+_PERIODS = {"DAILY": timedelta(days=1), "WEEKLY": timedelta(weeks=1)}
+
+
+@dataclass(frozen=True, slots=True)
+class _ParsedRule:
+    """A parsed RRULE with the parts it was parsed from.
+
+    dateutil has no public accessors for the parts of a parsed rule, so they
+    are read from the RRULE string itself.
+    """
+
+    rule: rrule
+    freq: str
+    count: int | None
+    interval: int
+
+
+@lru_cache(maxsize=1024)
+def _parse_rule(recurrence: str, first_start: datetime) -> _ParsedRule:
+    """Parse an RRULE once per rule and first start; every hydrated copy shares it."""
+    if "DTSTART" in recurrence.upper():
+        raise ValidationError("The recurrence rule must not set DTSTART")
+    try:
+        rule = rrulestr(recurrence, dtstart=first_start)
+    except (ValueError, TypeError) as e:
+        raise ValidationError(f"Invalid recurrence rule: {recurrence}") from e
+    if not isinstance(rule, rrule):
+        # RDATE/EXDATE lines make a set; single exceptions are kept in SeriesExceptions
+        raise ValidationError(f"Invalid recurrence rule: {recurrence}")
+    parts = _rule_parts(recurrence)
+    freq = parts["FREQ"]
+    count = int(parts["COUNT"]) if "COUNT" in parts else None
+    if freq in _PERIODS and count:
+        # A COUNT is counted from the first start; ending at the last occurrence
+        # instead lets the rule be fast-forwarded
+        rule = rule.replace(count=None, until=rule[-1])
+        count = None
+    return _ParsedRule(rule, freq, count, int(parts.get("INTERVAL", 1)))
+
+
+def _rule_parts(recurrence: str) -> dict[str, str]:
+    """Split a single RRULE, as accepted by ``rrulestr``, into its ``NAME=value`` parts."""
+    text = recurrence.strip().upper().removeprefix("RRULE:")
+    return dict(part.split("=", 1) for part in text.split(";") if "=" in part)
+
+
+@dataclass(frozen=True, slots=True)
+class Occurrence:
+    """One expanded occurrence of a recurring series.
+
+    ``original_start`` identifies the occurrence within its series; it differs
+    from ``schedule.start`` when the occurrence was moved.
+    """
+
+    series_id: str
+    original_start: datetime
+    schedule: DateTimeRange
+
+    @property
+    def is_moved(self) -> bool:
+        """Check if the occurrence was moved from its original slot."""
+        return self.schedule.start != self.original_start
+
+
+@dataclass(slots=True)
+class RecurringSeries:
+    """Recurring appointment series, stored once and expanded per queried window.
+
+    ``recurrence`` is an RFC 5545 RRULE (e.g. ``FREQ=WEEKLY;BYDAY=MO,TH;COUNT=12``)
+    whose occurrences start at ``first_start`` and are computed in its time
+    zone, UTC throughout the API.
+    """
+
+    id: str
+    tenant_id: TenantId
+    patient_id: str
+    practitioner_id: str
+    recurrence: str
+    first_start: datetime
+    duration_minutes: int
+    appointment_type: AppointmentType
+    reason: str | None = None
+    exceptions: SeriesExceptions = field(default_factory=SeriesExceptions)
+    is_active: bool = True
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        """Validate series after initialization."""
+        if self.first_start.tzinfo is None:
+            raise ValidationError("The first start of a series must be timezone-aware")
+        if not (
+            MIN_APPOINTMENT_DURATION_MINUTES
+            <= self.duration_minutes
+            <= MAX_APPOINTMENT_DURATION_MINUTES
+        ):
+            raise ValidationError(f"Invalid series duration: {self.duration_minutes} minutes")
+        _parse_rule(self.recurrence, self.first_start)
+        if self.first_start < datetime.now(UTC):
+            raise BusinessRuleViolationError("Cannot create series starting in the past")
+
+    @property
+    def duration(self) -> timedelta:
+        """Get the length of each occurrence."""
+        return timedelta(minutes=self.duration_minutes)
+
+    def _starts_after(self, instant: datetime) -> Iterator[datetime]:
+        """Original occurrence starts after ``instant``, generated lazily.
+
+        Daily and weekly rules are fast-forwarded by whole periods to
+        ``instant``, so a window far into a series does not walk every earlier
+        occurrence.
+        """
+        parsed = _parse_rule(self.recurrence, self.first_start)
+        rule = parsed.rule
+        period = _PERIODS.get(parsed.freq)
+        if period is not None and parsed.count is None and instant > self.first_start:
+            step = period * parsed.interval
+            skipped = (instant - self.first_start) // step
+            if skipped:
+                rule = rule.replace(dtstart=self.first_start + skipped * step)
+        return rule.xafter(instant)
+
+    def occurrences(self, window: DateTimeRange) -> list[Occurrence]:
+        """Occurrences overlapping ``window`` in start order, moved ones at their new slot.
+
+        The rule is walked lazily from just before the window and left as soon
+        as it passes the window end, so the series is never materialized.
+        """
+        if not self.is_active:
+            return []
+        duration = self.duration
+        found = []
+        # Occurrences starting after this instant end after the window starts
+        for start in self._starts_after(window.start - duration):
+            if start >= window.end:
+                break
+            if start not in self.exceptions:
+                found.append(Occurrence(self.id, start, DateTimeRange(start, start + duration)))
+        found.extend(
+            Occurrence(self.id, original, schedule)
+            for original, schedule in self.exceptions.moved
+            if schedule.overlaps_with(window)
+        )
+        found.sort(key=lambda occurrence: occurrence.schedule.start)
+        return found
+
+    def _require_occurrence(self, start: datetime) -> None:
+        if start not in _parse_rule(self.recurrence, self.first_start).rule:
+            raise BusinessRuleViolationError(
+                f"{start.isoformat()} is not an occurrence of this series"
+            )
+        if start in self.exceptions.cancelled:
+            raise BusinessRuleViolationError(f"Occurrence {start.isoformat()} is already cancelled")
+
+    def cancel_occurrence(self, start: datetime) -> None:
+        """Cancel the single occurrence originally starting at ``start``."""
+        self._require_occurrence(start)
+        self.exceptions = self.exceptions.cancel(start)
+        self.updated_at = datetime.now(UTC)
+
+    def reschedule_occurrence(self, start: datetime, schedule: DateTimeRange) -> None:
+        """Move the single occurrence originally starting at ``start`` to ``schedule``."""
+        self._require_occurrence(start)
+        if schedule.start < datetime.now(UTC):
+            raise BusinessRuleViolationError("Cannot move an occurrence into the past")
+        self.exceptions = self.exceptions.move(start, schedule)
+        self.updated_at = datetime.now(UTC)
+
+    def cancel(self) -> None:
+        """Cancel every remaining occurrence of the series."""
+        if not self.is_active:
+            raise BusinessRuleViolationError("Series is already cancelled")
+        self.is_active = False
+        self.updated_at = datetime.now(UTC)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "id": self.id,
+            "tenant_id": str(self.tenant_id),
+            "patient_id": self.patient_id,
+            "practitioner_id": self.practitioner_id,
+            "recurrence": self.recurrence,
+            "first_start": self.first_start.isoformat(),
+            "duration_minutes": self.duration_minutes,
+            "appointment_type": self.appointment_type.value,
+            "reason": self.reason,
+            "exceptions": self.exceptions.to_dict(),
+            "is_active": self.is_active,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+            "metadata": self.metadata,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "RecurringSeries":
+        """Create from dictionary."""
+        return cls(
+            id=data["id"],
+            tenant_id=TenantId.of(data["tenant_id"]),
+            patient_id=data["patient_id"],
+            practitioner_id=data["practitioner_id"],
+            recurrence=data["recurrence"],
+            first_start=datetime.fromisoformat(data["first_start"]),
+            duration_minutes=data["duration_minutes"],
+            appointment_type=AppointmentType(data["appointment_type"]),
+            reason=data.get("reason"),
+            exceptions=SeriesExceptions.from_dict(data["exceptions"]),
+            is_active=data.get("is_active", True),
+            created_at=datetime.fromisoformat(data["created_at"]),
+            updated_at=datetime.fromisoformat(data["updated_at"]),
+            metadata=data.get("metadata", {}),
+        )
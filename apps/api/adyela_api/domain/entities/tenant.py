@@ -7,7 +7,7 @@ from typing import Any
 from adyela_api.domain.value_objects import Address, Email, PhoneNumber
 
 
-@dataclass
+@dataclass(slots=True)
 class Tenant:
     """Tenant entity representing an organization (clinic, hospital, etc.)."""
 
@@ -56,8 +56,8 @@ class Tenant:
         return cls(
             id=data["id"],
             name=data["name"],
-            email=Email(data["email"]),
-            phone=PhoneNumber(data["phone"]),
+            email=Email.of(data["email"]),
+            phone=PhoneNumber.of(data["phone"]),
             address=Address.from_dict(data["address"]),
             is_active=data.get("is_active", True),
             created_at=datetime.fromisoformat(data["created_at"]),
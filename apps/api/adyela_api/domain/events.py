@@ -0,0 +1,30 @@
+"""Domain events."""
+
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+from adyela_api.config import AppointmentStatus
+
+
+@dataclass(frozen=True, slots=True)
+class AppointmentStatusChanged:
+    """Raised when an appointment moves from one status to another."""
+
+    appointment_id: str
+    tenant_id: str
+    previous_status: AppointmentStatus
+    new_status: AppointmentStatus
+    occurred_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+
+def status_deltas(
+    events: Iterable[AppointmentStatusChanged],
+) -> Counter[tuple[str, AppointmentStatus]]:
+    """Net change in appointments per tenant and status after a series of transitions."""
+    deltas: Counter[tuple[str, AppointmentStatus]] = Counter()
+    for event in events:
+        deltas[(event.tenant_id, event.previous_status)] -= 1
+        deltas[(event.tenant_id, event.new_status)] += 1
+    return deltas
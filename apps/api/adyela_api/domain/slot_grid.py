@@ -0,0 +1,145 @@
+"""Free-slot search over per-day occupancy bitsets."""
+
+from collections.abc import Iterable
+from datetime import UTC, date, datetime, time, timedelta
+from functools import cache
+
+from adyela_api.config.constants import (
+    MAX_APPOINTMENT_DURATION_MINUTES,
+    MIN_APPOINTMENT_DURATION_MINUTES,
+    SLOT_GRID_MINUTES,
+)
+
+from .exceptions import ValidationError
+from .value_objects import DateTimeRange, WorkingHours
+
+MINUTES_PER_DAY = 24 * 60
+
+
+@cache
+def _every(step: int, cells: int) -> int:
+    """Bitset with every ``step``-th of ``cells`` bits set, starting at bit 0."""
+    return sum(1 << cell for cell in range(0, cells, step))
+
+
+class SlotGrid:
+    """Free-slot search on a grid of ``grid_minutes`` cells per UTC day.
+
+    Each day is an integer bitset in which bit ``i`` stands for the cell
+    starting ``i * grid_minutes`` after midnight. Working hours set bits in
+    an open mask, bookings in a busy mask, and the free cells are
+    ``open & ~busy``. A slot of ``n`` cells can start at cell ``i`` when cells
+    ``i`` to ``i + n - 1`` are all free; that is found for every ``i`` at once
+    by AND-ing the free mask with copies of itself shifted right, doubling
+    the run length each time, so a day takes a handful of big-integer
+    operations whatever the number of bookings. A booking marks every cell
+    it touches, so one ending off the grid blocks the rest of its last cell.
+    """
+
+    def __init__(self, grid_minutes: int = SLOT_GRID_MINUTES) -> None:
+        if grid_minutes <= 0 or MINUTES_PER_DAY % grid_minutes:
+            raise ValueError(f"Grid of {grid_minutes} minutes does not divide a day")
+        self.grid_minutes = grid_minutes
+        self.cells_per_day = MINUTES_PER_DAY // grid_minutes
+
+    def cell(self, moment: time | datetime, round_up: bool = False) -> int:
+        """Index of the cell holding a time of day, or of the next boundary."""
+        seconds = moment.hour * 3600 + moment.minute * 60 + moment.second
+        micros = seconds * 1_000_000 + moment.microsecond
+        cell_micros = self.grid_minutes * 60 * 1_000_000
+        index, remainder = divmod(micros, cell_micros)
+        if round_up and remainder:
+            index += 1
+        return index
+
+    def span(self, first: int, last: int) -> int:
+        """Bitset of cells ``first`` (inclusive) to ``last`` (exclusive)."""
+        if last <= first:
+            return 0
+        return ((1 << (last - first)) - 1) << first
+
+    def open_mask(self, working_hours: WorkingHours, day: date) -> int:
+        """Cells inside the working hours of a day."""
+        mask = 0
+        for start, end in working_hours.on(day.weekday()):
+            mask |= self.span(self.cell(start, round_up=True), self.cell(end))
+        return mask
+
+    def busy_masks(self, bookings: Iterable[DateTimeRange]) -> dict[date, int]:
+        """Cells touched by bookings, per UTC day."""
+        masks: dict[date, int] = {}
+        for booking in bookings:
+            start, end = booking.start.astimezone(UTC), booking.end.astimezone(UTC)
+            day = start.date()
+            while True:
+                midnight = datetime.combine(day, time(), UTC)
+                first = self.cell(start) if start > midnight else 0
+                next_midnight = midnight + timedelta(days=1)
+                if end >= next_midnight:
+                    last = self.cells_per_day
+                else:
+                    last = self.cell(end, round_up=True)
+                masks[day] = masks.get(day, 0) | self.span(first, last)
+                if end <= next_midnight:
+                    break
+                day += timedelta(days=1)
+        return masks
+
+    def slot_starts(self, free: int, cells: int, step: int = 1) -> int:
+        """Cells, at multiples of ``step``, where ``cells`` consecutive free cells begin."""
+        runs, length = free, 1
+        while length < cells:
+            shift = min(length, cells - length)
+            runs &= runs >> shift
+            length += shift
+        return runs & _every(step, self.cells_per_day)
+
+    def free_slots(
+        self,
+        working_hours: WorkingHours,
+        bookings: Iterable[DateTimeRange],
+        start_day: date,
+        days: int,
+        duration_minutes: int,
+        step_minutes: int | None = None,
+        not_before: datetime | None = None,
+    ) -> dict[date, list[DateTimeRange]]:
+        """Free slots of ``duration_minutes`` on each of ``days`` days from ``start_day``.
+
+        Slots start every ``step_minutes`` from midnight (by default the
+        minimum appointment duration) and never before ``not_before``.
+        """
+        shortest, longest = MIN_APPOINTMENT_DURATION_MINUTES, MAX_APPOINTMENT_DURATION_MINUTES
+        if not shortest <= duration_minutes <= longest:
+            raise ValidationError(f"Duration must be between {shortest} and {longest} minutes")
+        cells = self._cells(duration_minutes, "Duration")
+        step = self._cells(step_minutes or MIN_APPOINTMENT_DURATION_MINUTES, "Step")
+        busy = self.busy_masks(bookings)
+        length = timedelta(minutes=duration_minutes)
+        cell_length = timedelta(minutes=self.grid_minutes)
+
+        slots: dict[date, list[DateTimeRange]] = {}
+        for offset in range(days):
+            day = start_day + timedelta(days=offset)
+            midnight = datetime.combine(day, time(), UTC)
+            free = self.open_mask(working_hours, day) & ~busy.get(day, 0)
+            if not_before is not None:
+                earliest = not_before.astimezone(UTC)
+                if earliest.date() > day:
+                    free = 0
+                elif earliest.date() == day:
+                    free &= ~self.span(0, self.cell(earliest, round_up=True))
+            starts = self.slot_starts(free, cells, step)
+            day_slots = []
+            while starts:
+                lowest = starts & -starts
+                begin = midnight + cell_length * (lowest.bit_length() - 1)
+                day_slots.append(DateTimeRange(start=begin, end=begin + length))
+                starts ^= lowest
+            slots[day] = day_slots
+        return slots
+
+    def _cells(self, minutes: int, name: str) -> int:
+        if minutes <= 0 or minutes % self.grid_minutes:
+            raise ValidationError(f"{name} must be a multiple of {self.grid_minutes} minutes")
+        return minutes // self.grid_minutes
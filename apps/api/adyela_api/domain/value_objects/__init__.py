@@ -1,11 +1,28 @@
 """Domain value objects."""
 
+import bisect
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Any
+from datetime import datetime, time
+from functools import lru_cache
+from typing import Any, Self, TypeVar, cast
 
+from adyela_api.config.constants import INTERNED_VALUE_OBJECTS
 
-@dataclass(frozen=True)
+V = TypeVar("V")
+
+_INTERNERS: dict[type, Callable[[str], Any]] = {}
+
+
+def _interner(cls: type[V]) -> Callable[[str], V]:
+    """Bounded cache of validated instances of ``cls``, shared by every caller."""
+    interner = _INTERNERS.get(cls)
+    if interner is None:
+        interner = _INTERNERS[cls] = lru_cache(maxsize=INTERNED_VALUE_OBJECTS)(cls)
+    return cast(Callable[[str], V], interner)
+
+
+@dataclass(frozen=True, slots=True)
 class Email:
     """Email value object."""
 
@@ -19,8 +36,13 @@ class Email:
     def __str__(self) -> str:
         return self.value
 
+    @classmethod
+    def of(cls, value: str) -> Self:
+        """Interned, already validated instance for ``value``."""
+        return _interner(cls)(value)
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PhoneNumber:
     """Phone number value object."""
 
@@ -36,8 +58,13 @@ class PhoneNumber:
     def __str__(self) -> str:
         return self.value
 
+    @classmethod
+    def of(cls, value: str) -> Self:
+        """Interned, already validated instance for ``value``."""
+        return _interner(cls)(value)
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TenantId:
     """Tenant ID value object."""
 
@@ -51,8 +78,13 @@ class TenantId:
     def __str__(self) -> str:
         return self.value
 
+    @classmethod
+    def of(cls, value: str) -> Self:
+        """Interned, already validated instance for ``value``."""
+        return _interner(cls)(value)
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Address:
     """Address value object."""
 
@@ -84,7 +116,7 @@ class Address:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DateTimeRange:
     """Date time range value object."""
 
@@ -104,3 +136,232 @@ class DateTimeRange:
     def duration_minutes(self) -> int:
         """Get duration in minutes."""
         return int((self.end - self.start).total_seconds() / 60)
+
+
+@dataclass(frozen=True, slots=True)
+class WorkingHours:
+    """Weekly working hours in UTC as ``(weekday, start, end)`` intervals, Monday = 0."""
+
+    intervals: tuple[tuple[int, time, time], ...]
+
+    def __post_init__(self) -> None:
+        """Validate intervals."""
+        for weekday, start, end in self.intervals:
+            if not 0 <= weekday <= 6:
+                raise ValueError(f"Invalid weekday: {weekday}")
+            if start >= end:
+                raise ValueError("Working hours must start before they end")
+
+    @classmethod
+    def weekdays(cls, start: time, end: time) -> "WorkingHours":
+        """Same hours Monday to Friday."""
+        return cls(tuple((weekday, start, end) for weekday in range(5)))
+
+    def on(self, weekday: int) -> list[tuple[time, time]]:
+        """Intervals of one weekday."""
+        return [(start, end) for day, start, end in self.intervals if day == weekday]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "intervals": [
+                {
+                    "weekday": weekday,
+                    "start": start.isoformat("minutes"),
+                    "end": end.isoformat("minutes"),
+                }
+                for weekday, start, end in self.intervals
+            ]
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "WorkingHours":
+        """Create from dictionary."""
+        return cls(
+            tuple(
+                (
+                    item["weekday"],
+                    time.fromisoformat(item["start"]),
+                    time.fromisoformat(item["end"]),
+                )
+                for item in data["intervals"]
+            )
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class SeriesExceptions:
+    """Cancelled and moved occurrences of a recurring series, keyed by original start."""
+
+    cancelled: frozenset[datetime] = frozenset()
+    moved: tuple[tuple[datetime, DateTimeRange], ...] = ()
+
+    def __post_init__(self) -> None:
+        """Validate that each occurrence has at most one exception."""
+        originals = {start for start, _ in self.moved}
+        if len(originals) != len(self.moved) or originals & self.cancelled:
+            raise ValueError("An occurrence can only be cancelled or moved once")
+
+    def __contains__(self, start: object) -> bool:
+        """Check if the occurrence originally starting at ``start`` was cancelled or moved."""
+        return start in self.cancelled or any(start == original for original, _ in self.moved)
+
+    def cancel(self, start: datetime) -> "SeriesExceptions":
+        """Copy with the occurrence cancelled, replacing any earlier move."""
+        return SeriesExceptions(
+            self.cancelled | {start},
+            tuple(item for item in self.moved if item[0] != start),
+        )
+
+    def move(self, start: datetime, schedule: DateTimeRange) -> "SeriesExceptions":
+        """Copy with the occurrence moved to ``schedule``, replacing any earlier move."""
+        moved = [item for item in self.moved if item[0] != start]
+        moved.append((start, schedule))
+        return SeriesExceptions(self.cancelled, tuple(sorted(moved, key=lambda item: item[0])))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "cancelled": [start.isoformat() for start in sorted(self.cancelled)],
+            "moved": [
+                {
+                    "original_start": original.isoformat(),
+                    "start_time": schedule.start.isoformat(),
+                    "end_time": schedule.end.isoformat(),
+                }
+                for original, schedule in self.moved
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "SeriesExceptions":
+        """Create from dictionary."""
+        return cls(
+            frozenset(map(datetime.fromisoformat, data["cancelled"])),
+            tuple(
+                (
+                    datetime.fromisoformat(item["original_start"]),
+                    DateTimeRange(
+                        start=datetime.fromisoformat(item["start_time"]),
+                        end=datetime.fromisoformat(item["end_time"]),
+                    ),
+                )
+                for item in data["moved"]
+            ),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class IntervalSet:
+    """Immutable set of disjoint half-open datetime intervals.
+
+    Stored as one sorted tuple of boundaries, starts at even and ends at odd
+    positions, with touching intervals merged. Set operations walk the two
+    boundary tuples once (O(n + m)), membership is a bisect (O(log n)), and
+    building from arbitrary ranges sorts them once (O(n log n)).
+    """
+
+    bounds: tuple[datetime, ...] = ()
+
+    def __post_init__(self) -> None:
+        """Validate boundaries."""
+        if len(self.bounds) % 2:
+            raise ValueError("Interval set needs an even number of boundaries")
+        if any(left >= right for left, right in zip(self.bounds, self.bounds[1:], strict=False)):
+            raise ValueError("Interval set boundaries must be strictly increasing")
+
+    @classmethod
+    def of(cls, ranges: Iterable[DateTimeRange]) -> "IntervalSet":
+        """Build the union of any ranges."""
+        bounds: list[datetime] = []
+        for item in sorted(ranges, key=lambda item: item.start):
+            if bounds and item.start <= bounds[-1]:
+                if item.end > bounds[-1]:
+                    bounds[-1] = item.end
+            else:
+                bounds.extend((item.start, item.end))
+        return cls(tuple(bounds))
+
+    def __len__(self) -> int:
+        return len(self.bounds) // 2
+
+    def __iter__(self) -> Iterator[DateTimeRange]:
+        bounds = self.bounds
+        for index in range(0, len(bounds), 2):
+            yield DateTimeRange(start=bounds[index], end=bounds[index + 1])
+
+    def __contains__(self, item: object) -> bool:
+        if isinstance(item, datetime):
+            return bisect.bisect_right(self.bounds, item) % 2 == 1
+        if isinstance(item, DateTimeRange):
+            index = bisect.bisect_right(self.bounds, item.start)
+            return index % 2 == 1 and item.end <= self.bounds[index]
+        if isinstance(item, IntervalSet):
+            return not item.difference(self)
+        return False
+
+    def __or__(self, other: "IntervalSet") -> "IntervalSet":
+        return self.union(other)
+
+    def __and__(self, other: "IntervalSet") -> "IntervalSet":
+        return self.intersection(other)
+
+    def __sub__(self, other: "IntervalSet") -> "IntervalSet":
+        return self.difference(other)
+
+    def union(self, other: "IntervalSet") -> "IntervalSet":
+        """Times in either set."""
+        return self._combine(other, lambda mine, theirs: mine or theirs)
+
+    def intersection(self, other: "IntervalSet") -> "IntervalSet":
+        """Times in both sets."""
+        return self._combine(other, lambda mine, theirs: mine and theirs)
+
+    def difference(self, other: "IntervalSet") -> "IntervalSet":
+        """Times in this set but not the other."""
+        return self._combine(other, lambda mine, theirs: mine and not theirs)
+
+    def overlaps(self, item: DateTimeRange) -> bool:
+        """Check if any interval overlaps a range."""
+        index = bisect.bisect_right(self.bounds, item.start)
+        # Inside an interval, or the next interval starts before the range ends
+        return index % 2 == 1 or (index < len(self.bounds) and self.bounds[index] < item.end)
+
+    def gaps(self, within: DateTimeRange | None = None) -> "IntervalSet":
+        """Uncovered time between the intervals, or within a range."""
+        if within is not None:
+            return IntervalSet((within.start, within.end)).difference(self)
+        return IntervalSet(self.bounds[1:-1])
+
+    @property
+    def duration_minutes(self) -> int:
+        """Get total covered duration in minutes."""
+        bounds = self.bounds
+        seconds = sum(
+            (bounds[index + 1] - bounds[index]).total_seconds()
+            for index in range(0, len(bounds), 2)
+        )
+        return int(seconds / 60)
+
+    def _combine(self, other: "IntervalSet", keep: Callable[[bool, bool], bool]) -> "IntervalSet":
+        """Merge both boundary tuples, tracking whether each set is entered."""
+        mine, theirs = self.bounds, other.bounds
+        i = j = 0
+        in_mine = in_theirs = inside = False
+        bounds: list[datetime] = []
+        while i < len(mine) or j < len(theirs):
+            if j == len(theirs) or (i < len(mine) and mine[i] <= theirs[j]):
+                moment = mine[i]
+            else:
+                moment = theirs[j]
+            # Boundaries alternate start/end, so crossing one toggles membership
+            if i < len(mine) and mine[i] == moment:
+                in_mine = not in_mine
+                i += 1
+            if j < len(theirs) and theirs[j] == moment:
+                in_theirs = not in_theirs
+                j += 1
+            if keep(in_mine, in_theirs) != inside:
+                inside = not inside
+                bounds.append(moment)
+        return IntervalSet(tuple(bounds))
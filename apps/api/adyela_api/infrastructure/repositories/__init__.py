@@ -0,0 +1,41 @@
+"""Repository implementations."""
+
+from .caching_repository import (
+    CacheStats,
+    CachingAppointmentRepository,
+    CachingPatientRepository,
+    CachingPractitionerRepository,
+    CachingRepository,
+    CachingTenantRepository,
+)
+from .firestore_appointment_repository import FirestoreAppointmentRepository
+from .firestore_patient_repository import FirestorePatientRepository
+from .firestore_practitioner_repository import FirestorePractitionerRepository
+from .firestore_recurring_series_repository import FirestoreRecurringSeriesRepository
+from .firestore_repository import FirestoreRepository
+from .firestore_tenant_repository import FirestoreTenantRepository
+from .in_memory_appointment_repository import InMemoryAppointmentRepository
+from .in_memory_patient_repository import InMemoryPatientRepository
+from .in_memory_practitioner_repository import InMemoryPractitionerRepository
+from .in_memory_recurring_series_repository import InMemoryRecurringSeriesRepository
+from .in_memory_tenant_repository import InMemoryTenantRepository
+
+__all__ = [
+    "CacheStats",
+    "CachingAppointmentRepository",
+    "CachingPatientRepository",
+    "CachingPractitionerRepository",
+    "CachingRepository",
+    "CachingTenantRepository",
+    "FirestoreAppointmentRepository",
+    "FirestorePatientRepository",
+    "FirestorePractitionerRepository",
+    "FirestoreRecurringSeriesRepository",
+    "FirestoreRepository",
+    "FirestoreTenantRepository",
+    "InMemoryAppointmentRepository",
+    "InMemoryPatientRepository",
+    "InMemoryPractitionerRepository",
+    "InMemoryRecurringSeriesRepository",
+    "InMemoryTenantRepository",
+]
@@ -0,0 +1,141 @@
+"""Chunked, bounded-parallel Firestore batch writes with per-item failures."""
+
+import asyncio
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any, Literal, TypeVar
+
+from google.cloud import firestore  # type: ignore
+
+from adyela_api.application.ports import BulkWriteFailure, BulkWriteResult
+
+T = TypeVar("T")
+
+# Firestore rejects commits with more than 500 writes
+MAX_BATCH_SIZE = 500
+
+
+@dataclass
+class WriteOp:
+    """A single document write queued for a bulk commit.
+
+    Every kind but ``delete`` writes ``data``.
+    """
+
+    index: int
+    ref: firestore.AsyncDocumentReference
+    kind: Literal["set", "create", "update", "delete"]
+    data: dict[str, Any] | None = None
+
+    def __post_init__(self) -> None:
+        """Reject writes missing their data."""
+        if self.kind != "delete" and self.data is None:
+            raise ValueError(f"A {self.kind} write needs data")
+
+    def add_to(self, batch: firestore.AsyncWriteBatch) -> None:
+        """Add this write to a batch."""
+        if self.kind == "delete":
+            batch.delete(self.ref)
+            return
+        data = self._payload()
+        if self.kind == "set":
+            batch.set(self.ref, data)
+        elif self.kind == "create":
+            batch.create(self.ref, data)
+        else:
+            batch.update(self.ref, data)
+
+    async def commit(self) -> None:
+        """Write this document on its own."""
+        if self.kind == "delete":
+            await self.ref.delete()
+            return
+        data = self._payload()
+        if self.kind == "set":
+            await self.ref.set(data)
+        elif self.kind == "create":
+            await self.ref.create(data)
+        else:
+            await self.ref.update(data)
+
+    def _payload(self) -> dict[str, Any]:
+        assert self.data is not None  # nosec B101 - checked by __post_init__
+        return self.data
+
+
+class BatchWriter:
+    """Commit many writes as chunked batches with bounded parallelism.
+
+    Writes are split into batches of ``batch_size`` and at most
+    ``max_concurrency`` commits are in flight at once. A batch commit is
+    atomic, so when one fails its writes are retried one by one to isolate
+    the items that actually failed; the rest of the batch still lands.
+    """
+
+    def __init__(
+        self, db: firestore.AsyncClient, batch_size: int = 100, max_concurrency: int = 10
+    ) -> None:
+        if not 0 < batch_size <= MAX_BATCH_SIZE:
+            raise ValueError(f"batch_size must be between 1 and {MAX_BATCH_SIZE}")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.db = db
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+
+    async def write(self, ops: Sequence[WriteOp]) -> dict[int, Exception]:
+        """Commit all writes and return the errors keyed by op index."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        chunks = [ops[i : i + self.batch_size] for i in range(0, len(ops), self.batch_size)]
+        results = await asyncio.gather(*(self._commit_chunk(chunk, semaphore) for chunk in chunks))
+
+        failures: dict[int, Exception] = {}
+        for chunk_failures in results:
+            failures.update(chunk_failures)
+        return failures
+
+    async def _commit_chunk(
+        self, chunk: Sequence[WriteOp], semaphore: asyncio.Semaphore
+    ) -> dict[int, Exception]:
+        try:
+            async with semaphore:
+                batch = self.db.batch()
+                for op in chunk:
+                    op.add_to(batch)
+                await batch.commit()
+            return {}
+        except Exception as e:
+            if len(chunk) == 1:
+                return {chunk[0].index: e}
+
+        results = await asyncio.gather(*(self._commit_single(op, semaphore) for op in chunk))
+        failures: dict[int, Exception] = {}
+        for op_failures in results:
+            failures.update(op_failures)
+        return failures
+
+    async def _commit_single(
+        self, op: WriteOp, semaphore: asyncio.Semaphore
+    ) -> dict[int, Exception]:
+        try:
+            async with semaphore:
+                await op.commit()
+            return {}
+        except Exception as e:
+            return {op.index: e}
+
+
+def build_bulk_result(
+    items: Sequence[T], failures: dict[int, Exception], entity_id: Callable[[T], str | None]
+) -> BulkWriteResult[T]:
+    """Split bulk write inputs into succeeded items and per-item failures."""
+    result: BulkWriteResult[T] = BulkWriteResult()
+    for index, item in enumerate(items):
+        error = failures.get(index)
+        if error is None:
+            result.succeeded.append(item)
+        else:
+            result.failed.append(
+                BulkWriteFailure(index=index, entity_id=entity_id(item), error=str(error))
+            )
+    return result
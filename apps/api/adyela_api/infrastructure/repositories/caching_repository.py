@@ -0,0 +1,411 @@
+"""Read-through caching decorator for repositories."""
+
+import asyncio
+import builtins
+import logging
+from collections.abc import AsyncIterator, Callable, Sequence
+from dataclasses import dataclass
+from typing import Any, ClassVar, Protocol, TypeVar
+
+from adyela_api.application.ports import (
+    AppointmentRepository,
+    BaseRepository,
+    BulkWriteResult,
+    CacheService,
+    Page,
+    PatientRepository,
+    PractitionerRepository,
+    TenantRepository,
+)
+from adyela_api.application.tenant_context import current_tenant_id
+from adyela_api.config import CACHE_KEYS, CACHE_TTL
+from adyela_api.domain import (
+    APPOINTMENT_CODEC,
+    PATIENT_CODEC,
+    PRACTITIONER_CODEC,
+    TENANT_CODEC,
+    Appointment,
+    AppointmentSummary,
+    Patient,
+    Practitioner,
+    Tenant,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class CacheableEntity(Protocol):
+    """Entity that round-trips through ``to_dict`` and a ``from_dict`` factory."""
+
+    id: str
+
+    def to_dict(self) -> dict[str, Any]: ...
+
+
+E = TypeVar("E", bound=CacheableEntity)
+
+
+@dataclass
+class CacheStats:
+    """Hit and miss counters for a cached repository."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class CachingRepository(BaseRepository[E]):
+    """Wrap a repository with a read-through cache of entities by ID.
+
+    ``get_by_id`` and ``get_many`` read from the cache first and fill it on a
+    miss; creates and updates write the new state through, and deletes
+    invalidate. Keys and TTLs come from ``CACHE_KEYS``/``CACHE_TTL`` for
+    ``entity_name``. Entities owned by a tenant are keyed within the tenant
+    of the request, and a cached entity of any other tenant is treated as a
+    miss; without a tenant context, reads bypass the cache. The per-entity
+    subclasses below implement the rest of their port by delegating to the
+    wrapped repository. Cache errors are logged and treated as misses, so an
+    unavailable cache only costs latency.
+    """
+
+    # Entities carry a ``tenant_id`` that scopes their cache keys
+    tenant_scoped: ClassVar[bool] = True
+
+    def __init__(
+        self,
+        inner: BaseRepository[E],
+        cache: CacheService,
+        entity_name: str,
+        from_dict: Callable[[dict[str, Any]], E],
+        stats: CacheStats | None = None,
+    ) -> None:
+        self.inner = inner
+        self.cache = cache
+        self.entity_name = entity_name
+        self.from_dict = from_dict
+        self.stats = stats or CacheStats()
+        self._key_template = CACHE_KEYS[entity_name]
+        self._ttl = CACHE_TTL[entity_name]
+
+    async def create(self, entity: E) -> E:
+        """Create an entity and cache it."""
+        created = await self.inner.create(entity)
+        await self._store(created)
+        return created
+
+    async def get_by_id(self, entity_id: str) -> E | None:
+        """Get an entity by ID, reading through the cache."""
+        cached = await self._lookup(entity_id)
+        if cached is not None:
+            self.stats.hits += 1
+            return cached
+
+        self.stats.misses += 1
+        entity = await self.inner.get_by_id(entity_id)
+        if entity is not None:
+            await self._store(entity)
+        return entity
+
+    async def get_many(self, entity_ids: Sequence[str]) -> dict[str, E]:
+        """Get entities by ID, fetching only cache misses from the wrapped repository."""
+        unique_ids = builtins.list(dict.fromkeys(entity_ids))
+        cached = await asyncio.gather(*(self._lookup(entity_id) for entity_id in unique_ids))
+
+        found = {
+            entity_id: entity
+            for entity_id, entity in zip(unique_ids, cached, strict=True)
+            if entity is not None
+        }
+        missing = [entity_id for entity_id in unique_ids if entity_id not in found]
+        self.stats.hits += len(found)
+        self.stats.misses += len(missing)
+
+        if missing:
+            fetched = await self.inner.get_many(missing)
+            await asyncio.gather(*(self._store(entity) for entity in fetched.values()))
+            found.update(fetched)
+        return found
+
+    async def update(self, entity: E) -> E:
+        """Update an entity and write the new state through."""
+        updated = await self.inner.update(entity)
+        await self._store(updated)
+        return updated
+
+    async def delete(self, entity_id: str) -> bool:
+        """Delete an entity and invalidate its cache entry."""
+        keys = await self._stored_keys([entity_id])
+        deleted = await self.inner.delete(entity_id)
+        if entity_id in keys:
+            await self._invalidate(entity_id, keys[entity_id])
+        return deleted
+
+    async def create_many(self, entities: builtins.list[E]) -> BulkWriteResult[E]:
+        """Create many entities and cache the ones written."""
+        result = await self.inner.create_many(entities)
+        await asyncio.gather(*(self._store(entity) for entity in result.succeeded))
+        return result
+
+    async def update_many(self, entities: builtins.list[E]) -> BulkWriteResult[E]:
+        """Update many entities and write through the ones written."""
+        result = await self.inner.update_many(entities)
+        await asyncio.gather(*(self._store(entity) for entity in result.succeeded))
+        return result
+
+    async def delete_many(self, entity_ids: builtins.list[str]) -> BulkWriteResult[str]:
+        """Delete many entities and invalidate their cache entries."""
+        keys = await self._stored_keys(entity_ids)
+        result = await self.inner.delete_many(entity_ids)
+        await asyncio.gather(
+            *(
+                self._invalidate(entity_id, keys[entity_id])
+                for entity_id in result.succeeded
+                if entity_id in keys
+            )
+        )
+        return result
+
+    async def list(
+        self, limit: int = 100, filters: dict | None = None, page_token: str | None = None
+    ) -> Page[E]:
+        """List entities from the wrapped repository."""
+        return await self.inner.list(limit=limit, filters=filters, page_token=page_token)
+
+    def _key(self, entity_id: str, tenant_id: str | None) -> str:
+        fields = {"tenant_id": tenant_id, f"{self.entity_name}_id": entity_id}
+        return self._key_template.format(**fields)
+
+    def _context_tenant(self) -> str | None:
+        return current_tenant_id.get() if self.tenant_scoped else None
+
+    def _owner(self, entity: E) -> str | None:
+        if not self.tenant_scoped:
+            return None
+        tenant_id = getattr(entity, "tenant_id", None)
+        return None if tenant_id is None else str(tenant_id)
+
+    async def _stored_keys(self, entity_ids: Sequence[str]) -> dict[str, str]:
+        """Cache keys of entities about to be deleted.
+
+        Outside a tenant context the owners are read from the wrapped
+        repository; IDs it does not know are left out.
+        """
+        tenant_id = self._context_tenant()
+        if tenant_id is not None or not self.tenant_scoped:
+            return {entity_id: self._key(entity_id, tenant_id) for entity_id in entity_ids}
+        stored = await self.inner.get_many(entity_ids)
+        return {
+            entity_id: self._key(entity_id, self._owner(entity))
+            for entity_id, entity in stored.items()
+        }
+
+    async def _lookup(self, entity_id: str) -> E | None:
+        tenant_id = self._context_tenant()
+        if tenant_id is None and self.tenant_scoped:
+            return None
+        try:
+            data = await self.cache.get(self._key(entity_id, tenant_id))
+        except Exception:
+            logger.warning(
+                "Cache read failed for %s %s", self.entity_name, entity_id, exc_info=True
+            )
+            return None
+        if data is None:
+            return None
+        entity = self.from_dict(data)
+        if self._owner(entity) != tenant_id:
+            logger.warning("Cached %s %s belongs to another tenant", self.entity_name, entity_id)
+            return None
+        return entity
+
+    async def _store(self, entity: E) -> None:
+        try:
+            await self.cache.set(
+                self._key(entity.id, self._owner(entity)), entity.to_dict(), ttl=self._ttl
+            )
+        except Exception:
+            logger.warning(
+                "Cache write failed for %s %s", self.entity_name, entity.id, exc_info=True
+            )
+
+    async def _invalidate(self, entity_id: str, key: str) -> None:
+        try:
+            await self.cache.delete(key)
+        except Exception:
+            logger.warning(
+                "Cache invalidation failed for %s %s", self.entity_name, entity_id, exc_info=True
+            )
+
+
+class CachingTenantRepository(CachingRepository[Tenant], TenantRepository):
+    """Tenant repository cached by ID."""
+
+    tenant_scoped = False
+    inner: TenantRepository
+
+    def __init__(
+        self, inner: TenantRepository, cache: CacheService, stats: CacheStats | None = None
+    ) -> None:
+        super().__init__(inner, cache, "tenant", TENANT_CODEC.hydrate, stats=stats)
+
+    async def get_by_name(self, name: str) -> Tenant | None:
+        """Get tenant by name from the wrapped repository."""
+        return await self.inner.get_by_name(name)
+
+
+class CachingPatientRepository(CachingRepository[Patient], PatientRepository):
+    """Patient repository cached by ID."""
+
+    inner: PatientRepository
+
+    def __init__(
+        self, inner: PatientRepository, cache: CacheService, stats: CacheStats | None = None
+    ) -> None:
+        super().__init__(inner, cache, "patient", PATIENT_CODEC.hydrate, stats=stats)
+
+    async def get_by_email(self, tenant_id: str, email: str) -> Patient | None:
+        """Get patient by email from the wrapped repository."""
+        return await self.inner.get_by_email(tenant_id, email)
+
+    async def get_by_medical_record(
+        self, tenant_id: str, medical_record_number: str
+    ) -> Patient | None:
+        """Get patient by medical record number from the wrapped repository."""
+        return await self.inner.get_by_medical_record(tenant_id, medical_record_number)
+
+    async def list_by_tenant(
+        self, tenant_id: str, limit: int = 100, page_token: str | None = None
+    ) -> Page[Patient]:
+        """List patients for a tenant from the wrapped repository."""
+        return await self.inner.list_by_tenant(tenant_id, limit=limit, page_token=page_token)
+
+
+class CachingPractitionerRepository(CachingRepository[Practitioner], PractitionerRepository):
+    """Practitioner repository cached by ID."""
+
+    inner: PractitionerRepository
+
+    def __init__(
+        self, inner: PractitionerRepository, cache: CacheService, stats: CacheStats | None = None
+    ) -> None:
+        super().__init__(inner, cache, "practitioner", PRACTITIONER_CODEC.hydrate, stats=stats)
+
+    async def get_by_email(self, tenant_id: str, email: str) -> Practitioner | None:
+        """Get practitioner by email from the wrapped repository."""
+        return await self.inner.get_by_email(tenant_id, email)
+
+    async def list_by_tenant(
+        self, tenant_id: str, limit: int = 100, page_token: str | None = None
+    ) -> Page[Practitioner]:
+        """List practitioners for a tenant from the wrapped repository."""
+        return await self.inner.list_by_tenant(tenant_id, limit=limit, page_token=page_token)
+
+    async def list_by_specialty(
+        self, tenant_id: str, specialty: str, limit: int = 100, page_token: str | None = None
+    ) -> Page[Practitioner]:
+        """List practitioners by specialty from the wrapped repository."""
+        return await self.inner.list_by_specialty(
+            tenant_id, specialty, limit=limit, page_token=page_token
+        )
+
+
+class CachingAppointmentRepository(CachingRepository[Appointment], AppointmentRepository):
+    """Appointment repository cached by ID."""
+
+    inner: AppointmentRepository
+
+    def __init__(
+        self, inner: AppointmentRepository, cache: CacheService, stats: CacheStats | None = None
+    ) -> None:
+        super().__init__(inner, cache, "appointment", APPOINTMENT_CODEC.hydrate, stats=stats)
+
+    async def list_by_patient(
+        self, tenant_id: str, patient_id: str, limit: int = 100, page_token: str | None = None
+    ) -> Page[Appointment]:
+        """List appointments for a patient from the wrapped repository."""
+        return await self.inner.list_by_patient(
+            tenant_id, patient_id, limit=limit, page_token=page_token
+        )
+
+    async def list_by_practitioner(
+        self, tenant_id: str, practitioner_id: str, limit: int = 100, page_token: str | None = None
+    ) -> Page[Appointment]:
+        """List appointments for a practitioner from the wrapped repository."""
+        return await self.inner.list_by_practitioner(
+            tenant_id, practitioner_id, limit=limit, page_token=page_token
+        )
+
+    async def list_by_date_range(
+        self,
+        tenant_id: str,
+        start_date: str,
+        end_date: str,
+        limit: int = 100,
+        page_token: str | None = None,
+    ) -> Page[Appointment]:
+        """List appointments within a date range from the wrapped repository."""
+        return await self.inner.list_by_date_range(
+            tenant_id, start_date, end_date, limit=limit, page_token=page_token
+        )
+
+    async def count(self, filters: dict | None = None) -> int:
+        """Count appointments in the wrapped repository."""
+        return await self.inner.count(filters)
+
+    def iter_by_patient(
+        self, tenant_id: str, patient_id: str, page_size: int = 500
+    ) -> AsyncIterator[Appointment]:
+        """Yield every appointment for a patient from the wrapped repository."""
+        return self.inner.iter_by_patient(tenant_id, patient_id, page_size=page_size)
+
+    def iter_by_practitioner(
+        self, tenant_id: str, practitioner_id: str, page_size: int = 500
+    ) -> AsyncIterator[Appointment]:
+        """Yield every appointment for a practitioner from the wrapped repository."""
+        return self.inner.iter_by_practitioner(tenant_id, practitioner_id, page_size=page_size)
+
+    def iter_by_date_range(
+        self, tenant_id: str, start_date: str, end_date: str, page_size: int = 500
+    ) -> AsyncIterator[Appointment]:
+        """Yield every appointment within a date range from the wrapped repository."""
+        return self.inner.iter_by_date_range(tenant_id, start_date, end_date, page_size=page_size)
+
+    async def list_summaries(
+        self,
+        tenant_id: str,
+        fields: Sequence[str] | None = None,
+        filters: dict | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        limit: int = 100,
+        page_token: str | None = None,
+    ) -> Page[AppointmentSummary]:
+        """List appointment summaries from the wrapped repository."""
+        return await self.inner.list_summaries(
+            tenant_id,
+            fields=fields,
+            filters=filters,
+            start_date=start_date,
+            end_date=end_date,
+            limit=limit,
+            page_token=page_token,
+        )
+
+    async def check_availability(
+        self, tenant_id: str, practitioner_id: str, start_time: str, end_time: str
+    ) -> bool:
+        """Check practitioner availability in the wrapped repository."""
+        return await self.inner.check_availability(tenant_id, practitioner_id, start_time, end_time)
+
+    async def check_patient_availability(
+        self, tenant_id: str, patient_id: str, start_time: str, end_time: str
+    ) -> bool:
+        """Check patient availability in the wrapped repository."""
+        return await self.inner.check_patient_availability(
+            tenant_id, patient_id, start_time, end_time
+        )
@@ -0,0 +1,53 @@
+"""In-process cache of aggregation counts keyed by query filters."""
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+CountKey = tuple[tuple[str, Any], ...]
+
+
+class CountCache:
+    """Counts per filter set, dropped when a write may have changed them.
+
+    Entries expire after ``ttl_seconds`` so that writes made by other
+    replicas are eventually reflected. Writes made through this process call
+    ``invalidate`` with the written entity's tenant, which drops every count
+    scoped to that tenant (or not scoped to any tenant); ``invalidate()``
+    without a tenant drops everything.
+    """
+
+    def __init__(
+        self, ttl_seconds: float = 60, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._counts: dict[CountKey, tuple[int, float]] = {}
+
+    @staticmethod
+    def key(filters: dict[str, Any] | None) -> CountKey:
+        """Normalize a filter dict into a cache key."""
+        return tuple(sorted((filters or {}).items()))
+
+    def get(self, filters: dict[str, Any] | None) -> int | None:
+        """Get a cached count if it has not expired."""
+        entry = self._counts.get(self.key(filters))
+        if entry is None:
+            return None
+        count, stored_at = entry
+        if self._clock() - stored_at >= self.ttl_seconds:
+            return None
+        return count
+
+    def set(self, filters: dict[str, Any] | None, count: int) -> None:
+        """Store a fresh count."""
+        self._counts[self.key(filters)] = (count, self._clock())
+
+    def invalidate(self, tenant_id: str | None = None) -> None:
+        """Drop counts a write to ``tenant_id`` may have changed."""
+        if tenant_id is None:
+            self._counts.clear()
+            return
+        for key in list(self._counts):
+            if dict(key).get("tenant_id", tenant_id) == tenant_id:
+                del self._counts[key]
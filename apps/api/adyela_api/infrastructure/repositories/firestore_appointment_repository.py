@@ -2,121 +2,409 @@
 
 from __future__ import annotations
 
+import asyncio
 import builtins
+from collections import Counter
+from collections.abc import AsyncIterator, Iterable, Sequence
+from datetime import UTC, datetime
 
 from google.cloud import firestore  # type: ignore
+from google.cloud.firestore_v1.async_aggregation import AsyncAggregationQuery  # type: ignore
+from google.cloud.firestore_v1.base_aggregation import AggregationResult  # type: ignore
 
-from adyela_api.application.ports import AppointmentRepository
-from adyela_api.config import COLLECTIONS
-from adyela_api.domain import Appointment
+from adyela_api.application.ports import (
+    AppointmentRepository,
+    AppointmentStatsService,
+    BookingService,
+    BulkWriteResult,
+    Page,
+)
+from adyela_api.config import AppointmentStatus
+from adyela_api.config.constants import ACTIVE_APPOINTMENT_STATUSES
+from adyela_api.domain import Appointment, AppointmentSummary, ValidationError, status_deltas
+from adyela_api.domain.value_objects import DateTimeRange
+from adyela_api.infrastructure.repositories.batch_writer import BatchWriter
+from adyela_api.infrastructure.repositories.count_cache import CountCache
+from adyela_api.infrastructure.repositories.firestore_repository import (
+    FirestoreRepository,
+    Query,
+)
+from adyela_api.infrastructure.repositories.interval_index import AvailabilityIndex, IndexKey
+from adyela_api.infrastructure.repositories.pagination import PageTokenCodec
+from adyela_api.infrastructure.repositories.partitioning import TenantPartitioning
+from adyela_api.infrastructure.repositories.today_view import TodayScheduleView
 
 
-class FirestoreAppointmentRepository(AppointmentRepository):
-    """Firestore implementation of appointment repository."""
+class FirestoreAppointmentRepository(FirestoreRepository[Appointment], AppointmentRepository):
+    """Firestore implementation of appointment repository.
 
-    def __init__(self, db: firestore.Client) -> None:
-        self.db = db
-        self.collection = COLLECTIONS["appointments"]
+    Built on ``firestore.AsyncClient`` so that every call yields to the event
+    loop while waiting on the network instead of blocking the worker. Lists
+    are keyset-paginated on ``start_time`` and the document ID, as described
+    on ``FirestoreRepository``.
+
+    With an ``AvailabilityIndex``, availability checks are answered in
+    process and only read Firestore to load a practitioner's or patient's
+    upcoming bookings on a cache miss; writes keep the index in sync. A
+    ``CountCache`` likewise keeps ``count`` results until a write invalidates
+    them. With an ``AppointmentStatsService``, creates, status transitions
+    and deletes are applied to the per-tenant status counters after the
+    write succeeds. With a started ``TodayScheduleView``, date range lists
+    that fall within the current day are served from the listener-fed view.
+    With a ``TenantPartitioning``, each tenant's appointments live in the
+    layout selected for it. With a ``BookingService``, every write keeps its
+    schedule documents in line: an appointment's slot is released once it is
+    cancelled, moved or deleted, and recorded when it is written active
+    without going through ``book``.
+    """
+
+    collection_key = "appointments"
+    entity_type = Appointment
+    order_field = "start_time"
+    partitioned = True
+
+    def __init__(
+        self,
+        db: firestore.AsyncClient,
+        page_tokens: PageTokenCodec,
+        batch_writer: BatchWriter | None = None,
+        availability_index: AvailabilityIndex | None = None,
+        count_cache: CountCache | None = None,
+        stats: AppointmentStatsService | None = None,
+        today_view: TodayScheduleView | None = None,
+        partitioning: TenantPartitioning | None = None,
+        booking_service: BookingService | None = None,
+    ) -> None:
+        super().__init__(db, page_tokens, batch_writer, partitioning)
+        self.availability_index = availability_index
+        self.count_cache = count_cache
+        self.stats = stats
+        self.today_view = today_view
+        self.booking_service = booking_service
 
     async def create(self, entity: Appointment) -> Appointment:
         """Create a new appointment."""
-        doc_ref = self.db.collection(self.collection).document()
-        entity.id = doc_ref.id
-        doc_ref.set(entity.to_dict())
+        await super().create(entity)
+        await self._update_stats(_status_totals([entity]))
+        await self._sync_schedules([(None, entity)])
         return entity
 
-    async def get_by_id(self, entity_id: str) -> Appointment | None:
-        """Get appointment by ID."""
-        doc = self.db.collection(self.collection).document(entity_id).get()
-        if not doc.exists:
-            return None
-        return Appointment.from_dict({"id": doc.id, **doc.to_dict()})
-
     async def update(self, entity: Appointment) -> Appointment:
         """Update an existing appointment."""
-        doc_ref = self.db.collection(self.collection).document(entity.id)
-        doc_ref.update(entity.to_dict())
+        # The stored slot is needed to release it if the appointment moved
+        previous = (
+            await self._get(str(entity.tenant_id), entity.id)
+            if self.booking_service is not None
+            else None
+        )
+        await super().update(entity)
+        await self._update_stats(status_deltas(entity.pull_events()))
+        await self._sync_schedules([(previous, entity)])
         return entity
 
     async def delete(self, entity_id: str) -> bool:
         """Delete an appointment."""
-        self.db.collection(self.collection).document(entity_id).delete()
+        # The stored status is needed to decrement its counter, and its slot to release it
+        existing = await self.get_by_id(entity_id) if self._reads_before_delete else None
+        await super().delete(entity_id)
+        if existing is not None:
+            await self._update_stats(_status_totals([existing], sign=-1))
+            await self._sync_schedules([(existing, None)])
         return True
 
-    async def list(
-        self, skip: int = 0, limit: int = 100, filters: dict | None = None
-    ) -> builtins.list[Appointment]:
-        """List appointments with pagination."""
-        query = self.db.collection(self.collection)
+    async def create_many(
+        self, entities: builtins.list[Appointment]
+    ) -> BulkWriteResult[Appointment]:
+        """Create many appointments in chunked batches."""
+        result = await super().create_many(entities)
+        await self._update_stats(_status_totals(result.succeeded))
+        await self._sync_schedules((None, entity) for entity in result.succeeded)
+        return result
 
-        if filters:
-            for key, value in filters.items():
-                query = query.where(key, "==", value)
+    async def update_many(
+        self, entities: builtins.list[Appointment]
+    ) -> BulkWriteResult[Appointment]:
+        """Update many appointments in chunked batches."""
+        previous = await self._stored(entities) if self.booking_service is not None else {}
+        result = await super().update_many(entities)
+        await self._update_stats(
+            status_deltas(event for entity in result.succeeded for event in entity.pull_events())
+        )
+        await self._sync_schedules((previous.get(entity.id), entity) for entity in result.succeeded)
+        return result
 
-        docs = query.offset(skip).limit(limit).stream()
-        return [Appointment.from_dict({"id": doc.id, **doc.to_dict()}) for doc in docs]
+    async def delete_many(self, entity_ids: builtins.list[str]) -> BulkWriteResult[str]:
+        """Delete many appointments in chunked batches."""
+        existing = await self.get_many(entity_ids) if self._reads_before_delete else {}
+        result = await super().delete_many(entity_ids)
+        deleted = [existing[entity_id] for entity_id in result.succeeded if entity_id in existing]
+        await self._update_stats(_status_totals(deleted, sign=-1))
+        await self._sync_schedules((appointment, None) for appointment in deleted)
+        return result
 
     async def list_by_patient(
-        self, tenant_id: str, patient_id: str, skip: int = 0, limit: int = 100
-    ) -> builtins.list[Appointment]:
+        self, tenant_id: str, patient_id: str, limit: int = 100, page_token: str | None = None
+    ) -> Page[Appointment]:
         """List appointments for a patient."""
-        docs = (
-            self.db.collection(self.collection)
-            .where("tenant_id", "==", tenant_id)
-            .where("patient_id", "==", patient_id)
-            .offset(skip)
-            .limit(limit)
-            .stream()
-        )
-        return [Appointment.from_dict({"id": doc.id, **doc.to_dict()}) for doc in docs]
+        query = (await self._tenant_query(tenant_id)).where("patient_id", "==", patient_id)
+        scope = ("patient", tenant_id, patient_id)
+        return await self._fetch_page(query, limit, page_token, scope)
 
     async def list_by_practitioner(
-        self, tenant_id: str, practitioner_id: str, skip: int = 0, limit: int = 100
-    ) -> builtins.list[Appointment]:
+        self, tenant_id: str, practitioner_id: str, limit: int = 100, page_token: str | None = None
+    ) -> Page[Appointment]:
         """List appointments for a practitioner."""
-        docs = (
-            self.db.collection(self.collection)
-            .where("tenant_id", "==", tenant_id)
-            .where("practitioner_id", "==", practitioner_id)
-            .offset(skip)
-            .limit(limit)
-            .stream()
+        query = (await self._tenant_query(tenant_id)).where(
+            "practitioner_id", "==", practitioner_id
         )
-        return [Appointment.from_dict({"id": doc.id, **doc.to_dict()}) for doc in docs]
+        scope = ("practitioner", tenant_id, practitioner_id)
+        return await self._fetch_page(query, limit, page_token, scope)
 
     async def list_by_date_range(
         self,
         tenant_id: str,
         start_date: str,
         end_date: str,
-        skip: int = 0,
         limit: int = 100,
-    ) -> builtins.list[Appointment]:
+        page_token: str | None = None,
+    ) -> Page[Appointment]:
         """List appointments within a date range."""
-        docs = (
-            self.db.collection(self.collection)
-            .where("tenant_id", "==", tenant_id)
+        if self.today_view is not None and self.today_view.covers(tenant_id, start_date, end_date):
+            return await self.today_view.list_by_date_range(
+                tenant_id, start_date, end_date, limit, page_token
+            )
+
+        query = (
+            (await self._tenant_query(tenant_id))
+            .where("start_time", ">=", start_date)
+            .where("start_time", "<=", end_date)
+        )
+        scope = ("date_range", tenant_id, start_date, end_date)
+        return await self._fetch_page(query, limit, page_token, scope)
+
+    async def count(self, filters: dict | None = None) -> int:
+        """Count appointments with a server-side aggregation query."""
+        if self.count_cache is not None:
+            cached = self.count_cache.get(filters)
+            if cached is not None:
+                return cached
+
+        aggregation: AsyncAggregationQuery = (await self._query(filters)).count(alias="total")
+        results: builtins.list[builtins.list[AggregationResult]] = await aggregation.get()
+        # One row holding one result per aggregation
+        total = int(results[0][0].value) if results else 0
+        if self.count_cache is not None:
+            self.count_cache.set(filters, total)
+        return total
+
+    async def iter_by_patient(
+        self, tenant_id: str, patient_id: str, page_size: int = 500
+    ) -> AsyncIterator[Appointment]:
+        """Yield every appointment for a patient."""
+        query = (await self._tenant_query(tenant_id)).where("patient_id", "==", patient_id)
+        async for appointment in self._iter_query(query, page_size):
+            yield appointment
+
+    async def iter_by_practitioner(
+        self, tenant_id: str, practitioner_id: str, page_size: int = 500
+    ) -> AsyncIterator[Appointment]:
+        """Yield every appointment for a practitioner."""
+        query = (await self._tenant_query(tenant_id)).where(
+            "practitioner_id", "==", practitioner_id
+        )
+        async for appointment in self._iter_query(query, page_size):
+            yield appointment
+
+    async def iter_by_date_range(
+        self, tenant_id: str, start_date: str, end_date: str, page_size: int = 500
+    ) -> AsyncIterator[Appointment]:
+        """Yield every appointment within a date range."""
+        query = (
+            (await self._tenant_query(tenant_id))
             .where("start_time", ">=", start_date)
             .where("start_time", "<=", end_date)
-            .offset(skip)
-            .limit(limit)
-            .stream()
         )
-        return [Appointment.from_dict({"id": doc.id, **doc.to_dict()}) for doc in docs]
+        async for appointment in self._iter_query(query, page_size):
+            yield appointment
+
+    async def list_summaries(
+        self,
+        tenant_id: str,
+        fields: Sequence[str] | None = None,
+        filters: dict | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        limit: int = 100,
+        page_token: str | None = None,
+    ) -> Page[AppointmentSummary]:
+        """List appointment summaries using a Firestore projection."""
+        requested = set(fields or AppointmentSummary.DEFAULT_FIELDS)
+        unknown = requested - AppointmentSummary.FIELDS
+        if unknown:
+            raise ValidationError(f"Cannot project fields: {', '.join(sorted(unknown))}")
+
+        query = await self._tenant_query(tenant_id)
+        for key, value in (filters or {}).items():
+            query = query.where(key, "==", value)
+        if start_date:
+            query = query.where("start_time", ">=", start_date)
+        if end_date:
+            query = query.where("start_time", "<=", end_date)
+
+        # The order field is always fetched because page cursors are built from it
+        projection = sorted(requested | {self.order_field})
+        scope = ("summaries", tenant_id, filters or {}, start_date, end_date, projection)
+        return await self._fetch_page(
+            query.select(projection),
+            limit,
+            page_token,
+            scope,
+            hydrate=AppointmentSummary.from_dict,
+        )
 
     async def check_availability(
         self, tenant_id: str, practitioner_id: str, start_time: str, end_time: str
     ) -> bool:
         """Check if practitioner is available."""
-        # Query for overlapping appointments
-        docs = (
-            self.db.collection(self.collection)
-            .where("tenant_id", "==", tenant_id)
-            .where("practitioner_id", "==", practitioner_id)
-            .where("start_time", "<", end_time)
-            .where("end_time", ">", start_time)
-            .where("status", "in", ["scheduled", "confirmed", "in_progress"])
-            .stream()
+        key = AvailabilityIndex.practitioner_key(tenant_id, practitioner_id)
+        bookings = await self._active_bookings(tenant_id, "practitioner_id", practitioner_id)
+        return await self._is_free(key, bookings, start_time, end_time)
+
+    async def check_patient_availability(
+        self, tenant_id: str, patient_id: str, start_time: str, end_time: str
+    ) -> bool:
+        """Check if patient has no other appointment in the time slot."""
+        key = AvailabilityIndex.patient_key(tenant_id, patient_id)
+        bookings = await self._active_bookings(tenant_id, "patient_id", patient_id)
+        return await self._is_free(key, bookings, start_time, end_time)
+
+    async def _active_bookings(self, tenant_id: str, field: str, value: str) -> Query:
+        """Query for the active appointments of a practitioner or patient."""
+        return (
+            (await self._tenant_query(tenant_id))
+            .where(field, "==", value)
+            .where("status", "in", [status.value for status in ACTIVE_APPOINTMENT_STATUSES])
+        )
+
+    async def _is_free(
+        self, key: IndexKey, bookings: Query, start_time: str, end_time: str
+    ) -> bool:
+        """Check a slot against the interval index, loading it on a miss."""
+        if self.availability_index is None:
+            # Query for overlapping appointments; a single hit is enough to answer
+            query = (
+                bookings.where("start_time", "<", end_time)
+                .where("end_time", ">", start_time)
+                .limit(1)
+            )
+            async for _doc in query.stream():
+                return False
+            return True
+
+        index = self.availability_index
+        if not index.is_loaded(key):
+            async with index.load_lock(key):
+                if not index.is_loaded(key):
+                    await self._load_bookings(index, key, bookings)
+
+        return not index.overlaps(
+            key, datetime.fromisoformat(start_time), datetime.fromisoformat(end_time)
         )
 
-        return not any(docs)
+    async def _load_bookings(
+        self, index: AvailabilityIndex, key: IndexKey, bookings: Query
+    ) -> None:
+        """Load upcoming bookings for an index key, fetching only their time range."""
+        query = bookings.where("end_time", ">", datetime.now(UTC).isoformat()).select(
+            ["start_time", "end_time"]
+        )
+        intervals = []
+        async for doc in query.stream():
+            data = doc.to_dict()
+            if data is None:
+                continue
+            intervals.append(
+                (
+                    doc.id,
+                    datetime.fromisoformat(data["start_time"]),
+                    datetime.fromisoformat(data["end_time"]),
+                )
+            )
+        index.load(key, intervals)
+
+    async def _update_stats(self, deltas: Counter[tuple[str, AppointmentStatus]]) -> None:
+        if self.stats is None:
+            return
+        by_tenant: dict[str, dict[AppointmentStatus, int]] = {}
+        for (tenant_id, status), delta in deltas.items():
+            if delta:
+                by_tenant.setdefault(tenant_id, {})[status] = delta
+        await asyncio.gather(
+            *(self.stats.increment(tenant_id, counts) for tenant_id, counts in by_tenant.items())
+        )
+
+    async def _stored(self, entities: Sequence[Appointment]) -> dict[str, Appointment]:
+        """Stored versions of appointments, read from each one's tenant partition."""
+        ids_by_tenant: dict[str, builtins.list[str]] = {}
+        for entity in entities:
+            ids_by_tenant.setdefault(str(entity.tenant_id), []).append(entity.id)
+        stored: dict[str, Appointment] = {}
+        for tenant_id, entity_ids in ids_by_tenant.items():
+            stored.update(await self._get_many(tenant_id, entity_ids))
+        return stored
+
+    @property
+    def _reads_before_delete(self) -> bool:
+        return self.stats is not None or self.booking_service is not None
+
+    async def _sync_schedules(
+        self, changes: Iterable[tuple[Appointment | None, Appointment | None]]
+    ) -> None:
+        """Apply writes, as stored appointments before and after, to the schedule documents."""
+        if self.booking_service is None:
+            return
+        booking_service = self.booking_service
+
+        async def sync(previous: Appointment | None, current: Appointment | None) -> None:
+            held, holds = _held_slot(previous), _held_slot(current)
+            # Released first: a move within the same day rewrites the same entry
+            if previous is not None and held is not None and held != holds:
+                await booking_service.release(previous)
+            if current is not None and holds is not None and holds != held:
+                await booking_service.record(current)
+
+        await asyncio.gather(*(sync(previous, current) for previous, current in changes))
+
+    def _record(self, entity: Appointment) -> None:
+        if self.availability_index is not None:
+            self.availability_index.record(entity)
+        if self.count_cache is not None:
+            self.count_cache.invalidate(str(entity.tenant_id))
+        if self.today_view is not None:
+            self.today_view.record(entity)
+
+    def _discard(self, entity_id: str) -> None:
+        if self.availability_index is not None:
+            self.availability_index.discard(entity_id)
+        if self.count_cache is not None:
+            # The deleted appointment's tenant is unknown here
+            self.count_cache.invalidate()
+        if self.today_view is not None:
+            self.today_view.discard(entity_id)
+
+
+def _status_totals(
+    appointments: Sequence[Appointment], sign: int = 1
+) -> Counter[tuple[str, AppointmentStatus]]:
+    """Per-tenant status deltas for appointments that appeared (or, with ``sign=-1``, vanished)."""
+    totals: Counter[tuple[str, AppointmentStatus]] = Counter()
+    for appointment in appointments:
+        totals[(str(appointment.tenant_id), appointment.status)] += sign
+    return totals
+
+
+def _held_slot(appointment: Appointment | None) -> tuple[str, DateTimeRange] | None:
+    """Practitioner and time an appointment occupies, if it is still active."""
+    if appointment is None or appointment.status not in ACTIVE_APPOINTMENT_STATUSES:
+        return None
+    return appointment.practitioner_id, appointment.schedule
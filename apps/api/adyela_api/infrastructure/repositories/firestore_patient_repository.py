@@ -0,0 +1,36 @@
+"""Firestore implementation of PatientRepository."""
+
+from adyela_api.application.ports import Page, PatientRepository
+from adyela_api.domain import Patient
+from adyela_api.infrastructure.repositories.firestore_repository import FirestoreRepository
+from adyela_api.infrastructure.repositories.lookup_keys import (
+    PATIENT_EMAIL_KEY,
+    PATIENT_MEDICAL_RECORD_KEY,
+)
+
+
+class FirestorePatientRepository(FirestoreRepository[Patient], PatientRepository):
+    """Firestore implementation of patient repository, ordered by ``created_at``."""
+
+    collection_key = "patients"
+    entity_type = Patient
+    lookup_keys = (PATIENT_EMAIL_KEY, PATIENT_MEDICAL_RECORD_KEY)
+
+    async def get_by_email(self, tenant_id: str, email: str) -> Patient | None:
+        """Get patient by email within a tenant."""
+        return await self._get_by_key(PATIENT_EMAIL_KEY, tenant_id, email)
+
+    async def get_by_medical_record(
+        self, tenant_id: str, medical_record_number: str
+    ) -> Patient | None:
+        """Get patient by medical record number."""
+        return await self._get_by_key(PATIENT_MEDICAL_RECORD_KEY, tenant_id, medical_record_number)
+
+    async def list_by_tenant(
+        self, tenant_id: str, limit: int = 100, page_token: str | None = None
+    ) -> Page[Patient]:
+        """List patients for a tenant."""
+        scope = ("tenant", tenant_id)
+        return await self._fetch_page(
+            await self._query({"tenant_id": tenant_id}), limit, page_token, scope
+        )
@@ -0,0 +1,35 @@
+"""Firestore implementation of PractitionerRepository."""
+
+from adyela_api.application.ports import Page, PractitionerRepository
+from adyela_api.domain import Practitioner
+from adyela_api.infrastructure.repositories.firestore_repository import FirestoreRepository
+from adyela_api.infrastructure.repositories.lookup_keys import PRACTITIONER_EMAIL_KEY
+
+
+class FirestorePractitionerRepository(FirestoreRepository[Practitioner], PractitionerRepository):
+    """Firestore implementation of practitioner repository, ordered by ``created_at``."""
+
+    collection_key = "practitioners"
+    entity_type = Practitioner
+    lookup_keys = (PRACTITIONER_EMAIL_KEY,)
+
+    async def get_by_email(self, tenant_id: str, email: str) -> Practitioner | None:
+        """Get practitioner by email within a tenant."""
+        return await self._get_by_key(PRACTITIONER_EMAIL_KEY, tenant_id, email)
+
+    async def list_by_tenant(
+        self, tenant_id: str, limit: int = 100, page_token: str | None = None
+    ) -> Page[Practitioner]:
+        """List practitioners for a tenant."""
+        scope = ("tenant", tenant_id)
+        return await self._fetch_page(
+            await self._query({"tenant_id": tenant_id}), limit, page_token, scope
+        )
+
+    async def list_by_specialty(
+        self, tenant_id: str, specialty: str, limit: int = 100, page_token: str | None = None
+    ) -> Page[Practitioner]:
+        """List practitioners by specialty."""
+        query = await self._query({"tenant_id": tenant_id, "specialty": specialty})
+        scope = ("specialty", tenant_id, specialty)
+        return await self._fetch_page(query, limit, page_token, scope)
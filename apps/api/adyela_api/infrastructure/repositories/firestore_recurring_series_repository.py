@@ -0,0 +1,38 @@
+"""Firestore implementation of RecurringSeriesRepository."""
+
+from adyela_api.application.ports import Page, RecurringSeriesRepository
+from adyela_api.domain import RecurringSeries
+from adyela_api.infrastructure.repositories.firestore_repository import FirestoreRepository
+
+
+class FirestoreRecurringSeriesRepository(
+    FirestoreRepository[RecurringSeries], RecurringSeriesRepository
+):
+    """Firestore implementation of recurring series repository, ordered by ``created_at``.
+
+    Each series is one document however many occurrences it has; occurrences
+    are expanded by the domain for the window being read.
+    """
+
+    collection_key = "recurring_series"
+    entity_type = RecurringSeries
+
+    async def list_by_practitioner(
+        self, tenant_id: str, practitioner_id: str, limit: int = 100, page_token: str | None = None
+    ) -> Page[RecurringSeries]:
+        """List active series for a practitioner."""
+        query = await self._query(
+            {"tenant_id": tenant_id, "practitioner_id": practitioner_id, "is_active": True}
+        )
+        scope = ("practitioner", tenant_id, practitioner_id)
+        return await self._fetch_page(query, limit, page_token, scope)
+
+    async def list_by_patient(
+        self, tenant_id: str, patient_id: str, limit: int = 100, page_token: str | None = None
+    ) -> Page[RecurringSeries]:
+        """List active series for a patient."""
+        query = await self._query(
+            {"tenant_id": tenant_id, "patient_id": patient_id, "is_active": True}
+        )
+        scope = ("patient", tenant_id, patient_id)
+        return await self._fetch_page(query, limit, page_token, scope)
@@ -0,0 +1,567 @@
+"""Generic Firestore repository shared by the entity-specific adapters."""
+
+from __future__ import annotations
+
+import asyncio
+import builtins
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Sequence
+from typing import Any, ClassVar, Literal, Protocol, TypeVar, cast, overload
+
+from google.api_core.exceptions import AlreadyExists  # type: ignore
+from google.cloud import firestore  # type: ignore
+
+from adyela_api.application.ports import BaseRepository, BulkWriteResult, Page
+from adyela_api.application.tenant_context import current_tenant_id
+from adyela_api.config import COLLECTIONS
+from adyela_api.domain import ConflictError, codec_for
+from adyela_api.infrastructure.repositories.batch_writer import (
+    BatchWriter,
+    WriteOp,
+    build_bulk_result,
+)
+from adyela_api.infrastructure.repositories.lookup_keys import BackfillReport, LookupKey
+from adyela_api.infrastructure.repositories.pagination import PageTokenCodec
+from adyela_api.infrastructure.repositories.partitioning import (
+    Layout,
+    Partition,
+    TenantPartitioning,
+)
+
+# Tie-breaker for every keyset order
+DOCUMENT_ID = "__name__"
+
+# Document references per ``get_all`` call; larger lookups are split and fetched concurrently
+GET_ALL_CHUNK_SIZE = 100
+
+
+class FirestoreEntity(Protocol):
+    """Entity stored as its ``to_dict`` under its ID."""
+
+    id: str
+
+    def to_dict(self) -> dict[str, Any]: ...
+
+
+class Query(Protocol):
+    """The methods of ``firestore.AsyncQuery`` the repositories build queries from.
+
+    Collection references offer them too, as a query over every document, so
+    a tenant's whole collection and a filtered one are used alike.
+    """
+
+    def where(self, field_path: str, op_string: str, value: Any, /) -> Query: ...
+
+    def order_by(self, field_path: str, /) -> Query: ...
+
+    def limit(self, count: int, /) -> Query: ...
+
+    def start_after(self, document_fields: Any, /) -> Query: ...
+
+    def select(self, field_paths: Iterable[str], /) -> Query: ...
+
+    def stream(self) -> AsyncIterator[Any]: ...
+
+    # Annotated upstream as returning the aggregation class, not an instance
+    def count(self, alias: str | None = None) -> Any: ...
+
+
+T = TypeVar("T", bound=FirestoreEntity)
+R = TypeVar("R")
+
+
+class FirestoreRepository(BaseRepository[T]):
+    """Firestore CRUD, batched reads and keyset pagination for one collection.
+
+    Subclasses set ``collection_key`` (a key of ``COLLECTIONS``),
+    ``entity_type`` and ``order_field``, and build their queries from
+    ``_query`` or ``_tenant_query``. Documents are encoded and decoded with
+    the generated codec of ``entity_type``. Every list is ordered by ``order_field``
+    and then the document ID and paginated with ``start_after`` on both, so
+    reading page N costs the same as reading page 1. ``get_many`` batches
+    lookups into ``get_all`` calls, bulk writes go through a ``BatchWriter``,
+    and ``_fetch_page`` accepts a projected query plus a matching ``hydrate``
+    for partial reads.
+
+    Subclasses with ``partitioned = True`` store each tenant's documents in
+    the partition resolved by a ``TenantPartitioning``: queries go to the
+    tenant's read partition and writes to all of its write partitions.
+    Operations addressed only by ID use the tenant of the current request,
+    or of a ``tenant_scope`` outside requests, and raise without one.
+
+    Subclasses of unpartitioned collections may declare ``lookup_keys``: each
+    write then creates, moves or deletes the entity's key documents in the
+    same transaction as the entity, and conflicting keys raise
+    ``ConflictError``. Bulk writes of such entities run one transaction per
+    entity, since a batch retried item by item would not keep them atomic.
+
+    ``_record`` and ``_discard`` are called after every successful write and
+    delete so that subclasses can keep in-process indexes in sync.
+    """
+
+    collection_key: ClassVar[str]
+    entity_type: ClassVar[Any]
+    order_field: ClassVar[str] = "created_at"
+    partitioned: ClassVar[bool] = False
+    lookup_keys: ClassVar[tuple[LookupKey, ...]] = ()
+
+    def __init__(
+        self,
+        db: firestore.AsyncClient,
+        page_tokens: PageTokenCodec,
+        batch_writer: BatchWriter | None = None,
+        partitioning: TenantPartitioning | None = None,
+    ) -> None:
+        self.db = db
+        self.collection = COLLECTIONS[self.collection_key]
+        self.page_tokens = page_tokens
+        self.batch_writer = batch_writer or BatchWriter(db)
+        self.partitioning = partitioning
+        self.codec = codec_for(self.entity_type)
+
+    async def create(self, entity: T) -> T:
+        """Create a new entity under a generated ID."""
+        partitions = await self._write_partitions(_tenant_of(entity))
+        entity.id = partitions[0].collection(self.collection).document().id
+        data = self.codec.encode(entity)
+        if self.lookup_keys:
+            await self._write_keyed(entity.id, data, "set")
+            self._record(entity)
+            return entity
+        await asyncio.gather(
+            *(
+                partition.collection(self.collection).document(entity.id).set(data)
+                for partition in partitions
+            )
+        )
+        self._record(entity)
+        return entity
+
+    async def get_by_id(self, entity_id: str) -> T | None:
+        """Get entity by ID."""
+        return await self._get(self._context_tenant(), entity_id)
+
+    async def get_many(self, entity_ids: Sequence[str]) -> dict[str, T]:
+        """Get entities by ID with batched ``get_all`` reads."""
+        return await self._get_many(self._context_tenant(), entity_ids)
+
+    async def _get(self, tenant_id: str | None, entity_id: str) -> T | None:
+        """Get an entity by ID from a tenant's partition."""
+        partition = await self._partition(tenant_id)
+        doc = await partition.collection(self.collection).document(entity_id).get()
+        if not doc.exists:
+            return None
+        return self._hydrate(doc)
+
+    async def _get_many(self, tenant_id: str | None, entity_ids: Sequence[str]) -> dict[str, T]:
+        """Get entities by ID from a tenant's partition with batched ``get_all`` reads."""
+        partition = await self._partition(tenant_id)
+        collection = partition.collection(self.collection)
+        refs = [collection.document(entity_id) for entity_id in dict.fromkeys(entity_ids)]
+        chunks = [
+            refs[start : start + GET_ALL_CHUNK_SIZE]
+            for start in range(0, len(refs), GET_ALL_CHUNK_SIZE)
+        ]
+
+        async def fetch(chunk: builtins.list[Any]) -> builtins.list[Any]:
+            return [doc async for doc in partition.db.get_all(chunk)]
+
+        results = await asyncio.gather(*(fetch(chunk) for chunk in chunks))
+        return {doc.id: self._hydrate(doc) for docs in results for doc in docs if doc.exists}
+
+    async def update(self, entity: T) -> T:
+        """Update an existing entity."""
+        partitions = await self._write_partitions(_tenant_of(entity))
+        data = self.codec.encode(entity)
+        if self.lookup_keys:
+            await self._write_keyed(entity.id, data, "update")
+            self._record(entity)
+            return entity
+        # Documents may not exist yet in a migration target, so only the read partition
+        # requires one
+        await asyncio.gather(
+            partitions[0].collection(self.collection).document(entity.id).update(data),
+            *(
+                partition.collection(self.collection).document(entity.id).set(data)
+                for partition in partitions[1:]
+            ),
+        )
+        self._record(entity)
+        return entity
+
+    async def delete(self, entity_id: str) -> bool:
+        """Delete an entity."""
+        if self.lookup_keys:
+            await self._write_keyed(entity_id, {}, "delete")
+            self._discard(entity_id)
+            return True
+        partitions = await self._write_partitions(self._context_tenant())
+        await asyncio.gather(
+            *(
+                partition.collection(self.collection).document(entity_id).delete()
+                for partition in partitions
+            )
+        )
+        self._discard(entity_id)
+        return True
+
+    async def create_many(self, entities: builtins.list[T]) -> BulkWriteResult[T]:
+        """Create many entities in chunked batches."""
+        if self.lookup_keys:
+            for entity in entities:
+                entity.id = self.db.collection(self.collection).document().id
+            return await self._write_each(
+                entities,
+                lambda entity: self._write_keyed(entity.id, self.codec.encode(entity), "set"),
+                lambda entity: entity.id,
+                self._record,
+            )
+        ops = []
+        for index, entity in enumerate(entities):
+            partitions = await self._write_partitions(_tenant_of(entity))
+            entity.id = partitions[0].collection(self.collection).document().id
+            data = self.codec.encode(entity)
+            for partition in partitions:
+                ref = partition.collection(self.collection).document(entity.id)
+                ops.append((partition.db, WriteOp(index, ref, "set", data)))
+        return await self._write(entities, ops, lambda entity: entity.id, self._record)
+
+    async def update_many(self, entities: builtins.list[T]) -> BulkWriteResult[T]:
+        """Update many entities in chunked batches."""
+        if self.lookup_keys:
+            return await self._write_each(
+                entities,
+                lambda entity: self._write_keyed(entity.id, self.codec.encode(entity), "update"),
+                lambda entity: entity.id,
+                self._record,
+            )
+        ops = []
+        for index, entity in enumerate(entities):
+            partitions = await self._write_partitions(_tenant_of(entity))
+            data = self.codec.encode(entity)
+            for position, partition in enumerate(partitions):
+                ref = partition.collection(self.collection).document(entity.id)
+                kind: Literal["set", "update"] = "update" if position == 0 else "set"
+                ops.append((partition.db, WriteOp(index, ref, kind, data)))
+        return await self._write(entities, ops, lambda entity: entity.id, self._record)
+
+    async def delete_many(self, entity_ids: builtins.list[str]) -> BulkWriteResult[str]:
+        """Delete many entities in chunked batches."""
+        if self.lookup_keys:
+            return await self._write_each(
+                entity_ids,
+                lambda entity_id: self._write_keyed(entity_id, {}, "delete"),
+                lambda entity_id: entity_id,
+                self._discard,
+            )
+        partitions = await self._write_partitions(self._context_tenant())
+        ops = [
+            (
+                partition.db,
+                WriteOp(index, partition.collection(self.collection).document(entity_id), "delete"),
+            )
+            for index, entity_id in enumerate(entity_ids)
+            for partition in partitions
+        ]
+        return await self._write(entity_ids, ops, lambda entity_id: entity_id, self._discard)
+
+    async def list(
+        self, limit: int = 100, filters: dict | None = None, page_token: str | None = None
+    ) -> Page[T]:
+        """List entities with pagination and equality filters."""
+        scope = ("list", filters or {})
+        return await self._fetch_page(await self._query(filters), limit, page_token, scope)
+
+    async def backfill_lookup_keys(self, page_size: int = 500) -> BackfillReport:
+        """Create the missing key documents of every stored entity.
+
+        Needed once for entities written before their keys were declared;
+        keys owned by another entity are reported as conflicts.
+        """
+        report = BackfillReport()
+        collection = self.db.collection(self.collection)
+        query = collection.order_by(DOCUMENT_ID).limit(page_size)
+        last = None
+        while True:
+            page = query.start_after(last) if last is not None else query
+            docs = [doc async for doc in page.stream()]
+            keys = [
+                (ref, doc.id)
+                for doc in docs
+                for ref in self._key_refs(doc.to_dict() or {}).values()
+            ]
+            ops = [
+                WriteOp(index, ref, "create", {"entity_id": entity_id})
+                for index, (ref, entity_id) in enumerate(keys)
+            ]
+            failures = await self.batch_writer.write(ops)
+            report.created += len(ops) - len(failures)
+            for index, error in failures.items():
+                if not isinstance(error, AlreadyExists):
+                    raise error
+                ref, entity_id = keys[index]
+                owner = await ref.get()
+                if owner.get("entity_id") == entity_id:
+                    report.already_present += 1
+                else:
+                    report.conflicts.append(ref.path)
+            if len(docs) < page_size:
+                return report
+            last = docs[-1]
+
+    def _context_tenant(self) -> str | None:
+        """Tenant of an operation addressed only by ID.
+
+        A partitioned repository cannot tell where such a document lives without
+        one, so it raises instead of falling back to the flat collection.
+        """
+        tenant_id = current_tenant_id.get()
+        if tenant_id is None and self.partitioned and self.partitioning is not None:
+            raise RuntimeError(
+                f"{type(self).__name__} needs a tenant context; "
+                "wrap calls made outside a request in tenant_scope()"
+            )
+        return tenant_id
+
+    async def _partition(self, tenant_id: str | None) -> Partition:
+        """Partition holding a tenant's documents; the flat layout when not partitioned."""
+        if tenant_id is None or self.partitioning is None or not self.partitioned:
+            return Partition(tenant_id, Layout.FLAT, self.db)
+        return await self.partitioning.resolve(tenant_id)
+
+    async def _write_partitions(self, tenant_id: str | None) -> builtins.list[Partition]:
+        if tenant_id is None or self.partitioning is None or not self.partitioned:
+            return [Partition(tenant_id, Layout.FLAT, self.db)]
+        return await self.partitioning.write_partitions(tenant_id)
+
+    async def _tenant_query(self, tenant_id: str) -> Query:
+        """Query over one tenant's documents."""
+        query: Query = (await self._partition(tenant_id)).query(self.collection)
+        return query
+
+    async def _query(self, filters: dict[str, Any] | None = None) -> Query:
+        """Build a query with an equality filter per item.
+
+        A ``tenant_id`` filter selects the tenant's partition; without one the
+        query covers the flat collection.
+        """
+        filters = dict(filters or {})
+        tenant_id = filters.pop("tenant_id", None)
+        query: Query
+        if tenant_id is None:
+            query = self.db.collection(self.collection)
+        else:
+            query = await self._tenant_query(tenant_id)
+        for key, value in filters.items():
+            query = query.where(key, "==", value)
+        return query
+
+    async def _get_by_key(self, key: LookupKey, *values: Any) -> T | None:
+        """Get the entity owning a lookup key with two document gets."""
+        doc_id = key.document_id(*values)
+        if doc_id is None:
+            return None
+        owner = await self.db.collection(key.collection).document(doc_id).get()
+        if not owner.exists:
+            return None
+        return await self.get_by_id(owner.get("entity_id"))
+
+    def _key_refs(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Key document references of a serialized entity, by document path."""
+        refs = {}
+        for key in self.lookup_keys:
+            doc_id = key.document_id_of(data)
+            if doc_id is not None:
+                refs[f"{key.collection}/{doc_id}"] = self.db.collection(key.collection).document(
+                    doc_id
+                )
+        return refs
+
+    async def _write_keyed(
+        self,
+        entity_id: str,
+        data: dict[str, Any],
+        kind: Literal["set", "update", "delete"],
+    ) -> None:
+        """Write an entity and move its lookup keys in one transaction.
+
+        A delete passes no ``data``, which drops every key of the entity.
+        """
+        ref = self.db.collection(self.collection).document(entity_id)
+
+        @firestore.async_transactional
+        async def run(transaction: firestore.AsyncTransaction) -> None:
+            previous: dict[str, Any] = {}
+            if kind != "set":
+                # Reading the entity also makes concurrent writes of it retry
+                snapshot = await ref.get(transaction=transaction)
+                previous = snapshot.to_dict() or {}
+            old, new = self._key_refs(previous), self._key_refs(data)
+            for path, key_ref in old.items():
+                if path not in new:
+                    transaction.delete(key_ref)
+            for path, key_ref in new.items():
+                if path not in old:
+                    transaction.create(key_ref, {"entity_id": entity_id})
+            if kind == "set":
+                transaction.set(ref, data)
+            elif kind == "update":
+                transaction.update(ref, data)
+            else:
+                transaction.delete(ref)
+
+        try:
+            await run(self.db.transaction())
+        except AlreadyExists as e:
+            raise ConflictError(
+                f"{self.entity_type.__name__} conflicts with an existing one: {e.message}"
+            ) from e
+
+    async def _write_each(
+        self,
+        items: builtins.list[R],
+        write: Callable[[R], Awaitable[None]],
+        key: Callable[[R], str],
+        on_success: Callable[[R], None],
+    ) -> BulkWriteResult[R]:
+        """Run one write per item with the batch writer's concurrency."""
+        semaphore = asyncio.Semaphore(self.batch_writer.max_concurrency)
+
+        async def run(index: int, item: R) -> dict[int, Exception]:
+            try:
+                async with semaphore:
+                    await write(item)
+            except Exception as e:
+                return {index: e}
+            return {}
+
+        results = await asyncio.gather(*(run(index, item) for index, item in enumerate(items)))
+        return _bulk_result(items, results, key, on_success)
+
+    def _hydrate(self, doc: Any) -> T:
+        """Build an entity from a snapshot without copying or re-validating its data."""
+        return cast(T, self.codec.hydrate(_stored(doc)))
+
+    def _record(self, entity: T) -> None:
+        """Hook run after an entity is written."""
+
+    def _discard(self, entity_id: str) -> None:
+        """Hook run after an entity is deleted."""
+
+    async def _write(
+        self,
+        items: builtins.list[R],
+        ops: builtins.list[tuple[Any, WriteOp]],
+        key: Callable[[R], str],
+        on_success: Callable[[R], None],
+    ) -> BulkWriteResult[R]:
+        """Commit writes per database; an item fails if any of its writes failed."""
+        by_database: dict[int, tuple[Any, builtins.list[WriteOp]]] = {}
+        for db, op in ops:
+            by_database.setdefault(id(db), (db, []))[1].append(op)
+        results = await asyncio.gather(
+            *(self._batch_writer(db).write(db_ops) for db, db_ops in by_database.values())
+        )
+        return _bulk_result(items, results, key, on_success)
+
+    def _batch_writer(self, db: Any) -> BatchWriter:
+        if db is self.db:
+            return self.batch_writer
+        return BatchWriter(db, self.batch_writer.batch_size, self.batch_writer.max_concurrency)
+
+    async def _first(self, query: Query) -> T | None:
+        """Get the first document of a query."""
+        async for doc in query.limit(1).stream():
+            return self._hydrate(doc)
+        return None
+
+    async def _iter_query(self, query: Query, page_size: int) -> AsyncIterator[T]:
+        """Yield a query's documents one keyset page at a time.
+
+        Each page is a separate bounded query resumed after the last document
+        seen, so long exports neither hold more than one page nor keep a
+        single stream open past its deadline.
+        """
+        query = query.order_by(self.order_field).order_by(DOCUMENT_ID).limit(page_size)
+        last = None
+        while True:
+            page = query.start_after(last) if last is not None else query
+            count = 0
+            async for doc in page.stream():
+                count += 1
+                last = doc
+                yield self._hydrate(doc)
+            if count < page_size:
+                return
+
+    @overload
+    async def _fetch_page(
+        self, query: Query, limit: int, page_token: str | None, scope: Any
+    ) -> Page[T]: ...
+
+    @overload
+    async def _fetch_page(
+        self,
+        query: Query,
+        limit: int,
+        page_token: str | None,
+        scope: Any,
+        hydrate: Callable[[dict[str, Any]], R],
+    ) -> Page[R]: ...
+
+    async def _fetch_page(
+        self,
+        query: Query,
+        limit: int,
+        page_token: str | None,
+        scope: Any,
+        hydrate: Callable[[dict[str, Any]], R] | None = None,
+    ) -> Page[T] | Page[R]:
+        """Run a query for one keyset page and hydrate the resulting documents.
+
+        One extra document is requested to know whether a next page exists
+        without issuing a second query. ``hydrate`` builds items from a
+        projected query; it defaults to the full entity.
+        """
+        query = query.order_by(self.order_field).order_by(DOCUMENT_ID)
+        if page_token:
+            order_value, doc_id = self.page_tokens.decode(page_token, scope)
+            query = query.start_after({self.order_field: order_value, DOCUMENT_ID: doc_id})
+
+        docs = [doc async for doc in query.limit(limit + 1).stream()]
+
+        next_page_token = None
+        if len(docs) > limit:
+            docs = docs[:limit]
+            last = docs[-1]
+            next_page_token = self.page_tokens.encode([last.get(self.order_field), last.id], scope)
+
+        stored = [_stored(doc) for doc in docs]
+        if hydrate is None:
+            return Page(items=self.codec.hydrate_many(stored), next_page_token=next_page_token)
+        return Page(items=[hydrate(data) for data in stored], next_page_token=next_page_token)
+
+
+def _bulk_result(
+    items: builtins.list[R],
+    results: Sequence[dict[int, Exception]],
+    key: Callable[[R], str],
+    on_success: Callable[[R], None],
+) -> BulkWriteResult[R]:
+    failures: dict[int, Exception] = {}
+    for partial in results:
+        failures.update(partial)
+    result = build_bulk_result(items, failures, key)
+    for item in result.succeeded:
+        on_success(item)
+    return result
+
+
+def _stored(doc: Any) -> dict[str, Any]:
+    data = doc.to_dict()
+    data["id"] = doc.id
+    return data  # type: ignore[no-any-return]
+
+
+def _tenant_of(entity: Any) -> str | None:
+    tenant_id = getattr(entity, "tenant_id", None)
+    return str(tenant_id) if tenant_id is not None else None
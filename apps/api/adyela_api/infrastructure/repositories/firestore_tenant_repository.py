@@ -0,0 +1,18 @@
+"""Firestore implementation of TenantRepository."""
+
+from adyela_api.application.ports import TenantRepository
+from adyela_api.domain import Tenant
+from adyela_api.infrastructure.repositories.firestore_repository import FirestoreRepository
+from adyela_api.infrastructure.repositories.lookup_keys import TENANT_NAME_KEY
+
+
+class FirestoreTenantRepository(FirestoreRepository[Tenant], TenantRepository):
+    """Firestore implementation of tenant repository, ordered by ``created_at``."""
+
+    collection_key = "tenants"
+    entity_type = Tenant
+    lookup_keys = (TENANT_NAME_KEY,)
+
+    async def get_by_name(self, name: str) -> Tenant | None:
+        """Get tenant by name."""
+        return await self._get_by_key(TENANT_NAME_KEY, name)
@@ -0,0 +1,176 @@
+"""In-memory implementation of AppointmentRepository."""
+
+import math
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
+from typing import Any
+
+from adyela_api.application.ports import AppointmentRepository, Page
+from adyela_api.config.constants import ACTIVE_APPOINTMENT_STATUSES
+from adyela_api.domain import APPOINTMENT_CODEC, Appointment, AppointmentSummary, ValidationError
+from adyela_api.infrastructure.repositories.in_memory_repository import InMemoryRepository
+from adyela_api.infrastructure.repositories.interval_index import AvailabilityIndex, IndexKey
+from adyela_api.infrastructure.repositories.pagination import PageTokenCodec
+
+
+class InMemoryAppointmentRepository(InMemoryRepository[Appointment], AppointmentRepository):
+    """Zero-I/O appointment repository for load tests and benchmarks.
+
+    Mirrors ``FirestoreAppointmentRepository``: queries are ordered by
+    ``start_time`` and paginated with the same tokens, and availability is
+    answered from an ``AvailabilityIndex`` that never expires, loaded from
+    the stored documents the first time a practitioner or patient is checked.
+    """
+
+    entity_name = "Appointment"
+    order_field = "start_time"
+    indexed_fields = ("tenant_id", "patient_id", "practitioner_id")
+
+    def __init__(self, page_tokens: PageTokenCodec) -> None:
+        super().__init__(page_tokens)
+        self.availability_index = AvailabilityIndex(ttl_seconds=math.inf)
+
+    def _hydrate(self, data: dict[str, Any]) -> Appointment:
+        return APPOINTMENT_CODEC.hydrate(data)
+
+    async def create(self, entity: Appointment) -> Appointment:
+        """Create a new appointment."""
+        await super().create(entity)
+        self.availability_index.record(entity)
+        return entity
+
+    async def update(self, entity: Appointment) -> Appointment:
+        """Update an existing appointment."""
+        await super().update(entity)
+        self.availability_index.record(entity)
+        return entity
+
+    async def delete(self, entity_id: str) -> bool:
+        """Delete an appointment."""
+        await super().delete(entity_id)
+        self.availability_index.discard(entity_id)
+        return True
+
+    async def list_by_patient(
+        self, tenant_id: str, patient_id: str, limit: int = 100, page_token: str | None = None
+    ) -> Page[Appointment]:
+        """List appointments for a patient."""
+        equals = {"tenant_id": tenant_id, "patient_id": patient_id}
+        scope = ("patient", tenant_id, patient_id)
+        return self._page(equals, limit, page_token, scope)
+
+    async def list_by_practitioner(
+        self, tenant_id: str, practitioner_id: str, limit: int = 100, page_token: str | None = None
+    ) -> Page[Appointment]:
+        """List appointments for a practitioner."""
+        equals = {"tenant_id": tenant_id, "practitioner_id": practitioner_id}
+        scope = ("practitioner", tenant_id, practitioner_id)
+        return self._page(equals, limit, page_token, scope)
+
+    async def list_by_date_range(
+        self,
+        tenant_id: str,
+        start_date: str,
+        end_date: str,
+        limit: int = 100,
+        page_token: str | None = None,
+    ) -> Page[Appointment]:
+        """List appointments within a date range."""
+        scope = ("date_range", tenant_id, start_date, end_date)
+        return self._page(
+            {"tenant_id": tenant_id}, limit, page_token, scope, start=start_date, end=end_date
+        )
+
+    async def count(self, filters: dict | None = None) -> int:
+        """Count appointments matching equality filters."""
+        return self._count(filters or {})
+
+    def iter_by_patient(
+        self, tenant_id: str, patient_id: str, page_size: int = 500
+    ) -> AsyncIterator[Appointment]:
+        """Yield every appointment for a patient."""
+        return self._iter({"tenant_id": tenant_id, "patient_id": patient_id}, page_size)
+
+    def iter_by_practitioner(
+        self, tenant_id: str, practitioner_id: str, page_size: int = 500
+    ) -> AsyncIterator[Appointment]:
+        """Yield every appointment for a practitioner."""
+        return self._iter({"tenant_id": tenant_id, "practitioner_id": practitioner_id}, page_size)
+
+    def iter_by_date_range(
+        self, tenant_id: str, start_date: str, end_date: str, page_size: int = 500
+    ) -> AsyncIterator[Appointment]:
+        """Yield every appointment within a date range."""
+        return self._iter({"tenant_id": tenant_id}, page_size, start=start_date, end=end_date)
+
+    async def list_summaries(
+        self,
+        tenant_id: str,
+        fields: Sequence[str] | None = None,
+        filters: dict | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        limit: int = 100,
+        page_token: str | None = None,
+    ) -> Page[AppointmentSummary]:
+        """List appointment summaries with only the requested fields."""
+        requested = set(fields or AppointmentSummary.DEFAULT_FIELDS)
+        unknown = requested - AppointmentSummary.FIELDS
+        if unknown:
+            raise ValidationError(f"Cannot project fields: {', '.join(sorted(unknown))}")
+
+        projection = sorted(requested | {self.order_field})
+        scope = ("summaries", tenant_id, filters or {}, start_date, end_date, projection)
+
+        def project(data: dict[str, Any]) -> AppointmentSummary:
+            return AppointmentSummary.from_dict(
+                {"id": data["id"], **{name: data[name] for name in projection if name in data}}
+            )
+
+        return self._page(
+            {"tenant_id": tenant_id, **(filters or {})},
+            limit,
+            page_token,
+            scope,
+            start=start_date,
+            end=end_date,
+            hydrate=project,
+        )
+
+    async def check_availability(
+        self, tenant_id: str, practitioner_id: str, start_time: str, end_time: str
+    ) -> bool:
+        """Check if practitioner is available."""
+        key = AvailabilityIndex.practitioner_key(tenant_id, practitioner_id)
+        equals = {"tenant_id": tenant_id, "practitioner_id": practitioner_id}
+        return self._is_free(key, equals, start_time, end_time)
+
+    async def check_patient_availability(
+        self, tenant_id: str, patient_id: str, start_time: str, end_time: str
+    ) -> bool:
+        """Check if patient has no other appointment in the time slot."""
+        key = AvailabilityIndex.patient_key(tenant_id, patient_id)
+        equals = {"tenant_id": tenant_id, "patient_id": patient_id}
+        return self._is_free(key, equals, start_time, end_time)
+
+    def _is_free(
+        self, key: IndexKey, equals: dict[str, Any], start_time: str, end_time: str
+    ) -> bool:
+        index = self.availability_index
+        if not index.is_loaded(key):
+            active = {status.value for status in ACTIVE_APPOINTMENT_STATUSES}
+            index.load(
+                key,
+                (
+                    (
+                        doc_id,
+                        datetime.fromisoformat(data["start_time"]),
+                        datetime.fromisoformat(data["end_time"]),
+                    )
+                    for doc_id, data in self._query(equals)
+                    if data["status"] in active
+                ),
+            )
+        return not index.overlaps(
+            key, datetime.fromisoformat(start_time), datetime.fromisoformat(end_time)
+        )
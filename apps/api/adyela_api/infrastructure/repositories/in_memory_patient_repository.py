@@ -0,0 +1,39 @@
+"""In-memory implementation of PatientRepository."""
+
+from typing import Any
+
+from adyela_api.application.ports import Page, PatientRepository
+from adyela_api.domain import PATIENT_CODEC, Patient
+from adyela_api.infrastructure.repositories.in_memory_repository import InMemoryRepository
+from adyela_api.infrastructure.repositories.lookup_keys import (
+    PATIENT_EMAIL_KEY,
+    PATIENT_MEDICAL_RECORD_KEY,
+)
+
+
+class InMemoryPatientRepository(InMemoryRepository[Patient], PatientRepository):
+    """Zero-I/O patient repository for load tests and benchmarks."""
+
+    entity_name = "Patient"
+    order_field = "created_at"
+    lookup_keys = (PATIENT_EMAIL_KEY, PATIENT_MEDICAL_RECORD_KEY)
+
+    def _hydrate(self, data: dict[str, Any]) -> Patient:
+        return PATIENT_CODEC.hydrate(data)
+
+    async def get_by_email(self, tenant_id: str, email: str) -> Patient | None:
+        """Get patient by email within a tenant."""
+        return await self._get_by_key(PATIENT_EMAIL_KEY, tenant_id, email)
+
+    async def get_by_medical_record(
+        self, tenant_id: str, medical_record_number: str
+    ) -> Patient | None:
+        """Get patient by medical record number."""
+        return await self._get_by_key(PATIENT_MEDICAL_RECORD_KEY, tenant_id, medical_record_number)
+
+    async def list_by_tenant(
+        self, tenant_id: str, limit: int = 100, page_token: str | None = None
+    ) -> Page[Patient]:
+        """List patients for a tenant."""
+        scope = ("tenant", tenant_id)
+        return self._page({"tenant_id": tenant_id}, limit, page_token, scope)
@@ -0,0 +1,39 @@
+"""In-memory implementation of PractitionerRepository."""
+
+from typing import Any
+
+from adyela_api.application.ports import Page, PractitionerRepository
+from adyela_api.domain import PRACTITIONER_CODEC, Practitioner
+from adyela_api.infrastructure.repositories.in_memory_repository import InMemoryRepository
+from adyela_api.infrastructure.repositories.lookup_keys import PRACTITIONER_EMAIL_KEY
+
+
+class InMemoryPractitionerRepository(InMemoryRepository[Practitioner], PractitionerRepository):
+    """Zero-I/O practitioner repository for load tests and benchmarks."""
+
+    entity_name = "Practitioner"
+    order_field = "created_at"
+    indexed_fields = ("tenant_id", "specialty")
+    lookup_keys = (PRACTITIONER_EMAIL_KEY,)
+
+    def _hydrate(self, data: dict[str, Any]) -> Practitioner:
+        return PRACTITIONER_CODEC.hydrate(data)
+
+    async def get_by_email(self, tenant_id: str, email: str) -> Practitioner | None:
+        """Get practitioner by email within a tenant."""
+        return await self._get_by_key(PRACTITIONER_EMAIL_KEY, tenant_id, email)
+
+    async def list_by_tenant(
+        self, tenant_id: str, limit: int = 100, page_token: str | None = None
+    ) -> Page[Practitioner]:
+        """List practitioners for a tenant."""
+        scope = ("tenant", tenant_id)
+        return self._page({"tenant_id": tenant_id}, limit, page_token, scope)
+
+    async def list_by_specialty(
+        self, tenant_id: str, specialty: str, limit: int = 100, page_token: str | None = None
+    ) -> Page[Practitioner]:
+        """List practitioners by specialty."""
+        equals = {"tenant_id": tenant_id, "specialty": specialty}
+        scope = ("specialty", tenant_id, specialty)
+        return self._page(equals, limit, page_token, scope)
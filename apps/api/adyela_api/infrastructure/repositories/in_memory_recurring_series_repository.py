@@ -0,0 +1,36 @@
+"""In-memory implementation of RecurringSeriesRepository."""
+
+from typing import Any
+
+from adyela_api.application.ports import Page, RecurringSeriesRepository
+from adyela_api.domain import RECURRING_SERIES_CODEC, RecurringSeries
+from adyela_api.infrastructure.repositories.in_memory_repository import InMemoryRepository
+
+
+class InMemoryRecurringSeriesRepository(
+    InMemoryRepository[RecurringSeries], RecurringSeriesRepository
+):
+    """Zero-I/O recurring series repository for load tests and benchmarks."""
+
+    entity_name = "RecurringSeries"
+    order_field = "created_at"
+    indexed_fields = ("tenant_id", "practitioner_id", "patient_id")
+
+    def _hydrate(self, data: dict[str, Any]) -> RecurringSeries:
+        return RECURRING_SERIES_CODEC.hydrate(data)
+
+    async def list_by_practitioner(
+        self, tenant_id: str, practitioner_id: str, limit: int = 100, page_token: str | None = None
+    ) -> Page[RecurringSeries]:
+        """List active series for a practitioner."""
+        equals = {"tenant_id": tenant_id, "practitioner_id": practitioner_id, "is_active": True}
+        scope = ("practitioner", tenant_id, practitioner_id)
+        return self._page(equals, limit, page_token, scope)
+
+    async def list_by_patient(
+        self, tenant_id: str, patient_id: str, limit: int = 100, page_token: str | None = None
+    ) -> Page[RecurringSeries]:
+        """List active series for a patient."""
+        equals = {"tenant_id": tenant_id, "patient_id": patient_id, "is_active": True}
+        scope = ("patient", tenant_id, patient_id)
+        return self._page(equals, limit, page_token, scope)
@@ -0,0 +1,293 @@
+"""Indexed in-memory document store shared by the in-memory repositories."""
+
+import bisect
+import builtins
+import itertools
+import uuid
+from abc import abstractmethod
+from collections.abc import AsyncIterator, Callable, Iterator, Sequence
+from typing import Any, ClassVar, TypeVar
+
+from adyela_api.application.ports import BaseRepository, BulkWriteResult, Page
+from adyela_api.domain import ConflictError, EntityNotFoundError
+from adyela_api.infrastructure.repositories.batch_writer import build_bulk_result
+from adyela_api.infrastructure.repositories.lookup_keys import LookupKey
+from adyela_api.infrastructure.repositories.pagination import PageTokenCodec
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Position of a document in an ordered index: (order field value, document ID)
+OrderKey = tuple[Any, str]
+
+
+class InMemoryRepository(BaseRepository[T]):
+    """Repository over plain dicts with the query semantics of the Firestore adapters.
+
+    Documents are stored as ``to_dict()`` snapshots and hydrated on every
+    read, as they would be when read from Firestore. Every query is ordered
+    by ``order_field`` and then the document ID, and paginated with the same
+    signed keyset tokens; documents without the order field are left out of
+    queries, as Firestore does. Each of ``indexed_fields`` gets a hash index
+    from value to that field's documents in query order, so an equality
+    filter costs a bisect plus the page being read rather than a scan.
+
+    ``lookup_keys`` are kept as the Firestore adapters keep them: each key
+    path maps to the ID of the entity owning it, values are casefolded the
+    same way, and writes taking a key owned by another entity raise
+    ``ConflictError``.
+    """
+
+    entity_name: ClassVar[str]
+    order_field: ClassVar[str]
+    indexed_fields: ClassVar[tuple[str, ...]] = ("tenant_id",)
+    lookup_keys: ClassVar[tuple[LookupKey, ...]] = ()
+
+    def __init__(self, page_tokens: PageTokenCodec) -> None:
+        self.page_tokens = page_tokens
+        self._docs: dict[str, dict[str, Any]] = {}
+        self._ordered: list[OrderKey] = []
+        self._indexes: dict[str, dict[Any, list[OrderKey]]] = {
+            field: {} for field in self.indexed_fields
+        }
+        # Key document path -> ID of the entity owning the key
+        self._keys: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    @abstractmethod
+    def _hydrate(self, data: dict[str, Any]) -> T:
+        """Build an entity from a stored document."""
+
+    async def create(self, entity: T) -> T:
+        """Create a new entity under a generated ID."""
+        entity.id = uuid.uuid4().hex  # type: ignore[attr-defined]
+        self._put(entity)
+        return entity
+
+    async def get_by_id(self, entity_id: str) -> T | None:
+        """Get entity by ID."""
+        data = self._docs.get(entity_id)
+        return self._hydrate(data) if data is not None else None
+
+    async def get_many(self, entity_ids: Sequence[str]) -> dict[str, T]:
+        """Get entities by ID; missing IDs are left out."""
+        return {
+            entity_id: self._hydrate(self._docs[entity_id])
+            for entity_id in dict.fromkeys(entity_ids)
+            if entity_id in self._docs
+        }
+
+    async def update(self, entity: T) -> T:
+        """Update an existing entity."""
+        entity_id = entity.id  # type: ignore[attr-defined]
+        if entity_id not in self._docs:
+            raise EntityNotFoundError(self.entity_name, entity_id)
+        self._put(entity)
+        return entity
+
+    async def delete(self, entity_id: str) -> bool:
+        """Delete an entity; deleting a missing entity succeeds, as in Firestore."""
+        self.remove_document(entity_id)
+        return True
+
+    async def create_many(self, entities: builtins.list[T]) -> BulkWriteResult[T]:
+        """Create many entities, failing per item for conflicting keys."""
+        failures: dict[int, Exception] = {}
+        for index, entity in enumerate(entities):
+            try:
+                await self.create(entity)
+            except ConflictError as e:
+                failures[index] = e
+        return build_bulk_result(entities, failures, lambda entity: entity.id)  # type: ignore[attr-defined]
+
+    async def update_many(self, entities: builtins.list[T]) -> BulkWriteResult[T]:
+        """Update many entities, failing per item for missing ones or conflicting keys."""
+        failures: dict[int, Exception] = {}
+        for index, entity in enumerate(entities):
+            try:
+                await self.update(entity)
+            except (EntityNotFoundError, ConflictError) as e:
+                failures[index] = e
+        return build_bulk_result(entities, failures, lambda entity: entity.id)  # type: ignore[attr-defined]
+
+    async def delete_many(self, entity_ids: builtins.list[str]) -> BulkWriteResult[str]:
+        """Delete many entities."""
+        for entity_id in entity_ids:
+            await self.delete(entity_id)
+        return build_bulk_result(entity_ids, {}, lambda entity_id: entity_id)
+
+    async def list(
+        self, limit: int = 100, filters: dict | None = None, page_token: str | None = None
+    ) -> Page[T]:
+        """List entities with pagination and equality filters."""
+        scope = ("list", filters or {})
+        return self._page(filters or {}, limit, page_token, scope)
+
+    def put_document(self, data: dict[str, Any]) -> None:
+        """Store a raw document snapshot, replacing any previous version."""
+        doc_id = data["id"]
+        self.remove_document(doc_id)
+        self._docs[doc_id] = data
+        for path in self._key_paths(data):
+            self._keys[path] = doc_id
+
+        order_value = data.get(self.order_field)
+        if order_value is None:
+            return
+        key = (order_value, doc_id)
+        bisect.insort(self._ordered, key)
+        for field, index in self._indexes.items():
+            value = data.get(field)
+            if value is not None:
+                bisect.insort(index.setdefault(value, []), key)
+
+    def remove_document(self, doc_id: str) -> None:
+        """Remove a document and its index entries if present."""
+        data = self._docs.pop(doc_id, None)
+        if data is None:
+            return
+        for path in self._key_paths(data):
+            if self._keys.get(path) == doc_id:
+                del self._keys[path]
+        if data.get(self.order_field) is None:
+            return
+        key = (data[self.order_field], doc_id)
+        _discard(self._ordered, key)
+        for field, index in self._indexes.items():
+            value = data.get(field)
+            if value is None:
+                continue
+            keys = index[value]
+            _discard(keys, key)
+            if not keys:
+                del index[value]
+
+    def _put(self, entity: T) -> None:
+        data = entity.to_dict()  # type: ignore[attr-defined]
+        for path in self._key_paths(data):
+            owner = self._keys.get(path)
+            if owner is not None and owner != data["id"]:
+                raise ConflictError(f"{self.entity_name} conflicts with an existing one: {path}")
+        self.put_document(data)
+
+    def _key_paths(self, data: dict[str, Any]) -> builtins.list[str]:
+        """Key document paths of a serialized entity, as the Firestore adapters name them."""
+        paths = []
+        for key in self.lookup_keys:
+            doc_id = key.document_id_of(data)
+            if doc_id is not None:
+                paths.append(f"{key.collection}/{doc_id}")
+        return paths
+
+    async def _get_by_key(self, key: LookupKey, *values: Any) -> T | None:
+        """Get the entity owning a lookup key."""
+        doc_id = key.document_id(*values)
+        if doc_id is None:
+            return None
+        owner = self._keys.get(f"{key.collection}/{doc_id}")
+        return await self.get_by_id(owner) if owner is not None else None
+
+    def _query(
+        self,
+        equals: dict[str, Any],
+        start: Any = None,
+        end: Any = None,
+        after: OrderKey | None = None,
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Yield matching documents in query order.
+
+        Scans the shortest indexed list among the equality filters (or every
+        document), starting at the later of ``start`` and the cursor ``after``
+        and stopping once the order field passes ``end``; both bounds are
+        inclusive, like the ``>=``/``<=`` filters of the Firestore queries.
+        """
+        candidates = self._ordered
+        for field, value in equals.items():
+            index = self._indexes.get(field)
+            if index is not None:
+                keys = index.get(value, [])
+                if len(keys) < len(candidates) or candidates is self._ordered:
+                    candidates = keys
+
+        position = 0
+        if start is not None:
+            position = bisect.bisect_left(candidates, (start,))
+        if after is not None:
+            position = max(position, bisect.bisect_right(candidates, after))
+
+        for offset in range(position, len(candidates)):
+            order_value, doc_id = candidates[offset]
+            if end is not None and order_value > end:
+                return
+            data = self._docs[doc_id]
+            if all(data.get(field) == value for field, value in equals.items()):
+                yield doc_id, data
+
+    async def _iter(
+        self, equals: dict[str, Any], page_size: int, start: Any = None, end: Any = None
+    ) -> AsyncIterator[T]:
+        """Yield matching entities, resuming after the last key once per page.
+
+        Like the Firestore adapter, writes made while iterating are seen or
+        not depending on where they fall relative to the cursor.
+        """
+        after = None
+        while True:
+            page = list(itertools.islice(self._query(equals, start, end, after), page_size))
+            for _, data in page:
+                yield self._hydrate(data)
+            if len(page) < page_size:
+                return
+            doc_id, data = page[-1]
+            after = (data[self.order_field], doc_id)
+
+    def _count(self, equals: dict[str, Any]) -> int:
+        """Count matching documents, reading only an index length when possible."""
+        if len(equals) == 1:
+            ((field, value),) = equals.items()
+            index = self._indexes.get(field)
+            if index is not None:
+                return len(index.get(value, []))
+        return sum(1 for _ in self._query(equals))
+
+    def _page(
+        self,
+        equals: dict[str, Any],
+        limit: int,
+        page_token: str | None,
+        scope: Any,
+        start: Any = None,
+        end: Any = None,
+        hydrate: Callable[[dict[str, Any]], R] | None = None,
+    ) -> Page[R]:
+        """Read one keyset page, using the same tokens as the Firestore adapters."""
+        after = None
+        if page_token:
+            order_value, doc_id = self.page_tokens.decode(page_token, scope)
+            after = (order_value, doc_id)
+
+        matches = []
+        for match in self._query(equals, start, end, after):
+            matches.append(match)
+            if len(matches) > limit:
+                break
+
+        next_page_token = None
+        if len(matches) > limit:
+            matches = matches[:limit]
+            doc_id, data = matches[-1]
+            next_page_token = self.page_tokens.encode([data[self.order_field], doc_id], scope)
+
+        convert = hydrate or self._hydrate
+        return Page(
+            items=[convert(data) for _, data in matches],  # type: ignore[misc]
+            next_page_token=next_page_token,
+        )
+
+
+def _discard(keys: list[OrderKey], key: OrderKey) -> None:
+    position = bisect.bisect_left(keys, key)
+    if position < len(keys) and keys[position] == key:
+        del keys[position]
@@ -0,0 +1,24 @@
+"""In-memory implementation of TenantRepository."""
+
+from typing import Any
+
+from adyela_api.application.ports import TenantRepository
+from adyela_api.domain import TENANT_CODEC, Tenant
+from adyela_api.infrastructure.repositories.in_memory_repository import InMemoryRepository
+from adyela_api.infrastructure.repositories.lookup_keys import TENANT_NAME_KEY
+
+
+class InMemoryTenantRepository(InMemoryRepository[Tenant], TenantRepository):
+    """Zero-I/O tenant repository for load tests and benchmarks."""
+
+    entity_name = "Tenant"
+    order_field = "created_at"
+    indexed_fields = ()
+    lookup_keys = (TENANT_NAME_KEY,)
+
+    def _hydrate(self, data: dict[str, Any]) -> Tenant:
+        return TENANT_CODEC.hydrate(data)
+
+    async def get_by_name(self, name: str) -> Tenant | None:
+        """Get tenant by name."""
+        return await self._get_by_key(TENANT_NAME_KEY, name)
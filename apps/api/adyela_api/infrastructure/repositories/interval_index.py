@@ -0,0 +1,192 @@
+"""In-process interval indexes for availability and overlap checks."""
+
+import asyncio
+import bisect
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from datetime import datetime
+
+from adyela_api.config.constants import ACTIVE_APPOINTMENT_STATUSES
+from adyela_api.domain import Appointment
+
+IndexKey = tuple[str, str, str]
+
+
+class IntervalIndex:
+    """Set of half-open intervals kept as sorted arrays.
+
+    Intervals are sorted by start, and a running maximum of end times is kept
+    alongside. An interval ``[start, end)`` overlaps the set if, among the
+    intervals starting before ``end``, the largest end is after ``start``:
+    one bisect plus one array lookup, so checks are O(log n). Inserts and
+    removals are O(n) in the worst case, which is fine for the few hundred
+    bookings a practitioner has ahead of them.
+    """
+
+    def __init__(self) -> None:
+        self._keys: list[tuple[float, str]] = []
+        self._ends: list[float] = []
+        self._max_ends: list[float] = []
+        self._members: dict[str, tuple[float, float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self._members
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._members))
+
+    def add(self, item_id: str, start: float, end: float) -> None:
+        """Add or move an interval."""
+        self.discard(item_id)
+        position = bisect.bisect_left(self._keys, (start, item_id))
+        self._keys.insert(position, (start, item_id))
+        self._ends.insert(position, end)
+        self._members[item_id] = (start, end)
+        self._refresh_max_ends(position)
+
+    def discard(self, item_id: str) -> None:
+        """Remove an interval if present."""
+        member = self._members.pop(item_id, None)
+        if member is None:
+            return
+        position = bisect.bisect_left(self._keys, (member[0], item_id))
+        del self._keys[position]
+        del self._ends[position]
+        self._refresh_max_ends(position)
+
+    def overlaps(self, start: float, end: float) -> bool:
+        """Check if any interval overlaps ``[start, end)``."""
+        # Intervals at positions < count start strictly before ``end``
+        count = bisect.bisect_left(self._keys, (end,))
+        return count > 0 and self._max_ends[count - 1] > start
+
+    def _refresh_max_ends(self, position: int) -> None:
+        del self._max_ends[position:]
+        running = self._max_ends[-1] if self._max_ends else float("-inf")
+        for end in self._ends[position:]:
+            running = max(running, end)
+            self._max_ends.append(running)
+
+
+class AvailabilityIndex:
+    """Per-tenant interval indexes of active bookings by practitioner and patient.
+
+    A key is only authoritative once it has been loaded from storage; until
+    then (or after ``ttl_seconds``, so that writes made by other replicas are
+    picked up) callers must fall back to the database and ``load`` the key.
+    Writes made through this process are applied with ``record`` and
+    ``discard`` to keep loaded keys in sync.
+
+    Expired keys are dropped when next looked up, and at most ``max_keys``
+    keys are kept, evicting the least recently used.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 300,
+        max_keys: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_keys = max_keys
+        self._clock = clock
+        # Least recently used first
+        self._indexes: OrderedDict[IndexKey, IntervalIndex] = OrderedDict()
+        self._loaded_at: dict[IndexKey, float] = {}
+        self._keys_by_id: dict[str, set[IndexKey]] = {}
+        self._load_locks: dict[IndexKey, asyncio.Lock] = {}
+
+    @staticmethod
+    def practitioner_key(tenant_id: str, practitioner_id: str) -> IndexKey:
+        """Key for a practitioner's bookings."""
+        return (tenant_id, "practitioner", practitioner_id)
+
+    @staticmethod
+    def patient_key(tenant_id: str, patient_id: str) -> IndexKey:
+        """Key for a patient's bookings."""
+        return (tenant_id, "patient", patient_id)
+
+    def __len__(self) -> int:
+        return len(self._indexes)
+
+    def is_loaded(self, key: IndexKey) -> bool:
+        """Check if a key can answer overlap checks without storage."""
+        loaded_at = self._loaded_at.get(key)
+        if loaded_at is None:
+            return False
+        if self._clock() - loaded_at >= self.ttl_seconds:
+            self._evict(key)
+            return False
+        self._indexes.move_to_end(key)
+        return True
+
+    def load_lock(self, key: IndexKey) -> asyncio.Lock:
+        """Lock that keeps concurrent cache misses on a key to a single load."""
+        return self._load_locks.setdefault(key, asyncio.Lock())
+
+    def load(self, key: IndexKey, intervals: Iterable[tuple[str, datetime, datetime]]) -> None:
+        """Replace a key's bookings with a fresh read from storage."""
+        self._drop(key)
+        index = IntervalIndex()
+        for item_id, start, end in intervals:
+            index.add(item_id, start.timestamp(), end.timestamp())
+            self._keys_by_id.setdefault(item_id, set()).add(key)
+        self._indexes[key] = index
+        self._loaded_at[key] = self._clock()
+        while len(self._indexes) > self.max_keys:
+            self._evict(next(iter(self._indexes)))
+
+    def overlaps(self, key: IndexKey, start: datetime, end: datetime) -> bool:
+        """Check a loaded key for bookings overlapping ``[start, end)``."""
+        return self._indexes[key].overlaps(start.timestamp(), end.timestamp())
+
+    def record(self, appointment: Appointment) -> None:
+        """Apply a created or updated appointment to the loaded keys."""
+        self.discard(appointment.id)
+        if appointment.status not in ACTIVE_APPOINTMENT_STATUSES:
+            return
+
+        tenant_id = str(appointment.tenant_id)
+        start = appointment.schedule.start.timestamp()
+        end = appointment.schedule.end.timestamp()
+        for key in (
+            self.practitioner_key(tenant_id, appointment.practitioner_id),
+            self.patient_key(tenant_id, appointment.patient_id),
+        ):
+            index = self._indexes.get(key)
+            if index is not None:
+                index.add(appointment.id, start, end)
+                self._keys_by_id.setdefault(appointment.id, set()).add(key)
+
+    def discard(self, appointment_id: str) -> None:
+        """Remove a cancelled or deleted appointment from every key."""
+        for key in self._keys_by_id.pop(appointment_id, set()):
+            index = self._indexes.get(key)
+            if index is not None:
+                index.discard(appointment_id)
+
+    def _drop(self, key: IndexKey) -> None:
+        """Forget a key's bookings, keeping its load lock."""
+        stale = self._indexes.pop(key, None)
+        self._loaded_at.pop(key, None)
+        if stale is not None:
+            for item_id in stale:
+                self._unlink(item_id, key)
+
+    def _evict(self, key: IndexKey) -> None:
+        """Forget a key entirely, unless a load of it is in flight."""
+        self._drop(key)
+        lock = self._load_locks.get(key)
+        if lock is not None and not lock.locked():
+            del self._load_locks[key]
+
+    def _unlink(self, item_id: str, key: IndexKey) -> None:
+        keys = self._keys_by_id.get(item_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_id[item_id]
@@ -0,0 +1,60 @@
+"""Create the lookup-key documents of entities stored before their keys existed.
+
+Run with::
+
+    poetry run backfill-lookup-keys [patients practitioners tenants]
+"""
+
+import argparse
+import asyncio
+
+from adyela_api.config import get_settings
+from adyela_api.infrastructure.repositories.firestore_patient_repository import (
+    FirestorePatientRepository,
+)
+from adyela_api.infrastructure.repositories.firestore_practitioner_repository import (
+    FirestorePractitionerRepository,
+)
+from adyela_api.infrastructure.repositories.firestore_repository import FirestoreRepository
+from adyela_api.infrastructure.repositories.firestore_tenant_repository import (
+    FirestoreTenantRepository,
+)
+from adyela_api.infrastructure.repositories.pagination import PageTokenCodec
+from adyela_api.infrastructure.services.database import FirestoreClientRegistry
+
+REPOSITORIES: dict[str, type[FirestoreRepository]] = {
+    "patients": FirestorePatientRepository,
+    "practitioners": FirestorePractitionerRepository,
+    "tenants": FirestoreTenantRepository,
+}
+
+
+async def _backfill(names: list[str], page_size: int) -> None:
+    settings = get_settings()
+    clients = FirestoreClientRegistry(settings.gcp_project_id)
+    page_tokens = PageTokenCodec(settings.secret_key.get_secret_value())
+    try:
+        for name in names:
+            repository = REPOSITORIES[name](clients.client(), page_tokens)
+            report = await repository.backfill_lookup_keys(page_size=page_size)
+            print(
+                f"{name}: created={report.created} already_present={report.already_present} "
+                f"conflicts={len(report.conflicts)}"
+            )
+            for path in report.conflicts:
+                print(f"  conflict: {path}")
+    finally:
+        await clients.close()
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Create missing lookup-key documents")
+    parser.add_argument("collections", nargs="*", choices=[*REPOSITORIES], default=[*REPOSITORIES])
+    parser.add_argument("--page-size", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(_backfill(args.collections, args.page_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Unique lookup keys stored as documents named after the key values."""
+
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import quote
+
+from adyela_api.config import COLLECTIONS
+
+# Characters of key values kept as they are in document IDs; ":" separates values
+SAFE_CHARACTERS = "@+-._~"
+
+
+@dataclass(frozen=True)
+class LookupKey:
+    """A unique key of an entity, e.g. a patient's email within its tenant.
+
+    The key document ``{collection}/{value}:{value}`` holds the ID of the
+    entity owning the key, so a lookup is one document get, and creating
+    it with a ``create`` precondition rejects duplicates without a query.
+    Values are percent-encoded so that they never contain ``/`` or ``:``.
+    ``casefold`` makes the key case-insensitive.
+    """
+
+    collection_key: str
+    fields: tuple[str, ...]
+    casefold: bool = False
+
+    @property
+    def collection(self) -> str:
+        """Name of the collection holding the key documents."""
+        return COLLECTIONS[self.collection_key]
+
+    def document_id(self, *values: Any) -> str | None:
+        """Key document ID for values of ``fields``; None if any value is empty."""
+        parts = []
+        for value in values:
+            if value is None or value == "":
+                return None
+            text = str(value).casefold() if self.casefold else str(value)
+            parts.append(quote(text, safe=SAFE_CHARACTERS))
+        return ":".join(parts)
+
+    def document_id_of(self, data: dict[str, Any]) -> str | None:
+        """Key document ID of a serialized entity."""
+        return self.document_id(*(data.get(name) for name in self.fields))
+
+
+PATIENT_EMAIL_KEY = LookupKey("patient_email", ("tenant_id", "email"), casefold=True)
+PATIENT_MEDICAL_RECORD_KEY = LookupKey(
+    "patient_medical_record", ("tenant_id", "medical_record_number")
+)
+PRACTITIONER_EMAIL_KEY = LookupKey("practitioner_email", ("tenant_id", "email"), casefold=True)
+TENANT_NAME_KEY = LookupKey("tenant_name", ("name",))
+
+
+@dataclass
+class BackfillReport:
+    """Key documents written by a lookup-key backfill."""
+
+    created: int = 0
+    already_present: int = 0
+    # Key document paths owned by another entity, i.e. existing duplicates
+    conflicts: list[str] = field(default_factory=list)
@@ -0,0 +1,227 @@
+"""Online migration of a tenant's partitioned collections between layouts.
+
+Run with::
+
+    poetry run migrate-tenant-layout <tenant_id> --to subcollection
+    poetry run migrate-tenant-layout <tenant_id> --to database --indexes <firestore.indexes.json>
+"""
+
+import argparse
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from google.api_core.exceptions import AlreadyExists  # type: ignore
+
+from adyela_api.config import COLLECTIONS, get_settings
+from adyela_api.infrastructure.repositories.batch_writer import BatchWriter, WriteOp
+from adyela_api.infrastructure.repositories.firestore_repository import DOCUMENT_ID
+from adyela_api.infrastructure.repositories.partitioning import (
+    PARTITIONED_COLLECTIONS,
+    Layout,
+    Partition,
+    PartitionState,
+    TenantPartitioning,
+)
+from adyela_api.infrastructure.repositories.tenant_indexes import deploy_for_tenants
+from adyela_api.infrastructure.services.database import FirestoreClientRegistry
+
+
+@dataclass
+class MigrationReport:
+    """Document counts of a layout migration."""
+
+    copied: int = 0
+    already_present: int = 0
+    removed: int = 0
+    source_deleted: int = 0
+
+
+class TenantLayoutMigration:
+    """Move one tenant's documents to another layout while it keeps serving traffic.
+
+    1. The tenant is marked as migrating, so every replica writes to both
+       layouts once it has refreshed its partition states.
+    2. After ``settle_seconds``, every source document is copied with
+       create-if-absent writes: a document already in the target was written
+       by a dual write and is at least as recent as the copy.
+    3. Target documents whose source was deleted during the copy are removed.
+    4. Reads switch to the target while writes still reach both layouts;
+       after another ``settle_seconds`` the dual writes stop.
+    5. Optionally, the source documents are deleted.
+
+    Every step is idempotent, so a failed migration can be run again.
+    """
+
+    def __init__(
+        self,
+        partitioning: TenantPartitioning,
+        page_size: int = 500,
+        settle_seconds: float | None = None,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    ) -> None:
+        self.partitioning = partitioning
+        self.page_size = page_size
+        # Twice the refresh interval, so that every replica has reloaded the state
+        self.settle_seconds = (
+            settle_seconds if settle_seconds is not None else 2 * partitioning.refresh_seconds
+        )
+        self._sleep = sleep
+
+    async def run(
+        self, tenant_id: str, target: Layout, delete_source: bool = False
+    ) -> MigrationReport:
+        """Migrate a tenant to ``target``."""
+        report = MigrationReport()
+        state = await self.partitioning.state(tenant_id)
+        source_layout = state.layout
+        if source_layout is target:
+            return report
+
+        source = self.partitioning.partition(tenant_id, source_layout)
+        destination = self.partitioning.partition(tenant_id, target)
+
+        await self.partitioning.set_state(tenant_id, PartitionState(source_layout, target))
+        await self._sleep(self.settle_seconds)
+
+        for key in PARTITIONED_COLLECTIONS:
+            name = COLLECTIONS[key]
+            source_ids = await self._copy(source, destination, name, report)
+            await self._remove_orphans(source, destination, name, source_ids, report)
+
+        await self.partitioning.set_state(tenant_id, PartitionState(target, source_layout))
+        await self._sleep(self.settle_seconds)
+        await self.partitioning.set_state(tenant_id, PartitionState(target))
+
+        if delete_source:
+            for key in PARTITIONED_COLLECTIONS:
+                report.source_deleted += await self._delete_all(source, COLLECTIONS[key])
+        return report
+
+    async def _copy(
+        self, source: Partition, destination: Partition, name: str, report: MigrationReport
+    ) -> set[str]:
+        writer = BatchWriter(destination.db)
+        collection = destination.collection(name)
+        source_ids: set[str] = set()
+        async for page in self._pages(source.query(name)):
+            ops = [
+                WriteOp(index, collection.document(doc.id), "create", doc.to_dict())
+                for index, doc in enumerate(page)
+            ]
+            source_ids.update(doc.id for doc in page)
+            failures = await writer.write(ops)
+            errors = [error for error in failures.values() if not isinstance(error, AlreadyExists)]
+            if errors:
+                raise RuntimeError(f"Failed to copy {len(errors)} {name} documents: {errors[0]}")
+            report.already_present += len(failures)
+            report.copied += len(ops) - len(failures)
+        return source_ids
+
+    async def _remove_orphans(
+        self,
+        source: Partition,
+        destination: Partition,
+        name: str,
+        source_ids: set[str],
+        report: MigrationReport,
+    ) -> None:
+        # Target documents missing from the copied set were either created by dual
+        # writes after the copy read them, or deleted from the source mid-copy
+        writer = BatchWriter(destination.db)
+        collection = destination.collection(name)
+        async for page in self._pages(destination.query(name).select([])):
+            candidates: list[str] = [doc.id for doc in page if doc.id not in source_ids]
+            if not candidates:
+                continue
+            refs = [source.collection(name).document(doc_id) for doc_id in candidates]
+            existing = {doc.id async for doc in source.db.get_all(refs) if doc.exists}
+            ops = [
+                WriteOp(index, collection.document(doc_id), "delete")
+                for index, doc_id in enumerate(
+                    doc_id for doc_id in candidates if doc_id not in existing
+                )
+            ]
+            failures = await writer.write(ops)
+            report.removed += len(ops) - len(failures)
+
+    async def _delete_all(self, partition: Partition, name: str) -> int:
+        writer = BatchWriter(partition.db)
+        collection = partition.collection(name)
+        deleted = 0
+        async for page in self._pages(partition.query(name).select([])):
+            ops = [
+                WriteOp(index, collection.document(doc.id), "delete")
+                for index, doc in enumerate(page)
+            ]
+            failures = await writer.write(ops)
+            deleted += len(ops) - len(failures)
+        return deleted
+
+    async def _pages(self, query: Any) -> AsyncIterator[list[Any]]:
+        """Yield a query's documents in keyset pages by document ID."""
+        query = query.order_by(DOCUMENT_ID).limit(self.page_size)
+        last = None
+        while True:
+            page = query.start_after(last) if last is not None else query
+            docs = [doc async for doc in page.stream()]
+            if docs:
+                yield docs
+            if len(docs) < self.page_size:
+                return
+            last = docs[-1]
+
+
+async def _migrate(
+    tenant_id: str,
+    target: Layout,
+    delete_source: bool,
+    page_size: int,
+    indexes_file: Path | None,
+) -> None:
+    settings = get_settings()
+    if indexes_file is not None:
+        # Reads switch to the tenant's database mid-migration, so its queries need indexes
+        await deploy_for_tenants([tenant_id], indexes_file)
+    clients = FirestoreClientRegistry(settings.gcp_project_id)
+    partitioning = TenantPartitioning(
+        clients.client(),
+        clients.client,
+        default_layout=Layout(settings.default_partition_layout),
+        database_template=settings.tenant_database_template,
+        refresh_seconds=settings.partition_refresh_seconds,
+    )
+    migration = TenantLayoutMigration(partitioning, page_size=page_size)
+    try:
+        report = await migration.run(tenant_id, target, delete_source=delete_source)
+    finally:
+        await clients.close()
+    print(
+        f"{tenant_id} -> {target.value}: copied={report.copied} "
+        f"already_present={report.already_present} removed={report.removed} "
+        f"source_deleted={report.source_deleted}"
+    )
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Move a tenant's appointments to another layout")
+    parser.add_argument("tenant_id")
+    parser.add_argument("--to", required=True, choices=[layout.value for layout in Layout])
+    parser.add_argument("--delete-source", action="store_true")
+    parser.add_argument("--page-size", type=int, default=500)
+    parser.add_argument(
+        "--indexes", type=Path, help="path to firestore.indexes.json; required with --to database"
+    )
+    args = parser.parse_args()
+    target = Layout(args.to)
+    if target is Layout.DATABASE and args.indexes is None:
+        parser.error("--to database needs --indexes to create the tenant database's indexes")
+    indexes_file = args.indexes if target is Layout.DATABASE else None
+    asyncio.run(_migrate(args.tenant_id, target, args.delete_source, args.page_size, indexes_file))
+
+
+if __name__ == "__main__":
+    main()
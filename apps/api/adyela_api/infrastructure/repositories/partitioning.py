@@ -0,0 +1,156 @@
+"""Per-tenant placement of partitioned collections."""
+
+import asyncio
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+from google.cloud import firestore  # type: ignore
+
+from adyela_api.config import COLLECTIONS
+
+# Collections stored in each tenant's partition; schedules move with the appointments
+# because bookings read both in one transaction
+PARTITIONED_COLLECTIONS = ("appointments", "practitioner_schedules")
+
+
+class Layout(str, Enum):
+    """Where a tenant's partitioned documents are stored."""
+
+    FLAT = "flat"  # shared top-level collection, filtered on tenant_id
+    SUBCOLLECTION = "subcollection"  # tenants/{tenant_id}/{collection}
+    DATABASE = "database"  # top-level collection of a named per-tenant database
+
+
+@dataclass(frozen=True)
+class Partition:
+    """One tenant's location under a layout, bound to the client of its database."""
+
+    tenant_id: str | None
+    layout: Layout
+    db: Any
+
+    def path(self, name: str) -> tuple[str, ...]:
+        """Collection path segments of ``name`` within this partition."""
+        if self.layout is Layout.SUBCOLLECTION:
+            return (COLLECTIONS["tenants"], str(self.tenant_id), name)
+        return (name,)
+
+    def collection(self, name: str) -> Any:
+        """Collection ``name`` within this partition."""
+        return self.db.collection(*self.path(name))
+
+    def query(self, name: str) -> Any:
+        """Query over the tenant's documents in collection ``name``.
+
+        Only the flat layout needs a ``tenant_id`` filter; in the others the
+        collection already belongs to the tenant.
+        """
+        collection = self.collection(name)
+        if self.layout is Layout.FLAT and self.tenant_id is not None:
+            return collection.where("tenant_id", "==", self.tenant_id)
+        return collection
+
+
+@dataclass(frozen=True)
+class PartitionState:
+    """Stored layout of a tenant, and the layout it is being migrated to."""
+
+    layout: Layout
+    migrating_to: Layout | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "layout": self.layout.value,
+            "migrating_to": self.migrating_to.value if self.migrating_to else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "PartitionState":
+        """Create from dictionary."""
+        migrating_to = data.get("migrating_to")
+        return cls(
+            layout=Layout(data["layout"]),
+            migrating_to=Layout(migrating_to) if migrating_to else None,
+        )
+
+
+class TenantPartitioning:
+    """Resolve the partition of each tenant from the ``tenant_partitions`` collection.
+
+    Tenants without a stored state use ``default_layout``. States are read
+    in one query and refreshed at most every ``refresh_seconds``, so a
+    layout change reaches every replica within that interval. While a
+    tenant is being migrated, reads use its current layout and writes go to
+    both layouts, which keeps the target complete while it is being filled.
+    """
+
+    def __init__(
+        self,
+        db: firestore.AsyncClient,
+        database_client: Callable[[str], Any],
+        default_layout: Layout = Layout.FLAT,
+        database_template: str = "tenant-{tenant_id}",
+        refresh_seconds: float = 60,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.db = db
+        self.database_client = database_client
+        self.default_layout = default_layout
+        self.database_template = database_template
+        self.refresh_seconds = refresh_seconds
+        self._clock = clock
+        self._states: dict[str, PartitionState] = {}
+        self._loaded_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    def partition(self, tenant_id: str, layout: Layout) -> Partition:
+        """Build the partition of a tenant under a given layout."""
+        if layout is Layout.DATABASE:
+            database = self.database_template.format(tenant_id=tenant_id)
+            return Partition(tenant_id, layout, self.database_client(database))
+        return Partition(tenant_id, layout, self.db)
+
+    async def state(self, tenant_id: str) -> PartitionState:
+        """Get the current state of a tenant."""
+        await self._refresh()
+        return self._states.get(tenant_id, PartitionState(self.default_layout))
+
+    async def resolve(self, tenant_id: str) -> Partition:
+        """Get the partition reads of a tenant are served from."""
+        state = await self.state(tenant_id)
+        return self.partition(tenant_id, state.layout)
+
+    async def write_partitions(self, tenant_id: str) -> list[Partition]:
+        """Get every partition writes of a tenant must reach, the read partition first."""
+        state = await self.state(tenant_id)
+        partitions = [self.partition(tenant_id, state.layout)]
+        if state.migrating_to is not None:
+            partitions.append(self.partition(tenant_id, state.migrating_to))
+        return partitions
+
+    async def set_state(self, tenant_id: str, state: PartitionState) -> None:
+        """Store a tenant's state; other replicas pick it up on their next refresh."""
+        collection = self.db.collection(COLLECTIONS["tenant_partitions"])
+        await collection.document(tenant_id).set(state.to_dict())
+        self._states[tenant_id] = state
+
+    async def _refresh(self) -> None:
+        if not self._is_stale():
+            return
+        async with self._lock:
+            if not self._is_stale():
+                return
+            collection = self.db.collection(COLLECTIONS["tenant_partitions"])
+            self._states = {
+                doc.id: PartitionState.from_dict(data)
+                async for doc in collection.stream()
+                if (data := doc.to_dict()) is not None
+            }
+            self._loaded_at = self._clock()
+
+    def _is_stale(self) -> bool:
+        return self._loaded_at is None or self._clock() - self._loaded_at >= self.refresh_seconds
@@ -0,0 +1,122 @@
+"""Composite indexes of per-tenant databases.
+
+``firebase deploy`` only deploys ``firestore.indexes.json`` to the default
+database. Tenants on the ``database`` layout query a named database of their
+own without a ``tenant_id`` filter, so that database needs the tenant-level
+variant of each ``tenant_id``-prefixed index of the partitioned collections.
+``migrate-tenant-layout --to database`` creates them before copying; to create
+them for tenants that are already there, run::
+
+    poetry run deploy-tenant-indexes --indexes <firestore.indexes.json> <tenant_id> ...
+
+The definitions file lives at the repository root, outside the deployed
+package, so both commands take its path.
+"""
+
+import argparse
+import asyncio
+import json
+from pathlib import Path
+from typing import Any
+
+from google.api_core.exceptions import AlreadyExists  # type: ignore
+from google.cloud.firestore_admin_v1 import Index  # type: ignore
+from google.cloud.firestore_admin_v1.services.firestore_admin import (  # type: ignore
+    FirestoreAdminAsyncClient,
+)
+
+from adyela_api.config import COLLECTIONS, get_settings
+from adyela_api.infrastructure.repositories.firestore_repository import DOCUMENT_ID
+from adyela_api.infrastructure.repositories.partitioning import PARTITIONED_COLLECTIONS
+
+
+def tenant_indexes(definitions: dict[str, Any]) -> list[dict[str, Any]]:
+    """Indexes a tenant's own database needs, derived from the shared definitions.
+
+    Every index of a partitioned collection that starts with ``tenant_id`` is
+    kept without that field. Those left with a single field are dropped, since
+    Firestore's automatic single-field indexes already serve them.
+    """
+    names = {COLLECTIONS[key] for key in PARTITIONED_COLLECTIONS}
+    indexes: list[dict[str, Any]] = []
+    for index in definitions["indexes"]:
+        fields = index["fields"]
+        if index["collectionGroup"] not in names or fields[0]["fieldPath"] != "tenant_id":
+            continue
+        remaining = fields[1:]
+        if sum(field["fieldPath"] != DOCUMENT_ID for field in remaining) < 2:
+            continue
+        tenant_index = {**index, "fields": remaining}
+        if tenant_index not in indexes:
+            indexes.append(tenant_index)
+    return indexes
+
+
+async def deploy_tenant_indexes(
+    admin: Any, project: str, database: str, indexes: list[dict[str, Any]]
+) -> int:
+    """Create the missing indexes of a database and wait until they are built.
+
+    Returns the number of indexes created.
+    """
+    operations = []
+    for definition in indexes:
+        parent = admin.collection_group_path(project, database, definition["collectionGroup"])
+        try:
+            operations.append(await admin.create_index(parent=parent, index=_index(definition)))
+        except AlreadyExists:
+            continue
+    for operation in operations:
+        await operation.result()
+    return len(operations)
+
+
+async def deploy_for_tenants(tenant_ids: list[str], indexes_file: Path) -> None:
+    """Create the indexes of each tenant's database, as named by the settings.
+
+    ``indexes_file`` is the ``firestore.indexes.json`` deployed to the default
+    database.
+    """
+    settings = get_settings()
+    indexes = tenant_indexes(json.loads(indexes_file.read_text()))
+    admin = FirestoreAdminAsyncClient()
+    for tenant_id in tenant_ids:
+        database = settings.tenant_database_template.format(tenant_id=tenant_id)
+        created = await deploy_tenant_indexes(admin, settings.gcp_project_id, database, indexes)
+        print(f"{database}: created={created} already_present={len(indexes) - created}")
+
+
+# Values of ``queryScope`` and ``order`` in firestore.indexes.json
+_QUERY_SCOPES = {
+    "COLLECTION": Index.QueryScope.COLLECTION,
+    "COLLECTION_GROUP": Index.QueryScope.COLLECTION_GROUP,
+}
+_ORDERS = {
+    "ASCENDING": Index.IndexField.Order.ASCENDING,
+    "DESCENDING": Index.IndexField.Order.DESCENDING,
+}
+
+
+def _index(definition: dict[str, Any]) -> Any:
+    return Index(
+        query_scope=_QUERY_SCOPES[definition["queryScope"]],
+        fields=[
+            Index.IndexField(field_path=field["fieldPath"], order=_ORDERS[field["order"]])
+            for field in definition["fields"]
+        ],
+    )
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Create the indexes of per-tenant databases")
+    parser.add_argument("tenant_ids", nargs="+")
+    parser.add_argument(
+        "--indexes", type=Path, required=True, help="path to firestore.indexes.json"
+    )
+    args = parser.parse_args()
+    asyncio.run(deploy_for_tenants(args.tenant_ids, args.indexes))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""Local view of today's appointments kept current by Firestore snapshot listeners."""
+
+import asyncio
+import logging
+from collections.abc import Callable, Iterable
+from datetime import UTC, date, datetime, time, timedelta
+from typing import Any
+
+from google.cloud import firestore  # type: ignore
+
+from adyela_api.application.ports import Page
+from adyela_api.config import COLLECTIONS
+from adyela_api.domain import APPOINTMENT_CODEC, Appointment
+from adyela_api.infrastructure.repositories.in_memory_appointment_repository import (
+    InMemoryAppointmentRepository,
+)
+from adyela_api.infrastructure.repositories.pagination import PageTokenCodec
+from adyela_api.infrastructure.repositories.partitioning import (
+    Layout,
+    Partition,
+    TenantPartitioning,
+)
+
+logger = logging.getLogger(__name__)
+
+# Delay before retrying a failed midnight re-subscription
+ROLLOVER_RETRY_SECONDS = 30
+
+
+class TodayScheduleView:
+    """Appointments starting today (UTC), mirrored in process for every active tenant.
+
+    One ``on_snapshot`` listener per active tenant streams the tenant's
+    appointments for the current day into an ``InMemoryAppointmentRepository``,
+    which pages with the same tokens as ``FirestoreAppointmentRepository``.
+    Listener callbacks run on the client's watch thread and are handed to the
+    event loop, so the store is only ever touched from the loop.
+
+    A tenant is served from the view once its first snapshot has arrived and
+    for as long as its listener is active; ``covers`` tells the repository
+    whether a date range can be answered locally. At midnight the listeners
+    are replaced by ones for the new day, which also picks up tenants
+    activated since the last subscription. With a ``TenantPartitioning``,
+    subcollection tenants are watched in place; tenants with their own
+    database are left to Firestore reads.
+    """
+
+    def __init__(
+        self,
+        db: firestore.Client,
+        page_tokens: PageTokenCodec,
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+        partitioning: TenantPartitioning | None = None,
+    ) -> None:
+        self.db = db
+        self.page_tokens = page_tokens
+        self.partitioning = partitioning
+        self._clock = clock
+        self.day = clock().date()
+        self.store = InMemoryAppointmentRepository(page_tokens)
+        self._watches: dict[str, Any] = {}
+        self._ready: set[str] = set()
+        self._generation = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._rollover: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Subscribe to today's appointments and schedule the daily rollover."""
+        self._loop = asyncio.get_running_loop()
+        await self._subscribe()
+        self._rollover = asyncio.create_task(self._roll_over_daily())
+
+    async def stop(self) -> None:
+        """Cancel the rollover and close every listener."""
+        if self._rollover is not None:
+            self._rollover.cancel()
+            self._rollover = None
+        self._unsubscribe()
+
+    def covers(self, tenant_id: str, start_date: str, end_date: str) -> bool:
+        """Whether ``[start_date, end_date]`` on ``start_time`` can be read from the view.
+
+        Bounds are compared as ISO strings, as Firestore does, so a bare date
+        such as ``"2030-01-07"`` covers the whole of that day.
+        """
+        if tenant_id not in self._ready:
+            return False
+        watch = self._watches.get(tenant_id)
+        if watch is None or not watch.is_active:
+            return False
+        day_start, next_day_start = _day_bounds(self.day)
+        return start_date >= day_start and end_date < next_day_start
+
+    async def list_by_date_range(
+        self,
+        tenant_id: str,
+        start_date: str,
+        end_date: str,
+        limit: int = 100,
+        page_token: str | None = None,
+    ) -> Page[Appointment]:
+        """List today's appointments within a date range."""
+        return await self.store.list_by_date_range(
+            tenant_id, start_date, end_date, limit, page_token
+        )
+
+    def record(self, appointment: Appointment) -> None:
+        """Apply a write made through this process before its snapshot arrives."""
+        day_start, next_day_start = _day_bounds(self.day)
+        data = APPOINTMENT_CODEC.encode(appointment)
+        if str(appointment.tenant_id) in self._watches and (
+            day_start <= data["start_time"] < next_day_start
+        ):
+            self.store.put_document(data)
+        else:
+            self.store.remove_document(appointment.id)
+
+    def discard(self, appointment_id: str) -> None:
+        """Drop a deleted appointment before its snapshot arrives."""
+        self.store.remove_document(appointment_id)
+
+    def apply(self, tenant_id: str, changes: Iterable[Any]) -> None:
+        """Apply one snapshot's document changes and mark the tenant ready."""
+        for change in changes:
+            document = change.document
+            if change.type.name == "REMOVED":
+                self.store.remove_document(document.id)
+            else:
+                self.store.put_document({"id": document.id, **document.to_dict()})
+        self._ready.add(tenant_id)
+
+    async def _subscribe(self) -> None:
+        tenants = await asyncio.to_thread(self._active_tenant_ids)
+        self._generation += 1
+        self.day = self._clock().date()
+        self.store = InMemoryAppointmentRepository(self.page_tokens)
+        self._ready.clear()
+        for tenant_id in tenants:
+            layout = Layout.FLAT
+            if self.partitioning is not None:
+                layout = (await self.partitioning.state(tenant_id)).layout
+            if layout is not Layout.DATABASE:
+                partition = Partition(tenant_id, layout, self.db)
+                self._watches[tenant_id] = self._watch(partition, self._generation)
+        logger.info("today_view_subscribed", extra={"day": self.day, "tenants": len(tenants)})
+
+    def _unsubscribe(self) -> None:
+        for watch in self._watches.values():
+            watch.unsubscribe()
+        self._watches.clear()
+        self._ready.clear()
+
+    def _active_tenant_ids(self) -> list[str]:
+        query = self.db.collection(COLLECTIONS["tenants"]).where("is_active", "==", True)
+        return [doc.id for doc in query.select([]).stream()]
+
+    def _watch(self, partition: Partition, generation: int) -> Any:
+        tenant_id = str(partition.tenant_id)
+        day_start, next_day_start = _day_bounds(self.day)
+        query = (
+            partition.query(COLLECTIONS["appointments"])
+            .where("start_time", ">=", day_start)
+            .where("start_time", "<", next_day_start)
+        )
+
+        def on_snapshot(docs: Any, changes: Any, read_time: Any) -> None:
+            # Runs on the watch thread; the store belongs to the event loop
+            assert self._loop is not None  # nosec B101 - set by start()
+            self._loop.call_soon_threadsafe(self._on_changes, tenant_id, generation, changes)
+
+        return query.on_snapshot(on_snapshot)
+
+    def _on_changes(self, tenant_id: str, generation: int, changes: Any) -> None:
+        # Late callbacks from the previous day's listeners are dropped
+        if generation == self._generation:
+            self.apply(tenant_id, changes)
+
+    async def _roll_over_daily(self) -> None:
+        while True:
+            next_midnight = datetime.combine(self.day + timedelta(days=1), time(), tzinfo=UTC)
+            await asyncio.sleep(max((next_midnight - self._clock()).total_seconds(), 0))
+            while True:
+                try:
+                    self._unsubscribe()
+                    await self._subscribe()
+                    break
+                except Exception:
+                    # Reads fall back to Firestore until a subscription succeeds
+                    logger.exception("today_view_rollover_failed")
+                    await asyncio.sleep(ROLLOVER_RETRY_SECONDS)
+
+
+def _day_bounds(day: date) -> tuple[str, str]:
+    return day.isoformat(), (day + timedelta(days=1)).isoformat()
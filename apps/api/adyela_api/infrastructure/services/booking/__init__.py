@@ -0,0 +1,5 @@
+"""Booking services."""
+
+from .firestore_booking_service import BookingMetrics, FirestoreBookingService
+
+__all__ = ["BookingMetrics", "FirestoreBookingService"]
@@ -0,0 +1,205 @@
+"""Firestore booking service using per-practitioner-day schedule documents."""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+
+from google.api_core.exceptions import Aborted  # type: ignore
+from google.cloud import firestore  # type: ignore
+
+from adyela_api.application.ports import AppointmentStatsService, BookingService
+from adyela_api.config import COLLECTIONS
+from adyela_api.domain import (
+    APPOINTMENT_CODEC,
+    Appointment,
+    BusinessRuleViolationError,
+    ConflictError,
+)
+from adyela_api.infrastructure.repositories.count_cache import CountCache
+from adyela_api.infrastructure.repositories.interval_index import AvailabilityIndex
+from adyela_api.infrastructure.repositories.partitioning import (
+    Layout,
+    Partition,
+    TenantPartitioning,
+)
+from adyela_api.infrastructure.repositories.today_view import TodayScheduleView
+
+
+@dataclass
+class BookingMetrics:
+    """Counters for booking transactions.
+
+    ``retries`` counts transaction attempts beyond the first, i.e. commits
+    aborted by contention on a schedule document; ``exhausted`` counts
+    bookings that still failed after the last attempt.
+    """
+
+    booked: int = 0
+    conflicts: int = 0
+    attempts: int = 0
+    retries: int = 0
+    exhausted: int = 0
+
+
+def schedule_days(start: datetime, end: datetime) -> list[date]:
+    """UTC days touched by ``[start, end)``."""
+    first = start.astimezone(UTC).date()
+    last = (end.astimezone(UTC) - timedelta(microseconds=1)).date()
+    return [first + timedelta(days=offset) for offset in range((last - first).days + 1)]
+
+
+class FirestoreBookingService(BookingService):
+    """Book appointments with one small transaction per practitioner-day.
+
+    Each practitioner has one schedule document per UTC day holding the
+    intervals already booked, keyed by appointment ID. Booking reads that
+    document (two if the appointment crosses midnight), rejects overlaps and
+    writes the interval together with the appointment in the same
+    transaction. Concurrent bookings for the same practitioner and day
+    contend on that single document and are retried by Firestore, while
+    bookings for other practitioners or days never conflict.
+
+    With a ``TenantPartitioning``, the appointment and its schedule documents
+    are written to the tenant's partition, so the transaction never spans
+    databases. While the tenant is being migrated, the committed writes are
+    then copied to the target partition.
+    """
+
+    def __init__(
+        self,
+        db: firestore.AsyncClient,
+        max_attempts: int = 5,
+        metrics: BookingMetrics | None = None,
+        availability_index: AvailabilityIndex | None = None,
+        count_cache: CountCache | None = None,
+        stats: AppointmentStatsService | None = None,
+        today_view: TodayScheduleView | None = None,
+        partitioning: TenantPartitioning | None = None,
+    ) -> None:
+        self.db = db
+        self.max_attempts = max_attempts
+        self.metrics = metrics or BookingMetrics()
+        self.availability_index = availability_index
+        self.count_cache = count_cache
+        self.stats = stats
+        self.today_view = today_view
+        self.partitioning = partitioning
+        self.appointments = COLLECTIONS["appointments"]
+        self.schedules = COLLECTIONS["practitioner_schedules"]
+
+    async def book(self, appointment: Appointment) -> Appointment:
+        """Book an appointment if the practitioner's schedule is free."""
+        primary, *mirrors = await self._partitions(str(appointment.tenant_id))
+        appointment_ref = primary.collection(self.appointments).document()
+        appointment.id = appointment_ref.id
+        days = schedule_days(appointment.schedule.start, appointment.schedule.end)
+        schedule_refs = [self._schedule_ref(primary, appointment, day) for day in days]
+        attempts = 0
+
+        @firestore.async_transactional
+        async def run(transaction: firestore.AsyncTransaction) -> None:
+            nonlocal attempts
+            attempts += 1
+            snapshots = [
+                snapshot
+                async for snapshot in primary.db.get_all(schedule_refs, transaction=transaction)
+            ]
+            for snapshot in snapshots:
+                bookings = (snapshot.to_dict() or {}).get("bookings", {})
+                if _overlaps(bookings, appointment):
+                    raise BusinessRuleViolationError(
+                        "Practitioner is not available in the selected time slot"
+                    )
+
+            transaction.set(appointment_ref, APPOINTMENT_CODEC.encode(appointment))
+            for day, ref in zip(days, schedule_refs, strict=True):
+                transaction.set(ref, _schedule_entry(appointment, day), merge=True)
+
+        try:
+            await run(primary.db.transaction(max_attempts=self.max_attempts))
+        except BusinessRuleViolationError:
+            self.metrics.conflicts += 1
+            raise
+        except ValueError as e:
+            # Raised by the transaction wrapper once every attempt was aborted
+            if not isinstance(e.__cause__, Aborted):
+                raise
+            self.metrics.exhausted += 1
+            raise ConflictError("Schedule is busy, please retry the booking") from e
+        finally:
+            self.metrics.attempts += attempts
+            self.metrics.retries += max(attempts - 1, 0)
+
+        self.metrics.booked += 1
+        for partition in mirrors:
+            batch = partition.db.batch()
+            batch.set(
+                partition.collection(self.appointments).document(appointment.id),
+                APPOINTMENT_CODEC.encode(appointment),
+            )
+            for day in days:
+                ref = self._schedule_ref(partition, appointment, day)
+                batch.set(ref, _schedule_entry(appointment, day), merge=True)
+            await batch.commit()
+        if self.availability_index is not None:
+            self.availability_index.record(appointment)
+        if self.count_cache is not None:
+            self.count_cache.invalidate(str(appointment.tenant_id))
+        if self.today_view is not None:
+            self.today_view.record(appointment)
+        if self.stats is not None:
+            await self.stats.increment(str(appointment.tenant_id), {appointment.status: 1})
+        return appointment
+
+    async def record(self, appointment: Appointment) -> None:
+        """Add an appointment's interval to its schedule documents."""
+        await self._write_schedules(appointment, lambda day: _schedule_entry(appointment, day))
+
+    async def release(self, appointment: Appointment) -> None:
+        """Remove an appointment's interval from its schedule documents."""
+        await self._write_schedules(
+            appointment, lambda day: {"bookings": {appointment.id: firestore.DELETE_FIELD}}
+        )
+
+    async def _write_schedules(
+        self, appointment: Appointment, entry: Callable[[date], dict[str, Any]]
+    ) -> None:
+        """Merge an entry into each schedule document of an appointment, in every partition."""
+        days = schedule_days(appointment.schedule.start, appointment.schedule.end)
+        for partition in await self._partitions(str(appointment.tenant_id)):
+            batch = partition.db.batch()
+            for day in days:
+                batch.set(self._schedule_ref(partition, appointment, day), entry(day), merge=True)
+            await batch.commit()
+
+    async def _partitions(self, tenant_id: str) -> list[Partition]:
+        if self.partitioning is None:
+            return [Partition(tenant_id, Layout.FLAT, self.db)]
+        return await self.partitioning.write_partitions(tenant_id)
+
+    def _schedule_ref(self, partition: Partition, appointment: Appointment, day: date) -> Any:
+        document_id = f"{appointment.tenant_id}_{appointment.practitioner_id}_{day.isoformat()}"
+        return partition.collection(self.schedules).document(document_id)
+
+
+def _schedule_entry(appointment: Appointment, day: date) -> dict[str, Any]:
+    return {
+        "tenant_id": str(appointment.tenant_id),
+        "practitioner_id": appointment.practitioner_id,
+        "date": day.isoformat(),
+        "bookings": {
+            appointment.id: [
+                appointment.schedule.start.isoformat(),
+                appointment.schedule.end.isoformat(),
+            ]
+        },
+    }
+
+
+def _overlaps(bookings: dict[str, list[str]], appointment: Appointment) -> bool:
+    start, end = appointment.schedule.start, appointment.schedule.end
+    return any(
+        datetime.fromisoformat(booked_start) < end and datetime.fromisoformat(booked_end) > start
+        for booked_start, booked_end in bookings.values()
+    )
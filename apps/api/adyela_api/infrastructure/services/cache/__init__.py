@@ -0,0 +1,6 @@
+"""Cache services."""
+
+from .in_memory_cache_service import InMemoryCacheService
+from .redis_cache_service import RedisCacheService
+
+__all__ = ["InMemoryCacheService", "RedisCacheService"]
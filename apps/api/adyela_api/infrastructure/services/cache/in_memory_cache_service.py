@@ -0,0 +1,40 @@
+"""In-process cache service implementation."""
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+from adyela_api.application.ports import CacheService
+
+
+class InMemoryCacheService(CacheService):
+    """Per-process cache with lazy expiry, for tests and single-replica deployments."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._entries: dict[str, tuple[Any, float | None]] = {}
+
+    async def get(self, key: str) -> Any | None:
+        """Get value from cache."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and self._clock() >= expires_at:
+            del self._entries[key]
+            return None
+        return value
+
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> bool:
+        """Set value in cache with optional TTL."""
+        expires_at = self._clock() + ttl if ttl is not None else None
+        self._entries[key] = (value, expires_at)
+        return True
+
+    async def delete(self, key: str) -> bool:
+        """Delete value from cache."""
+        return self._entries.pop(key, None) is not None
+
+    async def exists(self, key: str) -> bool:
+        """Check if key exists in cache."""
+        return await self.get(key) is not None
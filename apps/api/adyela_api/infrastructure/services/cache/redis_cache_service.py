@@ -0,0 +1,37 @@
+"""Redis cache service implementation."""
+
+import json
+from typing import Any
+
+from redis.asyncio import Redis
+
+from adyela_api.application.ports import CacheService
+
+
+class RedisCacheService(CacheService):
+    """Redis cache service storing JSON-encoded values."""
+
+    def __init__(self, client: Redis) -> None:
+        self.client = client
+
+    @classmethod
+    def from_url(cls, url: str, max_connections: int = 10) -> "RedisCacheService":
+        """Create a service backed by a connection pool for ``url``."""
+        return cls(Redis.from_url(url, max_connections=max_connections))
+
+    async def get(self, key: str) -> Any | None:
+        """Get value from cache."""
+        raw = await self.client.get(key)
+        return json.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> bool:
+        """Set value in cache with optional TTL."""
+        return bool(await self.client.set(key, json.dumps(value), ex=ttl))
+
+    async def delete(self, key: str) -> bool:
+        """Delete value from cache."""
+        return bool(await self.client.delete(key))
+
+    async def exists(self, key: str) -> bool:
+        """Check if key exists in cache."""
+        return bool(await self.client.exists(key))
@@ -0,0 +1,10 @@
+"""Database client services."""
+
+from .firestore_client_registry import (
+    FirestoreClientRegistry,
+    TunedAsyncClient,
+    TunedClient,
+    channel_options,
+)
+
+__all__ = ["FirestoreClientRegistry", "TunedAsyncClient", "TunedClient", "channel_options"]
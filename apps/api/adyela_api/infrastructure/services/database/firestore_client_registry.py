@@ -0,0 +1,202 @@
+"""Process-wide Firestore clients with tuned gRPC channels."""
+
+import asyncio
+from contextlib import suppress
+from typing import Any
+
+import structlog
+from google.cloud import firestore  # type: ignore
+
+from adyela_api.config import COLLECTIONS
+
+logger = structlog.get_logger()
+
+ChannelOptions = list[tuple[str, Any]]
+
+# Document read to open a channel; it never exists, the read only has to reach the backend
+WARMUP_DOCUMENT = "warmup"
+
+
+def channel_options(
+    keepalive_time_ms: int = 30000, keepalive_timeout_ms: int = 10000
+) -> ChannelOptions:
+    """gRPC options for long-lived Firestore channels.
+
+    Keepalive pings are also sent while no call is in flight, so idle channels
+    are not silently dropped by load balancers and NATs between requests.
+    """
+    return [
+        ("grpc.keepalive_time_ms", keepalive_time_ms),
+        ("grpc.keepalive_timeout_ms", keepalive_timeout_ms),
+        ("grpc.keepalive_permit_without_calls", 1),
+        ("grpc.http2.max_pings_without_data", 0),
+        ("grpc.max_send_message_length", -1),
+        ("grpc.max_receive_message_length", -1),
+        ("grpc.enable_retries", 1),
+    ]
+
+
+def _open_api(
+    client: Any, options: ChannelOptions, transport: Any, client_class: Any, client_module: Any
+) -> None:
+    # Mirrors BaseClient._firestore_api_helper, which always uses the library's
+    # default channel options; emulator channels are still built by the library.
+    # The clients take no channel options or transport through any public
+    # argument, so this follows library internals and google-cloud-firestore is
+    # pinned to the exact version it was written against (see pyproject.toml)
+    if client._firestore_api_internal is not None or client._emulator_host is not None:
+        return
+    channel = transport.create_channel(
+        client._target, credentials=client._credentials, options=options
+    )
+    client._transport = transport(host=client._target, channel=channel)
+    client._firestore_api_internal = client_class(
+        transport=client._transport, client_options=client._client_options
+    )
+    client_module._client_info = client._client_info
+
+
+class TunedAsyncClient(firestore.AsyncClient):  # type: ignore[misc]
+    """``firestore.AsyncClient`` whose channel uses the given gRPC options."""
+
+    _firestore_api_internal: Any
+
+    def __init__(self, *args: Any, options: ChannelOptions | None = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._channel_options = options if options is not None else channel_options()
+
+    def _firestore_api_helper(self, transport: Any, client_class: Any, client_module: Any) -> Any:
+        _open_api(self, self._channel_options, transport, client_class, client_module)
+        return super()._firestore_api_helper(transport, client_class, client_module)
+
+    async def warm_up(self) -> None:
+        """Open the channel and fetch credentials with one cheap read."""
+        await self.collection(COLLECTIONS["tenants"]).document(WARMUP_DOCUMENT).get()
+
+    async def close(self) -> None:
+        """Close the channel, if it was opened."""
+        if self._firestore_api_internal is not None:
+            await self._firestore_api_internal.transport.close()
+            self._firestore_api_internal = None
+
+
+class TunedClient(firestore.Client):  # type: ignore[misc]
+    """Synchronous ``firestore.Client`` whose channel uses the given gRPC options."""
+
+    _firestore_api_internal: Any
+
+    def __init__(self, *args: Any, options: ChannelOptions | None = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._channel_options = options if options is not None else channel_options()
+
+    def _firestore_api_helper(self, transport: Any, client_class: Any, client_module: Any) -> Any:
+        _open_api(self, self._channel_options, transport, client_class, client_module)
+        return super()._firestore_api_helper(transport, client_class, client_module)
+
+    async def warm_up(self) -> None:
+        """Open the channel and fetch credentials with one cheap read."""
+        document = self.collection(COLLECTIONS["tenants"]).document(WARMUP_DOCUMENT)
+        await asyncio.to_thread(document.get)
+
+    async def close(self) -> None:
+        """Close the channel, if it was opened."""
+        if self._firestore_api_internal is not None:
+            self._firestore_api_internal.transport.close()
+            self._firestore_api_internal = None
+
+
+class FirestoreClientRegistry:
+    """One Firestore client per database for the whole process.
+
+    Clients are created on first use and share their gRPC channel across
+    requests. ``start`` opens the channels of every client created so far,
+    so the first requests do not pay for DNS, TLS and token fetches; it is
+    run by the application lifespan before the instance reports ready, and
+    ``close`` releases the channels on shutdown. ``ready`` turns true after
+    the first successful warm-up.
+    """
+
+    def __init__(
+        self,
+        project: str,
+        options: ChannelOptions | None = None,
+        warmup_timeout_seconds: float = 10,
+        warmup_retry_seconds: float = 5,
+        async_client_class: type[TunedAsyncClient] = TunedAsyncClient,
+        sync_client_class: type[TunedClient] = TunedClient,
+    ) -> None:
+        self.project = project
+        self.options = options if options is not None else channel_options()
+        self.warmup_timeout_seconds = warmup_timeout_seconds
+        self.warmup_retry_seconds = warmup_retry_seconds
+        self._async_client_class = async_client_class
+        self._sync_client_class = sync_client_class
+        self._clients: dict[str | None, TunedAsyncClient] = {}
+        self._sync_client: TunedClient | None = None
+        self._retry: asyncio.Task[None] | None = None
+        self.ready = False
+
+    def client(self, database: str | None = None) -> TunedAsyncClient:
+        """Get the async client of ``database``, or of the default database."""
+        if database not in self._clients:
+            kwargs = {"database": database} if database is not None else {}
+            self._clients[database] = self._async_client_class(
+                project=self.project, options=self.options, **kwargs
+            )
+        return self._clients[database]
+
+    def sync_client(self) -> TunedClient:
+        """Get the synchronous client of the default database, for snapshot listeners."""
+        if self._sync_client is None:
+            self._sync_client = self._sync_client_class(project=self.project, options=self.options)
+        return self._sync_client
+
+    async def start(self) -> None:
+        """Open the channels of the default client and every client created so far.
+
+        A failed warm-up leaves the registry not ready and is retried in the
+        background every ``warmup_retry_seconds`` until the backend answers.
+        """
+        self.client()
+        if not await self._warm_up():
+            self._retry = asyncio.create_task(self._retry_warm_up())
+
+    async def close(self) -> None:
+        """Close every channel; a client used afterwards opens a new one."""
+        if self._retry is not None:
+            self._retry.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._retry
+            self._retry = None
+        self.ready = False
+        for client in self._all_clients():
+            try:
+                await client.close()
+            except Exception as e:
+                logger.warning("firestore_close_failed", error=str(e))
+
+    async def _warm_up(self) -> bool:
+        clients = self._all_clients()
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(client.warm_up() for client in clients)),
+                self.warmup_timeout_seconds,
+            )
+        except Exception as e:
+            logger.error("firestore_warmup_failed", error=str(e))
+            return False
+        self.ready = True
+        logger.info("firestore_channels_opened", clients=len(clients))
+        return True
+
+    async def _retry_warm_up(self) -> None:
+        while True:
+            await asyncio.sleep(self.warmup_retry_seconds)
+            if await self._warm_up():
+                return
+
+    def _all_clients(self) -> list[TunedAsyncClient | TunedClient]:
+        clients: list[TunedAsyncClient | TunedClient] = [*self._clients.values()]
+        if self._sync_client is not None:
+            clients.append(self._sync_client)
+        return clients
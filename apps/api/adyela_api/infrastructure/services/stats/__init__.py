@@ -0,0 +1,5 @@
+"""Statistics services."""
+
+from .firestore_appointment_stats_service import FirestoreAppointmentStatsService
+
+__all__ = ["FirestoreAppointmentStatsService"]
@@ -0,0 +1,66 @@
+"""Firestore appointment statistics using sharded counters."""
+
+import random
+import time
+from collections.abc import Callable, Mapping
+
+from google.cloud import firestore  # type: ignore
+
+from adyela_api.application.ports import AppointmentStatsService
+from adyela_api.config import COLLECTIONS, AppointmentStatus
+
+
+class FirestoreAppointmentStatsService(AppointmentStatsService):
+    """Per-tenant appointment counts spread over ``shard_count`` documents.
+
+    Every increment lands on one randomly chosen shard, so sustained write
+    throughput grows with the shard count instead of being capped by a
+    single document's write rate. Reads sum all shards of a tenant and are
+    cached for ``cache_ttl_seconds``; increments made through this process
+    drop the tenant's cached sum. The shard count can be changed at any time
+    because reads always sum every shard that exists.
+    """
+
+    def __init__(
+        self,
+        db: firestore.AsyncClient,
+        shard_count: int = 10,
+        cache_ttl_seconds: float = 10,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.db = db
+        self.shard_count = shard_count
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.collection = COLLECTIONS["appointment_stats"]
+        self._clock = clock
+        self._cache: dict[str, tuple[dict[AppointmentStatus, int], float]] = {}
+
+    async def increment(self, tenant_id: str, deltas: Mapping[AppointmentStatus, int]) -> None:
+        """Add per-status deltas to one shard of the tenant's counters."""
+        updates = {
+            status.value: firestore.Increment(delta) for status, delta in deltas.items() if delta
+        }
+        if not updates:
+            return
+        shard_id = random.randrange(self.shard_count)  # nosec B311 - load spreading, not security
+        shard = self._shards(tenant_id).document(str(shard_id))
+        await shard.set(updates, merge=True)
+        self._cache.pop(tenant_id, None)
+
+    async def status_counts(self, tenant_id: str) -> dict[AppointmentStatus, int]:
+        """Sum a tenant's counter shards, serving recent sums from cache."""
+        cached = self._cache.get(tenant_id)
+        if cached is not None and self._clock() - cached[1] < self.cache_ttl_seconds:
+            return dict(cached[0])
+
+        counts = dict.fromkeys(AppointmentStatus, 0)
+        async for shard in self._shards(tenant_id).stream():
+            data = shard.to_dict() or {}
+            for status in AppointmentStatus:
+                counts[status] += int(data.get(status.value, 0))
+
+        self._cache[tenant_id] = (counts, self._clock())
+        return dict(counts)
+
+    def _shards(self, tenant_id: str) -> firestore.AsyncCollectionReference:
+        return self.db.collection(self.collection).document(tenant_id).collection("shards")
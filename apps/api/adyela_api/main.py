@@ -36,6 +36,10 @@ structlog.configure(
 
 from adyela_api.presentation.api.v1 import api_router  # noqa: E402
 from adyela_api.presentation.api.v1.endpoints import health  # noqa: E402
+from adyela_api.presentation.dependencies import (  # noqa: E402
+    get_firestore_clients,
+    get_today_view,
+)
 from adyela_api.presentation.middleware import LoggingMiddleware, TenantMiddleware  # noqa: E402
 
 logger = structlog.get_logger()
@@ -83,6 +87,16 @@ async def lifespan(app: FastAPI):
         raise
 
     # Initialize database connections
+    firestore_clients = (
+        get_firestore_clients() if settings.repository_backend == "firestore" else None
+    )
+    today_view = get_today_view() if firestore_clients is not None else None
+    if firestore_clients is not None:
+        # Open the channels before the first request, listeners included
+        await firestore_clients.start()
+    if today_view is not None:
+        await today_view.start()
+        logger.info("today_view_started", day=today_view.day.isoformat())
     # Initialize cache connections
 
     yield
@@ -90,6 +104,10 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("application_shutting_down")
     # Close database connections
+    if today_view is not None:
+        await today_view.stop()
+    if firestore_clients is not None:
+        await firestore_clients.close()
     # Close cache connections
 
 
@@ -1,11 +1,47 @@
 """Appointment endpoints."""
 
-from datetime import datetime
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import UTC, date, datetime
+from typing import Any, Self
 
-from fastapi import APIRouter, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
+from adyela_api.application.loaders import DataLoader
+from adyela_api.application.ports import (
+    AppointmentRepository,
+    AppointmentStatsService,
+    PractitionerRepository,
+    RecurringSeriesRepository,
+)
+from adyela_api.application.use_cases.appointments import GetAvailableSlotsUseCase
 from adyela_api.config import AppointmentStatus, AppointmentType
+from adyela_api.config.constants import (
+    DEFAULT_APPOINTMENT_DURATION_MINUTES,
+    DEFAULT_PAGE_SIZE,
+    MAX_APPOINTMENT_DURATION_MINUTES,
+    MAX_AVAILABILITY_DAYS,
+    MAX_PAGE_SIZE,
+    MIN_APPOINTMENT_DURATION_MINUTES,
+)
+from adyela_api.domain import (
+    Appointment,
+    AppointmentSummary,
+    EntityNotFoundError,
+    Patient,
+    Practitioner,
+    ValidationError,
+)
+from adyela_api.presentation.dependencies import (
+    get_appointment_repository,
+    get_appointment_stats_service,
+    get_patient_loader,
+    get_practitioner_loader,
+    get_practitioner_repository,
+    get_recurring_series_repository,
+)
 
 router = APIRouter(prefix="/appointments", tags=["appointments"])
 
@@ -38,14 +74,92 @@ class AppointmentResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
+    @classmethod
+    def from_entity(cls, appointment: Appointment, **extra: Any) -> Self:
+        """Build the response from a domain appointment."""
+        return cls(
+            id=appointment.id,
+            tenant_id=str(appointment.tenant_id),
+            patient_id=appointment.patient_id,
+            practitioner_id=appointment.practitioner_id,
+            start_time=appointment.schedule.start,
+            end_time=appointment.schedule.end,
+            appointment_type=appointment.appointment_type,
+            status=appointment.status,
+            reason=appointment.reason,
+            notes=appointment.notes,
+            video_room_url=appointment.video_room_url,
+            created_at=appointment.created_at,
+            updated_at=appointment.updated_at,
+            **extra,
+        )
+
+
+class AppointmentListItemResponse(AppointmentResponse):
+    """Appointment list item, with the names of the people involved."""
+
+    patient_name: str | None = None
+    practitioner_name: str | None = None
+
 
 class AppointmentListResponse(BaseModel):
     """Appointment list response schema."""
 
-    items: list[AppointmentResponse]
-    total: int
-    page: int
+    items: list[AppointmentListItemResponse]
+    total: int | None = None
+    page_size: int
+    next_page_token: str | None = Field(
+        None, description="Opaque token for the next page; absent on the last page"
+    )
+
+
+class AppointmentSummaryResponse(BaseModel):
+    """Appointment summary schema; only requested fields are included."""
+
+    id: str
+    tenant_id: str | None = None
+    patient_id: str | None = None
+    practitioner_id: str | None = None
+    start_time: datetime | None = None
+    end_time: datetime | None = None
+    appointment_type: AppointmentType | None = None
+    status: AppointmentStatus | None = None
+
+
+class AppointmentSummaryListResponse(BaseModel):
+    """Appointment summary list response schema."""
+
+    items: list[AppointmentSummaryResponse]
     page_size: int
+    next_page_token: str | None = None
+
+
+class AppointmentStatsResponse(BaseModel):
+    """Appointment statistics response schema."""
+
+    counts: dict[AppointmentStatus, int]
+
+
+class AvailableSlotResponse(BaseModel):
+    """Free slot schema."""
+
+    start_time: datetime
+    end_time: datetime
+
+
+class AvailabilityDayResponse(BaseModel):
+    """Free slots of one UTC day."""
+
+    date: date
+    slots: list[AvailableSlotResponse]
+
+
+class AvailabilityResponse(BaseModel):
+    """Practitioner availability response schema."""
+
+    practitioner_id: str
+    duration_minutes: int
+    days: list[AvailabilityDayResponse]
 
 
 @router.post(
@@ -78,18 +192,197 @@ async def create_appointment(
 )
 async def list_appointments(
     request: Request,
-    page: int = 1,
-    page_size: int = 20,
+    page_size: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    page_token: str | None = Query(None, description="Token from a previous page"),
+    repository: AppointmentRepository = Depends(get_appointment_repository),
+    patient_loader: DataLoader[str, Patient] = Depends(get_patient_loader),
+    practitioner_loader: DataLoader[str, Practitioner] = Depends(get_practitioner_loader),
 ) -> AppointmentListResponse:
-    """List appointments."""
-    _tenant_id = request.state.tenant_id
+    """List appointments using keyset pagination, with a server-side total count.
+
+    Patient and practitioner names are resolved with one batched lookup each
+    per page, however many rows share them.
+    """
+    tenant_id = request.state.tenant_id
+
+    filters = {"tenant_id": tenant_id}
+
+    try:
+        page, total = await asyncio.gather(
+            repository.list(limit=page_size, filters=filters, page_token=page_token),
+            repository.count(filters),
+        )
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    patients, practitioners = await asyncio.gather(
+        patient_loader.load_many([appointment.patient_id for appointment in page.items]),
+        practitioner_loader.load_many([appointment.practitioner_id for appointment in page.items]),
+    )
 
-    # Placeholder implementation
     return AppointmentListResponse(
-        items=[],
-        total=0,
-        page=page,
+        items=[
+            AppointmentListItemResponse.from_entity(
+                appointment,
+                patient_name=patient.full_name if patient else None,
+                practitioner_name=practitioner.full_name if practitioner else None,
+            )
+            for appointment, patient, practitioner in zip(
+                page.items, patients, practitioners, strict=True
+            )
+        ],
+        total=total,
+        page_size=page_size,
+        next_page_token=page.next_page_token,
+    )
+
+
+@router.get(
+    "/summaries",
+    response_model=AppointmentSummaryListResponse,
+    response_model_exclude_none=True,
+    status_code=status.HTTP_200_OK,
+    summary="List appointment summaries",
+    description="List appointments with only the requested fields, for list-heavy views",
+)
+async def list_appointment_summaries(
+    request: Request,
+    fields: str | None = Query(
+        None,
+        description="Comma-separated fields to include; defaults to "
+        + ",".join(AppointmentSummary.DEFAULT_FIELDS),
+    ),
+    practitioner_id: str | None = None,
+    patient_id: str | None = None,
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+    page_size: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    page_token: str | None = Query(None, description="Token from a previous page"),
+    repository: AppointmentRepository = Depends(get_appointment_repository),
+) -> AppointmentSummaryListResponse:
+    """List appointment summaries using a field projection."""
+    tenant_id = request.state.tenant_id
+    filters = {
+        key: value
+        for key, value in {"practitioner_id": practitioner_id, "patient_id": patient_id}.items()
+        if value
+    }
+
+    try:
+        page = await repository.list_summaries(
+            tenant_id,
+            fields=[name.strip() for name in fields.split(",") if name.strip()] if fields else None,
+            filters=filters,
+            start_date=start_date.isoformat() if start_date else None,
+            end_date=end_date.isoformat() if end_date else None,
+            limit=page_size,
+            page_token=page_token,
+        )
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    return AppointmentSummaryListResponse(
+        items=[
+            AppointmentSummaryResponse.model_validate(summary, from_attributes=True)
+            for summary in page.items
+        ],
         page_size=page_size,
+        next_page_token=page.next_page_token,
+    )
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Export appointments",
+    description="Stream every appointment in a date range as newline-delimited JSON",
+)
+async def export_appointments(
+    request: Request,
+    start_date: datetime,
+    end_date: datetime,
+    repository: AppointmentRepository = Depends(get_appointment_repository),
+) -> StreamingResponse:
+    """Export appointments without loading the whole range into memory."""
+    tenant_id = request.state.tenant_id
+    appointments = repository.iter_by_date_range(
+        tenant_id, start_date.isoformat(), end_date.isoformat()
+    )
+
+    async def lines() -> AsyncIterator[str]:
+        async for appointment in appointments:
+            yield AppointmentResponse.from_entity(appointment).model_dump_json() + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@router.get(
+    "/stats",
+    response_model=AppointmentStatsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Appointment statistics",
+    description="Number of the tenant's appointments in each status",
+)
+async def get_appointment_stats(
+    request: Request,
+    stats: AppointmentStatsService = Depends(get_appointment_stats_service),
+) -> AppointmentStatsResponse:
+    """Get per-status appointment counts from the sharded counters."""
+    return AppointmentStatsResponse(counts=await stats.status_counts(request.state.tenant_id))
+
+
+@router.get(
+    "/availability",
+    response_model=AvailabilityResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Practitioner availability",
+    description="Free slots of a practitioner for each day of a window, a week by default",
+)
+async def get_availability(
+    request: Request,
+    practitioner_id: str,
+    start_date: date | None = Query(None, description="First UTC day; defaults to today"),
+    days: int = Query(7, ge=1, le=MAX_AVAILABILITY_DAYS),
+    duration_minutes: int = Query(
+        DEFAULT_APPOINTMENT_DURATION_MINUTES,
+        ge=MIN_APPOINTMENT_DURATION_MINUTES,
+        le=MAX_APPOINTMENT_DURATION_MINUTES,
+    ),
+    step_minutes: int | None = Query(None, description="Minutes between slot starts"),
+    repository: AppointmentRepository = Depends(get_appointment_repository),
+    practitioners: PractitionerRepository = Depends(get_practitioner_repository),
+    series: RecurringSeriesRepository = Depends(get_recurring_series_repository),
+) -> AvailabilityResponse:
+    """Get a practitioner's free slots from working hours, bookings and recurring series."""
+    use_case = GetAvailableSlotsUseCase(repository, practitioners, series_repository=series)
+    try:
+        slots = await use_case.execute(
+            request.state.tenant_id,
+            practitioner_id,
+            start_date or datetime.now(UTC).date(),
+            days,
+            duration_minutes,
+            step_minutes=step_minutes,
+        )
+    except EntityNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    return AvailabilityResponse(
+        practitioner_id=practitioner_id,
+        duration_minutes=duration_minutes,
+        days=[
+            AvailabilityDayResponse(
+                date=day,
+                slots=[
+                    AvailableSlotResponse(start_time=slot.start, end_time=slot.end)
+                    for slot in day_slots
+                ],
+            )
+            for day, day_slots in slots.items()
+        ],
     )
 
 
@@ -3,6 +3,9 @@
 from fastapi import APIRouter, status
 from pydantic import BaseModel
 
+from adyela_api.config import get_settings
+from adyela_api.presentation.dependencies import get_firestore_clients
+
 router = APIRouter()
 
 
@@ -43,9 +46,9 @@ async def health_check() -> HealthResponse:
 )
 async def readiness_check() -> ReadinessResponse:
     """Readiness check endpoint."""
-    # Add actual checks for database, cache, etc.
+    # Add actual checks for cache, etc.
     checks = {
-        "database": True,
+        "database": get_settings().repository_backend == "memory" or get_firestore_clients().ready,
         "cache": True,
         "firebase": True,
     }
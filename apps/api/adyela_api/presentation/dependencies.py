@@ -0,0 +1,282 @@
+"""FastAPI dependencies wiring ports to their infrastructure adapters."""
+
+from functools import lru_cache
+
+from fastapi import Depends
+from google.cloud import firestore  # type: ignore
+
+from adyela_api.application.loaders import DataLoader
+from adyela_api.application.ports import (
+    AppointmentRepository,
+    AppointmentStatsService,
+    BookingService,
+    CacheService,
+    PatientRepository,
+    PractitionerRepository,
+    RecurringSeriesRepository,
+    TenantRepository,
+)
+from adyela_api.config import get_settings
+from adyela_api.domain import Appointment, Patient, Practitioner
+from adyela_api.infrastructure.repositories import (
+    CacheStats,
+    CachingAppointmentRepository,
+    CachingPatientRepository,
+    CachingPractitionerRepository,
+    CachingTenantRepository,
+    FirestoreAppointmentRepository,
+    FirestorePatientRepository,
+    FirestorePractitionerRepository,
+    FirestoreRecurringSeriesRepository,
+    FirestoreTenantRepository,
+    InMemoryAppointmentRepository,
+    InMemoryPatientRepository,
+    InMemoryPractitionerRepository,
+    InMemoryRecurringSeriesRepository,
+    InMemoryTenantRepository,
+)
+from adyela_api.infrastructure.repositories.count_cache import CountCache
+from adyela_api.infrastructure.repositories.interval_index import AvailabilityIndex
+from adyela_api.infrastructure.repositories.pagination import PageTokenCodec
+from adyela_api.infrastructure.repositories.partitioning import Layout, TenantPartitioning
+from adyela_api.infrastructure.repositories.today_view import TodayScheduleView
+from adyela_api.infrastructure.services.booking import BookingMetrics, FirestoreBookingService
+from adyela_api.infrastructure.services.cache import RedisCacheService
+from adyela_api.infrastructure.services.database import FirestoreClientRegistry, channel_options
+from adyela_api.infrastructure.services.stats import FirestoreAppointmentStatsService
+
+
+@lru_cache
+def get_firestore_clients() -> FirestoreClientRegistry:
+    """Get the registry of process-wide Firestore clients, opened by the app lifespan."""
+    settings = get_settings()
+    return FirestoreClientRegistry(
+        settings.gcp_project_id,
+        channel_options(
+            keepalive_time_ms=settings.firestore_keepalive_time_ms,
+            keepalive_timeout_ms=settings.firestore_keepalive_timeout_ms,
+        ),
+        warmup_timeout_seconds=settings.firestore_warmup_timeout_seconds,
+        warmup_retry_seconds=settings.firestore_warmup_retry_seconds,
+    )
+
+
+def get_firestore_client() -> firestore.AsyncClient:
+    """Get the process-wide Firestore client."""
+    return get_firestore_clients().client()
+
+
+def get_firestore_database_client(database: str) -> firestore.AsyncClient:
+    """Get the process-wide client of a named (per-tenant) database."""
+    return get_firestore_clients().client(database)
+
+
+@lru_cache
+def get_tenant_partitioning() -> TenantPartitioning:
+    """Get the process-wide resolver of per-tenant appointment layouts."""
+    settings = get_settings()
+    return TenantPartitioning(
+        get_firestore_client(),
+        get_firestore_database_client,
+        default_layout=Layout(settings.default_partition_layout),
+        database_template=settings.tenant_database_template,
+        refresh_seconds=settings.partition_refresh_seconds,
+    )
+
+
+@lru_cache
+def get_page_token_codec() -> PageTokenCodec:
+    """Get the page token codec keyed with the application secret."""
+    return PageTokenCodec(get_settings().secret_key.get_secret_value())
+
+
+@lru_cache
+def get_availability_index() -> AvailabilityIndex:
+    """Get the process-wide index of active bookings."""
+    settings = get_settings()
+    return AvailabilityIndex(
+        ttl_seconds=settings.availability_index_ttl_seconds,
+        max_keys=settings.availability_index_max_keys,
+    )
+
+
+@lru_cache
+def get_count_cache() -> CountCache:
+    """Get the process-wide cache of appointment counts."""
+    return CountCache(ttl_seconds=get_settings().count_cache_ttl_seconds)
+
+
+@lru_cache
+def get_appointment_stats_service() -> AppointmentStatsService:
+    """Get the process-wide appointment status counters."""
+    settings = get_settings()
+    return FirestoreAppointmentStatsService(
+        get_firestore_client(),
+        shard_count=settings.stats_counter_shards,
+        cache_ttl_seconds=settings.stats_cache_ttl_seconds,
+    )
+
+
+@lru_cache
+def get_today_view() -> TodayScheduleView | None:
+    """Get the listener-fed view of today's appointments, if enabled."""
+    settings = get_settings()
+    if not settings.today_view_enabled:
+        return None
+    # Snapshot listeners are only available on the synchronous client
+    return TodayScheduleView(
+        get_firestore_clients().sync_client(),
+        get_page_token_codec(),
+        partitioning=get_tenant_partitioning(),
+    )
+
+
+@lru_cache
+def get_cache_service() -> CacheService:
+    """Get the process-wide cache service."""
+    settings = get_settings()
+    return RedisCacheService.from_url(
+        settings.redis_url, max_connections=settings.redis_max_connections
+    )
+
+
+@lru_cache
+def get_appointment_cache_stats() -> CacheStats:
+    """Get the hit/miss counters of the appointment cache."""
+    return CacheStats()
+
+
+@lru_cache
+def get_in_memory_appointment_repository() -> InMemoryAppointmentRepository:
+    """Get the process-wide in-memory appointment store."""
+    return InMemoryAppointmentRepository(get_page_token_codec())
+
+
+def get_appointment_repository(
+    page_tokens: PageTokenCodec = Depends(get_page_token_codec),
+) -> AppointmentRepository:
+    """Get the appointment repository for the configured backend, cached by ID."""
+    if get_settings().repository_backend == "memory":
+        return get_in_memory_appointment_repository()
+
+    repository = FirestoreAppointmentRepository(
+        get_firestore_client(),
+        page_tokens,
+        availability_index=get_availability_index(),
+        count_cache=get_count_cache(),
+        stats=get_appointment_stats_service(),
+        today_view=get_today_view(),
+        partitioning=get_tenant_partitioning(),
+        booking_service=get_booking_service(),
+    )
+    return CachingAppointmentRepository(
+        repository, get_cache_service(), stats=get_appointment_cache_stats()
+    )
+
+
+@lru_cache
+def get_in_memory_tenant_repository() -> InMemoryTenantRepository:
+    """Get the process-wide in-memory tenant store."""
+    return InMemoryTenantRepository(get_page_token_codec())
+
+
+@lru_cache
+def get_in_memory_patient_repository() -> InMemoryPatientRepository:
+    """Get the process-wide in-memory patient store."""
+    return InMemoryPatientRepository(get_page_token_codec())
+
+
+@lru_cache
+def get_in_memory_practitioner_repository() -> InMemoryPractitionerRepository:
+    """Get the process-wide in-memory practitioner store."""
+    return InMemoryPractitionerRepository(get_page_token_codec())
+
+
+def get_tenant_repository(
+    page_tokens: PageTokenCodec = Depends(get_page_token_codec),
+) -> TenantRepository:
+    """Get the tenant repository for the configured backend, cached by ID."""
+    if get_settings().repository_backend == "memory":
+        return get_in_memory_tenant_repository()
+
+    repository = FirestoreTenantRepository(get_firestore_client(), page_tokens)
+    return CachingTenantRepository(repository, get_cache_service())
+
+
+def get_patient_repository(
+    page_tokens: PageTokenCodec = Depends(get_page_token_codec),
+) -> PatientRepository:
+    """Get the patient repository for the configured backend, cached by ID."""
+    if get_settings().repository_backend == "memory":
+        return get_in_memory_patient_repository()
+
+    repository = FirestorePatientRepository(get_firestore_client(), page_tokens)
+    return CachingPatientRepository(repository, get_cache_service())
+
+
+def get_practitioner_repository(
+    page_tokens: PageTokenCodec = Depends(get_page_token_codec),
+) -> PractitionerRepository:
+    """Get the practitioner repository for the configured backend, cached by ID."""
+    if get_settings().repository_backend == "memory":
+        return get_in_memory_practitioner_repository()
+
+    repository = FirestorePractitionerRepository(get_firestore_client(), page_tokens)
+    return CachingPractitionerRepository(repository, get_cache_service())
+
+
+@lru_cache
+def get_in_memory_recurring_series_repository() -> InMemoryRecurringSeriesRepository:
+    """Get the process-wide in-memory recurring series store."""
+    return InMemoryRecurringSeriesRepository(get_page_token_codec())
+
+
+def get_recurring_series_repository(
+    page_tokens: PageTokenCodec = Depends(get_page_token_codec),
+) -> RecurringSeriesRepository:
+    """Get the recurring series repository for the configured backend."""
+    if get_settings().repository_backend == "memory":
+        return get_in_memory_recurring_series_repository()
+
+    return FirestoreRecurringSeriesRepository(get_firestore_client(), page_tokens)
+
+
+@lru_cache
+def get_booking_metrics() -> BookingMetrics:
+    """Get the process-wide booking transaction counters."""
+    return BookingMetrics()
+
+
+@lru_cache
+def get_booking_service() -> BookingService:
+    """Get the process-wide transactional booking service."""
+    return FirestoreBookingService(
+        get_firestore_client(),
+        metrics=get_booking_metrics(),
+        availability_index=get_availability_index(),
+        count_cache=get_count_cache(),
+        stats=get_appointment_stats_service(),
+        today_view=get_today_view(),
+        partitioning=get_tenant_partitioning(),
+    )
+
+
+def get_appointment_loader(
+    repository: AppointmentRepository = Depends(get_appointment_repository),
+) -> DataLoader[str, Appointment]:
+    """Get a batching appointment loader; FastAPI resolves it once per request."""
+    return DataLoader(repository.get_many)
+
+
+def get_patient_loader(
+    repository: PatientRepository = Depends(get_patient_repository),
+) -> DataLoader[str, Patient]:
+    """Get a batching patient loader; FastAPI resolves it once per request."""
+    return DataLoader(repository.get_many)
+
+
+def get_practitioner_loader(
+    repository: PractitionerRepository = Depends(get_practitioner_repository),
+) -> DataLoader[str, Practitioner]:
+    """Get a batching practitioner loader; FastAPI resolves it once per request."""
+    return DataLoader(repository.get_many)
@@ -4,6 +4,8 @@ from fastapi import Request, status
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from adyela_api.application.tenant_context import current_tenant_id
+
 
 class TenantMiddleware(BaseHTTPMiddleware):
     """Middleware to extract and validate tenant context."""
@@ -29,8 +31,12 @@ class TenantMiddleware(BaseHTTPMiddleware):
                 content={"detail": "Missing X-Tenant-ID header"},
             )
 
-        # Store tenant_id in request state for use in endpoints
+        # Store tenant_id in request state for use in endpoints, and in the context
+        # for repositories that partition data by tenant
         request.state.tenant_id = tenant_id
-
-        response = await call_next(request)
+        token = current_tenant_id.set(tenant_id)
+        try:
+            response = await call_next(request)
+        finally:
+            current_tenant_id.reset(token)
         return response
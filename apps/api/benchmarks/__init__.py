@@ -0,0 +1,5 @@
+"""Performance benchmarks for the Adyela API.
+
+Benchmarks are standalone scripts and are not collected by pytest. Run them
+from ``apps/api`` with ``poetry run python -m benchmarks.<name>``.
+"""
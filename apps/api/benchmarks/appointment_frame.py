@@ -0,0 +1,144 @@
+"""Analytics over a tenant's appointments: loops over entities versus ``AppointmentFrame``.
+
+Generates ``--count`` appointments spread over 30 days and ``--practitioners``
+practitioners, then times status counts, a filtered selection and
+practitioner conflict detection both as Python loops over ``Appointment``
+objects and as array operations on a frame. Building the frame from stored
+documents is reported separately. Requires the ``analytics`` extra.
+
+Run from ``apps/api``::
+
+    poetry run python -m benchmarks.appointment_frame --count 100000
+"""
+
+import argparse
+import random
+import time
+from collections import Counter, defaultdict
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from adyela_api.application.analytics import AppointmentFrame
+from adyela_api.config import AppointmentStatus, AppointmentType
+from adyela_api.config.constants import ACTIVE_APPOINTMENT_STATUSES
+from adyela_api.domain import APPOINTMENT_CODEC, Appointment
+
+
+def _rows(count: int, practitioners: int) -> list[dict[str, Any]]:
+    rng = random.Random(42)
+    base = datetime.now(UTC).replace(second=0, microsecond=0) + timedelta(days=1)
+    statuses = [status.value for status in AppointmentStatus]
+    types = [appointment_type.value for appointment_type in AppointmentType]
+    rows = []
+    for index in range(count):
+        start = base + timedelta(minutes=rng.randrange(0, 30 * 24 * 60, 15))
+        created = base.isoformat()
+        rows.append(
+            {
+                "id": f"appointment-{index}",
+                "tenant_id": "tenant-1",
+                "patient_id": f"patient-{rng.randrange(count // 4 + 1)}",
+                "practitioner_id": f"practitioner-{rng.randrange(practitioners)}",
+                "start_time": start.isoformat(),
+                "end_time": (start + timedelta(minutes=rng.choice((15, 30, 60)))).isoformat(),
+                "appointment_type": rng.choice(types),
+                "status": rng.choice(statuses),
+                "created_at": created,
+                "updated_at": created,
+            }
+        )
+    return rows
+
+
+def _loop_conflicts(appointments: list[Appointment]) -> set[str]:
+    """Sweep each practitioner's appointments in start order."""
+    by_practitioner: defaultdict[str, list[Appointment]] = defaultdict(list)
+    for appointment in appointments:
+        by_practitioner[appointment.practitioner_id].append(appointment)
+    conflicting: set[str] = set()
+    for items in by_practitioner.values():
+        items.sort(key=lambda appointment: appointment.schedule.start)
+        latest_end = items[0].schedule.end
+        for previous, appointment in zip(items, items[1:], strict=False):
+            if appointment.schedule.start < latest_end:
+                conflicting.add(appointment.id)
+            if previous.schedule.overlaps_with(appointment.schedule):
+                conflicting.add(previous.id)
+            latest_end = max(latest_end, appointment.schedule.end)
+    return conflicting
+
+
+def _best_ms(operation: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        operation()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main(count: int, practitioners: int, repeat: int) -> None:
+    """Compare entity loops with frame operations."""
+    rows = _rows(count, practitioners)
+    appointments = APPOINTMENT_CODEC.decode_many(rows)
+    frame = AppointmentFrame.from_dicts(rows)
+    week_start = datetime.fromisoformat(rows[0]["start_time"])
+    week_end = week_start + timedelta(days=7)
+    active = set(ACTIVE_APPOINTMENT_STATUSES)
+
+    def loop_select() -> list[str]:
+        return [
+            appointment.id
+            for appointment in appointments
+            if appointment.status in active
+            and appointment.practitioner_id == "practitioner-0"
+            and appointment.schedule.start < week_end
+            and appointment.schedule.end > week_start
+        ]
+
+    def frame_select() -> AppointmentFrame:
+        return frame.select(
+            statuses=ACTIVE_APPOINTMENT_STATUSES,
+            practitioner_ids=["practitioner-0"],
+            start=week_start,
+            end=week_end,
+        )
+
+    cases: list[tuple[str, Callable[[], object], Callable[[], object]]] = [
+        (
+            "count by status",
+            lambda: Counter(appointment.status for appointment in appointments),
+            lambda: frame.count_by("status"),
+        ),
+        (
+            "count by practitioner/status",
+            lambda: Counter((a.practitioner_id, a.status) for a in appointments),
+            lambda: frame.count_by("practitioner_id", "status"),
+        ),
+        ("select active in a week", loop_select, frame_select),
+        (
+            "practitioner conflicts",
+            lambda: _loop_conflicts(appointments),
+            lambda: frame.conflicts(),
+        ),
+    ]
+    assert _loop_conflicts(appointments) == set(frame.ids[frame.conflicts()].tolist())
+
+    print(f"count={count} practitioners={practitioners} repeat={repeat}")
+    build_ms = _best_ms(lambda: AppointmentFrame.from_dicts(rows), repeat)
+    print(f"{'frame from documents':<30}{build_ms:>10.1f}ms")
+    print(f"{'operation':<30}{'loop':>12}{'frame':>12}{'speedup':>10}")
+    for name, loop, vectorized in cases:
+        loop_ms = _best_ms(loop, repeat)
+        frame_ms = _best_ms(vectorized, repeat)
+        print(f"{name:<30}{loop_ms:>10.1f}ms{frame_ms:>10.2f}ms{loop_ms / frame_ms:>9.0f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--practitioners", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    main(args.count, args.practitioners, args.repeat)
@@ -0,0 +1,168 @@
+"""Memory and construction time of domain entities, slotted versus ``__dict__``-backed.
+
+The domain dataclasses are slotted. For the "before" numbers each entity and
+value object is rebuilt as a twin class whose instances keep their fields in
+a per-instance ``__dict__``; both variants run exactly the same generated
+``__init__`` and validation. Field values (strings, datetimes) are shared
+across instances, so the bytes per entity are the cost of the entity and its
+value objects themselves.
+
+Run from ``apps/api``::
+
+    poetry run python -m benchmarks.domain_memory --count 100000
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import fields
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+
+from adyela_api.config import AppointmentType, UserRole
+from adyela_api.domain import Appointment, Patient, Practitioner, Tenant
+from adyela_api.domain.value_objects import Address, DateTimeRange, Email, PhoneNumber, TenantId
+
+SLOTTED = {
+    cls.__name__: cls
+    for cls in (
+        Appointment,
+        Patient,
+        Practitioner,
+        Tenant,
+        Address,
+        DateTimeRange,
+        Email,
+        PhoneNumber,
+        TenantId,
+    )
+}
+
+
+def with_dict(cls: type) -> type:
+    """Copy of a slotted dataclass whose instances store their fields in ``__dict__``."""
+    excluded = {field.name for field in fields(cls)} | {"__slots__", "__dict__", "__weakref__"}
+    namespace = {name: value for name, value in vars(cls).items() if name not in excluded}
+    return type(cls.__name__, cls.__bases__, namespace)
+
+
+START = datetime.now(UTC) + timedelta(days=1)
+END = START + timedelta(minutes=30)
+NOW = datetime.now(UTC)
+
+
+def _builders(classes: dict[str, Any]) -> dict[str, Callable[[], object]]:
+    appointment, patient = classes["Appointment"], classes["Patient"]
+    practitioner, tenant = classes["Practitioner"], classes["Tenant"]
+    tenant_id, email = classes["TenantId"], classes["Email"]
+    phone, address = classes["PhoneNumber"], classes["Address"]
+    date_range = classes["DateTimeRange"]
+
+    def build_appointment() -> object:
+        return appointment(
+            id="appointment-id",
+            tenant_id=tenant_id("tenant-1"),
+            patient_id="patient-1",
+            practitioner_id="practitioner-1",
+            schedule=date_range(start=START, end=END),
+            appointment_type=AppointmentType.IN_PERSON,
+            created_at=NOW,
+            updated_at=NOW,
+        )
+
+    def build_patient() -> object:
+        return patient(
+            id="patient-id",
+            tenant_id=tenant_id("tenant-1"),
+            first_name="Ana",
+            last_name="Diaz",
+            email=email("ana@example.com"),
+            phone=phone("+15551234567"),
+            date_of_birth=date(1990, 5, 1),
+            created_at=NOW,
+            updated_at=NOW,
+        )
+
+    def build_practitioner() -> object:
+        return practitioner(
+            id="practitioner-id",
+            tenant_id=tenant_id("tenant-1"),
+            first_name="Eva",
+            last_name="Ruiz",
+            email=email("eva@example.com"),
+            phone=phone("+15551234567"),
+            role=UserRole.DOCTOR,
+            created_at=NOW,
+            updated_at=NOW,
+        )
+
+    def build_tenant() -> object:
+        return tenant(
+            id="tenant-id",
+            name="Clinic",
+            email=email("clinic@example.com"),
+            phone=phone("+15551234567"),
+            address=address("Main St 1", "Springfield", "IL", "62701", "US"),
+            created_at=NOW,
+            updated_at=NOW,
+        )
+
+    return {
+        "Appointment": build_appointment,
+        "Patient": build_patient,
+        "Practitioner": build_practitioner,
+        "Tenant": build_tenant,
+    }
+
+
+def _bytes_per_entity(build: Callable[[], object], count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    items = [build() for _ in range(count)]
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del items
+    # The list holding the entities is not part of their size
+    return (allocated - 8 * count) / count
+
+
+def _seconds_per_100k(build: Callable[[], object], count: int) -> float:
+    gc.collect()
+    started = time.perf_counter()
+    items = [build() for _ in range(count)]
+    elapsed = time.perf_counter() - started
+    del items
+    return elapsed * 100_000 / count
+
+
+def main(count: int) -> None:
+    """Compare ``__dict__``-backed and slotted entities."""
+    variants = {
+        "dict": _builders({name: with_dict(cls) for name, cls in SLOTTED.items()}),
+        "slots": _builders(SLOTTED),
+    }
+    print(f"count={count}  (bytes include the entity's value objects)")
+    print(f"{'entity':<14}{'variant':<8}{'bytes/entity':>14}{'ms/100k':>10}")
+    for entity in ("Appointment", "Patient", "Practitioner", "Tenant"):
+        results = {}
+        for variant, builders in variants.items():
+            build = builders[entity]
+            size = _bytes_per_entity(build, count)
+            seconds = _seconds_per_100k(build, count)
+            results[variant] = (size, seconds)
+            print(f"{entity:<14}{variant:<8}{size:>14.1f}{seconds * 1000:>10.1f}")
+        (dict_size, dict_seconds), (slots_size, slots_seconds) = results.values()
+        print(
+            f"{'':<14}{'saved':<8}{1 - slots_size / dict_size:>13.0%} "
+            f"{1 - slots_seconds / dict_seconds:>9.0%}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+    main(args.count)
@@ -0,0 +1,31 @@
+"""Shared setup for benchmarks that run against the Firestore emulator."""
+
+import os
+from datetime import UTC, datetime, timedelta
+
+from adyela_api.config import AppointmentType, Settings, get_settings
+from adyela_api.domain import Appointment
+from adyela_api.domain.value_objects import DateTimeRange, TenantId
+
+
+def require_emulator() -> Settings:
+    """Point the Firestore client at the emulator or exit."""
+    settings = get_settings()
+    if settings.firestore_emulator_host:
+        os.environ.setdefault("FIRESTORE_EMULATOR_HOST", settings.firestore_emulator_host)
+    if "FIRESTORE_EMULATOR_HOST" not in os.environ:
+        raise SystemExit("FIRESTORE_EMULATOR_HOST must point at a running Firestore emulator")
+    return settings
+
+
+def sample_appointment(tenant_id: str, practitioner_id: str, slot: int) -> Appointment:
+    """Build a future 30-minute appointment in the given slot."""
+    start = datetime.now(UTC) + timedelta(days=1, minutes=30 * slot)
+    return Appointment(
+        id="",
+        tenant_id=TenantId(tenant_id),
+        patient_id=f"patient-{slot}",
+        practitioner_id=practitioner_id,
+        schedule=DateTimeRange(start=start, end=start + timedelta(minutes=30)),
+        appointment_type=AppointmentType.IN_PERSON,
+    )
@@ -0,0 +1,135 @@
+"""Hydration and serialization speed of generated codecs versus ``from_dict``/``to_dict``.
+
+Decodes and encodes ``--count`` stored rows per entity type, once per row
+with the entity methods, once with ``decode_many``/``encode_many`` and once
+with the trusted ``hydrate_many`` storage path, and reports the best of
+``--repeat`` runs.
+
+Run from ``apps/api``::
+
+    poetry run python -m benchmarks.entity_codecs --count 10000
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+
+from adyela_api.config import AppointmentType, UserRole
+from adyela_api.domain import (
+    APPOINTMENT_CODEC,
+    PATIENT_CODEC,
+    PRACTITIONER_CODEC,
+    TENANT_CODEC,
+    Appointment,
+    EntityCodec,
+    Patient,
+    Practitioner,
+    Tenant,
+)
+from adyela_api.domain.value_objects import Address, DateTimeRange, Email, PhoneNumber, TenantId
+
+
+def _rows(count: int) -> dict[str, tuple[EntityCodec[Any], list[dict[str, Any]]]]:
+    start = datetime.now(UTC) + timedelta(days=1)
+    appointments = [
+        Appointment(
+            id=f"appointment-{index}",
+            tenant_id=TenantId("tenant-1"),
+            patient_id=f"patient-{index}",
+            practitioner_id="practitioner-1",
+            schedule=DateTimeRange(
+                start=start + timedelta(minutes=30 * index),
+                end=start + timedelta(minutes=30 * index + 30),
+            ),
+            appointment_type=AppointmentType.IN_PERSON,
+        )
+        for index in range(count)
+    ]
+    patients = [
+        Patient(
+            id=f"patient-{index}",
+            tenant_id=TenantId("tenant-1"),
+            first_name="Ana",
+            last_name=f"Diaz {index}",
+            email=Email(f"ana{index}@example.com"),
+            phone=PhoneNumber("+15551234567"),
+            date_of_birth=date(1990, 5, 1),
+        )
+        for index in range(count)
+    ]
+    practitioners = [
+        Practitioner(
+            id=f"practitioner-{index}",
+            tenant_id=TenantId("tenant-1"),
+            first_name="Eva",
+            last_name=f"Ruiz {index}",
+            email=Email(f"eva{index}@example.com"),
+            phone=PhoneNumber("+15551234567"),
+            role=UserRole.DOCTOR,
+        )
+        for index in range(count)
+    ]
+    tenants = [
+        Tenant(
+            id=f"tenant-{index}",
+            name=f"Clinic {index}",
+            email=Email(f"clinic{index}@example.com"),
+            phone=PhoneNumber("+15551234567"),
+            address=Address("Main St 1", "Springfield", "IL", "62701", "US"),
+        )
+        for index in range(count)
+    ]
+    return {
+        "Appointment": (APPOINTMENT_CODEC, [a.to_dict() for a in appointments]),
+        "Patient": (PATIENT_CODEC, [p.to_dict() for p in patients]),
+        "Practitioner": (PRACTITIONER_CODEC, [p.to_dict() for p in practitioners]),
+        "Tenant": (TENANT_CODEC, [t.to_dict() for t in tenants]),
+    }
+
+
+def _best_ms(operation: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        operation()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def _timings(codec: EntityCodec[Any], rows: list[dict[str, Any]], repeat: int) -> list[float]:
+    from_dict = codec.entity_type.from_dict  # type: ignore[attr-defined]
+    entities = codec.decode_many(rows)
+    return [
+        _best_ms(lambda: [from_dict(row) for row in rows], repeat),
+        _best_ms(lambda: codec.decode_many(rows), repeat),
+        _best_ms(lambda: codec.hydrate_many(rows), repeat),
+        _best_ms(lambda: [entity.to_dict() for entity in entities], repeat),
+        _best_ms(lambda: codec.encode_many(entities), repeat),
+    ]
+
+
+def main(count: int, repeat: int) -> None:
+    """Compare entity methods with generated codecs."""
+    print(f"count={count} repeat={repeat}")
+    print(
+        f"{'entity':<14}{'from_dict':>11}{'decode_many':>13}{'hydrate_many':>14}"
+        f"{'to_dict':>10}{'encode_many':>13}"
+    )
+    for name, (codec, rows) in _rows(count).items():
+        from_dict, decode, hydrate, to_dict, encode = _timings(codec, rows, repeat)
+        print(
+            f"{name:<14}{from_dict:>9.1f}ms{decode:>11.1f}ms{hydrate:>12.1f}ms"
+            f"{to_dict:>8.1f}ms{encode:>11.1f}ms"
+            f"   decode {from_dict / decode:.2f}x  hydrate {from_dict / hydrate:.2f}x"
+            f"  encode {to_dict / encode:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.count, args.repeat)
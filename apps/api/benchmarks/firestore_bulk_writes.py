@@ -0,0 +1,93 @@
+"""Write throughput of bulk repository methods versus one-document writes.
+
+Creates, updates and deletes ``--count`` appointments first with one awaited
+call per document (what onboarding scripts did with ``create``/``update``/
+``delete``), then with ``create_many``/``update_many``/``delete_many``.
+
+Requires the Firestore emulator::
+
+    FIRESTORE_EMULATOR_HOST=localhost:8080 poetry run python -m benchmarks.firestore_bulk_writes
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+
+from google.cloud import firestore  # type: ignore
+
+from adyela_api.infrastructure.repositories import FirestoreAppointmentRepository
+from adyela_api.infrastructure.repositories.batch_writer import BatchWriter
+from adyela_api.infrastructure.repositories.pagination import PageTokenCodec
+from benchmarks.emulator import require_emulator, sample_appointment
+
+
+async def _timed(name: str, count: int, operation: Callable[[], Awaitable[object]]) -> float:
+    started = time.perf_counter()
+    await operation()
+    elapsed = time.perf_counter() - started
+    print(f"{name:<18} {count:>6} docs  {elapsed:8.3f}s  {count / elapsed:10.1f} docs/s")
+    return elapsed
+
+
+async def main(count: int, batch_size: int, max_concurrency: int) -> None:
+    """Compare sequential single-document writes with bulk writes."""
+    settings = require_emulator()
+    db = firestore.AsyncClient(project=settings.gcp_project_id)
+    repo = FirestoreAppointmentRepository(
+        db,
+        PageTokenCodec(settings.secret_key.get_secret_value()),
+        BatchWriter(db, batch_size=batch_size, max_concurrency=max_concurrency),
+    )
+    tenant_id = f"bench-{uuid.uuid4().hex[:8]}"
+
+    single = [sample_appointment(tenant_id, "bench-single", slot) for slot in range(count)]
+    bulk = [sample_appointment(tenant_id, "bench-bulk", slot) for slot in range(count)]
+
+    async def create_one_by_one() -> None:
+        for appointment in single:
+            await repo.create(appointment)
+
+    async def update_one_by_one() -> None:
+        for appointment in single:
+            appointment.confirm()
+            await repo.update(appointment)
+
+    async def delete_one_by_one() -> None:
+        for appointment in single:
+            await repo.delete(appointment.id)
+
+    async def update_in_bulk() -> None:
+        for appointment in bulk:
+            appointment.confirm()
+        await repo.update_many(bulk)
+
+    print(f"count={count} batch_size={batch_size} max_concurrency={max_concurrency}")
+    timings = [
+        (
+            await _timed("create (single)", count, create_one_by_one),
+            await _timed("create_many", count, lambda: repo.create_many(bulk)),
+        ),
+        (
+            await _timed("update (single)", count, update_one_by_one),
+            await _timed("update_many", count, update_in_bulk),
+        ),
+        (
+            await _timed("delete (single)", count, delete_one_by_one),
+            await _timed("delete_many", count, lambda: repo.delete_many([a.id for a in bulk])),
+        ),
+    ]
+    for name, (single_elapsed, bulk_elapsed) in zip(
+        ["create", "update", "delete"], timings, strict=True
+    ):
+        print(f"{name:<18} speedup {single_elapsed / bulk_elapsed:6.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--max-concurrency", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.count, args.batch_size, args.max_concurrency))
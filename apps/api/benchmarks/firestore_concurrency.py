@@ -0,0 +1,118 @@
+"""Concurrent-request throughput of the Firestore appointment repository.
+
+Compares the previous access pattern (the synchronous ``firestore.Client``
+called from inside ``async def`` handlers) with the ``AsyncClient``-backed
+``FirestoreAppointmentRepository``. Each simulated request performs one
+``get_by_id`` and one ``list_by_practitioner`` call, and ``--concurrency``
+requests are in flight at the same time on a single event loop, which is what
+one uvicorn worker sees under load.
+
+Requires the Firestore emulator (``make start`` brings it up)::
+
+    FIRESTORE_EMULATOR_HOST=localhost:8080 poetry run python -m benchmarks.firestore_concurrency
+"""
+
+import argparse
+import asyncio
+import os
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+
+from google.cloud import firestore  # type: ignore
+
+from adyela_api.config import COLLECTIONS
+from adyela_api.domain import Appointment
+from adyela_api.infrastructure.repositories import FirestoreAppointmentRepository
+from adyela_api.infrastructure.repositories.pagination import PageTokenCodec
+from benchmarks.emulator import require_emulator, sample_appointment
+
+
+class BlockingAppointmentReader:
+    """Reproduces the old repository behaviour: sync client calls in coroutines."""
+
+    def __init__(self, db: firestore.Client) -> None:
+        self.db = db
+        self.collection = COLLECTIONS["appointments"]
+
+    async def get_by_id(self, entity_id: str) -> Appointment | None:
+        doc = self.db.collection(self.collection).document(entity_id).get()
+        if not doc.exists:
+            return None
+        return Appointment.from_dict({"id": doc.id, **doc.to_dict()})
+
+    async def list_by_practitioner(
+        self, tenant_id: str, practitioner_id: str, limit: int = 20
+    ) -> list[Appointment]:
+        docs = (
+            self.db.collection(self.collection)
+            .where("tenant_id", "==", tenant_id)
+            .where("practitioner_id", "==", practitioner_id)
+            .limit(limit)
+            .stream()
+        )
+        return [Appointment.from_dict({"id": doc.id, **doc.to_dict()}) for doc in docs]
+
+
+async def _run(
+    name: str,
+    request: Callable[[int], Awaitable[object]],
+    total_requests: int,
+    concurrency: int,
+) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(i: int) -> None:
+        async with semaphore:
+            await request(i)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(bounded(i) for i in range(total_requests)))
+    elapsed = time.perf_counter() - started
+    throughput = total_requests / elapsed
+    print(f"{name:<10} {total_requests:>6} requests  {elapsed:8.3f}s  {throughput:10.1f} req/s")
+    return throughput
+
+
+async def main(total_requests: int, concurrency: int, seed: int) -> None:
+    """Seed the emulator and compare blocking and async throughput."""
+    settings = require_emulator()
+
+    tenant_id = f"bench-{uuid.uuid4().hex[:8]}"
+    practitioner_id = "bench-practitioner"
+
+    async_repo = FirestoreAppointmentRepository(
+        firestore.AsyncClient(project=settings.gcp_project_id),
+        PageTokenCodec(settings.secret_key.get_secret_value()),
+    )
+    blocking_repo = BlockingAppointmentReader(firestore.Client(project=settings.gcp_project_id))
+
+    ids = [
+        (await async_repo.create(sample_appointment(tenant_id, practitioner_id, slot))).id
+        for slot in range(seed)
+    ]
+
+    async def blocking_request(i: int) -> None:
+        await blocking_repo.get_by_id(ids[i % len(ids)])
+        await blocking_repo.list_by_practitioner(tenant_id, practitioner_id)
+
+    async def async_request(i: int) -> None:
+        await async_repo.get_by_id(ids[i % len(ids)])
+        await async_repo.list_by_practitioner(tenant_id, practitioner_id, limit=20)
+
+    print(f"concurrency={concurrency} seed={seed} emulator={os.environ['FIRESTORE_EMULATOR_HOST']}")
+    before = await _run("blocking", blocking_request, total_requests, concurrency)
+    after = await _run("async", async_request, total_requests, concurrency)
+    print(f"speedup    {after / before:.2f}x")
+
+    for entity_id in ids:
+        await async_repo.delete(entity_id)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency, args.seed))
@@ -0,0 +1,142 @@
+"""Calendar algebra: naive pairwise loops over ``DateTimeRange`` versus ``IntervalSet``.
+
+Builds two calendars of ``--count`` random busy blocks each over a month and
+times merging one into disjoint blocks, intersecting the two, subtracting one
+from the other and listing the gaps, first with pairwise loops (every block
+against every other) and then with sorted-boundary ``IntervalSet`` sweeps.
+
+Run from ``apps/api``::
+
+    poetry run python -m benchmarks.interval_set --count 500
+"""
+
+import argparse
+import random
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from time import perf_counter
+
+from adyela_api.domain import IntervalSet
+from adyela_api.domain.value_objects import DateTimeRange
+
+BASE = datetime(2030, 1, 1, tzinfo=UTC)
+
+
+def _calendar(count: int, seed: int) -> list[DateTimeRange]:
+    rng = random.Random(seed)
+    blocks = []
+    for _ in range(count):
+        start = BASE + timedelta(minutes=rng.randrange(0, 30 * 24 * 60, 5))
+        blocks.append(
+            DateTimeRange(start=start, end=start + timedelta(minutes=rng.choice((15, 30, 60, 120))))
+        )
+    return blocks
+
+
+def naive_union(blocks: list[DateTimeRange]) -> list[DateTimeRange]:
+    """Merge any overlapping or touching pair until none is left."""
+    merged = list(blocks)
+    changed = True
+    while changed:
+        changed = False
+        for i in range(len(merged)):
+            for j in range(i + 1, len(merged)):
+                a, b = merged[i], merged[j]
+                if a.start <= b.end and b.start <= a.end:
+                    merged[i] = DateTimeRange(start=min(a.start, b.start), end=max(a.end, b.end))
+                    del merged[j]
+                    changed = True
+                    break
+            if changed:
+                break
+    return sorted(merged, key=lambda block: block.start)
+
+
+def naive_intersection(
+    first: list[DateTimeRange], second: list[DateTimeRange]
+) -> list[DateTimeRange]:
+    """Overlap of every pair of disjoint blocks."""
+    return [
+        DateTimeRange(start=max(a.start, b.start), end=min(a.end, b.end))
+        for a in first
+        for b in second
+        if a.overlaps_with(b)
+    ]
+
+
+def naive_difference(
+    first: list[DateTimeRange], second: list[DateTimeRange]
+) -> list[DateTimeRange]:
+    """Cut every block of the second calendar out of every piece of the first."""
+    pieces = list(first)
+    for b in second:
+        remaining = []
+        for a in pieces:
+            if not a.overlaps_with(b):
+                remaining.append(a)
+                continue
+            if a.start < b.start:
+                remaining.append(DateTimeRange(start=a.start, end=b.start))
+            if b.end < a.end:
+                remaining.append(DateTimeRange(start=b.end, end=a.end))
+        pieces = remaining
+    return pieces
+
+
+def naive_gaps(blocks: list[DateTimeRange]) -> list[DateTimeRange]:
+    """Gaps between disjoint blocks, found by checking every block for the next start."""
+    gaps = []
+    for a in blocks:
+        later = [b.start for b in blocks if b.start >= a.end]
+        if later and min(later) > a.end:
+            gaps.append(DateTimeRange(start=a.end, end=min(later)))
+    return gaps
+
+
+def _best_ms(operation: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = perf_counter()
+        operation()
+        best = min(best, perf_counter() - started)
+    return best * 1000
+
+
+def main(count: int, repeat: int) -> None:
+    """Compare pairwise loops with interval-set sweeps."""
+    first, second = _calendar(count, 1), _calendar(count, 2)
+    merged_first, merged_second = naive_union(first), naive_union(second)
+    left, right = IntervalSet.of(first), IntervalSet.of(second)
+    assert list(left) == merged_first
+    assert IntervalSet.of(naive_intersection(merged_first, merged_second)) == left & right
+    assert IntervalSet.of(naive_difference(merged_first, merged_second)) == left - right
+    assert IntervalSet.of(naive_gaps(merged_first)) == left.gaps()
+
+    cases: list[tuple[str, Callable[[], object], Callable[[], object]]] = [
+        ("merge busy blocks", lambda: naive_union(first), lambda: IntervalSet.of(first)),
+        (
+            "intersect calendars",
+            lambda: naive_intersection(merged_first, merged_second),
+            lambda: left & right,
+        ),
+        (
+            "subtract calendar",
+            lambda: naive_difference(merged_first, merged_second),
+            lambda: left - right,
+        ),
+        ("list gaps", lambda: naive_gaps(merged_first), lambda: left.gaps()),
+    ]
+    print(f"count={count} per calendar, {len(left)} and {len(right)} disjoint blocks")
+    print(f"{'operation':<22}{'pairwise':>12}{'interval set':>14}{'speedup':>10}")
+    for name, naive, fast in cases:
+        naive_ms = _best_ms(naive, repeat)
+        fast_ms = _best_ms(fast, repeat)
+        print(f"{name:<22}{naive_ms:>10.1f}ms{fast_ms:>12.2f}ms{naive_ms / fast_ms:>9.0f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    main(args.count, args.repeat)
@@ -0,0 +1,115 @@
+"""Recurring bookings stored as materialized appointments versus one ``RecurringSeries`` each.
+
+Books ``--series`` weekly series of ``--weeks`` occurrences for one
+practitioner, then compares what each model writes (documents and encoded
+bytes) and the CPU cost of the busy ranges of one week near the start and
+one near the end of the series: filtering the materialized appointments
+against expanding every series for that week only.
+
+Run from ``apps/api``::
+
+    poetry run python -m benchmarks.recurring_series --series 40 --weeks 104
+"""
+
+import argparse
+import json
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from time import perf_counter
+
+from adyela_api.config import AppointmentType
+from adyela_api.domain import (
+    APPOINTMENT_CODEC,
+    RECURRING_SERIES_CODEC,
+    Appointment,
+    RecurringSeries,
+)
+from adyela_api.domain.value_objects import DateTimeRange, TenantId
+
+# A Monday
+BASE = datetime(2030, 1, 7, 8, tzinfo=UTC)
+
+
+def _series(count: int, weeks: int) -> list[RecurringSeries]:
+    return [
+        RecurringSeries(
+            id=f"series-{index}",
+            tenant_id=TenantId.of("tenant-1"),
+            patient_id=f"patient-{index}",
+            practitioner_id="doc-1",
+            recurrence=f"FREQ=WEEKLY;COUNT={weeks}",
+            first_start=BASE + timedelta(days=index % 5, minutes=30 * (index // 5)),
+            duration_minutes=30,
+            appointment_type=AppointmentType.IN_PERSON,
+        )
+        for index in range(count)
+    ]
+
+
+def _materialized(series: list[RecurringSeries], weeks: int) -> list[Appointment]:
+    everything = DateTimeRange(start=BASE, end=BASE + timedelta(weeks=weeks + 1))
+    return [
+        Appointment(
+            id=f"{item.id}-{occurrence.original_start:%Y%m%d}",
+            tenant_id=item.tenant_id,
+            patient_id=item.patient_id,
+            practitioner_id=item.practitioner_id,
+            schedule=occurrence.schedule,
+            appointment_type=item.appointment_type,
+        )
+        for item in series
+        for occurrence in item.occurrences(everything)
+    ]
+
+
+def _best_ms(operation: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = perf_counter()
+        operation()
+        best = min(best, perf_counter() - started)
+    return best * 1000
+
+
+def main(series_count: int, weeks: int, repeat: int) -> None:
+    """Compare materialized occurrences with lazily expanded series."""
+    series = _series(series_count, weeks)
+    appointments = _materialized(series, weeks)
+    stored_series = [RECURRING_SERIES_CODEC.encode(item) for item in series]
+    stored_appointments = [APPOINTMENT_CODEC.encode(item) for item in appointments]
+    print(f"series={series_count} weeks={weeks}")
+    print(
+        f"writes: {len(stored_appointments)} appointments "
+        f"({len(json.dumps(stored_appointments)) / 1024:.0f}KB) versus "
+        f"{len(stored_series)} series ({len(json.dumps(stored_series)) / 1024:.0f}KB)"
+    )
+
+    for week in (1, weeks - 2):
+        window = DateTimeRange(
+            start=BASE + timedelta(weeks=week), end=BASE + timedelta(weeks=week + 1)
+        )
+
+        def materialized(window: DateTimeRange = window) -> list[DateTimeRange]:
+            return [a.schedule for a in appointments if a.schedule.overlaps_with(window)]
+
+        def expanded(window: DateTimeRange = window) -> list[DateTimeRange]:
+            return [o.schedule for item in series for o in item.occurrences(window)]
+
+        assert sorted(materialized(), key=lambda r: r.start) == sorted(
+            expanded(), key=lambda r: r.start
+        )
+        materialized_ms = _best_ms(materialized, repeat)
+        expanded_ms = _best_ms(expanded, repeat)
+        print(
+            f"week {week:>4} busy ranges: materialized {materialized_ms:7.2f}ms"
+            f"   expanded {expanded_ms:7.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--series", type=int, default=40)
+    parser.add_argument("--weeks", type=int, default=104)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.series, args.weeks, args.repeat)
@@ -0,0 +1,85 @@
+"""Free-slot search for a week: per-candidate overlap checks versus ``SlotGrid`` bitsets.
+
+Books ``--bookings`` random appointments into a practitioner's week and
+lists every free ``--duration``-minute slot on a 5-minute step, first by
+checking each candidate slot against every booking (what calling
+``check_availability`` per candidate amounts to, minus the I/O) and then with
+``SlotGrid.free_slots``.
+
+Run from ``apps/api``::
+
+    poetry run python -m benchmarks.slot_grid --bookings 200
+"""
+
+import argparse
+import random
+from collections.abc import Callable
+from datetime import UTC, date, datetime, time, timedelta
+from time import perf_counter
+
+from adyela_api.domain import SlotGrid, WorkingHours
+from adyela_api.domain.value_objects import DateTimeRange
+
+MONDAY = date(2030, 1, 7)
+HOURS = WorkingHours.weekdays(time(8), time(20))
+
+
+def _bookings(count: int) -> list[DateTimeRange]:
+    rng = random.Random(42)
+    bookings = []
+    for _ in range(count):
+        day = MONDAY + timedelta(days=rng.randrange(5))
+        start = datetime.combine(day, time(), UTC) + timedelta(
+            minutes=rng.randrange(8 * 60, 20 * 60, 5)
+        )
+        bookings.append(DateTimeRange(start=start, end=start + timedelta(minutes=15)))
+    return bookings
+
+
+def _per_candidate(bookings: list[DateTimeRange], duration: int) -> int:
+    found = 0
+    for offset in range(7):
+        day = MONDAY + timedelta(days=offset)
+        for start, end in HOURS.on(day.weekday()):
+            candidate = datetime.combine(day, start, UTC)
+            closing = datetime.combine(day, end, UTC)
+            while candidate + timedelta(minutes=duration) <= closing:
+                slot = DateTimeRange(start=candidate, end=candidate + timedelta(minutes=duration))
+                if not any(slot.overlaps_with(booking) for booking in bookings):
+                    found += 1
+                candidate += timedelta(minutes=5)
+    return found
+
+
+def _grid(bookings: list[DateTimeRange], duration: int) -> int:
+    slots = SlotGrid().free_slots(HOURS, bookings, MONDAY, 7, duration, step_minutes=5)
+    return sum(len(day_slots) for day_slots in slots.values())
+
+
+def _best_ms(operation: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = perf_counter()
+        operation()
+        best = min(best, perf_counter() - started)
+    return best * 1000
+
+
+def main(bookings: int, duration: int, repeat: int) -> None:
+    """Compare per-candidate checks with bitset search."""
+    booked = _bookings(bookings)
+    assert _per_candidate(booked, duration) == _grid(booked, duration)
+    loop_ms = _best_ms(lambda: _per_candidate(booked, duration), repeat)
+    grid_ms = _best_ms(lambda: _grid(booked, duration), repeat)
+    print(f"bookings={bookings} duration={duration}m slots={_grid(booked, duration)}")
+    print(f"per-candidate {loop_ms:9.2f}ms")
+    print(f"slot grid     {grid_ms:9.2f}ms   {loop_ms / grid_ms:.0f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bookings", type=int, default=200)
+    parser.add_argument("--duration", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.bookings, args.duration, args.repeat)
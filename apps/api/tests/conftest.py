@@ -1,10 +1,21 @@
 """Pytest configuration and fixtures."""
 
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+
 import pytest
 from fastapi.testclient import TestClient
 
+from adyela_api.config import AppointmentStatus, AppointmentType
+from adyela_api.domain import Appointment
+from adyela_api.domain.value_objects import DateTimeRange, TenantId
 from adyela_api.main import app
 
+# First slot of make_appointment, a Monday far enough ahead to stay in the future
+APPOINTMENT_START = datetime(2030, 1, 7, 9, tzinfo=UTC)
+
+AppointmentFactory = Callable[..., Appointment]
+
 
 @pytest.fixture
 def client() -> TestClient:
@@ -22,3 +33,36 @@ def tenant_id() -> str:
 def headers(tenant_id: str) -> dict[str, str]:
     """Return test headers with tenant ID."""
     return {"X-Tenant-ID": tenant_id}
+
+
+@pytest.fixture
+def make_appointment() -> AppointmentFactory:
+    """Return a factory of unsaved 30-minute in-person appointments.
+
+    ``slot`` counts 30-minute slots from ``APPOINTMENT_START``; ``start`` and
+    ``end`` set the schedule directly instead.
+    """
+
+    def make(
+        slot: int = 0,
+        *,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        appointment_id: str = "",
+        tenant_id: str = "tenant-1",
+        patient_id: str = "pat-1",
+        practitioner_id: str = "doc-1",
+        status: AppointmentStatus = AppointmentStatus.SCHEDULED,
+    ) -> Appointment:
+        start = start or APPOINTMENT_START + timedelta(minutes=30 * slot)
+        return Appointment(
+            id=appointment_id,
+            tenant_id=TenantId(tenant_id),
+            patient_id=patient_id,
+            practitioner_id=practitioner_id,
+            schedule=DateTimeRange(start=start, end=end or start + timedelta(minutes=30)),
+            appointment_type=AppointmentType.IN_PERSON,
+            status=status,
+        )
+
+    return make
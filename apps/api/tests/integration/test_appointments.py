@@ -0,0 +1,364 @@
+"""Integration tests for appointment endpoints."""
+
+import json
+from collections.abc import AsyncIterator, Iterator
+from datetime import UTC, date, datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from adyela_api.application.ports import (
+    AppointmentRepository,
+    Page,
+    PatientRepository,
+    PractitionerRepository,
+    RecurringSeriesRepository,
+)
+from adyela_api.config import AppointmentStatus, AppointmentType, UserRole
+from adyela_api.domain import (
+    Appointment,
+    AppointmentSummary,
+    Patient,
+    Practitioner,
+    RecurringSeries,
+    ValidationError,
+)
+from adyela_api.domain.value_objects import Email, PhoneNumber, TenantId
+from adyela_api.main import app
+from adyela_api.presentation.dependencies import (
+    get_appointment_repository,
+    get_patient_repository,
+    get_practitioner_repository,
+    get_recurring_series_repository,
+)
+from tests.conftest import AppointmentFactory
+
+
+@pytest.fixture
+def repository() -> Iterator[AsyncMock]:
+    """Override the appointment repository with a mock."""
+    mock = AsyncMock(spec=AppointmentRepository)
+    mock.count.return_value = 0
+    app.dependency_overrides[get_appointment_repository] = lambda: mock
+    yield mock
+    app.dependency_overrides.pop(get_appointment_repository, None)
+
+
+@pytest.fixture
+def patients() -> Iterator[AsyncMock]:
+    """Override the patient repository with a mock."""
+    mock = AsyncMock(spec=PatientRepository)
+    mock.get_many.return_value = {}
+    app.dependency_overrides[get_patient_repository] = lambda: mock
+    yield mock
+    app.dependency_overrides.pop(get_patient_repository, None)
+
+
+@pytest.fixture
+def practitioners() -> Iterator[AsyncMock]:
+    """Override the practitioner repository with a mock."""
+    mock = AsyncMock(spec=PractitionerRepository)
+    mock.get_many.return_value = {}
+    app.dependency_overrides[get_practitioner_repository] = lambda: mock
+    yield mock
+    app.dependency_overrides.pop(get_practitioner_repository, None)
+
+
+@pytest.fixture
+def series() -> Iterator[AsyncMock]:
+    """Override the recurring series repository with a mock holding no series."""
+    mock = AsyncMock(spec=RecurringSeriesRepository)
+    mock.list_by_practitioner.return_value = Page()
+    app.dependency_overrides[get_recurring_series_repository] = lambda: mock
+    yield mock
+    app.dependency_overrides.pop(get_recurring_series_repository, None)
+
+
+@pytest.fixture
+def appointment(make_appointment: AppointmentFactory, tenant_id: str) -> Appointment:
+    """Create an appointment of the test tenant."""
+    return make_appointment(
+        appointment_id="appt-123",
+        tenant_id=tenant_id,
+        patient_id="patient-123",
+        practitioner_id="doc-123",
+    )
+
+
+@pytest.mark.usefixtures("patients", "practitioners")
+class TestListAppointments:
+    """Test GET /api/v1/appointments."""
+
+    def test_returns_page_and_next_token(
+        self,
+        client: TestClient,
+        headers: dict[str, str],
+        tenant_id: str,
+        repository: AsyncMock,
+        appointment: Appointment,
+    ) -> None:
+        """Test that the endpoint returns the repository page and its token."""
+        repository.list.return_value = Page(items=[appointment], next_page_token="t2")
+        repository.count.return_value = 42
+
+        response = client.get("/api/v1/appointments?page_size=1", headers=headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert [item["id"] for item in data["items"]] == ["appt-123"]
+        assert data["next_page_token"] == "t2"
+        assert data["total"] == 42
+        repository.list.assert_awaited_once_with(
+            limit=1, filters={"tenant_id": tenant_id}, page_token=None
+        )
+        repository.count.assert_awaited_once_with({"tenant_id": tenant_id})
+
+    def test_resolves_names_with_one_lookup_each(
+        self,
+        client: TestClient,
+        headers: dict[str, str],
+        tenant_id: str,
+        repository: AsyncMock,
+        patients: AsyncMock,
+        practitioners: AsyncMock,
+        appointment: Appointment,
+    ) -> None:
+        """Test that rows sharing people resolve their names with one batched lookup each."""
+        repository.list.return_value = Page(items=[appointment] * 3)
+        patients.get_many.return_value = {
+            "patient-123": Patient(
+                id="patient-123",
+                tenant_id=TenantId(tenant_id),
+                first_name="Luis",
+                last_name="Gomez",
+                email=Email("luis@example.com"),
+                phone=PhoneNumber("+15551234567"),
+                date_of_birth=date(1990, 5, 1),
+            )
+        }
+
+        response = client.get("/api/v1/appointments", headers=headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        items = response.json()["items"]
+        assert {item["patient_name"] for item in items} == {"Luis Gomez"}
+        assert {item["practitioner_name"] for item in items} == {None}
+        patients.get_many.assert_awaited_once_with(["patient-123"])
+        practitioners.get_many.assert_awaited_once_with(["doc-123"])
+
+    def test_forwards_page_token(
+        self, client: TestClient, headers: dict[str, str], tenant_id: str, repository: AsyncMock
+    ) -> None:
+        """Test that the page token is passed through to the repository."""
+        repository.list.return_value = Page()
+
+        response = client.get("/api/v1/appointments?page_token=t2", headers=headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["next_page_token"] is None
+        repository.list.assert_awaited_once_with(
+            limit=20, filters={"tenant_id": tenant_id}, page_token="t2"
+        )
+
+    def test_invalid_page_token(
+        self, client: TestClient, headers: dict[str, str], repository: AsyncMock
+    ) -> None:
+        """Test that a tampered page token is a client error."""
+        repository.list.side_effect = ValidationError("Invalid page token")
+
+        response = client.get("/api/v1/appointments?page_token=forged", headers=headers)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_page_size_is_bounded(
+        self, client: TestClient, headers: dict[str, str], repository: AsyncMock
+    ) -> None:
+        """Test that page size above the maximum is rejected."""
+        response = client.get("/api/v1/appointments?page_size=1000", headers=headers)
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+class TestListAppointmentSummaries:
+    """Test GET /api/v1/appointments/summaries."""
+
+    def test_returns_only_projected_fields(
+        self, client: TestClient, headers: dict[str, str], tenant_id: str, repository: AsyncMock
+    ) -> None:
+        """Test that unrequested fields are left out of the response."""
+        repository.list_summaries.return_value = Page(
+            items=[AppointmentSummary(id="appt-123", status=AppointmentStatus.CONFIRMED)]
+        )
+
+        response = client.get(
+            "/api/v1/appointments/summaries?fields=status&practitioner_id=doc-123",
+            headers=headers,
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["items"] == [{"id": "appt-123", "status": "confirmed"}]
+        repository.list_summaries.assert_awaited_once_with(
+            tenant_id,
+            fields=["status"],
+            filters={"practitioner_id": "doc-123"},
+            start_date=None,
+            end_date=None,
+            limit=20,
+            page_token=None,
+        )
+
+    def test_unknown_field(
+        self, client: TestClient, headers: dict[str, str], repository: AsyncMock
+    ) -> None:
+        """Test that projecting an unsupported field is a client error."""
+        repository.list_summaries.side_effect = ValidationError("Cannot project fields: notes")
+
+        response = client.get("/api/v1/appointments/summaries?fields=notes", headers=headers)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestExportAppointments:
+    """Test GET /api/v1/appointments/export."""
+
+    def test_streams_ndjson(
+        self,
+        client: TestClient,
+        headers: dict[str, str],
+        tenant_id: str,
+        repository: AsyncMock,
+        make_appointment: AppointmentFactory,
+    ) -> None:
+        """Test that every yielded appointment becomes one JSON line."""
+
+        async def appointments() -> AsyncIterator[Appointment]:
+            for index in range(3):
+                yield make_appointment(appointment_id=f"appt-{index}", tenant_id=tenant_id)
+
+        repository.iter_by_date_range.return_value = appointments()
+
+        response = client.get(
+            "/api/v1/appointments/export",
+            params={
+                "start_date": "2030-01-01T00:00:00+00:00",
+                "end_date": "2030-02-01T00:00:00+00:00",
+            },
+            headers=headers,
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["id"] for line in lines] == ["appt-0", "appt-1", "appt-2"]
+        repository.iter_by_date_range.assert_called_once_with(
+            tenant_id, "2030-01-01T00:00:00+00:00", "2030-02-01T00:00:00+00:00"
+        )
+
+
+class TestAvailability:
+    """Test GET /api/v1/appointments/availability."""
+
+    def test_returns_a_week_of_slots(
+        self,
+        client: TestClient,
+        headers: dict[str, str],
+        tenant_id: str,
+        repository: AsyncMock,
+        practitioners: AsyncMock,
+        series: AsyncMock,
+    ) -> None:
+        """Test that one call returns each day's free slots around bookings and series."""
+        practitioners.get_by_id.return_value = Practitioner(
+            id="doc-123",
+            tenant_id=TenantId(tenant_id),
+            first_name="Ana",
+            last_name="Diaz",
+            email=Email("ana@example.com"),
+            phone=PhoneNumber("+15551234567"),
+            role=UserRole.DOCTOR,
+        )
+        start = datetime(2030, 1, 7, 9, tzinfo=UTC)
+        repository.list_summaries.return_value = Page(
+            items=[
+                AppointmentSummary(
+                    id="appt-123",
+                    start_time=start,
+                    end_time=start + timedelta(hours=7),
+                    status=AppointmentStatus.CONFIRMED,
+                )
+            ]
+        )
+
+        series.list_by_practitioner.return_value = Page(
+            items=[
+                RecurringSeries(
+                    id="series-123",
+                    tenant_id=TenantId(tenant_id),
+                    patient_id="patient-123",
+                    practitioner_id="doc-123",
+                    recurrence="FREQ=WEEKLY;BYDAY=TU",
+                    first_start=datetime(2030, 1, 1, 9, tzinfo=UTC),
+                    duration_minutes=60,
+                    appointment_type=AppointmentType.IN_PERSON,
+                )
+            ]
+        )
+
+        response = client.get(
+            "/api/v1/appointments/availability",
+            params={
+                "practitioner_id": "doc-123",
+                "start_date": "2030-01-07",
+                "duration_minutes": 60,
+                "step_minutes": 60,
+            },
+            headers=headers,
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["duration_minutes"] == 60
+        assert [day["date"] for day in data["days"]][0] == "2030-01-07"
+        assert len(data["days"]) == 7
+        assert data["days"][0]["slots"] == [
+            {"start_time": "2030-01-07T16:00:00Z", "end_time": "2030-01-07T17:00:00Z"}
+        ]
+        # Tuesdays at 09:00 belong to the weekly series
+        assert len(data["days"][1]["slots"]) == 7
+        assert data["days"][1]["slots"][0]["start_time"] == "2030-01-08T10:00:00Z"
+        assert len(data["days"][2]["slots"]) == 8
+
+    def test_unknown_practitioner(
+        self,
+        client: TestClient,
+        headers: dict[str, str],
+        repository: AsyncMock,
+        practitioners: AsyncMock,
+        series: AsyncMock,
+    ) -> None:
+        """Test that an unknown practitioner is not found."""
+        practitioners.get_by_id.return_value = None
+
+        response = client.get(
+            "/api/v1/appointments/availability?practitioner_id=missing", headers=headers
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_duration_limits(
+        self,
+        client: TestClient,
+        headers: dict[str, str],
+        repository: AsyncMock,
+        practitioners: AsyncMock,
+        series: AsyncMock,
+    ) -> None:
+        """Test that durations outside the appointment limits are rejected."""
+        response = client.get(
+            "/api/v1/appointments/availability?practitioner_id=doc-123&duration_minutes=300",
+            headers=headers,
+        )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
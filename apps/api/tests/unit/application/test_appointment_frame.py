@@ -0,0 +1,144 @@
+"""Unit tests for the columnar appointment frame."""
+
+import itertools
+import random
+from collections import Counter
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from adyela_api.application.analytics import AppointmentFrame  # noqa: E402
+from adyela_api.config import AppointmentStatus  # noqa: E402
+from adyela_api.domain import Appointment  # noqa: E402
+from adyela_api.domain.value_objects import DateTimeRange  # noqa: E402
+from tests.conftest import APPOINTMENT_START, AppointmentFactory  # noqa: E402
+
+
+def _at(minutes: int) -> datetime:
+    return APPOINTMENT_START + timedelta(minutes=minutes)
+
+
+def _random_appointments(
+    make_appointment: AppointmentFactory, count: int, seed: int = 7
+) -> list[Appointment]:
+    rng = random.Random(seed)
+    appointments = []
+    for index in range(count):
+        start = rng.randrange(0, 24 * 60, 5)
+        appointments.append(
+            make_appointment(
+                start=_at(start),
+                end=_at(start + rng.choice((15, 30, 45, 60))),
+                appointment_id=f"a-{index}",
+                practitioner_id=f"doc-{rng.randrange(4)}",
+                patient_id=f"p-{rng.randrange(10)}",
+                status=rng.choice(list(AppointmentStatus)),
+            )
+        )
+    return appointments
+
+
+class TestAppointmentFrame:
+    """Test AppointmentFrame against loops over appointments."""
+
+    def test_from_dicts_matches_from_appointments(
+        self, make_appointment: AppointmentFactory
+    ) -> None:
+        """Test that both builders produce the same columns."""
+        appointments = _random_appointments(make_appointment, 50)
+        from_entities = AppointmentFrame.from_appointments(appointments)
+        from_rows = AppointmentFrame.from_dicts(a.to_dict() for a in appointments)
+
+        assert from_rows.ids.tolist() == from_entities.ids.tolist()
+        assert from_rows.starts.tolist() == from_entities.starts.tolist()
+        assert from_rows.ends.tolist() == from_entities.ends.tolist()
+        assert from_rows.categories == from_entities.categories
+        for column, codes in from_entities.codes.items():
+            assert from_rows.codes[column].tolist() == codes.tolist()
+
+    def test_from_dicts_rejects_unknown_status(self, make_appointment: AppointmentFactory) -> None:
+        """Test that invalid stored enum values are reported."""
+        row = make_appointment(appointment_id="a").to_dict()
+
+        with pytest.raises(ValueError, match="AppointmentStatus"):
+            AppointmentFrame.from_dicts([{**row, "status": "unknown"}])
+
+    def test_select(self, make_appointment: AppointmentFactory) -> None:
+        """Test that filters combine like the equivalent comprehension."""
+        appointments = _random_appointments(make_appointment, 200)
+        frame = AppointmentFrame.from_appointments(appointments)
+        window_start, window_end = _at(6 * 60), _at(12 * 60)
+
+        selected = frame.select(
+            statuses=["scheduled", AppointmentStatus.CONFIRMED],
+            practitioner_ids=["doc-1", "doc-2", "missing"],
+            start=window_start,
+            end=window_end,
+        )
+
+        assert selected.ids.tolist() == [
+            a.id
+            for a in appointments
+            if a.status in (AppointmentStatus.SCHEDULED, AppointmentStatus.CONFIRMED)
+            and a.practitioner_id in ("doc-1", "doc-2")
+            and a.schedule.overlaps_with(DateTimeRange(start=window_start, end=window_end))
+        ]
+
+    def test_count_by(self, make_appointment: AppointmentFactory) -> None:
+        """Test single- and multi-column counts."""
+        appointments = _random_appointments(make_appointment, 200)
+        frame = AppointmentFrame.from_appointments(appointments)
+
+        assert frame.count_by("status") == Counter(a.status for a in appointments)
+        assert frame.count_by("practitioner_id", "status") == Counter(
+            (a.practitioner_id, a.status) for a in appointments
+        )
+        assert AppointmentFrame.from_appointments([]).count_by("status") == {}
+
+    def test_overlaps_match_pairwise_check(self, make_appointment: AppointmentFactory) -> None:
+        """Test conflicts and overlap pairs against every pair of appointments."""
+        appointments = _random_appointments(make_appointment, 150)
+        frame = AppointmentFrame.from_appointments(appointments)
+
+        for by in ("practitioner_id", "patient_id"):
+            expected = {
+                (first.id, second.id)
+                for first, second in itertools.permutations(appointments, 2)
+                if getattr(first, by) == getattr(second, by)
+                and first.schedule.overlaps_with(second.schedule)
+                and (first.schedule.start, first.id) <= (second.schedule.start, second.id)
+            }
+            pairs = {tuple(frame.ids[pair].tolist()) for pair in frame.overlap_pairs(by)}
+            conflicting = set(frame.ids[frame.conflicts(by)].tolist())
+
+            assert {tuple(sorted(pair)) for pair in pairs} == {
+                tuple(sorted(pair)) for pair in expected
+            }
+            assert len(frame.overlap_pairs(by)) == len(expected)
+            assert conflicting == {id_ for pair in expected for id_ in pair}
+
+    def test_back_to_back_appointments_do_not_overlap(
+        self, make_appointment: AppointmentFactory
+    ) -> None:
+        """Test that intervals are half-open."""
+        frame = AppointmentFrame.from_appointments(
+            [
+                make_appointment(appointment_id="a"),
+                make_appointment(1, appointment_id="b"),
+                make_appointment(start=_at(59), end=_at(90), appointment_id="c"),
+            ]
+        )
+
+        assert frame.conflicts().tolist() == [False, True, True]
+        assert frame.ids[frame.overlap_pairs()].tolist() == [["b", "c"]]
+
+    def test_empty_frame(self) -> None:
+        """Test that operations on an empty frame return empty results."""
+        frame = AppointmentFrame.from_dicts([])
+
+        assert len(frame) == 0
+        assert frame.conflicts().tolist() == []
+        assert frame.overlap_pairs().shape == (0, 2)
+        assert len(frame.select(statuses=[AppointmentStatus.SCHEDULED])) == 0
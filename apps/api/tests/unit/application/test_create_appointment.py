@@ -0,0 +1,175 @@
+"""Unit tests for CreateAppointmentUseCase."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from adyela_api.application.ports import (
+    AppointmentRepository,
+    BookingService,
+    Page,
+    PractitionerRepository,
+    RecurringSeriesRepository,
+)
+from adyela_api.application.use_cases.appointments import CreateAppointmentUseCase
+from adyela_api.config import AppointmentType, UserRole
+from adyela_api.domain import BusinessRuleViolationError, Practitioner, RecurringSeries
+from adyela_api.domain.value_objects import Email, PhoneNumber, TenantId
+
+
+@pytest.fixture
+def practitioner() -> Practitioner:
+    """Create an active practitioner."""
+    return Practitioner(
+        id="doc-123",
+        tenant_id=TenantId("tenant-123"),
+        first_name="Ana",
+        last_name="Diaz",
+        email=Email("ana@example.com"),
+        phone=PhoneNumber("+15551234567"),
+        role=UserRole.DOCTOR,
+    )
+
+
+@pytest.fixture
+def appointment_repository() -> AsyncMock:
+    """Create an appointment repository where every slot is free."""
+    repository = AsyncMock(spec=AppointmentRepository)
+    repository.check_availability.return_value = True
+    repository.check_patient_availability.return_value = True
+    repository.create.side_effect = lambda appointment: appointment
+    return repository
+
+
+@pytest.fixture
+def use_case(
+    appointment_repository: AsyncMock, practitioner: Practitioner
+) -> CreateAppointmentUseCase:
+    """Create the use case under test."""
+    practitioner_repository = AsyncMock(spec=PractitionerRepository)
+    practitioner_repository.get_by_id.return_value = practitioner
+    return CreateAppointmentUseCase(appointment_repository, practitioner_repository)
+
+
+async def _execute(use_case: CreateAppointmentUseCase) -> object:
+    start = datetime.now(UTC) + timedelta(days=1)
+    return await use_case.execute(
+        tenant_id="tenant-123",
+        patient_id="patient-123",
+        practitioner_id="doc-123",
+        start_time=start,
+        end_time=start + timedelta(minutes=30),
+        appointment_type=AppointmentType.IN_PERSON,
+    )
+
+
+class TestCreateAppointmentUseCase:
+    """Test CreateAppointmentUseCase."""
+
+    async def test_creates_appointment(
+        self, use_case: CreateAppointmentUseCase, appointment_repository: AsyncMock
+    ) -> None:
+        """Test the happy path."""
+        await _execute(use_case)
+
+        appointment_repository.create.assert_awaited_once()
+
+    async def test_rejects_busy_practitioner(
+        self, use_case: CreateAppointmentUseCase, appointment_repository: AsyncMock
+    ) -> None:
+        """Test that an overlapping practitioner booking is rejected."""
+        appointment_repository.check_availability.return_value = False
+
+        with pytest.raises(BusinessRuleViolationError, match="Practitioner"):
+            await _execute(use_case)
+        appointment_repository.create.assert_not_awaited()
+
+    async def test_rejects_patient_double_booking(
+        self, use_case: CreateAppointmentUseCase, appointment_repository: AsyncMock
+    ) -> None:
+        """Test that a patient cannot hold two overlapping appointments."""
+        appointment_repository.check_patient_availability.return_value = False
+
+        with pytest.raises(BusinessRuleViolationError, match="Patient"):
+            await _execute(use_case)
+        appointment_repository.create.assert_not_awaited()
+
+    async def test_books_through_booking_service(
+        self, appointment_repository: AsyncMock, practitioner: Practitioner
+    ) -> None:
+        """Test that a booking service replaces the repository create."""
+        practitioner_repository = AsyncMock(spec=PractitionerRepository)
+        practitioner_repository.get_by_id.return_value = practitioner
+        booking_service = AsyncMock(spec=BookingService)
+        booking_service.book.side_effect = lambda appointment: appointment
+        use_case = CreateAppointmentUseCase(
+            appointment_repository, practitioner_repository, booking_service
+        )
+
+        await _execute(use_case)
+
+        booking_service.book.assert_awaited_once()
+        appointment_repository.check_availability.assert_awaited_once()
+        appointment_repository.check_patient_availability.assert_awaited_once()
+        appointment_repository.create.assert_not_awaited()
+
+    async def test_booking_service_respects_existing_appointments(
+        self, appointment_repository: AsyncMock, practitioner: Practitioner
+    ) -> None:
+        """Test that appointments missing from the schedule documents still block the slot."""
+        practitioner_repository = AsyncMock(spec=PractitionerRepository)
+        practitioner_repository.get_by_id.return_value = practitioner
+        booking_service = AsyncMock(spec=BookingService)
+        appointment_repository.check_availability.return_value = False
+        use_case = CreateAppointmentUseCase(
+            appointment_repository, practitioner_repository, booking_service
+        )
+
+        with pytest.raises(BusinessRuleViolationError, match="Practitioner"):
+            await _execute(use_case)
+        booking_service.book.assert_not_awaited()
+
+    @pytest.mark.parametrize(
+        ("listing", "message"),
+        [("list_by_practitioner", "Practitioner"), ("list_by_patient", "Patient")],
+    )
+    async def test_rejects_recurring_series_occurrence(
+        self,
+        appointment_repository: AsyncMock,
+        practitioner: Practitioner,
+        listing: str,
+        message: str,
+    ) -> None:
+        """Test that occurrences of the practitioner's or patient's series block the slot."""
+        start = datetime.now(UTC).replace(microsecond=0) + timedelta(days=1)
+        series = RecurringSeries(
+            id="series-1",
+            tenant_id=TenantId("tenant-123"),
+            patient_id="patient-123",
+            practitioner_id="doc-123",
+            recurrence="FREQ=WEEKLY",
+            first_start=start - timedelta(minutes=15),
+            duration_minutes=30,
+            appointment_type=AppointmentType.IN_PERSON,
+        )
+        practitioner_repository = AsyncMock(spec=PractitionerRepository)
+        practitioner_repository.get_by_id.return_value = practitioner
+        series_repository = AsyncMock(spec=RecurringSeriesRepository)
+        series_repository.list_by_practitioner.return_value = Page()
+        series_repository.list_by_patient.return_value = Page()
+        getattr(series_repository, listing).return_value = Page(items=[series])
+        use_case = CreateAppointmentUseCase(
+            appointment_repository, practitioner_repository, series_repository=series_repository
+        )
+
+        with pytest.raises(BusinessRuleViolationError, match=message):
+            await use_case.execute(
+                tenant_id="tenant-123",
+                patient_id="patient-123",
+                practitioner_id="doc-123",
+                start_time=start,
+                end_time=start + timedelta(minutes=30),
+                appointment_type=AppointmentType.IN_PERSON,
+            )
+        appointment_repository.create.assert_not_awaited()
@@ -0,0 +1,129 @@
+"""Unit tests for CreateRecurringSeriesUseCase."""
+
+from datetime import UTC, datetime, time, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from adyela_api.application.ports import (
+    AppointmentRepository,
+    Page,
+    PractitionerRepository,
+    RecurringSeriesRepository,
+)
+from adyela_api.application.use_cases.appointments import CreateRecurringSeriesUseCase
+from adyela_api.config import AppointmentStatus, AppointmentType, UserRole
+from adyela_api.domain import (
+    AppointmentSummary,
+    BusinessRuleViolationError,
+    Practitioner,
+    ValidationError,
+)
+from adyela_api.domain.value_objects import Email, PhoneNumber, TenantId
+
+# Mondays at 09:00, far enough ahead that no occurrence is in the past
+FIRST_START = datetime(2030, 1, 7, 9, tzinfo=UTC)
+
+
+@pytest.fixture
+def appointments() -> AsyncMock:
+    """Create an appointment repository with no bookings."""
+    repository = AsyncMock(spec=AppointmentRepository)
+    repository.list_summaries.return_value = Page()
+    return repository
+
+
+@pytest.fixture
+def series_repository() -> AsyncMock:
+    """Create a series repository with no other series."""
+    repository = AsyncMock(spec=RecurringSeriesRepository)
+    repository.list_by_practitioner.return_value = Page()
+    repository.list_by_patient.return_value = Page()
+    repository.create.side_effect = lambda series: series
+    return repository
+
+
+@pytest.fixture
+def use_case(appointments: AsyncMock, series_repository: AsyncMock) -> CreateRecurringSeriesUseCase:
+    """Create the use case under test."""
+    practitioners = AsyncMock(spec=PractitionerRepository)
+    practitioners.get_by_id.return_value = Practitioner(
+        id="doc-123",
+        tenant_id=TenantId("tenant-123"),
+        first_name="Ana",
+        last_name="Diaz",
+        email=Email("ana@example.com"),
+        phone=PhoneNumber("+15551234567"),
+        role=UserRole.DOCTOR,
+    )
+    return CreateRecurringSeriesUseCase(appointments, practitioners, series_repository)
+
+
+async def _execute(use_case: CreateRecurringSeriesUseCase, recurrence: str) -> object:
+    return await use_case.execute(
+        tenant_id="tenant-123",
+        patient_id="patient-123",
+        practitioner_id="doc-123",
+        recurrence=recurrence,
+        first_start=FIRST_START,
+        duration_minutes=45,
+        appointment_type=AppointmentType.IN_PERSON,
+    )
+
+
+class TestCreateRecurringSeriesUseCase:
+    """Test CreateRecurringSeriesUseCase."""
+
+    async def test_stores_one_series(
+        self, use_case: CreateRecurringSeriesUseCase, series_repository: AsyncMock
+    ) -> None:
+        """Test that an unbounded series is stored once, not per occurrence."""
+        series = await _execute(use_case, "FREQ=WEEKLY")
+
+        series_repository.create.assert_awaited_once_with(series)
+        assert series.recurrence == "FREQ=WEEKLY"
+
+    async def test_rejects_conflicting_occurrences(
+        self,
+        use_case: CreateRecurringSeriesUseCase,
+        appointments: AsyncMock,
+        series_repository: AsyncMock,
+    ) -> None:
+        """Test that a booking on a later occurrence rejects the series."""
+        booked = datetime.combine(FIRST_START.date() + timedelta(weeks=3), time(9, 30), UTC)
+        appointments.list_summaries.return_value = Page(
+            items=[
+                AppointmentSummary(
+                    id="appt-1",
+                    start_time=booked,
+                    end_time=booked + timedelta(minutes=30),
+                    status=AppointmentStatus.CONFIRMED,
+                )
+            ]
+        )
+
+        with pytest.raises(BusinessRuleViolationError, match="1 occurrences conflict"):
+            await _execute(use_case, "FREQ=WEEKLY;COUNT=10")
+        series_repository.create.assert_not_awaited()
+
+    async def test_ignores_cancelled_bookings(
+        self, use_case: CreateRecurringSeriesUseCase, appointments: AsyncMock
+    ) -> None:
+        """Test that only active bookings conflict."""
+        appointments.list_summaries.return_value = Page(
+            items=[
+                AppointmentSummary(
+                    id="appt-1",
+                    start_time=FIRST_START,
+                    end_time=FIRST_START + timedelta(minutes=30),
+                    status=AppointmentStatus.CANCELLED,
+                )
+            ]
+        )
+
+        await _execute(use_case, "FREQ=WEEKLY;COUNT=10")
+
+    async def test_invalid_rule(self, use_case: CreateRecurringSeriesUseCase) -> None:
+        """Test that invalid rules are rejected before any query."""
+        with pytest.raises(ValidationError):
+            await _execute(use_case, "FREQ=FORTNIGHTLY")
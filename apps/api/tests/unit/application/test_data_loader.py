@@ -0,0 +1,82 @@
+"""Unit tests for the batching DataLoader."""
+
+import asyncio
+
+import pytest
+
+from adyela_api.application import DataLoader
+
+
+class RecordingSource:
+    """Batch function that records the keys of every call."""
+
+    def __init__(self, values: dict[str, str], fail: bool = False) -> None:
+        self.values = values
+        self.fail = fail
+        self.calls: list[list[str]] = []
+
+    async def __call__(self, keys: list[str]) -> dict[str, str]:
+        self.calls.append(keys)
+        if self.fail:
+            raise RuntimeError("backend unavailable")
+        return {key: self.values[key] for key in keys if key in self.values}
+
+
+class TestDataLoader:
+    """Test DataLoader batching and memoization."""
+
+    async def test_batches_loads_in_same_tick(self) -> None:
+        """Test that concurrent loads are deduplicated into one call."""
+        source = RecordingSource({"a": "A", "b": "B"})
+        loader = DataLoader(source)
+
+        results = await asyncio.gather(
+            loader.load("a"), loader.load("b"), loader.load("a"), loader.load("missing")
+        )
+
+        assert results == ["A", "B", "A", None]
+        assert source.calls == [["a", "b", "missing"]]
+
+    async def test_memoizes_results(self) -> None:
+        """Test that later loads in the same request are served from the memo."""
+        source = RecordingSource({"a": "A", "b": "B"})
+        loader = DataLoader(source)
+
+        assert await loader.load_many(["a", "b"]) == ["A", "B"]
+        assert await loader.load("a") == "A"
+        assert await loader.load_many(["b", "a"]) == ["B", "A"]
+
+        assert source.calls == [["a", "b"]]
+
+    async def test_max_batch_size(self) -> None:
+        """Test that large batches are split."""
+        source = RecordingSource({str(i): str(i) for i in range(5)})
+        loader = DataLoader(source, max_batch_size=2)
+
+        await loader.load_many([str(i) for i in range(5)])
+
+        assert source.calls == [["0", "1"], ["2", "3"], ["4"]]
+
+    async def test_failures_are_not_memoized(self) -> None:
+        """Test that a failed batch propagates and can be retried."""
+        source = RecordingSource({"a": "A"}, fail=True)
+        loader = DataLoader(source)
+
+        with pytest.raises(RuntimeError):
+            await loader.load("a")
+
+        source.fail = False
+        assert await loader.load("a") == "A"
+        assert len(source.calls) == 2
+
+    async def test_prime_and_clear(self) -> None:
+        """Test seeding and invalidating memoized values."""
+        source = RecordingSource({"a": "fresh"})
+        loader = DataLoader(source)
+
+        loader.prime("a", "primed")
+        assert await loader.load("a") == "primed"
+
+        loader.clear("a")
+        assert await loader.load("a") == "fresh"
+        assert source.calls == [["a"]]
@@ -0,0 +1,153 @@
+"""Unit tests for GetAvailableSlotsUseCase."""
+
+from datetime import UTC, date, datetime, time, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from adyela_api.application.ports import (
+    AppointmentRepository,
+    Page,
+    PractitionerRepository,
+    RecurringSeriesRepository,
+)
+from adyela_api.application.use_cases.appointments import GetAvailableSlotsUseCase
+from adyela_api.config import AppointmentStatus, AppointmentType, UserRole
+from adyela_api.domain import AppointmentSummary, EntityNotFoundError, Practitioner, RecurringSeries
+from adyela_api.domain.value_objects import Email, PhoneNumber, TenantId, WorkingHours
+
+# A Monday, far enough ahead that no slot is in the past
+MONDAY = date(2030, 1, 7)
+
+
+def _practitioner(**overrides: object) -> Practitioner:
+    return Practitioner(
+        **{
+            "id": "doc-123",
+            "tenant_id": TenantId("tenant-123"),
+            "first_name": "Ana",
+            "last_name": "Diaz",
+            "email": Email("ana@example.com"),
+            "phone": PhoneNumber("+15551234567"),
+            "role": UserRole.DOCTOR,
+            **overrides,
+        }
+    )
+
+
+def _summary(hour: int, status: AppointmentStatus, day: date = MONDAY) -> AppointmentSummary:
+    start = datetime.combine(day, time(hour), UTC)
+    return AppointmentSummary(
+        id=f"appt-{day}-{hour}",
+        start_time=start,
+        end_time=start + timedelta(hours=1),
+        status=status,
+    )
+
+
+@pytest.fixture
+def practitioners() -> AsyncMock:
+    """Create a practitioner repository holding one practitioner."""
+    repository = AsyncMock(spec=PractitionerRepository)
+    repository.get_by_id.return_value = _practitioner()
+    return repository
+
+
+@pytest.fixture
+def appointments() -> AsyncMock:
+    """Create an appointment repository with no bookings."""
+    repository = AsyncMock(spec=AppointmentRepository)
+    repository.list_summaries.return_value = Page()
+    return repository
+
+
+class TestGetAvailableSlotsUseCase:
+    """Test GetAvailableSlotsUseCase."""
+
+    async def test_default_working_hours(
+        self, appointments: AsyncMock, practitioners: AsyncMock
+    ) -> None:
+        """Test that practitioners without hours are open 09:00-17:00 on weekdays."""
+        use_case = GetAvailableSlotsUseCase(appointments, practitioners)
+
+        slots = await use_case.execute("tenant-123", "doc-123", MONDAY, 7, 60, step_minutes=60)
+
+        assert [len(day_slots) for day_slots in slots.values()] == [8, 8, 8, 8, 8, 0, 0]
+        assert slots[MONDAY][0].start == datetime.combine(MONDAY, time(9), UTC)
+
+    async def test_active_bookings_across_pages(
+        self, appointments: AsyncMock, practitioners: AsyncMock
+    ) -> None:
+        """Test that every page of bookings is read and only active ones block slots."""
+        practitioners.get_by_id.return_value = _practitioner(
+            working_hours=WorkingHours(((0, time(9), time(13)),))
+        )
+        appointments.list_summaries.side_effect = [
+            Page(items=[_summary(9, AppointmentStatus.CONFIRMED)], next_page_token="t2"),
+            Page(
+                items=[
+                    _summary(10, AppointmentStatus.CANCELLED),
+                    _summary(11, AppointmentStatus.SCHEDULED),
+                    # Ends before the window, so it cannot block anything
+                    _summary(23, AppointmentStatus.SCHEDULED, MONDAY - timedelta(days=1)),
+                ]
+            ),
+        ]
+        use_case = GetAvailableSlotsUseCase(appointments, practitioners)
+
+        slots = await use_case.execute("tenant-123", "doc-123", MONDAY, 1, 60, step_minutes=60)
+
+        assert [slot.start.hour for slot in slots[MONDAY]] == [10, 12]
+        assert appointments.list_summaries.await_count == 2
+        first_call = appointments.list_summaries.await_args_list[0]
+        assert first_call.kwargs["filters"] == {"practitioner_id": "doc-123"}
+        assert first_call.kwargs["start_date"] == "2030-01-06T20:00:00+00:00"
+        assert appointments.list_summaries.await_args_list[1].kwargs["page_token"] == "t2"
+
+    async def test_recurring_series_block_their_occurrences(
+        self, appointments: AsyncMock, practitioners: AsyncMock
+    ) -> None:
+        """Test that series are expanded for the window, without their cancelled occurrences."""
+        series = RecurringSeries(
+            id="series-1",
+            tenant_id=TenantId("tenant-123"),
+            patient_id="patient-1",
+            practitioner_id="doc-123",
+            recurrence="FREQ=DAILY",
+            first_start=datetime.combine(MONDAY - timedelta(weeks=4), time(9), UTC),
+            duration_minutes=60,
+            appointment_type=AppointmentType.IN_PERSON,
+        )
+        series.cancel_occurrence(datetime.combine(MONDAY + timedelta(days=1), time(9), UTC))
+        repository = AsyncMock(spec=RecurringSeriesRepository)
+        repository.list_by_practitioner.return_value = Page(items=[series])
+        use_case = GetAvailableSlotsUseCase(
+            appointments, practitioners, series_repository=repository
+        )
+
+        slots = await use_case.execute("tenant-123", "doc-123", MONDAY, 2, 60, step_minutes=60)
+
+        assert slots[MONDAY][0].start == datetime.combine(MONDAY, time(10), UTC)
+        assert slots[MONDAY + timedelta(days=1)][0].start == datetime.combine(
+            MONDAY + timedelta(days=1), time(9), UTC
+        )
+        repository.list_by_practitioner.assert_awaited_once_with(
+            "tenant-123", "doc-123", limit=100, page_token=None
+        )
+
+    @pytest.mark.parametrize(
+        "practitioner",
+        [None, _practitioner(is_active=False), _practitioner(tenant_id=TenantId("other"))],
+    )
+    async def test_unknown_practitioner(
+        self,
+        appointments: AsyncMock,
+        practitioners: AsyncMock,
+        practitioner: Practitioner | None,
+    ) -> None:
+        """Test that missing, inactive and other tenants' practitioners are not found."""
+        practitioners.get_by_id.return_value = practitioner
+        use_case = GetAvailableSlotsUseCase(appointments, practitioners)
+
+        with pytest.raises(EntityNotFoundError):
+            await use_case.execute("tenant-123", "doc-123", MONDAY, 7, 30)
@@ -1,11 +1,18 @@
 """Unit tests for Appointment entity."""
 
+import copy
+import pickle
 from datetime import UTC, datetime, timedelta
 
 import pytest
 
 from adyela_api.config import AppointmentStatus, AppointmentType
-from adyela_api.domain import Appointment, BusinessRuleViolationError
+from adyela_api.domain import (
+    Appointment,
+    AppointmentSummary,
+    BusinessRuleViolationError,
+    status_deltas,
+)
 from adyela_api.domain.value_objects import DateTimeRange, TenantId
 
 
@@ -81,3 +88,82 @@ class TestAppointment:
 
         with pytest.raises(BusinessRuleViolationError):
             appointment.set_video_room("https://meet.jit.si/test")
+
+
+class TestAppointmentEvents:
+    """Test status-change events raised by Appointment transitions."""
+
+    def test_transitions_record_events(self, appointment: Appointment) -> None:
+        """Test that each transition records one event and pulling clears them."""
+        appointment.confirm()
+        appointment.cancel()
+
+        events = appointment.pull_events()
+
+        assert [(e.previous_status, e.new_status) for e in events] == [
+            (AppointmentStatus.SCHEDULED, AppointmentStatus.CONFIRMED),
+            (AppointmentStatus.CONFIRMED, AppointmentStatus.CANCELLED),
+        ]
+        assert all(e.appointment_id == "appt-123" for e in events)
+        assert appointment.pull_events() == []
+
+    def test_rejected_transition_records_nothing(self, appointment: Appointment) -> None:
+        """Test that invalid transitions raise no event."""
+        with pytest.raises(BusinessRuleViolationError):
+            appointment.complete()
+
+        assert appointment.pull_events() == []
+
+    def test_status_deltas_net_out(self, appointment: Appointment) -> None:
+        """Test that intermediate statuses cancel out."""
+        appointment.confirm()
+        appointment.mark_no_show()
+
+        deltas = status_deltas(appointment.pull_events())
+
+        assert deltas[("tenant-123", AppointmentStatus.SCHEDULED)] == -1
+        assert deltas[("tenant-123", AppointmentStatus.CONFIRMED)] == 0
+        assert deltas[("tenant-123", AppointmentStatus.NO_SHOW)] == 1
+
+
+class TestSlots:
+    """Test that entities and value objects are slotted without behavior changes."""
+
+    def test_no_instance_dict(self, appointment: Appointment) -> None:
+        """Test that fields live in slots and unknown attributes are rejected."""
+        assert not hasattr(appointment, "__dict__")
+        assert not hasattr(appointment.schedule, "__dict__")
+        with pytest.raises(AttributeError):
+            appointment.unknown = 1  # type: ignore[attr-defined]
+
+    def test_events_and_copies(self, appointment: Appointment) -> None:
+        """Test that pending events, copies and pickles still work."""
+        appointment.confirm()
+
+        restored = pickle.loads(pickle.dumps(appointment))
+        duplicate = copy.deepcopy(appointment)
+
+        assert restored == appointment == duplicate
+        assert [event.new_status for event in restored.pull_events()] == [
+            AppointmentStatus.CONFIRMED
+        ]
+        assert appointment.pull_events() and not appointment.events
+
+
+class TestAppointmentSummary:
+    """Test AppointmentSummary projection."""
+
+    def test_from_projected_dict(self, appointment: Appointment) -> None:
+        """Test that only projected fields are populated."""
+        data = appointment.to_dict()
+        projected = {key: data[key] for key in ["id", *AppointmentSummary.DEFAULT_FIELDS]}
+
+        summary = AppointmentSummary.from_dict(projected)
+
+        assert summary.id == appointment.id
+        assert summary.start_time == appointment.schedule.start
+        assert summary.end_time == appointment.schedule.end
+        assert summary.status == AppointmentStatus.SCHEDULED
+        assert summary.practitioner_id == "doc-123"
+        assert summary.patient_id is None
+        assert summary.appointment_type is None
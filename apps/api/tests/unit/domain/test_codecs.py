@@ -0,0 +1,195 @@
+"""Unit tests for the generated entity codecs."""
+
+from datetime import UTC, date, datetime, time, timedelta
+from typing import Any
+
+import pytest
+
+from adyela_api.config import AppointmentStatus, AppointmentType, UserRole
+from adyela_api.domain import (
+    APPOINTMENT_CODEC,
+    PATIENT_CODEC,
+    PRACTITIONER_CODEC,
+    RECURRING_SERIES_CODEC,
+    TENANT_CODEC,
+    Appointment,
+    BusinessRuleViolationError,
+    EntityCodec,
+    Patient,
+    Practitioner,
+    RecurringSeries,
+    Tenant,
+)
+from adyela_api.domain.value_objects import (
+    Address,
+    DateTimeRange,
+    Email,
+    PhoneNumber,
+    SeriesExceptions,
+    TenantId,
+    WorkingHours,
+)
+
+START = datetime.now(UTC).replace(microsecond=0) + timedelta(days=1)
+
+
+def _entities() -> list[tuple[EntityCodec[Any], Any]]:
+    return [
+        (
+            APPOINTMENT_CODEC,
+            Appointment(
+                id="appt-1",
+                tenant_id=TenantId("tenant-1"),
+                patient_id="patient-1",
+                practitioner_id="doc-1",
+                schedule=DateTimeRange(start=START, end=START + timedelta(minutes=30)),
+                appointment_type=AppointmentType.VIDEO_CALL,
+                status=AppointmentStatus.CONFIRMED,
+                reason="Checkup",
+                metadata={"source": "web"},
+            ),
+        ),
+        (
+            PATIENT_CODEC,
+            Patient(
+                id="patient-1",
+                tenant_id=TenantId("tenant-1"),
+                first_name="Ana",
+                last_name="Diaz",
+                email=Email("ana@example.com"),
+                phone=PhoneNumber("+15551234567"),
+                date_of_birth=date(1990, 5, 1),
+                medical_record_number="MRN-1",
+            ),
+        ),
+        (
+            PRACTITIONER_CODEC,
+            Practitioner(
+                id="doc-1",
+                tenant_id=TenantId("tenant-1"),
+                first_name="Eva",
+                last_name="Ruiz",
+                email=Email("eva@example.com"),
+                phone=PhoneNumber("+15551234567"),
+                role=UserRole.DOCTOR,
+                specialty="cardiology",
+                working_hours=WorkingHours(((0, time(8), time(12)), (2, time(13, 30), time(18)))),
+            ),
+        ),
+        (
+            TENANT_CODEC,
+            Tenant(
+                id="tenant-1",
+                name="Clinic",
+                email=Email("clinic@example.com"),
+                phone=PhoneNumber("+15551234567"),
+                address=Address("Main St 1", "Springfield", "IL", "62701", "US"),
+                is_active=False,
+            ),
+        ),
+        (
+            RECURRING_SERIES_CODEC,
+            RecurringSeries(
+                id="series-1",
+                tenant_id=TenantId("tenant-1"),
+                patient_id="patient-1",
+                practitioner_id="doc-1",
+                recurrence="FREQ=WEEKLY;BYDAY=MO,TH;COUNT=12",
+                first_start=START,
+                duration_minutes=45,
+                appointment_type=AppointmentType.IN_PERSON,
+                exceptions=SeriesExceptions(
+                    cancelled=frozenset({START}),
+                    moved=(
+                        (
+                            START + timedelta(weeks=1),
+                            DateTimeRange(start=START, end=START + timedelta(hours=1)),
+                        ),
+                    ),
+                ),
+            ),
+        ),
+    ]
+
+
+@pytest.mark.parametrize(("codec", "entity"), _entities())
+class TestEntityCodecs:
+    """Test that codecs match ``to_dict``/``from_dict``."""
+
+    def test_round_trip(self, codec: EntityCodec[Any], entity: Any) -> None:
+        """Test that encoding and decoding match the reference methods."""
+        data = codec.encode(entity)
+
+        assert data == entity.to_dict()
+        assert list(data) == list(entity.to_dict())
+        assert codec.decode(data) == type(entity).from_dict(data) == entity
+        assert codec.encode_many([entity, entity]) == [data, data]
+        assert codec.decode_many([data, data]) == [entity, entity]
+        assert codec.hydrate(data) == entity
+        assert codec.hydrate_many([data, data]) == [entity, entity]
+
+    def test_optional_fields(self, codec: EntityCodec[Any], entity: Any) -> None:
+        """Test that missing optional fields get the reference defaults."""
+        data = codec.encode(entity)
+        for name in codec.optional:
+            del data[name]
+
+        decoded = codec.decode(data)
+
+        assert decoded == type(entity).from_dict(data) == codec.hydrate(data)
+        assert codec.decode(data) is not decoded
+        for name, default in codec.optional.items():
+            if isinstance(default, dict):
+                assert getattr(decoded, name) is not getattr(codec.decode(data), name)
+
+
+class TestCodecValidation:
+    """Test that decoding still validates."""
+
+    def test_invalid_values_raise(self) -> None:
+        """Test that unknown enum values and invalid value objects are rejected."""
+        _, appointment = _entities()[0]
+        data = APPOINTMENT_CODEC.encode(appointment)
+
+        with pytest.raises(ValueError):
+            APPOINTMENT_CODEC.decode({**data, "status": "unknown"})
+        with pytest.raises(ValueError):
+            APPOINTMENT_CODEC.decode({**data, "tenant_id": " "})
+        with pytest.raises(KeyError):
+            APPOINTMENT_CODEC.decode({key: value for key, value in data.items() if key != "id"})
+
+
+class TestTrustedHydration:
+    """Test that hydration skips construction-time validation."""
+
+    def test_past_appointment_hydrates(self) -> None:
+        """Test that stored history loads although new past appointments are rejected."""
+        _, appointment = _entities()[0]
+        past = START - timedelta(days=30)
+        data = {
+            **APPOINTMENT_CODEC.encode(appointment),
+            "start_time": past.isoformat(),
+            "end_time": (past + timedelta(minutes=30)).isoformat(),
+        }
+
+        with pytest.raises(BusinessRuleViolationError):
+            APPOINTMENT_CODEC.decode(data)
+        (hydrated,) = APPOINTMENT_CODEC.hydrate_many([data])
+
+        assert hydrated.schedule == DateTimeRange(start=past, end=past + timedelta(minutes=30))
+        assert hydrated.status is AppointmentStatus.CONFIRMED
+        assert hydrated.events == []
+        assert hydrated.events is not APPOINTMENT_CODEC.hydrate(data).events
+
+    def test_value_objects_are_not_revalidated(self) -> None:
+        """Test that stored value objects are trusted as they are."""
+        _, patient = _entities()[1]
+        data = {**PATIENT_CODEC.encode(patient), "email": "legacy-address"}
+
+        with pytest.raises(ValueError):
+            PATIENT_CODEC.decode(data)
+        hydrated = PATIENT_CODEC.hydrate(data)
+
+        assert type(hydrated.email) is Email
+        assert str(hydrated.email) == "legacy-address"
+        assert PATIENT_CODEC.encode(hydrated) == data
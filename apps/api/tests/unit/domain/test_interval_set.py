@@ -0,0 +1,118 @@
+"""Unit and property tests for IntervalSet."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from adyela_api.domain import IntervalSet
+from adyela_api.domain.value_objects import DateTimeRange
+
+BASE = datetime(2030, 1, 7, tzinfo=UTC)
+
+
+def _at(minute: int) -> datetime:
+    return BASE + timedelta(minutes=minute)
+
+
+def _range(start: int, end: int) -> DateTimeRange:
+    return DateTimeRange(start=_at(start), end=_at(end))
+
+
+def _minutes(items: IntervalSet | list[DateTimeRange]) -> set[int]:
+    """Minutes covered by ranges, the reference model for set operations."""
+    return {
+        minute
+        for item in items
+        for minute in range(
+            int((item.start - BASE).total_seconds() // 60),
+            int((item.end - BASE).total_seconds() // 60),
+        )
+    }
+
+
+@st.composite
+def ranges(draw: st.DrawFn) -> list[DateTimeRange]:
+    """Lists of possibly overlapping or touching ranges on a small minute grid."""
+    pairs = draw(
+        st.lists(
+            st.tuples(st.integers(0, 120), st.integers(1, 30)),
+            max_size=12,
+        )
+    )
+    return [_range(start, start + length) for start, length in pairs]
+
+
+class TestIntervalSet:
+    """Test IntervalSet."""
+
+    def test_of_merges_overlapping_and_touching_ranges(self) -> None:
+        """Test that building normalizes to sorted, disjoint, non-touching intervals."""
+        intervals = IntervalSet.of([_range(30, 40), _range(0, 10), _range(10, 20), _range(35, 50)])
+
+        assert list(intervals) == [_range(0, 20), _range(30, 50)]
+        assert intervals.duration_minutes == 40
+
+    def test_half_open_membership(self) -> None:
+        """Test that starts are inside and ends are outside."""
+        intervals = IntervalSet.of([_range(0, 10), _range(20, 30)])
+
+        assert _at(0) in intervals
+        assert _at(10) not in intervals
+        assert _range(20, 30) in intervals
+        assert _range(5, 25) not in intervals
+        assert IntervalSet.of([_range(1, 5), _range(22, 30)]) in intervals
+        assert "10:00" not in intervals
+
+    def test_gaps(self) -> None:
+        """Test gaps between intervals and within a range."""
+        intervals = IntervalSet.of([_range(10, 20), _range(30, 40)])
+
+        assert list(intervals.gaps()) == [_range(20, 30)]
+        assert list(intervals.gaps(_range(0, 35))) == [_range(0, 10), _range(20, 30)]
+        assert list(IntervalSet().gaps(_range(0, 5))) == [_range(0, 5)]
+
+    def test_invalid_bounds(self) -> None:
+        """Test that unsorted or odd boundaries are rejected."""
+        with pytest.raises(ValueError):
+            IntervalSet((_at(0),))
+        with pytest.raises(ValueError):
+            IntervalSet((_at(10), _at(0)))
+
+
+class TestIntervalSetProperties:
+    """Test IntervalSet operations against sets of covered minutes."""
+
+    @given(ranges())
+    def test_of_covers_exactly_the_ranges(self, items: list[DateTimeRange]) -> None:
+        """Test that building from ranges covers their minutes with normalized bounds."""
+        intervals = IntervalSet.of(items)
+
+        assert _minutes(intervals) == _minutes(items)
+        assert intervals == IntervalSet.of(reversed(items))
+        assert all(item in intervals for item in items)
+
+    @given(ranges(), ranges())
+    def test_set_operations(self, first: list[DateTimeRange], second: list[DateTimeRange]) -> None:
+        """Test union, intersection and difference."""
+        left, right = IntervalSet.of(first), IntervalSet.of(second)
+
+        assert _minutes(left | right) == _minutes(first) | _minutes(second)
+        assert _minutes(left & right) == _minutes(first) & _minutes(second)
+        assert _minutes(left - right) == _minutes(first) - _minutes(second)
+        assert left | right == IntervalSet.of(first + second)
+        assert (left & right) in left
+        assert ((left - right) & right) == IntervalSet()
+
+    @given(ranges(), st.integers(0, 150), st.integers(1, 40))
+    def test_overlaps_and_gaps(self, items: list[DateTimeRange], start: int, length: int) -> None:
+        """Test overlap checks and gaps within a window."""
+        intervals = IntervalSet.of(items)
+        window = _range(start, start + length)
+        window_minutes = set(range(start, start + length))
+
+        assert intervals.overlaps(window) == bool(_minutes(items) & window_minutes)
+        assert intervals.overlaps(window) == any(item.overlaps_with(window) for item in items)
+        assert _minutes(intervals.gaps(window)) == window_minutes - _minutes(items)
+        assert (window in intervals) == (window_minutes <= _minutes(items))
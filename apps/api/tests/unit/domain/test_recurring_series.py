@@ -0,0 +1,200 @@
+"""Unit tests for RecurringSeries."""
+
+from datetime import UTC, date, datetime, time, timedelta
+
+import pytest
+from dateutil.rrule import rrulestr
+
+from adyela_api.config import AppointmentType
+from adyela_api.domain import BusinessRuleViolationError, RecurringSeries, ValidationError
+from adyela_api.domain.value_objects import DateTimeRange, SeriesExceptions, TenantId
+
+# A Monday
+MONDAY = date(2030, 1, 7)
+
+
+def _at(day: date, hour: int = 0) -> datetime:
+    return datetime.combine(day, time(hour), UTC)
+
+
+def _week(weeks: int) -> DateTimeRange:
+    start = _at(MONDAY + timedelta(weeks=weeks))
+    return DateTimeRange(start=start, end=start + timedelta(weeks=1))
+
+
+def _series(recurrence: str = "FREQ=WEEKLY;BYDAY=MO,TH", **overrides: object) -> RecurringSeries:
+    return RecurringSeries(
+        **{
+            "id": "series-1",
+            "tenant_id": TenantId("tenant-1"),
+            "patient_id": "patient-1",
+            "practitioner_id": "doc-1",
+            "recurrence": recurrence,
+            "first_start": _at(MONDAY, 9),
+            "duration_minutes": 45,
+            "appointment_type": AppointmentType.IN_PERSON,
+            **overrides,
+        }
+    )
+
+
+class TestOccurrences:
+    """Test lazy expansion of a series for a window."""
+
+    def test_expands_only_the_window(self) -> None:
+        """Test that a week of an unbounded series yields that week's occurrences."""
+        occurrences = _series().occurrences(_week(10))
+
+        monday = MONDAY + timedelta(weeks=10)
+        assert [occurrence.schedule for occurrence in occurrences] == [
+            DateTimeRange(start=_at(monday, 9), end=_at(monday, 9) + timedelta(minutes=45)),
+            DateTimeRange(
+                start=_at(monday + timedelta(days=3), 9),
+                end=_at(monday + timedelta(days=3), 9) + timedelta(minutes=45),
+            ),
+        ]
+        assert all(occurrence.series_id == "series-1" for occurrence in occurrences)
+
+    def test_occurrence_overlapping_the_window_start(self) -> None:
+        """Test that an occurrence that started before the window but ends in it is included."""
+        window = DateTimeRange(start=_at(MONDAY, 9) + timedelta(minutes=30), end=_at(MONDAY, 12))
+
+        assert [occurrence.original_start for occurrence in _series().occurrences(window)] == [
+            _at(MONDAY, 9)
+        ]
+        assert (
+            _series().occurrences(
+                DateTimeRange(start=_at(MONDAY, 9) + timedelta(minutes=45), end=_at(MONDAY, 12))
+            )
+            == []
+        )
+
+    def test_bounded_series(self) -> None:
+        """Test that COUNT and UNTIL end the series."""
+        counted = _series("FREQ=DAILY;COUNT=3")
+        until = _series("FREQ=DAILY;UNTIL=20300109T090000Z")
+
+        assert len(counted.occurrences(_week(0))) == 3
+        assert len(until.occurrences(_week(0))) == 3
+        assert counted.occurrences(_week(1)) == []
+
+    def test_far_window_of_unbounded_series(self) -> None:
+        """Test that a window decades ahead is expanded without materializing the series."""
+        occurrences = _series("FREQ=DAILY").occurrences(_week(52 * 30))
+
+        assert len(occurrences) == 7
+
+    @pytest.mark.parametrize(
+        "recurrence",
+        [
+            "FREQ=WEEKLY;BYDAY=MO,TH",
+            "FREQ=WEEKLY;INTERVAL=3;BYDAY=TU,FR",
+            "FREQ=WEEKLY;COUNT=20",
+            "FREQ=DAILY;INTERVAL=2;UNTIL=20300601T090000Z",
+            "FREQ=DAILY;INTERVAL=5;COUNT=30",
+            "RRULE:freq=weekly;interval=2;byday=we",
+            "FREQ=MONTHLY;BYDAY=1WE",
+        ],
+    )
+    def test_fast_forward_matches_the_rule(self, recurrence: str) -> None:
+        """Test that skipping whole periods yields the same occurrences as walking the rule."""
+        series = _series(recurrence)
+        rule = rrulestr(recurrence, dtstart=series.first_start)
+
+        for weeks in range(0, 30, 4):
+            window = _week(weeks)
+            expected = rule.between(window.start - series.duration, window.end, inc=False)
+            assert [o.original_start for o in series.occurrences(window)] == expected
+
+    def test_cancelled_and_moved_occurrences(self) -> None:
+        """Test that cancelled occurrences disappear and moved ones follow their new slot."""
+        series = _series()
+        moved_to = DateTimeRange(
+            start=_at(MONDAY + timedelta(days=8), 15), end=_at(MONDAY + timedelta(days=8), 16)
+        )
+        series.cancel_occurrence(_at(MONDAY, 9))
+        series.reschedule_occurrence(_at(MONDAY + timedelta(days=3), 9), moved_to)
+
+        first_week = series.occurrences(_week(0))
+        second_week = series.occurrences(_week(1))
+
+        assert first_week == []
+        assert [occurrence.schedule.start for occurrence in second_week] == [
+            _at(MONDAY + timedelta(days=7), 9),
+            moved_to.start,
+            _at(MONDAY + timedelta(days=10), 9),
+        ]
+        assert [occurrence.is_moved for occurrence in second_week] == [False, True, False]
+
+    def test_cancelled_series_has_no_occurrences(self) -> None:
+        """Test that cancelling the series hides every occurrence."""
+        series = _series()
+        series.cancel()
+
+        assert series.occurrences(_week(0)) == []
+        with pytest.raises(BusinessRuleViolationError):
+            series.cancel()
+
+
+class TestExceptions:
+    """Test single-occurrence exceptions."""
+
+    def test_only_occurrences_can_be_changed(self) -> None:
+        """Test that starts off the rule and cancelled occurrences are rejected."""
+        series = _series()
+        series.cancel_occurrence(_at(MONDAY, 9))
+
+        with pytest.raises(BusinessRuleViolationError, match="not an occurrence"):
+            series.cancel_occurrence(_at(MONDAY, 10))
+        with pytest.raises(BusinessRuleViolationError, match="already cancelled"):
+            series.cancel_occurrence(_at(MONDAY, 9))
+        with pytest.raises(BusinessRuleViolationError, match="already cancelled"):
+            series.reschedule_occurrence(_at(MONDAY, 9), _week(1))
+
+    def test_cancel_replaces_move(self) -> None:
+        """Test that each occurrence keeps a single exception."""
+        start = _at(MONDAY, 9)
+        exceptions = SeriesExceptions().move(start, _week(1)).move(start, _week(2))
+
+        assert exceptions.moved == ((start, _week(2)),)
+        assert exceptions.cancel(start) == SeriesExceptions(cancelled=frozenset({start}))
+        assert start in exceptions
+        with pytest.raises(ValueError):
+            SeriesExceptions(cancelled=frozenset({start}), moved=((start, _week(1)),))
+
+    def test_round_trip(self) -> None:
+        """Test that exceptions survive serialization."""
+        series = _series()
+        series.cancel_occurrence(_at(MONDAY, 9))
+        series.reschedule_occurrence(_at(MONDAY + timedelta(days=3), 9), _week(3))
+
+        assert RecurringSeries.from_dict(series.to_dict()) == series
+
+
+class TestValidation:
+    """Test series validation."""
+
+    @pytest.mark.parametrize(
+        "recurrence",
+        [
+            "FREQ=SOMETIMES",
+            "not a rule",
+            "DTSTART:20300107T090000Z\nRRULE:FREQ=DAILY",
+            "RRULE:FREQ=DAILY\nEXDATE:20300108T090000Z",
+            # UNTIL must be in UTC when the first start is timezone-aware
+            "FREQ=DAILY;UNTIL=20300109T090000",
+        ],
+    )
+    def test_invalid_rules(self, recurrence: str) -> None:
+        """Test that unparseable rules and rule sets are rejected."""
+        with pytest.raises(ValidationError):
+            _series(recurrence)
+
+    def test_invalid_first_start_and_duration(self) -> None:
+        """Test naive and past first starts and durations outside the limits."""
+        with pytest.raises(ValidationError):
+            _series(first_start=datetime(2030, 1, 7, 9))
+        with pytest.raises(ValidationError):
+            _series(duration_minutes=5)
+        with pytest.raises(BusinessRuleViolationError):
+            _series(first_start=datetime.now(UTC) - timedelta(days=1))
@@ -0,0 +1,129 @@
+"""Unit tests for the bitset slot grid."""
+
+import random
+from datetime import UTC, date, datetime, time, timedelta
+
+import pytest
+
+from adyela_api.domain import SlotGrid, ValidationError, WorkingHours
+from adyela_api.domain.value_objects import DateTimeRange
+
+# A Monday
+MONDAY = date(2030, 1, 7)
+HOURS = WorkingHours.weekdays(time(9), time(17))
+
+
+def _at(day: date, hour: int, minute: int = 0) -> datetime:
+    return datetime.combine(day, time(hour, minute), UTC)
+
+
+def _starts(slots: dict[date, list[DateTimeRange]], day: date) -> list[str]:
+    return [slot.start.strftime("%H:%M") for slot in slots[day]]
+
+
+def _reference(
+    hours: WorkingHours,
+    bookings: list[DateTimeRange],
+    day: date,
+    duration: int,
+    step: int,
+) -> list[datetime]:
+    """Every step-aligned slot inside working hours that touches no booking's cells."""
+    starts = []
+    for minute in range(0, 24 * 60, step):
+        slot = DateTimeRange(
+            start=_at(day, 0) + timedelta(minutes=minute),
+            end=_at(day, 0) + timedelta(minutes=minute + duration),
+        )
+        inside = any(
+            _at(day, start.hour, start.minute) <= slot.start
+            and slot.end <= _at(day, end.hour, end.minute)
+            for start, end in hours.on(day.weekday())
+        )
+        # Bookings block whole 5-minute cells
+        blocked = any(
+            slot.overlaps_with(
+                DateTimeRange(
+                    start=booking.start - timedelta(minutes=booking.start.minute % 5),
+                    end=booking.end + timedelta(minutes=-booking.end.minute % 5),
+                )
+            )
+            for booking in bookings
+        )
+        if inside and not blocked:
+            starts.append(slot.start)
+    return starts
+
+
+class TestSlotGrid:
+    """Test SlotGrid."""
+
+    def test_week_without_bookings(self) -> None:
+        """Test that only working days have slots, back to back within hours."""
+        slots = SlotGrid().free_slots(HOURS, [], MONDAY, 7, 60, step_minutes=60)
+
+        assert list(slots) == [MONDAY + timedelta(days=offset) for offset in range(7)]
+        assert _starts(slots, MONDAY) == [f"{hour:02d}:00" for hour in range(9, 17)]
+        assert slots[MONDAY + timedelta(days=5)] == []
+        assert slots[MONDAY + timedelta(days=6)] == []
+
+    def test_bookings_block_touched_cells(self) -> None:
+        """Test that a booking ending off the grid blocks the rest of its last cell."""
+        bookings = [DateTimeRange(start=_at(MONDAY, 10), end=_at(MONDAY, 10, 32))]
+
+        slots = SlotGrid().free_slots(HOURS, bookings, MONDAY, 1, 30, step_minutes=5)
+
+        starts = _starts(slots, MONDAY)
+        assert "09:30" in starts
+        assert "09:35" not in starts
+        assert "10:30" not in starts
+        assert "10:35" in starts
+
+    def test_booking_across_midnight(self) -> None:
+        """Test that a multi-day booking blocks the end of one day and the start of the next."""
+        hours = WorkingHours(((0, time(20), time(23, 55)), (1, time(0), time(4))))
+        bookings = [DateTimeRange(start=_at(MONDAY, 22), end=_at(MONDAY + timedelta(days=1), 2))]
+
+        slots = SlotGrid().free_slots(hours, bookings, MONDAY, 2, 60, step_minutes=60)
+
+        assert _starts(slots, MONDAY) == ["20:00", "21:00"]
+        assert _starts(slots, MONDAY + timedelta(days=1)) == ["02:00", "03:00"]
+
+    def test_not_before(self) -> None:
+        """Test that slots in the past are not offered."""
+        slots = SlotGrid().free_slots(
+            HOURS, [], MONDAY, 2, 30, step_minutes=30, not_before=_at(MONDAY, 15, 10)
+        )
+
+        assert _starts(slots, MONDAY) == ["15:30", "16:00", "16:30"]
+        assert len(slots[MONDAY + timedelta(days=1)]) == 16
+        assert SlotGrid().free_slots(
+            HOURS, [], MONDAY, 1, 30, not_before=_at(MONDAY, 0) + timedelta(days=1)
+        ) == {MONDAY: []}
+
+    @pytest.mark.parametrize("duration", [15, 25, 30, 45, 90, 240])
+    def test_matches_reference(self, duration: int) -> None:
+        """Test random schedules against a slot-by-slot overlap check."""
+        rng = random.Random(duration)
+        hours = WorkingHours(((0, time(8, 30), time(12, 15)), (0, time(13), time(19, 40))))
+        bookings = []
+        for _ in range(8):
+            start = _at(MONDAY, 8) + timedelta(minutes=rng.randrange(0, 11 * 60))
+            bookings.append(
+                DateTimeRange(start=start, end=start + timedelta(minutes=rng.randrange(5, 90)))
+            )
+
+        slots = SlotGrid().free_slots(hours, bookings, MONDAY, 1, duration, step_minutes=5)
+
+        assert [slot.start for slot in slots[MONDAY]] == _reference(
+            hours, bookings, MONDAY, duration, 5
+        )
+
+    @pytest.mark.parametrize(
+        ("duration", "step"),
+        [(10, None), (245, None), (32, None), (30, 7)],
+    )
+    def test_invalid_durations(self, duration: int, step: int | None) -> None:
+        """Test that durations outside the limits or off the grid are rejected."""
+        with pytest.raises(ValidationError):
+            SlotGrid().free_slots(HOURS, [], MONDAY, 1, duration, step_minutes=step)
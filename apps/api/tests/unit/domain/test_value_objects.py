@@ -0,0 +1,68 @@
+"""Unit tests for value object interning."""
+
+import pytest
+
+from adyela_api.domain import TENANT_CODEC, Tenant
+from adyela_api.domain.value_objects import Address, Email, PhoneNumber, TenantId
+
+
+def _tenant() -> Tenant:
+    return Tenant(
+        id="tenant-1",
+        name="Clinic",
+        email=Email("clinic@example.com"),
+        phone=PhoneNumber("+15551234567"),
+        address=Address("Main St 1", "Springfield", "IL", "62701", "US"),
+    )
+
+
+@pytest.mark.parametrize(
+    ("value_type", "value", "invalid"),
+    [
+        (TenantId, "tenant-1", " "),
+        (Email, "ana@example.com", "ana@example"),
+        (PhoneNumber, "+15551234567", "555-1234"),
+    ],
+)
+class TestInterning:
+    """Test the ``of`` constructors."""
+
+    def test_repeated_values_share_an_instance(
+        self, value_type: type, value: str, invalid: str
+    ) -> None:
+        """Test that equal values are built once and still equal constructed ones."""
+        interned = value_type.of(value)
+
+        assert value_type.of(value) is interned
+        assert interned == value_type(value)
+        assert type(interned) is value_type
+
+    def test_invalid_values_raise_every_time(
+        self, value_type: type, value: str, invalid: str
+    ) -> None:
+        """Test that failed validation is not cached."""
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                value_type.of(invalid)
+
+
+class TestCodecInterning:
+    """Test that codecs share value objects across rows."""
+
+    def test_decoded_and_hydrated_rows_share_value_objects(self) -> None:
+        """Test that repeated emails and phone numbers are one instance per path."""
+        rows = [{**TENANT_CODEC.encode(_tenant()), "id": f"tenant-{index}"} for index in range(3)]
+
+        for tenants in (TENANT_CODEC.decode_many(rows), TENANT_CODEC.hydrate_many(rows)):
+            assert len({id(tenant.email) for tenant in tenants}) == 1
+            assert len({id(tenant.phone) for tenant in tenants}) == 1
+            assert tenants[0].email == Email("clinic@example.com")
+
+    def test_hydration_interning_skips_validation(self) -> None:
+        """Test that trusted interning still accepts stored legacy values."""
+        data = {**TENANT_CODEC.encode(_tenant()), "phone": "n/a"}
+
+        first, second = TENANT_CODEC.hydrate_many([data, data])
+
+        assert str(first.phone) == "n/a"
+        assert first.phone is second.phone
@@ -0,0 +1,226 @@
+"""In-process fake of the Firestore client shared by the infrastructure tests."""
+
+import itertools
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+from google.api_core.exceptions import Aborted, AlreadyExists  # type: ignore
+from google.cloud import firestore  # type: ignore
+
+from adyela_api.infrastructure.repositories.firestore_repository import DOCUMENT_ID
+
+
+def _merge(target: dict[str, Any], data: dict[str, Any]) -> None:
+    for key, value in data.items():
+        if value is firestore.DELETE_FIELD:
+            target.pop(key, None)
+        elif isinstance(value, dict):
+            _merge(target.setdefault(key, {}), value)
+        else:
+            target[key] = value
+
+
+class FakeSnapshot:
+    """Document snapshot over a stored dict."""
+
+    def __init__(self, doc_id: str, data: dict[str, Any] | None) -> None:
+        self.id = doc_id
+        self.exists = data is not None
+        self._data = data
+
+    def to_dict(self) -> dict[str, Any] | None:
+        return None if self._data is None else dict(self._data)
+
+    def get(self, field: str) -> Any:
+        return (self._data or {})[field]
+
+
+class FakeDocumentRef:
+    """Document reference within one collection path of the fake client."""
+
+    def __init__(self, db: "FakeClient", path: tuple[str, ...], doc_id: str) -> None:
+        self.id = doc_id
+        self.path = "/".join((*path, doc_id))
+        self.docs = db.collections.setdefault("/".join(path), {})
+
+    def write(self, data: dict[str, Any], merge: bool = False) -> None:
+        if merge:
+            _merge(self.docs.setdefault(self.id, {}), data)
+        else:
+            self.docs[self.id] = dict(data)
+
+    async def set(self, data: dict[str, Any], merge: bool = False) -> None:
+        self.write(data, merge)
+
+    async def create(self, data: dict[str, Any]) -> None:
+        if self.id in self.docs:
+            raise AlreadyExists(f"{self.path} already exists")
+        self.write(data)
+
+    async def update(self, data: dict[str, Any]) -> None:
+        self.write(data)
+
+    async def delete(self) -> None:
+        self.docs.pop(self.id, None)
+
+    async def get(self, transaction: Any = None) -> FakeSnapshot:
+        return FakeSnapshot(self.id, self.docs.get(self.id))
+
+
+class FakeTransaction:
+    """Transaction or batch applying its writes at commit, all or none.
+
+    The first ``aborts`` commits fail with ``Aborted``, as under contention.
+    """
+
+    _read_only = False
+
+    def __init__(self, max_attempts: int = 5, aborts: int = 0) -> None:
+        self._id = b"transaction"
+        self._max_attempts = max_attempts
+        self.aborts = aborts
+        self.writes: list[tuple[str, FakeDocumentRef, dict[str, Any], bool]] = []
+
+    def _clean_up(self) -> None:
+        self.writes = []
+
+    async def _begin(self, retry_id: bytes | None = None) -> None:
+        return None
+
+    async def _rollback(self) -> None:
+        self.writes = []
+
+    async def _commit(self) -> None:
+        if self.aborts:
+            self.aborts -= 1
+            raise Aborted("contention")
+        for kind, ref, _, _ in self.writes:
+            if kind == "create" and ref.id in ref.docs:
+                raise AlreadyExists(f"{ref.path} already exists")
+        for kind, ref, data, merge in self.writes:
+            if kind == "delete":
+                await ref.delete()
+            else:
+                ref.write(data, merge)
+
+    async def commit(self) -> None:
+        await self._commit()
+
+    def set(self, ref: FakeDocumentRef, data: dict[str, Any], merge: bool = False) -> None:
+        self.writes.append(("set", ref, data, merge))
+
+    def create(self, ref: FakeDocumentRef, data: dict[str, Any]) -> None:
+        self.writes.append(("create", ref, data, False))
+
+    def update(self, ref: FakeDocumentRef, data: dict[str, Any]) -> None:
+        self.writes.append(("update", ref, data, False))
+
+    def delete(self, ref: FakeDocumentRef) -> None:
+        self.writes.append(("delete", ref, {}, False))
+
+
+class FakeQuery:
+    """Collection reference and query: equality filters, ordering, cursors and limits."""
+
+    def __init__(
+        self,
+        db: "FakeClient",
+        path: tuple[str, ...],
+        filters: tuple[tuple[str, Any], ...] = (),
+        order: tuple[str, ...] = (),
+        after: dict[str, Any] | None = None,
+        limit: int | None = None,
+    ) -> None:
+        self.db = db
+        self.path = path
+        self.filters = filters
+        self.order = order
+        self.after = after
+        self._limit = limit
+
+    def _with(self, **changes: Any) -> "FakeQuery":
+        state = {
+            "filters": self.filters,
+            "order": self.order,
+            "after": self.after,
+            "limit": self._limit,
+        }
+        return FakeQuery(self.db, self.path, **{**state, **changes})
+
+    def document(self, doc_id: str | None = None) -> FakeDocumentRef:
+        return FakeDocumentRef(self.db, self.path, doc_id or f"doc-{next(self.db.ids)}")
+
+    def where(self, field: str, op: str, value: Any) -> "FakeQuery":
+        assert op == "=="
+        return self._with(filters=(*self.filters, (field, value)))
+
+    def order_by(self, field: str) -> "FakeQuery":
+        return self._with(order=(*self.order, field))
+
+    def start_after(self, cursor: dict[str, Any] | FakeSnapshot) -> "FakeQuery":
+        if isinstance(cursor, FakeSnapshot):
+            cursor = {**(cursor.to_dict() or {}), DOCUMENT_ID: cursor.id}
+        return self._with(after=cursor)
+
+    def limit(self, count: int) -> "FakeQuery":
+        return self._with(limit=count)
+
+    def select(self, fields: list[str]) -> "FakeQuery":
+        return self
+
+    async def stream(self) -> AsyncIterator[FakeSnapshot]:
+        def key(item: tuple[str, dict[str, Any]]) -> tuple[Any, ...]:
+            doc_id, data = item
+            return tuple(doc_id if field == DOCUMENT_ID else data[field] for field in self.order)
+
+        matches = sorted(
+            (
+                (doc_id, data)
+                for doc_id, data in self.db.collections.get("/".join(self.path), {}).items()
+                if all(data.get(field) == value for field, value in self.filters)
+            ),
+            key=key,
+        )
+        if self.after is not None:
+            cursor = tuple(self.after[field] for field in self.order)
+            matches = [match for match in matches if key(match) > cursor]
+        for doc_id, data in matches[: self._limit]:
+            yield FakeSnapshot(doc_id, data)
+
+
+class FakeClient:
+    """Minimal stand-in for one firestore.AsyncClient database.
+
+    Documents are kept in ``collections`` by collection path, e.g.
+    ``"tenants/t1/appointments"``. ``aborts`` makes the first commits of
+    each new transaction fail, and ``get_all_sizes`` records batched gets.
+    """
+
+    def __init__(self) -> None:
+        self.collections: dict[str, dict[str, dict[str, Any]]] = {}
+        self.ids = itertools.count()
+        self.aborts = 0
+        self.get_all_sizes: list[int] = []
+
+    def collection(self, *path: str) -> FakeQuery:
+        return FakeQuery(self, path)
+
+    def transaction(self, max_attempts: int = 5) -> FakeTransaction:
+        return FakeTransaction(max_attempts, self.aborts)
+
+    def batch(self) -> FakeTransaction:
+        return FakeTransaction()
+
+    async def get_all(
+        self, refs: list[FakeDocumentRef], transaction: Any = None
+    ) -> AsyncIterator[FakeSnapshot]:
+        self.get_all_sizes.append(len(refs))
+        for ref in refs:
+            yield await ref.get()
+
+
+@pytest.fixture
+def db() -> FakeClient:
+    """Create an empty fake client."""
+    return FakeClient()
@@ -0,0 +1,101 @@
+"""Unit tests for sharded appointment counters."""
+
+from typing import Any
+
+from adyela_api.config import AppointmentStatus
+from adyela_api.infrastructure.services.stats import FirestoreAppointmentStatsService
+
+
+class FakeDocument:
+    """Document reference and snapshot backed by a dict."""
+
+    def __init__(self, store: dict[str, dict[str, Any]], path: str) -> None:
+        self.store = store
+        self.path = path
+
+    def collection(self, name: str) -> "FakeCollection":
+        return FakeCollection(self.store, f"{self.path}/{name}")
+
+    async def set(self, updates: dict[str, Any], merge: bool = False) -> None:
+        data = self.store.setdefault(self.path, {})
+        for key, value in updates.items():
+            data[key] = data.get(key, 0) + value.value
+
+    def to_dict(self) -> dict[str, Any]:
+        return dict(self.store[self.path])
+
+
+class FakeCollection:
+    """Collection that lists the documents stored under its path."""
+
+    def __init__(self, store: dict[str, dict[str, Any]], path: str) -> None:
+        self.store = store
+        self.path = path
+
+    def document(self, doc_id: str) -> FakeDocument:
+        return FakeDocument(self.store, f"{self.path}/{doc_id}")
+
+    async def stream(self) -> Any:
+        for path in list(self.store):
+            if path.rsplit("/", 1)[0] == self.path:
+                yield FakeDocument(self.store, path)
+
+
+class FakeClient:
+    """Minimal stand-in for firestore.AsyncClient collections."""
+
+    def __init__(self) -> None:
+        self.store: dict[str, dict[str, Any]] = {}
+        self.reads = 0
+
+    def collection(self, name: str) -> FakeCollection:
+        self.reads += 1
+        return FakeCollection(self.store, name)
+
+
+class TestFirestoreAppointmentStatsService:
+    """Test sharded increments and cached sums."""
+
+    async def test_increments_spread_over_shards(self) -> None:
+        """Test that sums across shards equal the applied deltas."""
+        db = FakeClient()
+        service = FirestoreAppointmentStatsService(db, shard_count=4)  # type: ignore[arg-type]
+
+        for _ in range(40):
+            await service.increment("t1", {AppointmentStatus.SCHEDULED: 1})
+        await service.increment(
+            "t1", {AppointmentStatus.SCHEDULED: -3, AppointmentStatus.CONFIRMED: 3}
+        )
+        counts = await service.status_counts("t1")
+
+        assert 1 < len(db.store) <= 4
+        assert counts[AppointmentStatus.SCHEDULED] == 37
+        assert counts[AppointmentStatus.CONFIRMED] == 3
+        assert counts[AppointmentStatus.NO_SHOW] == 0
+        assert (await service.status_counts("t2"))[AppointmentStatus.SCHEDULED] == 0
+
+    async def test_sums_are_cached_until_local_write(self) -> None:
+        """Test that reads are cached and local increments drop the cache."""
+        now = [0.0]
+        db = FakeClient()
+        service = FirestoreAppointmentStatsService(
+            db, cache_ttl_seconds=10, clock=lambda: now[0]  # type: ignore[arg-type]
+        )
+        await service.increment("t1", {AppointmentStatus.CANCELLED: 1})
+
+        await service.status_counts("t1")
+        reads = db.reads
+        await service.status_counts("t1")
+        assert db.reads == reads
+
+        await service.increment("t1", {AppointmentStatus.CANCELLED: 1})
+        assert (await service.status_counts("t1"))[AppointmentStatus.CANCELLED] == 2
+
+    async def test_zero_deltas_are_skipped(self) -> None:
+        """Test that no document is written when nothing changed."""
+        db = FakeClient()
+        service = FirestoreAppointmentStatsService(db)  # type: ignore[arg-type]
+
+        await service.increment("t1", {AppointmentStatus.CONFIRMED: 0})
+
+        assert db.store == {}
@@ -0,0 +1,140 @@
+"""Unit tests for chunked Firestore batch writes."""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from adyela_api.infrastructure.repositories.batch_writer import (
+    BatchWriter,
+    WriteOp,
+    build_bulk_result,
+)
+
+
+class FakeDocumentRef:
+    """Document reference that records writes and fails for chosen IDs."""
+
+    def __init__(self, db: "FakeClient", doc_id: str) -> None:
+        self.db = db
+        self.id = doc_id
+
+    async def set(self, data: dict[str, Any]) -> None:
+        self.db.apply([(self, "set")])
+
+    async def update(self, data: dict[str, Any]) -> None:
+        self.db.apply([(self, "update")])
+
+    async def delete(self) -> None:
+        self.db.apply([(self, "delete")])
+
+
+class FakeBatch:
+    """Atomic batch that tracks concurrent commits."""
+
+    def __init__(self, db: "FakeClient") -> None:
+        self.db = db
+        self.writes: list[tuple[FakeDocumentRef, str]] = []
+
+    def set(self, ref: FakeDocumentRef, data: dict[str, Any]) -> None:
+        self.writes.append((ref, "set"))
+
+    def update(self, ref: FakeDocumentRef, data: dict[str, Any]) -> None:
+        self.writes.append((ref, "update"))
+
+    def delete(self, ref: FakeDocumentRef) -> None:
+        self.writes.append((ref, "delete"))
+
+    async def commit(self) -> None:
+        self.db.in_flight += 1
+        self.db.max_in_flight = max(self.db.max_in_flight, self.db.in_flight)
+        try:
+            await asyncio.sleep(0)
+            self.db.batch_sizes.append(len(self.writes))
+            self.db.apply(self.writes)
+        finally:
+            self.db.in_flight -= 1
+
+
+class FakeClient:
+    """Minimal stand-in for firestore.AsyncClient batch support."""
+
+    def __init__(self, missing: set[str] | None = None) -> None:
+        self.missing = missing or set()
+        self.written: dict[str, str] = {}
+        self.batch_sizes: list[int] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def batch(self) -> FakeBatch:
+        return FakeBatch(self)
+
+    def apply(self, writes: list[tuple[FakeDocumentRef, str]]) -> None:
+        for ref, kind in writes:
+            if kind == "update" and ref.id in self.missing:
+                raise RuntimeError(f"No document to update: {ref.id}")
+        for ref, kind in writes:
+            self.written[ref.id] = kind
+
+
+def _ops(db: FakeClient, count: int, kind: str = "set") -> list[WriteOp]:
+    return [WriteOp(i, FakeDocumentRef(db, f"doc-{i}"), kind, {"n": i}) for i in range(count)]
+
+
+class TestBatchWriter:
+    """Test BatchWriter."""
+
+    async def test_chunks_writes_into_batches(self) -> None:
+        """Test that writes are committed in batches of batch_size."""
+        db = FakeClient()
+        writer = BatchWriter(db, batch_size=100, max_concurrency=4)
+
+        failures = await writer.write(_ops(db, 250))
+
+        assert failures == {}
+        assert sorted(db.batch_sizes) == [50, 100, 100]
+        assert len(db.written) == 250
+
+    async def test_bounds_parallel_commits(self) -> None:
+        """Test that no more than max_concurrency commits run at once."""
+        db = FakeClient()
+        writer = BatchWriter(db, batch_size=10, max_concurrency=3)
+
+        await writer.write(_ops(db, 200))
+
+        assert db.max_in_flight == 3
+
+    async def test_isolates_failed_items(self) -> None:
+        """Test that a failing item does not fail the rest of its batch."""
+        db = FakeClient(missing={"doc-3", "doc-7"})
+        writer = BatchWriter(db, batch_size=5)
+
+        failures = await writer.write(_ops(db, 10, kind="update"))
+
+        assert set(failures) == {3, 7}
+        assert "doc-3" in str(failures[3])
+        assert set(db.written) == {f"doc-{i}" for i in range(10)} - {"doc-3", "doc-7"}
+
+    def test_rejects_oversized_batches(self) -> None:
+        """Test that batch size is bounded by the Firestore commit limit."""
+        with pytest.raises(ValueError):
+            BatchWriter(FakeClient(), batch_size=501)
+
+    def test_rejects_writes_without_data(self) -> None:
+        """Test that only deletes may omit the document data."""
+        ref = FakeDocumentRef(FakeClient(), "doc-1")
+
+        with pytest.raises(ValueError, match="update write needs data"):
+            WriteOp(0, ref, "update")
+        assert WriteOp(0, ref, "delete").data is None
+
+
+def test_build_bulk_result() -> None:
+    """Test that failures are reported per item with their index."""
+    result = build_bulk_result(
+        ["a", "b", "c"], {1: RuntimeError("boom")}, lambda entity_id: entity_id
+    )
+
+    assert result.succeeded == ["a", "c"]
+    assert [(f.index, f.entity_id, f.error) for f in result.failed] == [(1, "b", "boom")]
+    assert not result.ok
@@ -0,0 +1,152 @@
+"""Unit tests for schedule-document bookings."""
+
+from datetime import UTC, date, datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+
+from adyela_api.domain import Appointment, BusinessRuleViolationError, ConflictError
+from adyela_api.domain.value_objects import DateTimeRange
+from adyela_api.infrastructure.repositories import FirestoreAppointmentRepository
+from adyela_api.infrastructure.repositories.pagination import PageTokenCodec
+from adyela_api.infrastructure.services.booking import FirestoreBookingService
+from adyela_api.infrastructure.services.booking.firestore_booking_service import schedule_days
+from tests.conftest import APPOINTMENT_START, AppointmentFactory
+from tests.unit.infrastructure.conftest import FakeClient
+
+# Start overlapping the first slot of make_appointment
+OVERLAPPING = APPOINTMENT_START + timedelta(minutes=15)
+
+
+@pytest.fixture
+def booking(db: FakeClient) -> FirestoreBookingService:
+    """Create a booking service over the fake client."""
+    return FirestoreBookingService(db)
+
+
+@pytest.fixture
+def repository(db: FakeClient, booking: FirestoreBookingService) -> FirestoreAppointmentRepository:
+    """Create an appointment repository that keeps the schedule documents in sync."""
+    return FirestoreAppointmentRepository(
+        db, PageTokenCodec("test-secret"), booking_service=booking
+    )
+
+
+class TestScheduleDays:
+    """Test which schedule documents a booking touches."""
+
+    def test_single_day(self) -> None:
+        """Test that a same-day appointment touches one document."""
+        start = datetime(2030, 1, 7, 9, tzinfo=UTC)
+
+        assert schedule_days(start, start + timedelta(minutes=30)) == [date(2030, 1, 7)]
+
+    def test_ending_at_midnight(self) -> None:
+        """Test that an appointment ending exactly at midnight stays on its day."""
+        start = datetime(2030, 1, 7, 23, 30, tzinfo=UTC)
+
+        assert schedule_days(start, start + timedelta(minutes=30)) == [date(2030, 1, 7)]
+
+    def test_crossing_midnight(self) -> None:
+        """Test that an appointment crossing midnight touches both days."""
+        start = datetime(2030, 1, 7, 23, 30, tzinfo=UTC)
+
+        assert schedule_days(start, start + timedelta(hours=1)) == [
+            date(2030, 1, 7),
+            date(2030, 1, 8),
+        ]
+
+    def test_uses_utc_days(self) -> None:
+        """Test that local times are bucketed by their UTC day."""
+        start = datetime(2030, 1, 7, 20, tzinfo=timezone(timedelta(hours=-5)))
+
+        assert schedule_days(start, start + timedelta(minutes=30)) == [date(2030, 1, 8)]
+
+
+class TestFirestoreBookingService:
+    """Test bookings against the schedule documents."""
+
+    async def test_cancelled_slot_can_be_booked_again(
+        self,
+        db: FakeClient,
+        booking: FirestoreBookingService,
+        repository: FirestoreAppointmentRepository,
+        make_appointment: AppointmentFactory,
+    ) -> None:
+        """Test that cancelling an appointment frees its slot for a new booking."""
+        first = await booking.book(make_appointment())
+        with pytest.raises(BusinessRuleViolationError):
+            await booking.book(make_appointment(start=OVERLAPPING))
+
+        first.cancel()
+        await repository.update(first)
+        second = await booking.book(make_appointment(start=OVERLAPPING))
+
+        (schedule,) = db.collections["practitioner_schedules"].values()
+        assert set(schedule["bookings"]) == {second.id}
+
+    async def test_moves_and_deletes_release_their_slot(
+        self,
+        db: FakeClient,
+        booking: FirestoreBookingService,
+        repository: FirestoreAppointmentRepository,
+        make_appointment: AppointmentFactory,
+    ) -> None:
+        """Test that rescheduled and deleted appointments stop holding their old slots."""
+        moved = await booking.book(make_appointment())
+        deleted = await booking.book(make_appointment(2))
+
+        moved.schedule = DateTimeRange(
+            start=APPOINTMENT_START + timedelta(days=1),
+            end=APPOINTMENT_START + timedelta(days=1, minutes=30),
+        )
+        await repository.update(moved)
+        await repository.delete(deleted.id)
+
+        schedules = db.collections["practitioner_schedules"]
+        assert schedules["tenant-1_doc-1_2030-01-07"]["bookings"] == {}
+        assert set(schedules["tenant-1_doc-1_2030-01-08"]["bookings"]) == {moved.id}
+
+    async def test_repository_creates_are_recorded(
+        self,
+        booking: FirestoreBookingService,
+        repository: FirestoreAppointmentRepository,
+        make_appointment: AppointmentFactory,
+    ) -> None:
+        """Test that appointments created without booking still block their slot."""
+        await repository.create(make_appointment())
+
+        with pytest.raises(BusinessRuleViolationError):
+            await booking.book(make_appointment(start=OVERLAPPING))
+
+    async def test_exhausted_retries_are_conflicts(
+        self, db: FakeClient, booking: FirestoreBookingService, make_appointment: AppointmentFactory
+    ) -> None:
+        """Test that only contention on every attempt maps to a conflict."""
+        db.aborts = booking.max_attempts
+
+        with pytest.raises(ConflictError):
+            await booking.book(make_appointment())
+        assert booking.metrics.exhausted == 1
+
+    async def test_other_value_errors_propagate(
+        self,
+        db: FakeClient,
+        booking: FirestoreBookingService,
+        monkeypatch: pytest.MonkeyPatch,
+        make_appointment: AppointmentFactory,
+    ) -> None:
+        """Test that unrelated errors inside the transaction are not reported as conflicts."""
+
+        def invalid(appointment: Appointment) -> dict[str, Any]:
+            raise ValueError("invalid appointment")
+
+        monkeypatch.setattr(
+            "adyela_api.infrastructure.services.booking.firestore_booking_service"
+            ".APPOINTMENT_CODEC.encode",
+            invalid,
+        )
+
+        with pytest.raises(ValueError, match="invalid appointment"):
+            await booking.book(make_appointment())
+        assert booking.metrics.exhausted == 0
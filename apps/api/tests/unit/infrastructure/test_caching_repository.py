@@ -0,0 +1,203 @@
+"""Unit tests for the read-through caching repository."""
+
+import asyncio
+from collections.abc import Coroutine, Iterator
+from contextvars import Context
+from typing import Any, TypeVar
+from unittest.mock import AsyncMock
+
+import pytest
+
+from adyela_api.application import tenant_scope
+from adyela_api.application.ports import AppointmentRepository, BulkWriteResult, CacheService
+from adyela_api.domain.value_objects import TenantId
+from adyela_api.infrastructure.repositories import CachingAppointmentRepository
+from adyela_api.infrastructure.services.cache import InMemoryCacheService
+from tests.conftest import AppointmentFactory
+
+T = TypeVar("T")
+
+
+async def _outside_tenant(coroutine: Coroutine[Any, Any, T]) -> T:
+    return await asyncio.create_task(coroutine, context=Context())
+
+
+@pytest.fixture(autouse=True)
+def tenant() -> Iterator[None]:
+    """Serve every test on behalf of the appointments' tenant."""
+    with tenant_scope("tenant-1"):
+        yield
+
+
+@pytest.fixture
+def inner(make_appointment: AppointmentFactory) -> AsyncMock:
+    """Create the wrapped repository."""
+    repository = AsyncMock(spec=AppointmentRepository)
+    repository.get_by_id.side_effect = lambda entity_id: make_appointment(appointment_id=entity_id)
+    repository.get_many.side_effect = lambda ids: {
+        i: make_appointment(appointment_id=i) for i in ids
+    }
+    repository.update.side_effect = lambda appointment: appointment
+    repository.delete.return_value = True
+    return repository
+
+
+@pytest.fixture
+def cache() -> InMemoryCacheService:
+    """Create an empty cache."""
+    return InMemoryCacheService()
+
+
+@pytest.fixture
+def repository(inner: AsyncMock, cache: InMemoryCacheService) -> CachingAppointmentRepository:
+    """Create the caching repository under test."""
+    return CachingAppointmentRepository(inner, cache)
+
+
+class TestCachingRepository:
+    """Test CachingRepository read-through and invalidation."""
+
+    async def test_read_through(
+        self, repository: CachingAppointmentRepository, inner: AsyncMock
+    ) -> None:
+        """Test that repeated reads are served from cache."""
+        first = await repository.get_by_id("appt-1")
+        second = await repository.get_by_id("appt-1")
+
+        assert first is not None and second is not None
+        assert second.to_dict() == first.to_dict()
+        inner.get_by_id.assert_awaited_once_with("appt-1")
+        assert (repository.stats.hits, repository.stats.misses) == (1, 1)
+
+    async def test_uses_configured_key_and_ttl(
+        self, repository: CachingAppointmentRepository
+    ) -> None:
+        """Test that entries use CACHE_KEYS and CACHE_TTL."""
+        clock = [0.0]
+        repository.cache = InMemoryCacheService(clock=lambda: clock[0])
+
+        await repository.get_by_id("appt-1")
+        assert await repository.cache.exists("appointment:tenant-1:appt-1")
+
+        clock[0] = 301
+        assert not await repository.cache.exists("appointment:tenant-1:appt-1")
+
+    async def test_update_writes_through(
+        self, repository: CachingAppointmentRepository, inner: AsyncMock
+    ) -> None:
+        """Test that updates refresh the cached entity."""
+        appointment = await repository.get_by_id("appt-1")
+        assert appointment is not None
+        appointment.confirm()
+
+        await repository.update(appointment)
+        cached = await repository.get_by_id("appt-1")
+
+        assert cached is not None
+        assert cached.status == appointment.status
+        inner.get_by_id.assert_awaited_once()
+
+    async def test_delete_invalidates(
+        self, repository: CachingAppointmentRepository, inner: AsyncMock
+    ) -> None:
+        """Test that deletes drop the cached entity."""
+        await repository.get_by_id("appt-1")
+        await repository.delete("appt-1")
+        await repository.get_by_id("appt-1")
+
+        assert inner.get_by_id.await_count == 2
+
+    async def test_get_many_fetches_only_misses(
+        self, repository: CachingAppointmentRepository, inner: AsyncMock
+    ) -> None:
+        """Test that batch reads only hit the wrapped repository for misses."""
+        await repository.get_by_id("appt-1")
+
+        result = await repository.get_many(["appt-1", "appt-2", "appt-2"])
+
+        assert set(result) == {"appt-1", "appt-2"}
+        inner.get_many.assert_awaited_once_with(["appt-2"])
+
+    async def test_delete_many_invalidates_succeeded(
+        self, repository: CachingAppointmentRepository, inner: AsyncMock
+    ) -> None:
+        """Test that bulk deletes drop the deleted entities."""
+        await repository.get_many(["appt-1", "appt-2"])
+        inner.delete_many.return_value = BulkWriteResult(succeeded=["appt-1"])
+
+        await repository.delete_many(["appt-1", "appt-2"])
+        await repository.get_many(["appt-1", "appt-2"])
+
+        inner.get_many.assert_awaited_with(["appt-1"])
+
+    async def test_cache_errors_fall_back(self, inner: AsyncMock) -> None:
+        """Test that an unavailable cache is treated as a miss."""
+        broken = AsyncMock(spec=CacheService)
+        broken.get.side_effect = ConnectionError("cache down")
+        broken.set.side_effect = ConnectionError("cache down")
+        repository = CachingAppointmentRepository(inner, broken)
+
+        appointment = await repository.get_by_id("appt-1")
+
+        assert appointment is not None
+        assert repository.stats.misses == 1
+
+    async def test_forwards_other_methods(
+        self, repository: CachingAppointmentRepository, inner: AsyncMock
+    ) -> None:
+        """Test that repository-specific methods reach the wrapped repository."""
+        inner.check_availability.return_value = True
+
+        assert await repository.check_availability("t", "doc-123", "a", "b")
+        inner.check_availability.assert_awaited_once_with("t", "doc-123", "a", "b")
+
+    async def test_tenants_do_not_share_entries(
+        self, repository: CachingAppointmentRepository, inner: AsyncMock
+    ) -> None:
+        """Test that an entity cached for one tenant is not served to another."""
+        await repository.get_by_id("appt-1")
+
+        with tenant_scope("tenant-2"):
+            await repository.get_by_id("appt-1")
+            await repository.get_many(["appt-1"])
+
+        assert inner.get_by_id.await_count == 2
+        inner.get_many.assert_awaited_once_with(["appt-1"])
+        assert repository.stats.hits == 0
+
+    async def test_rejects_entries_of_another_tenant(
+        self,
+        repository: CachingAppointmentRepository,
+        inner: AsyncMock,
+        cache: InMemoryCacheService,
+        make_appointment: AppointmentFactory,
+    ) -> None:
+        """Test that a cached entity is only returned to its own tenant."""
+        foreign = make_appointment(appointment_id="appt-1", tenant_id="tenant-2")
+        await cache.set("appointment:tenant-1:appt-1", foreign.to_dict())
+
+        appointment = await repository.get_by_id("appt-1")
+
+        assert appointment is not None
+        assert appointment.tenant_id == TenantId("tenant-1")
+        inner.get_by_id.assert_awaited_once_with("appt-1")
+
+    async def test_reads_without_tenant_bypass_cache(
+        self, repository: CachingAppointmentRepository, inner: AsyncMock
+    ) -> None:
+        """Test that reads outside a tenant context go to the wrapped repository."""
+        await repository.get_by_id("appt-1")
+
+        await _outside_tenant(repository.get_by_id("appt-1"))
+
+        assert inner.get_by_id.await_count == 2
+
+    async def test_delete_without_tenant_invalidates_owner_entry(
+        self, repository: CachingAppointmentRepository, inner: AsyncMock
+    ) -> None:
+        """Test that deletes outside a tenant context find the entry of the owner."""
+        await repository.get_by_id("appt-1")
+
+        await _outside_tenant(repository.delete("appt-1"))
+
+        assert not await repository.cache.exists("appointment:tenant-1:appt-1")
@@ -0,0 +1,48 @@
+"""Unit tests for the aggregation count cache."""
+
+from adyela_api.infrastructure.repositories.count_cache import CountCache
+
+
+class TestCountCache:
+    """Test CountCache expiry and invalidation."""
+
+    def test_filters_are_order_insensitive(self) -> None:
+        """Test that equal filter dicts share an entry."""
+        cache = CountCache()
+        cache.set({"tenant_id": "t1", "status": "confirmed"}, 5)
+
+        assert cache.get({"status": "confirmed", "tenant_id": "t1"}) == 5
+        assert cache.get({"tenant_id": "t1"}) is None
+
+    def test_expires_after_ttl(self) -> None:
+        """Test that counts are dropped after the TTL."""
+        now = [0.0]
+        cache = CountCache(ttl_seconds=60, clock=lambda: now[0])
+        cache.set({"tenant_id": "t1"}, 5)
+
+        now[0] = 59
+        assert cache.get({"tenant_id": "t1"}) == 5
+        now[0] = 60
+        assert cache.get({"tenant_id": "t1"}) is None
+
+    def test_invalidate_tenant(self) -> None:
+        """Test that a write drops only counts that may include it."""
+        cache = CountCache()
+        cache.set({"tenant_id": "t1"}, 5)
+        cache.set({"tenant_id": "t2"}, 7)
+        cache.set({"status": "confirmed"}, 9)
+
+        cache.invalidate("t1")
+
+        assert cache.get({"tenant_id": "t1"}) is None
+        assert cache.get({"status": "confirmed"}) is None
+        assert cache.get({"tenant_id": "t2"}) == 7
+
+    def test_invalidate_all(self) -> None:
+        """Test that invalidating without a tenant drops everything."""
+        cache = CountCache()
+        cache.set({"tenant_id": "t1"}, 5)
+
+        cache.invalidate()
+
+        assert cache.get({"tenant_id": "t1"}) is None
@@ -0,0 +1,134 @@
+"""Unit tests for the process-wide Firestore client registry."""
+
+import asyncio
+from typing import Any
+
+import pytest
+from google.auth.credentials import AnonymousCredentials  # type: ignore
+
+from adyela_api.infrastructure.services.database import (
+    FirestoreClientRegistry,
+    TunedAsyncClient,
+    channel_options,
+)
+
+
+class FakeClient:
+    """Client that records warm-ups and closes."""
+
+    def __init__(self, project: str, options: Any, database: str | None = None) -> None:
+        self.project = project
+        self.options = options
+        self.database = database
+        self.warmups = 0
+        self.closed = 0
+        self.fail = False
+
+    async def warm_up(self) -> None:
+        self.warmups += 1
+        if self.fail:
+            raise RuntimeError("unavailable")
+
+    async def close(self) -> None:
+        self.closed += 1
+
+
+@pytest.fixture
+def registry() -> FirestoreClientRegistry:
+    """Create a registry of fake clients."""
+    return FirestoreClientRegistry(
+        "project-1",
+        channel_options(keepalive_time_ms=20000),
+        async_client_class=FakeClient,
+        sync_client_class=FakeClient,
+    )
+
+
+class TestFirestoreClientRegistry:
+    """Test client reuse, warm-up and shutdown."""
+
+    async def test_one_client_per_database(self, registry: FirestoreClientRegistry) -> None:
+        """Test that clients are created once and share the channel options."""
+        default = registry.client()
+
+        assert registry.client() is default
+        assert registry.client("tenant-t1") is registry.client("tenant-t1")
+        assert registry.client("tenant-t1").database == "tenant-t1"
+        assert ("grpc.keepalive_time_ms", 20000) in default.options
+
+    async def test_start_warms_every_client(self, registry: FirestoreClientRegistry) -> None:
+        """Test that startup opens every channel before reporting ready."""
+        tenant = registry.client("tenant-t1")
+        listener = registry.sync_client()
+
+        await registry.start()
+
+        assert registry.ready
+        assert [registry.client().warmups, tenant.warmups, listener.warmups] == [1, 1, 1]
+
+        await registry.close()
+
+        assert not registry.ready
+        assert [registry.client().closed, tenant.closed, listener.closed] == [1, 1, 1]
+        assert registry.client("tenant-t1") is tenant
+
+    async def test_failed_warmup_is_retried(self, registry: FirestoreClientRegistry) -> None:
+        """Test that the registry stays not ready while unreachable, then recovers."""
+        registry.warmup_retry_seconds = 0
+        client = registry.client()
+        client.fail = True
+
+        await registry.start()
+
+        assert not registry.ready
+        while client.warmups < 3:
+            await asyncio.sleep(0)
+        assert not registry.ready
+
+        client.fail = False
+        while not registry.ready:
+            await asyncio.sleep(0)
+        warmups = client.warmups
+        await asyncio.sleep(0)
+        assert client.warmups == warmups
+
+    async def test_close_stops_retrying(self, registry: FirestoreClientRegistry) -> None:
+        """Test that shutdown cancels a pending warm-up retry."""
+        client = registry.client()
+        client.fail = True
+        await registry.start()
+
+        await registry.close()
+        client.fail = False
+        await asyncio.sleep(0)
+
+        assert not registry.ready
+        assert client.warmups == 1
+
+
+class TestTunedAsyncClient:
+    """Test the channel of the tuned client."""
+
+    async def test_channel_uses_options(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the lazily built channel gets the tuned options."""
+        monkeypatch.delenv("FIRESTORE_EMULATOR_HOST", raising=False)
+        client = TunedAsyncClient(
+            project="project-1",
+            credentials=AnonymousCredentials(),
+            options=channel_options(keepalive_time_ms=20000),
+        )
+        created: list[Any] = []
+        transport_class = type(client._firestore_api.transport)
+        await client.close()
+        create_channel = transport_class.create_channel
+
+        def record(*args: Any, **kwargs: Any) -> Any:
+            created.append(kwargs["options"])
+            return create_channel(*args, **kwargs)
+
+        monkeypatch.setattr(transport_class, "create_channel", record)
+
+        assert client._firestore_api is not None
+        assert ("grpc.keepalive_time_ms", 20000) in created[0]
+        assert ("grpc.keepalive_permit_without_calls", 1) in created[0]
+        await client.close()
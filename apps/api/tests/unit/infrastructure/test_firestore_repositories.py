@@ -0,0 +1,184 @@
+"""Unit tests for the generic Firestore repository and its entity adapters."""
+
+from datetime import UTC, date, datetime, timedelta
+
+import pytest
+
+from adyela_api.config import UserRole
+from adyela_api.domain import ConflictError, Patient, Practitioner, ValidationError
+from adyela_api.domain.value_objects import Email, PhoneNumber, TenantId
+from adyela_api.infrastructure.repositories import (
+    FirestorePatientRepository,
+    FirestorePractitionerRepository,
+)
+from adyela_api.infrastructure.repositories.pagination import PageTokenCodec
+from tests.unit.infrastructure.conftest import FakeClient
+
+BASE = datetime(2030, 1, 7, 9, tzinfo=UTC)
+
+
+def _patient(index: int, tenant_id: str = "tenant-1") -> Patient:
+    return Patient(
+        id="",
+        tenant_id=TenantId(tenant_id),
+        first_name="Ana",
+        last_name=f"Diaz {index}",
+        email=Email(f"ana{index}@example.com"),
+        phone=PhoneNumber("+15551234567"),
+        date_of_birth=date(1990, 5, 1),
+        created_at=BASE + timedelta(minutes=index),
+    )
+
+
+@pytest.fixture
+def patients(db: FakeClient) -> FirestorePatientRepository:
+    """Create a patient repository over the fake client."""
+    return FirestorePatientRepository(db, PageTokenCodec("test-secret"))
+
+
+class TestFirestoreRepository:
+    """Test the generic Firestore repository through the patient adapter."""
+
+    async def test_round_trips_entities(
+        self, db: FakeClient, patients: FirestorePatientRepository
+    ) -> None:
+        """Test that created entities are hydrated with their document ID."""
+        created = await patients.create(_patient(0))
+
+        found = await patients.get_by_id(created.id)
+
+        assert found is not None and found.id == created.id
+        assert found.email == created.email
+        assert "id" in db.collections["patients"][created.id]
+        assert await patients.get_by_id("missing") is None
+
+    async def test_get_many_uses_chunked_get_all(
+        self, db: FakeClient, patients: FirestorePatientRepository
+    ) -> None:
+        """Test that batched gets dedupe IDs and skip missing documents."""
+        result = await patients.create_many([_patient(index) for index in range(150)])
+        ids = [patient.id for patient in result.succeeded]
+
+        found = await patients.get_many([*ids, ids[0], "missing"])
+
+        assert set(found) == set(ids)
+        assert sorted(db.get_all_sizes) == [51, 100]
+
+    async def test_pages_by_created_at(self, patients: FirestorePatientRepository) -> None:
+        """Test that tenant lists page in creation order with scoped tokens."""
+        await patients.create_many([_patient(index) for index in (3, 1, 4, 0, 2)])
+        await patients.create(_patient(9, "tenant-2"))
+
+        seen, token = [], None
+        while True:
+            page = await patients.list_by_tenant("tenant-1", 2, token)
+            seen.extend(page.items)
+            token = page.next_page_token
+            if token is None:
+                break
+
+        assert [patient.last_name for patient in seen] == [f"Diaz {i}" for i in range(5)]
+        first = await patients.list_by_tenant("tenant-1", 2)
+        with pytest.raises(ValidationError):
+            await patients.list(2, {"tenant_id": "tenant-1"}, first.next_page_token)
+
+    async def test_get_by_email(self, patients: FirestorePatientRepository) -> None:
+        """Test that email lookups are scoped to the tenant."""
+        created = await patients.create(_patient(0))
+
+        found = await patients.get_by_email("tenant-1", "ana0@example.com")
+
+        assert found is not None and found.id == created.id
+        assert await patients.get_by_email("tenant-2", "ana0@example.com") is None
+
+    async def test_bulk_deletes(self, db: FakeClient, patients: FirestorePatientRepository) -> None:
+        """Test that bulk deletes remove every document."""
+        result = await patients.create_many([_patient(index) for index in range(3)])
+
+        deleted = await patients.delete_many([patient.id for patient in result.succeeded])
+
+        assert deleted.ok
+        assert db.collections["patients"] == {}
+
+
+class TestFirestorePractitionerRepository:
+    """Test FirestorePractitionerRepository queries."""
+
+    async def test_list_by_specialty(self, db: FakeClient) -> None:
+        """Test that specialty lists only include matching practitioners."""
+        repository = FirestorePractitionerRepository(db, PageTokenCodec("test-secret"))
+        for index, specialty in enumerate(["cardiology", "dermatology", "cardiology"]):
+            await repository.create(
+                Practitioner(
+                    id="",
+                    tenant_id=TenantId("tenant-1"),
+                    first_name="Eva",
+                    last_name=f"Ruiz {index}",
+                    email=Email(f"eva{index}@example.com"),
+                    phone=PhoneNumber("+15551234567"),
+                    role=UserRole.DOCTOR,
+                    specialty=specialty,
+                )
+            )
+
+        page = await repository.list_by_specialty("tenant-1", "cardiology")
+
+        assert [practitioner.last_name for practitioner in page.items] == ["Ruiz 0", "Ruiz 2"]
+
+
+class TestLookupKeys:
+    """Test lookup-key documents kept with entity writes."""
+
+    async def test_keys_follow_entity_writes(
+        self, db: FakeClient, patients: FirestorePatientRepository
+    ) -> None:
+        """Test that updates move keys and deletes remove them."""
+        patient = _patient(0)
+        patient.medical_record_number = "MRN/7"
+        created = await patients.create(patient)
+
+        assert db.collections["patient_email"] == {
+            "tenant-1:ana0@example.com": {"entity_id": created.id}
+        }
+        found = await patients.get_by_medical_record("tenant-1", "MRN/7")
+        assert found is not None and found.id == created.id
+        assert "tenant-1:MRN%2F7" in db.collections["patient_medical_record"]
+
+        created.email = Email("Ana.New@example.com")
+        await patients.update(created)
+
+        assert set(db.collections["patient_email"]) == {"tenant-1:ana.new@example.com"}
+        assert await patients.get_by_email("tenant-1", "ANA.NEW@example.com") is not None
+        assert await patients.get_by_email("tenant-1", "ana0@example.com") is None
+
+        await patients.delete(created.id)
+
+        assert db.collections["patient_email"] == {}
+        assert db.collections["patient_medical_record"] == {}
+
+    async def test_duplicates_are_rejected(
+        self, db: FakeClient, patients: FirestorePatientRepository
+    ) -> None:
+        """Test that a taken key fails the whole write."""
+        await patients.create(_patient(0))
+
+        with pytest.raises(ConflictError):
+            await patients.create(_patient(0, "tenant-1"))
+        result = await patients.create_many([_patient(1), _patient(0), _patient(2, "tenant-2")])
+
+        assert len(db.collections["patients"]) == 3
+        assert [failure.index for failure in result.failed] == [1]
+        assert await patients.get_by_email("tenant-2", "ana2@example.com") is not None
+
+    async def test_backfill(self, db: FakeClient, patients: FirestorePatientRepository) -> None:
+        """Test that missing keys are created and duplicates reported."""
+        await patients.create(_patient(0))
+        db.collections["patient_email"].clear()
+        db.collections["patients"]["old-1"] = {**_patient(1).to_dict(), "id": "old-1"}
+        db.collections["patients"]["old-2"] = {**_patient(1).to_dict(), "id": "old-2"}
+
+        report = await patients.backfill_lookup_keys(page_size=2)
+
+        assert report.created == 2
+        assert report.conflicts == ["patient_email/tenant-1:ana1@example.com"]
+        assert await patients.get_by_email("tenant-1", "ana0@example.com") is not None
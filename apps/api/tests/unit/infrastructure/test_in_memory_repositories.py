@@ -0,0 +1,269 @@
+"""Unit tests for the in-memory repositories."""
+
+from datetime import date, timedelta
+
+import pytest
+
+from adyela_api.config import AppointmentStatus, AppointmentType
+from adyela_api.domain import (
+    ConflictError,
+    Patient,
+    RecurringSeries,
+    ValidationError,
+)
+from adyela_api.domain.value_objects import DateTimeRange, Email, PhoneNumber, TenantId
+from adyela_api.infrastructure.repositories import (
+    InMemoryAppointmentRepository,
+    InMemoryPatientRepository,
+    InMemoryRecurringSeriesRepository,
+)
+from adyela_api.infrastructure.repositories.pagination import PageTokenCodec
+from tests.conftest import APPOINTMENT_START, AppointmentFactory
+
+
+def _patient(email: str = "luis@example.com", tenant_id: str = "tenant-1") -> Patient:
+    return Patient(
+        id="",
+        tenant_id=TenantId(tenant_id),
+        first_name="Luis",
+        last_name="Gomez",
+        email=Email(email),
+        phone=PhoneNumber("+15551234567"),
+        date_of_birth=date(1990, 5, 1),
+    )
+
+
+@pytest.fixture
+def repository() -> InMemoryAppointmentRepository:
+    """Create an empty appointment repository."""
+    return InMemoryAppointmentRepository(PageTokenCodec("test-secret"))
+
+
+class TestInMemoryAppointmentRepository:
+    """Test InMemoryAppointmentRepository query semantics."""
+
+    async def test_pages_in_start_time_order(
+        self, repository: InMemoryAppointmentRepository, make_appointment: AppointmentFactory
+    ) -> None:
+        """Test that keyset pages cover every match once, in order."""
+        await repository.create_many([make_appointment(slot) for slot in (3, 0, 4, 1, 2)])
+
+        seen, token = [], None
+        while True:
+            page = await repository.list_by_practitioner("tenant-1", "doc-1", 2, token)
+            seen.extend(page.items)
+            token = page.next_page_token
+            if token is None:
+                break
+
+        assert [a.schedule.start for a in seen] == [
+            APPOINTMENT_START + timedelta(minutes=30 * slot) for slot in range(5)
+        ]
+
+    async def test_tokens_are_scoped(
+        self, repository: InMemoryAppointmentRepository, make_appointment: AppointmentFactory
+    ) -> None:
+        """Test that a token from one query is rejected by another."""
+        await repository.create_many([make_appointment(slot) for slot in range(3)])
+        page = await repository.list_by_practitioner("tenant-1", "doc-1", 1)
+
+        with pytest.raises(ValidationError):
+            await repository.list_by_patient("tenant-1", "pat-1", 1, page.next_page_token)
+
+    async def test_filters_use_indexes(
+        self, repository: InMemoryAppointmentRepository, make_appointment: AppointmentFactory
+    ) -> None:
+        """Test equality filters and the date range bounds."""
+        await repository.create_many(
+            [
+                make_appointment(0),
+                make_appointment(1, practitioner_id="doc-2", patient_id="pat-2"),
+                make_appointment(2, practitioner_id="doc-2"),
+            ]
+        )
+
+        by_practitioner = await repository.list_by_practitioner("tenant-1", "doc-2")
+        by_patient = await repository.list_by_patient("tenant-1", "pat-1")
+        by_range = await repository.list_by_date_range(
+            "tenant-1",
+            (APPOINTMENT_START + timedelta(minutes=30)).isoformat(),
+            (APPOINTMENT_START + timedelta(minutes=60)).isoformat(),
+        )
+        other_tenant = await repository.list(filters={"tenant_id": "tenant-2"})
+
+        assert len(by_practitioner.items) == 2
+        assert len(by_patient.items) == 2
+        assert len(by_range.items) == 2
+        assert other_tenant.items == []
+
+    async def test_iter_yields_every_match(
+        self, repository: InMemoryAppointmentRepository, make_appointment: AppointmentFactory
+    ) -> None:
+        """Test that iteration walks all pages in order."""
+        await repository.create_many([make_appointment(slot) for slot in (2, 0, 1, 4, 3)])
+
+        starts = [
+            appointment.schedule.start
+            async for appointment in repository.iter_by_date_range(
+                "tenant-1",
+                APPOINTMENT_START.isoformat(),
+                (APPOINTMENT_START + timedelta(hours=2)).isoformat(),
+                page_size=2,
+            )
+        ]
+
+        assert starts == [APPOINTMENT_START + timedelta(minutes=30 * slot) for slot in range(5)]
+
+    async def test_count(
+        self, repository: InMemoryAppointmentRepository, make_appointment: AppointmentFactory
+    ) -> None:
+        """Test counting by indexed and unindexed filters."""
+        await repository.create_many(
+            [
+                make_appointment(0),
+                make_appointment(1, practitioner_id="doc-2"),
+                make_appointment(2, practitioner_id="doc-2"),
+            ]
+        )
+
+        assert await repository.count({"tenant_id": "tenant-1"}) == 3
+        assert await repository.count({"tenant_id": "tenant-1", "practitioner_id": "doc-2"}) == 2
+        assert await repository.count({"status": AppointmentStatus.SCHEDULED.value}) == 3
+        assert await repository.count({"tenant_id": "tenant-2"}) == 0
+
+    async def test_availability_tracks_writes(
+        self, repository: InMemoryAppointmentRepository, make_appointment: AppointmentFactory
+    ) -> None:
+        """Test that availability follows creates, cancellations and deletes."""
+        appointment = await repository.create(make_appointment(0))
+        slot = (
+            APPOINTMENT_START.isoformat(),
+            (APPOINTMENT_START + timedelta(minutes=30)).isoformat(),
+        )
+
+        assert not await repository.check_availability("tenant-1", "doc-1", *slot)
+        assert not await repository.check_patient_availability("tenant-1", "pat-1", *slot)
+
+        appointment.cancel()
+        await repository.update(appointment)
+        assert await repository.check_availability("tenant-1", "doc-1", *slot)
+
+        appointment.status = AppointmentStatus.SCHEDULED
+        await repository.update(appointment)
+        await repository.delete_many([appointment.id])
+        assert await repository.check_availability("tenant-1", "doc-1", *slot)
+
+    async def test_update_missing_fails_per_item(
+        self, repository: InMemoryAppointmentRepository, make_appointment: AppointmentFactory
+    ) -> None:
+        """Test that bulk updates report missing appointments."""
+        existing = await repository.create(make_appointment(0))
+        missing = make_appointment(1)
+        missing.id = "missing"
+
+        result = await repository.update_many([existing, missing])
+
+        assert result.succeeded == [existing]
+        assert [failure.entity_id for failure in result.failed] == ["missing"]
+
+    async def test_summaries_project_fields(
+        self, repository: InMemoryAppointmentRepository, make_appointment: AppointmentFactory
+    ) -> None:
+        """Test that summaries only carry projected fields."""
+        await repository.create(make_appointment(0))
+
+        page = await repository.list_summaries("tenant-1", fields=["status"])
+
+        summary = page.items[0]
+        assert summary.status == AppointmentStatus.SCHEDULED
+        assert summary.start_time == APPOINTMENT_START
+        assert summary.practitioner_id is None
+
+
+class TestInMemoryPatientRepository:
+    """Test InMemoryPatientRepository lookups."""
+
+    async def test_get_by_email(self) -> None:
+        """Test that email lookups are scoped to the tenant."""
+        repository = InMemoryPatientRepository(PageTokenCodec("test-secret"))
+        patient = await repository.create(_patient())
+
+        found = await repository.get_by_email("tenant-1", "luis@example.com")
+
+        assert found is not None and found.id == patient.id
+        assert await repository.get_by_email("tenant-2", "luis@example.com") is None
+
+    async def test_keys_follow_entity_writes(self) -> None:
+        """Test that keys are case-insensitive, move on updates and go on deletes."""
+        repository = InMemoryPatientRepository(PageTokenCodec("test-secret"))
+        patient = _patient()
+        patient.medical_record_number = "MRN/7"
+        created = await repository.create(patient)
+
+        found = await repository.get_by_medical_record("tenant-1", "MRN/7")
+        assert found is not None and found.id == created.id
+
+        created.email = Email("Luis.New@example.com")
+        await repository.update(created)
+
+        assert await repository.get_by_email("tenant-1", "LUIS.NEW@example.com") is not None
+        assert await repository.get_by_email("tenant-1", "luis@example.com") is None
+
+        await repository.delete(created.id)
+
+        assert await repository.get_by_email("tenant-1", "luis.new@example.com") is None
+        assert await repository.get_by_medical_record("tenant-1", "MRN/7") is None
+
+    async def test_duplicates_are_rejected(self) -> None:
+        """Test that a taken key fails the whole write."""
+        repository = InMemoryPatientRepository(PageTokenCodec("test-secret"))
+        await repository.create(_patient())
+
+        with pytest.raises(ConflictError):
+            await repository.create(_patient("LUIS@example.com"))
+        result = await repository.create_many(
+            [_patient("ana@example.com"), _patient(), _patient(tenant_id="tenant-2")]
+        )
+
+        assert len(repository) == 3
+        assert [failure.index for failure in result.failed] == [1]
+        assert await repository.get_by_email("tenant-2", "luis@example.com") is not None
+
+
+class TestInMemoryRecurringSeriesRepository:
+    """Test InMemoryRecurringSeriesRepository queries."""
+
+    async def test_lists_active_series(self) -> None:
+        """Test that cancelled series and other practitioners' series are left out."""
+        repository = InMemoryRecurringSeriesRepository(PageTokenCodec("test-secret"))
+        result = await repository.create_many(
+            [
+                RecurringSeries(
+                    id="",
+                    tenant_id=TenantId("tenant-1"),
+                    patient_id="pat-1",
+                    practitioner_id=practitioner_id,
+                    recurrence=recurrence,
+                    first_start=APPOINTMENT_START,
+                    duration_minutes=30,
+                    appointment_type=AppointmentType.IN_PERSON,
+                )
+                for recurrence, practitioner_id in (
+                    ("FREQ=WEEKLY", "doc-1"),
+                    ("FREQ=DAILY", "doc-1"),
+                    ("FREQ=WEEKLY", "doc-2"),
+                )
+            ]
+        )
+        weekly, daily, other = result.succeeded
+        daily.cancel()
+        await repository.update(daily)
+
+        page = await repository.list_by_practitioner("tenant-1", "doc-1")
+        by_patient = await repository.list_by_patient("tenant-1", "pat-1")
+
+        assert [series.id for series in page.items] == [weekly.id]
+        assert {series.id for series in by_patient.items} == {weekly.id, other.id}
+        assert page.items[0].occurrences(
+            DateTimeRange(start=APPOINTMENT_START, end=APPOINTMENT_START + timedelta(days=7))
+        )
@@ -0,0 +1,179 @@
+"""Unit tests for in-process availability indexes."""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from adyela_api.config import AppointmentStatus
+from adyela_api.infrastructure.repositories.interval_index import (
+    AvailabilityIndex,
+    IntervalIndex,
+)
+from tests.conftest import APPOINTMENT_START, AppointmentFactory
+
+
+def _at(minutes: int) -> datetime:
+    return APPOINTMENT_START + timedelta(minutes=minutes)
+
+
+class TestIntervalIndex:
+    """Test IntervalIndex."""
+
+    def test_half_open_overlap(self) -> None:
+        """Test that back-to-back intervals do not overlap."""
+        index = IntervalIndex()
+        index.add("a", 60, 120)
+
+        assert index.overlaps(90, 150)
+        assert index.overlaps(0, 61)
+        assert not index.overlaps(120, 180)
+        assert not index.overlaps(0, 60)
+
+    def test_long_interval_shadows_later_starts(self) -> None:
+        """Test that an early long interval is found past shorter ones."""
+        index = IntervalIndex()
+        index.add("long", 0, 1000)
+        index.add("short", 10, 20)
+
+        assert index.overlaps(500, 600)
+
+    def test_add_moves_existing_interval(self) -> None:
+        """Test that re-adding an ID replaces its interval."""
+        index = IntervalIndex()
+        index.add("a", 0, 60)
+        index.add("a", 120, 180)
+
+        assert len(index) == 1
+        assert not index.overlaps(0, 60)
+        assert index.overlaps(150, 160)
+
+    def test_matches_pairwise_check(self) -> None:
+        """Test overlap answers against a naive pairwise scan."""
+        rng = random.Random(7)
+        index = IntervalIndex()
+        intervals: dict[str, tuple[int, int]] = {}
+        for step in range(500):
+            item_id = f"i-{rng.randrange(60)}"
+            if rng.random() < 0.3:
+                index.discard(item_id)
+                intervals.pop(item_id, None)
+            else:
+                start = rng.randrange(1000)
+                end = start + rng.randrange(1, 120)
+                index.add(item_id, start, end)
+                intervals[item_id] = (start, end)
+
+            start = rng.randrange(1000)
+            end = start + rng.randrange(1, 120)
+            expected = any(s < end and e > start for s, e in intervals.values())
+            assert index.overlaps(start, end) == expected, step
+
+
+class TestAvailabilityIndex:
+    """Test AvailabilityIndex."""
+
+    @pytest.fixture
+    def clock(self) -> list[float]:
+        """Controllable monotonic clock."""
+        return [0.0]
+
+    @pytest.fixture
+    def index(self, clock: list[float]) -> AvailabilityIndex:
+        """Create an index with a 60 second TTL."""
+        return AvailabilityIndex(ttl_seconds=60, clock=lambda: clock[0])
+
+    def test_keys_start_unloaded_and_expire(
+        self, index: AvailabilityIndex, clock: list[float]
+    ) -> None:
+        """Test that keys need a load and go stale after the TTL."""
+        key = AvailabilityIndex.practitioner_key("tenant-1", "doc-1")
+        assert not index.is_loaded(key)
+
+        index.load(key, [])
+        assert index.is_loaded(key)
+
+        clock[0] = 61
+        assert not index.is_loaded(key)
+        assert len(index) == 0
+
+    async def test_evicts_least_recently_used_keys(self, clock: list[float]) -> None:
+        """Test that keys beyond ``max_keys`` are dropped with their bookings and locks."""
+        index = AvailabilityIndex(ttl_seconds=60, max_keys=2, clock=lambda: clock[0])
+        first, second, third = (
+            AvailabilityIndex.practitioner_key("tenant-1", f"doc-{n}") for n in range(3)
+        )
+        for key in (first, second):
+            async with index.load_lock(key):
+                index.load(key, [(f"a-{key[2]}", _at(0), _at(30))])
+
+        assert index.is_loaded(first)
+        index.load(third, [])
+
+        assert len(index) == 2
+        assert index.is_loaded(first)
+        assert not index.is_loaded(second)
+        assert second not in index._load_locks
+        index.discard("a-doc-1")
+        assert index._keys_by_id == {"a-doc-0": {first}}
+
+    def test_record_updates_practitioner_and_patient(
+        self, index: AvailabilityIndex, make_appointment: AppointmentFactory
+    ) -> None:
+        """Test that a created appointment blocks both its practitioner and patient."""
+        doc_key = AvailabilityIndex.practitioner_key("tenant-1", "doc-1")
+        patient_key = AvailabilityIndex.patient_key("tenant-1", "pat-1")
+        index.load(doc_key, [])
+        index.load(patient_key, [])
+
+        index.record(make_appointment(appointment_id="a-1"))
+
+        assert index.overlaps(doc_key, _at(15), _at(45))
+        assert index.overlaps(patient_key, _at(15), _at(45))
+        assert not index.overlaps(doc_key, _at(30), _at(60))
+
+    def test_cancel_frees_slot(
+        self, index: AvailabilityIndex, make_appointment: AppointmentFactory
+    ) -> None:
+        """Test that cancelling an appointment releases its slot."""
+        key = AvailabilityIndex.practitioner_key("tenant-1", "doc-1")
+        index.load(key, [("a-1", _at(0), _at(30))])
+        appointment = make_appointment(appointment_id="a-1")
+
+        appointment.cancel()
+        index.record(appointment)
+
+        assert appointment.status == AppointmentStatus.CANCELLED
+        assert not index.overlaps(key, _at(0), _at(30))
+
+    def test_reschedule_moves_slot(
+        self, index: AvailabilityIndex, make_appointment: AppointmentFactory
+    ) -> None:
+        """Test that updating the schedule moves the booking."""
+        key = AvailabilityIndex.practitioner_key("tenant-1", "doc-1")
+        index.load(key, [("a-1", _at(0), _at(30))])
+
+        index.record(make_appointment(2, appointment_id="a-1"))
+
+        assert not index.overlaps(key, _at(0), _at(30))
+        assert index.overlaps(key, _at(60), _at(90))
+
+    def test_discard_removes_from_all_keys(self, index: AvailabilityIndex) -> None:
+        """Test that deleting an appointment removes it everywhere."""
+        doc_key = AvailabilityIndex.practitioner_key("tenant-1", "doc-1")
+        patient_key = AvailabilityIndex.patient_key("tenant-1", "pat-1")
+        index.load(doc_key, [("a-1", _at(0), _at(30))])
+        index.load(patient_key, [("a-1", _at(0), _at(30))])
+
+        index.discard("a-1")
+
+        assert not index.overlaps(doc_key, _at(0), _at(30))
+        assert not index.overlaps(patient_key, _at(0), _at(30))
+
+    def test_record_ignores_unloaded_keys(
+        self, index: AvailabilityIndex, make_appointment: AppointmentFactory
+    ) -> None:
+        """Test that writes do not make a partial key look loaded."""
+        index.record(make_appointment(appointment_id="a-1"))
+
+        assert not index.is_loaded(AvailabilityIndex.practitioner_key("tenant-1", "doc-1"))
@@ -0,0 +1,58 @@
+"""Unit tests for page token codec."""
+
+import pytest
+
+from adyela_api.domain import ValidationError
+from adyela_api.infrastructure.repositories.pagination import PageTokenCodec
+
+
+@pytest.fixture
+def codec() -> PageTokenCodec:
+    """Create a test codec."""
+    return PageTokenCodec("test-secret")
+
+
+class TestPageTokenCodec:
+    """Test PageTokenCodec."""
+
+    def test_round_trip(self, codec: PageTokenCodec) -> None:
+        """Test that a token decodes to the cursor it was built from."""
+        cursor = ["2030-01-01T09:00:00+00:00", "appt-123"]
+        token = codec.encode(cursor, ("patient", "tenant-1", "patient-1"))
+
+        assert codec.decode(token, ("patient", "tenant-1", "patient-1")) == cursor
+
+    def test_token_is_opaque(self, codec: PageTokenCodec) -> None:
+        """Test that the token does not expose the cursor in clear text."""
+        token = codec.encode(["appt-123"], "scope")
+
+        assert "appt-123" not in token
+
+    def test_rejects_tampered_token(self, codec: PageTokenCodec) -> None:
+        """Test that an edited payload is rejected."""
+        token = codec.encode(["2030-01-01T09:00:00+00:00", "appt-123"], "scope")
+        other = codec.encode(["2031-01-01T09:00:00+00:00", "appt-999"], "scope")
+        forged = f"{other.split('.')[0]}.{token.split('.')[1]}"
+
+        with pytest.raises(ValidationError):
+            codec.decode(forged, "scope")
+
+    def test_rejects_token_from_other_scope(self, codec: PageTokenCodec) -> None:
+        """Test that a token cannot be replayed against another tenant."""
+        token = codec.encode(["appt-123"], ("list", {"tenant_id": "tenant-1"}))
+
+        with pytest.raises(ValidationError):
+            codec.decode(token, ("list", {"tenant_id": "tenant-2"}))
+
+    def test_rejects_token_signed_with_other_secret(self, codec: PageTokenCodec) -> None:
+        """Test that tokens from another deployment are rejected."""
+        token = PageTokenCodec("other-secret").encode(["appt-123"], "scope")
+
+        with pytest.raises(ValidationError):
+            codec.decode(token, "scope")
+
+    @pytest.mark.parametrize("token", ["", "garbage", "a.b.c", "!!!.???"])
+    def test_rejects_malformed_token(self, codec: PageTokenCodec, token: str) -> None:
+        """Test that malformed tokens are rejected."""
+        with pytest.raises(ValidationError):
+            codec.decode(token, "scope")
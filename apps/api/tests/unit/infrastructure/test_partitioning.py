@@ -0,0 +1,253 @@
+"""Unit tests for per-tenant partitioning and layout migrations."""
+
+import json
+import pathlib
+from typing import Any
+
+import pytest
+from google.api_core.exceptions import AlreadyExists  # type: ignore
+
+from adyela_api.application.tenant_context import tenant_scope
+from adyela_api.infrastructure.repositories import FirestoreAppointmentRepository
+from adyela_api.infrastructure.repositories.pagination import PageTokenCodec
+from adyela_api.infrastructure.repositories.partition_migration import TenantLayoutMigration
+from adyela_api.infrastructure.repositories.partitioning import (
+    Layout,
+    PartitionState,
+    TenantPartitioning,
+)
+from adyela_api.infrastructure.repositories.tenant_indexes import (
+    deploy_tenant_indexes,
+    tenant_indexes,
+)
+from tests.conftest import AppointmentFactory
+from tests.unit.infrastructure.conftest import FakeClient
+
+# Index definitions deployed to the default database, at the repository root
+INDEXES_FILE = pathlib.Path(__file__).resolve().parents[5] / "firestore.indexes.json"
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def databases() -> dict[str, FakeClient]:
+    """Named per-tenant fake databases, created on first use."""
+    return {}
+
+
+@pytest.fixture
+def partitioning(db: FakeClient, databases: dict[str, FakeClient]) -> TenantPartitioning:
+    """Create a partitioning over the fake databases."""
+    return TenantPartitioning(
+        db, lambda database: databases.setdefault(database, FakeClient()), clock=FakeClock()
+    )
+
+
+class TestTenantPartitioning:
+    """Test layout resolution."""
+
+    async def test_layout_paths(
+        self, partitioning: TenantPartitioning, databases: dict[str, FakeClient]
+    ) -> None:
+        """Test where each layout places a tenant's collection."""
+        flat = partitioning.partition("t1", Layout.FLAT)
+        nested = partitioning.partition("t1", Layout.SUBCOLLECTION)
+        own = partitioning.partition("t1", Layout.DATABASE)
+
+        assert flat.query("appointments").filters == (("tenant_id", "t1"),)
+        assert nested.query("appointments").path == ("tenants", "t1", "appointments")
+        assert nested.query("appointments").filters == ()
+        assert own.db is databases["tenant-t1"]
+        assert own.query("appointments").path == ("appointments",)
+
+    async def test_states_are_refreshed(self, db: FakeClient) -> None:
+        """Test that stored states apply after the refresh interval."""
+        clock = FakeClock()
+        partitioning = TenantPartitioning(db, FakeClient, refresh_seconds=60, clock=clock)
+        assert (await partitioning.resolve("t1")).layout is Layout.FLAT
+
+        db.collections["tenant_partitions"] = {
+            "t1": PartitionState(Layout.FLAT, Layout.SUBCOLLECTION).to_dict()
+        }
+        assert (await partitioning.resolve("t1")).layout is Layout.FLAT
+
+        clock.now = 60
+        partitions = await partitioning.write_partitions("t1")
+        assert [partition.layout for partition in partitions] == [
+            Layout.FLAT,
+            Layout.SUBCOLLECTION,
+        ]
+
+
+class TestPartitionedRepository:
+    """Test FirestoreAppointmentRepository over partitioned tenants."""
+
+    async def test_writes_reach_every_write_partition(
+        self, db: FakeClient, partitioning: TenantPartitioning, make_appointment: AppointmentFactory
+    ) -> None:
+        """Test dual writes during a migration and reads from the current layout."""
+        await partitioning.set_state("t1", PartitionState(Layout.SUBCOLLECTION, Layout.FLAT))
+        repository = FirestoreAppointmentRepository(
+            db, PageTokenCodec("test-secret"), partitioning=partitioning
+        )
+
+        created = await repository.create(make_appointment(tenant_id="t1"))
+        await repository.create(make_appointment(tenant_id="t2"))
+
+        assert set(db.collections["tenants/t1/appointments"]) == {created.id}
+        assert created.id in db.collections["appointments"]
+        page = await repository.list_by_practitioner("t1", "doc-1")
+        assert [appointment.id for appointment in page.items] == [created.id]
+
+        with tenant_scope("t1"):
+            assert await repository.get_by_id(created.id) is not None
+            await repository.delete(created.id)
+        assert db.collections["tenants/t1/appointments"] == {}
+        assert created.id not in db.collections["appointments"]
+
+    async def test_id_lookups_need_a_tenant(
+        self, db: FakeClient, partitioning: TenantPartitioning
+    ) -> None:
+        """Test that lookups by ID outside a tenant scope raise instead of reading the flat layout."""
+        repository = FirestoreAppointmentRepository(
+            db, PageTokenCodec("test-secret"), partitioning=partitioning
+        )
+
+        with pytest.raises(RuntimeError, match="tenant_scope"):
+            await repository.get_by_id("a")
+        with pytest.raises(RuntimeError, match="tenant_scope"):
+            await repository.delete_many(["a"])
+
+
+class TestTenantLayoutMigration:
+    """Test online migrations between layouts."""
+
+    async def test_moves_only_the_tenant(
+        self, db: FakeClient, partitioning: TenantPartitioning, make_appointment: AppointmentFactory
+    ) -> None:
+        """Test that a migration copies, switches and cleans up one tenant."""
+        repository = FirestoreAppointmentRepository(
+            db, PageTokenCodec("test-secret"), partitioning=partitioning
+        )
+        moved = [
+            await repository.create(make_appointment(slot, tenant_id="t1")) for slot in range(5)
+        ]
+        other = await repository.create(make_appointment(tenant_id="t2"))
+        states: list[PartitionState] = []
+
+        async def sleep(seconds: float) -> None:
+            states.append(await partitioning.state("t1"))
+
+        migration = TenantLayoutMigration(partitioning, page_size=2, sleep=sleep)
+        report = await migration.run("t1", Layout.SUBCOLLECTION, delete_source=True)
+
+        assert states == [
+            PartitionState(Layout.FLAT, Layout.SUBCOLLECTION),
+            PartitionState(Layout.SUBCOLLECTION, Layout.FLAT),
+        ]
+        assert await partitioning.state("t1") == PartitionState(Layout.SUBCOLLECTION)
+        assert set(db.collections["tenants/t1/appointments"]) == {a.id for a in moved}
+        assert set(db.collections["appointments"]) == {other.id}
+        assert report.copied == 5
+        assert report.source_deleted == 5
+
+    async def test_keeps_dual_writes_and_drops_orphans(
+        self, db: FakeClient, partitioning: TenantPartitioning
+    ) -> None:
+        """Test that copies never replace newer target documents."""
+        source = partitioning.partition("t1", Layout.FLAT).collection("appointments")
+        target = partitioning.partition("t1", Layout.SUBCOLLECTION).collection("appointments")
+        await source.document("a").set({"tenant_id": "t1", "status": "confirmed"})
+        await target.document("a").set({"tenant_id": "t1", "status": "cancelled"})
+        await target.document("gone").set({"tenant_id": "t1", "status": "scheduled"})
+
+        async def sleep(seconds: float) -> None:
+            return None
+
+        report = await TenantLayoutMigration(partitioning, sleep=sleep).run(
+            "t1", Layout.SUBCOLLECTION
+        )
+
+        assert db.collections["tenants/t1/appointments"] == {
+            "a": {"tenant_id": "t1", "status": "cancelled"}
+        }
+        assert report.already_present == 1
+        assert report.removed == 1
+
+    async def test_drops_orphans_page_by_page(
+        self, db: FakeClient, partitioning: TenantPartitioning
+    ) -> None:
+        """Test that orphans spread over several target pages are all removed."""
+        source = partitioning.partition("t1", Layout.FLAT).collection("appointments")
+        target = partitioning.partition("t1", Layout.SUBCOLLECTION).collection("appointments")
+        for doc_id in ("a", "c", "e"):
+            await source.document(doc_id).set({"tenant_id": "t1"})
+        for doc_id in ("b", "d", "f", "g"):
+            await target.document(doc_id).set({"tenant_id": "t1"})
+
+        async def sleep(seconds: float) -> None:
+            return None
+
+        report = await TenantLayoutMigration(partitioning, page_size=2, sleep=sleep).run(
+            "t1", Layout.SUBCOLLECTION
+        )
+
+        assert set(db.collections["tenants/t1/appointments"]) == {"a", "c", "e"}
+        assert report.removed == 4
+
+
+class FakeOperation:
+    """Long-running index build that is already done."""
+
+    async def result(self) -> None:
+        return None
+
+
+class FakeFirestoreAdmin:
+    """Admin client holding the indexes of each collection group path."""
+
+    def __init__(self) -> None:
+        self.indexes: dict[str, list[Any]] = {}
+
+    def collection_group_path(self, project: str, database: str, collection: str) -> str:
+        return f"projects/{project}/databases/{database}/collectionGroups/{collection}"
+
+    async def create_index(self, parent: str, index: Any) -> FakeOperation:
+        if index in self.indexes.get(parent, []):
+            raise AlreadyExists("index already exists")
+        self.indexes.setdefault(parent, []).append(index)
+        return FakeOperation()
+
+
+class TestTenantIndexes:
+    """Test the indexes of tenant-owned collections."""
+
+    def test_tenant_indexes_are_declared(self) -> None:
+        """Test that queries without a tenant_id filter have their indexes declared."""
+        definitions = json.loads(INDEXES_FILE.read_text())
+        indexes = tenant_indexes(definitions)
+
+        assert {tuple(field["fieldPath"] for field in index["fields"]) for index in indexes} >= {
+            ("practitioner_id", "start_time", "__name__"),
+            ("patient_id", "status", "end_time"),
+        }
+        assert all(index in definitions["indexes"] for index in indexes)
+
+    async def test_deploy_skips_existing_indexes(self) -> None:
+        """Test that deploying twice only creates the indexes once."""
+        admin = FakeFirestoreAdmin()
+        indexes = tenant_indexes(json.loads(INDEXES_FILE.read_text()))
+
+        assert await deploy_tenant_indexes(admin, "p", "tenant-t1", indexes) == len(indexes)
+        assert await deploy_tenant_indexes(admin, "p", "tenant-t1", indexes) == 0
+        assert list(admin.indexes) == [
+            "projects/p/databases/tenant-t1/collectionGroups/appointments"
+        ]
@@ -0,0 +1,169 @@
+"""Unit tests for the listener-fed view of today's appointments."""
+
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from adyela_api.domain import Appointment
+from adyela_api.domain.value_objects import DateTimeRange
+from adyela_api.infrastructure.repositories import FirestoreAppointmentRepository
+from adyela_api.infrastructure.repositories.pagination import PageTokenCodec
+from adyela_api.infrastructure.repositories.today_view import TodayScheduleView
+from tests.conftest import AppointmentFactory
+
+NOW = datetime(2030, 1, 7, 8, tzinfo=UTC)
+
+
+class FakeWatch:
+    """Stand-in for a Firestore ``Watch``."""
+
+    def __init__(self, callback: Any) -> None:
+        self.callback = callback
+        self.is_active = True
+
+    def unsubscribe(self) -> None:
+        self.is_active = False
+
+
+class FakeQuery:
+    """Chainable query recording its filters and listeners."""
+
+    def __init__(self, db: "FakeClient", collection: str) -> None:
+        self.db = db
+        self.collection = collection
+        self.filters: list[tuple[str, str, Any]] = []
+
+    def where(self, field: str, op: str, value: Any) -> "FakeQuery":
+        self.filters.append((field, op, value))
+        return self
+
+    def select(self, fields: list[str]) -> "FakeQuery":
+        return self
+
+    def stream(self) -> list[Any]:
+        return [SimpleNamespace(id=tenant_id) for tenant_id in self.db.tenants]
+
+    def on_snapshot(self, callback: Any) -> FakeWatch:
+        watch = FakeWatch(callback)
+        self.db.watches.append((self.filters, watch))
+        return watch
+
+
+class FakeClient:
+    """Synchronous client serving a fixed list of active tenants."""
+
+    def __init__(self, tenants: list[str]) -> None:
+        self.tenants = tenants
+        self.watches: list[tuple[list[tuple[str, str, Any]], FakeWatch]] = []
+
+    def collection(self, name: str) -> FakeQuery:
+        return FakeQuery(self, name)
+
+
+def _change(kind: str, appointment: Appointment) -> Any:
+    data = appointment.to_dict()
+    data.pop("id", None)
+    document = SimpleNamespace(id=appointment.id, to_dict=lambda: data)
+    return SimpleNamespace(type=SimpleNamespace(name=kind), document=document)
+
+
+@pytest.fixture
+async def view() -> AsyncIterator[TodayScheduleView]:
+    """Create a view subscribed for a single tenant."""
+    view = TodayScheduleView(FakeClient(["tenant-1"]), PageTokenCodec("test"), clock=lambda: NOW)
+    await view.start()
+    yield view
+    await view.stop()
+
+
+class TestTodayScheduleView:
+    """Test TodayScheduleView subscriptions and reads."""
+
+    async def test_subscribes_to_today_per_tenant(self, view: TodayScheduleView) -> None:
+        """Test that one listener covers each active tenant's current day."""
+        ((filters, _),) = view.db.watches
+
+        assert filters == [
+            ("tenant_id", "==", "tenant-1"),
+            ("start_time", ">=", "2030-01-07"),
+            ("start_time", "<", "2030-01-08"),
+        ]
+
+    async def test_covers_after_first_snapshot(self, view: TodayScheduleView) -> None:
+        """Test that only ready tenants and ranges within today are covered."""
+        assert not view.covers("tenant-1", "2030-01-07", "2030-01-07T23:59:59")
+
+        view.apply("tenant-1", [])
+
+        assert view.covers("tenant-1", "2030-01-07", "2030-01-07T23:59:59")
+        assert view.covers("tenant-1", "2030-01-07T12:00:00+00:00", "2030-01-07T13:00:00+00:00")
+        assert not view.covers("tenant-1", "2030-01-06T23:00:00+00:00", "2030-01-07T12:00")
+        assert not view.covers("tenant-1", "2030-01-07", "2030-01-08")
+        assert not view.covers("tenant-2", "2030-01-07", "2030-01-07T23:59:59")
+
+        _, watch = view.db.watches[0]
+        watch.unsubscribe()
+        assert not view.covers("tenant-1", "2030-01-07", "2030-01-07T23:59:59")
+
+    async def test_applies_snapshot_changes(
+        self, view: TodayScheduleView, make_appointment: AppointmentFactory
+    ) -> None:
+        """Test that added, modified and removed documents update the view."""
+        first = make_appointment(start=NOW, appointment_id="a-1")
+        second = make_appointment(start=NOW + timedelta(hours=1), appointment_id="a-2")
+        view.apply("tenant-1", [_change("ADDED", second), _change("ADDED", first)])
+
+        second.cancel()
+        view.apply("tenant-1", [_change("MODIFIED", second), _change("REMOVED", first)])
+
+        page = await view.list_by_date_range("tenant-1", "2030-01-07", "2030-01-08")
+        assert [(a.id, a.status) for a in page.items] == [("a-2", second.status)]
+
+    async def test_drops_callbacks_from_previous_day(
+        self, view: TodayScheduleView, make_appointment: AppointmentFactory
+    ) -> None:
+        """Test that late changes from replaced listeners are ignored."""
+        view._on_changes(
+            "tenant-1",
+            view._generation - 1,
+            [_change("ADDED", make_appointment(start=NOW, appointment_id="a"))],
+        )
+
+        assert len(view.store) == 0
+        assert "tenant-1" not in view._ready
+
+    async def test_records_local_writes_for_today(
+        self, view: TodayScheduleView, make_appointment: AppointmentFactory
+    ) -> None:
+        """Test that writes through this process are visible before their snapshot."""
+        today = make_appointment(start=NOW, appointment_id="a-1")
+        view.record(today)
+        view.record(make_appointment(start=NOW + timedelta(days=1), appointment_id="a-2"))
+
+        assert await view.store.get_by_id("a-1") is not None
+        assert await view.store.get_by_id("a-2") is None
+
+        today.schedule = DateTimeRange(
+            start=NOW + timedelta(days=1), end=NOW + timedelta(days=1, minutes=30)
+        )
+        view.record(today)
+        assert await view.store.get_by_id("a-1") is None
+
+    async def test_repository_serves_covered_ranges(
+        self, view: TodayScheduleView, make_appointment: AppointmentFactory
+    ) -> None:
+        """Test that the Firestore repository reads today's ranges from the view."""
+        view.apply(
+            "tenant-1", [_change("ADDED", make_appointment(start=NOW, appointment_id="a-1"))]
+        )
+        db = MagicMock()
+        repository = FirestoreAppointmentRepository(db, view.page_tokens, today_view=view)
+
+        page = await repository.list_by_date_range("tenant-1", "2030-01-07", "2030-01-07T23:59")
+
+        assert [a.id for a in page.items] == ["a-1"]
+        db.collection.assert_not_called()